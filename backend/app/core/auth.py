@@ -1,10 +1,18 @@
+import hmac
+from typing import Optional
+
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError, ExpiredSignatureError
-from fastapi import HTTPException
+from fastapi import Header, HTTPException
 from enum import Enum
 from .config import settings
-from .exceptions import AuthTokenExpiredException, InvalidTokenException, InvalidTokenTypeException
+from .exceptions import (
+    AuthTokenExpiredException,
+    InvalidAdminKeyException,
+    InvalidTokenException,
+    InvalidTokenTypeException,
+)
 from fastapi.security import HTTPBearer
 
 
@@ -59,4 +67,11 @@ def verify_token(token: str, expected_type: TokenType) -> dict:
     except ExpiredSignatureError:
         raise AuthTokenExpiredException()
     except JWTError as e:
-        raise InvalidTokenException()
\ No newline at end of file
+        raise InvalidTokenException()
+
+
+def verify_admin_key(x_admin_key: Optional[str] = Header(default=None)) -> None:
+    """Dependency for operational endpoints; rejects everything when ADMIN_API_KEY is unset."""
+    expected = settings.admin_api_key
+    if not expected or not x_admin_key or not hmac.compare_digest(x_admin_key, expected):
+        raise InvalidAdminKeyException()
@@ -0,0 +1,55 @@
+"""Fixed-size bitsets and 4-bit packed arrays stored as ``bytes``.
+
+Bit ``i`` lives in byte ``i // 8`` at position ``i % 8`` (LSB first), which is
+also what ``int.from_bytes(buf, "little")`` yields, so counting and run-length
+queries run as whole-integer bit operations instead of per-day loops.
+Nibble ``i`` is the low half of byte ``i // 2`` for even ``i``, the high half
+for odd ``i``.
+"""
+from __future__ import annotations
+
+
+def set_bit(buf: bytearray, index: int) -> None:
+    buf[index >> 3] |= 1 << (index & 7)
+
+
+def test_bit(buf: bytes, index: int) -> bool:
+    return bool(buf[index >> 3] & (1 << (index & 7)))
+
+
+def popcount(buf: bytes) -> int:
+    return int.from_bytes(buf, "little").bit_count()
+
+
+def run_ending_at(buf: bytes, index: int) -> int:
+    """Number of consecutive set bits ending at ``index`` (0 if that bit is clear)."""
+    window = int.from_bytes(buf, "little") & ((1 << (index + 1)) - 1)
+    # window에서 0인 비트들; 가장 높은 0 비트 위부터 index까지가 연속 구간
+    zeros = ~window & ((1 << (index + 1)) - 1)
+    if not zeros:
+        return index + 1
+    return index - (zeros.bit_length() - 1)
+
+
+def longest_run(buf: bytes) -> int:
+    """Longest run of set bits (x &= x >> 1 strips one bit off every run per step)."""
+    value = int.from_bytes(buf, "little")
+    length = 0
+    while value:
+        value &= value >> 1
+        length += 1
+    return length
+
+
+def highest_set_bit(buf: bytes) -> int:
+    """Index of the highest set bit, or -1 when the bitset is empty."""
+    return int.from_bytes(buf, "little").bit_length() - 1
+
+
+def get_nibble(buf: bytes, index: int) -> int:
+    return (buf[index >> 1] >> ((index & 1) * 4)) & 0xF
+
+
+def set_nibble(buf: bytearray, index: int, value: int) -> None:
+    shift = (index & 1) * 4
+    buf[index >> 1] = (buf[index >> 1] & ~(0xF << shift) & 0xFF) | ((value & 0xF) << shift)
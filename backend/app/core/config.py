@@ -23,6 +23,33 @@ class Settings(BaseSettings):
     aws_secret_access_key: str | None = None
     aws_region: str | None = None
     aws_s3_bucket: str | None = None
+    # optional "word<TAB>CEFR level" file; the built-in seed list is used when unset
+    cefr_wordlist_path: str | None = None
+    # level_system.fitting이 만든 가중치 설정 파일; 없으면 service의 DEFAULT_WEIGHT_MATRIX 사용
+    level_weights_path: str | None = None
+    # 0보다 크면 이 비율의 level-system 요청에 대해 LLM 전략을 shadow로 실행해 비교 기록
+    level_shadow_sample_rate: float = 0.0
+    # 동일한 레벨 평가 프롬프트의 LLM 결과 캐시 (TTL 0이면 비활성화, version을 바꾸면 전부 무효화)
+    level_eval_cache_ttl_seconds: int = 7 * 24 * 3600
+    level_eval_cache_version: str = "1"
+    # 레벨 평가 user 프롬프트의 추정 토큰 상한 (넘으면 스크립트 발췌문을 줄임)
+    level_eval_prompt_token_budget: int = 1200
+    # True면 level-test가 휴리스틱 임시 결과를 즉시 반환하고 LLM 평가는 백그라운드에서 반영
+    level_eval_two_phase: bool = False
+    # 단어 일괄 저장 시 예문 TTS(ElevenLabs + S3 업로드)를 동시에 실행하는 최대 개수
+    vocab_tts_max_concurrency: int = 4
+    # 운영용 엔드포인트(X-Admin-Key 헤더) 키; 설정하지 않으면 해당 엔드포인트는 모두 거부
+    admin_api_key: str | None = None
+    # 사용자별 통계 응답 캐시 TTL (0이면 비활성화); 이벤트 무효화 외 다른 프로세스 쓰기에 대한 상한
+    stats_cache_ttl_seconds: int = 600
+    # 재생 이벤트 수집(POST /playback/events); 켜면 학습 시간은 생성 시점 추정 대신 실제 청취 시간으로 기록
+    playback_ingest_enabled: bool = False
+    # write-behind 버퍼를 DB로 flush하는 주기와 버퍼 상한(넘으면 503)
+    playback_flush_interval_seconds: float = 2.0
+    playback_buffer_max_events: int = 50_000
+    # 이벤트를 재생 세션으로 집계하는 주기, 마지막 이벤트 이후 이 시간이 지나면 세션을 study_sessions에 기록
+    playback_aggregate_interval_seconds: float = 30.0
+    playback_session_idle_seconds: int = 1800
 
     class Config:
         env_file = ".env"
@@ -96,6 +123,84 @@ def apply_startup_migrations():
                 text("ALTER TABLE user_level_history ADD COLUMN sample_count INT NULL")
             )
 
+        # --- vocab_entries: (user, word, sentence hash) uniqueness for upsert saves ---
+        try:
+            vocab_columns = {column["name"] for column in inspector.get_columns("vocab_entries")}
+        except Exception:
+            vocab_columns = None
+        if vocab_columns is not None and "sentence_hash" not in vocab_columns:
+            conn.execute(text("ALTER TABLE vocab_entries ADD COLUMN sentence_hash VARCHAR(64) NOT NULL DEFAULT ''"))
+            conn.execute(text("UPDATE vocab_entries SET sentence_hash = SHA2(COALESCE(example_sentence, ''), 256)"))
+            # keep the oldest row of each duplicate group before enforcing uniqueness
+            conn.execute(
+                text(
+                    "DELETE newer FROM vocab_entries newer "
+                    "JOIN vocab_entries older ON newer.user_id = older.user_id "
+                    "AND newer.word = older.word AND newer.sentence_hash = older.sentence_hash "
+                    "AND newer.id > older.id"
+                )
+            )
+            conn.execute(
+                text(
+                    "ALTER TABLE vocab_entries ADD CONSTRAINT uq_vocab_entries_user_word_sentence "
+                    "UNIQUE (user_id, word, sentence_hash)"
+                )
+            )
+
+        # --- user_achievements: one row per (user, achievement) for INSERT IGNORE unlocks ---
+        try:
+            achievement_indexes = {index["name"] for index in inspector.get_indexes("user_achievements")}
+        except Exception:
+            achievement_indexes = None
+        if achievement_indexes is not None and "uq_user_achievements_user_code" not in achievement_indexes:
+            # keep the earliest unlock of each duplicate group before enforcing uniqueness
+            conn.execute(
+                text(
+                    "DELETE newer FROM user_achievements newer "
+                    "JOIN user_achievements older ON newer.user_id = older.user_id "
+                    "AND newer.achievement_code = older.achievement_code "
+                    "AND newer.id > older.id"
+                )
+            )
+            conn.execute(
+                text(
+                    "ALTER TABLE user_achievements ADD CONSTRAINT uq_user_achievements_user_code "
+                    "UNIQUE (user_id, achievement_code)"
+                )
+            )
+
+        # --- user_study_totals: longest streak counter ---
+        try:
+            totals_columns = {column["name"] for column in inspector.get_columns("user_study_totals")}
+        except Exception:
+            totals_columns = None
+        if totals_columns is not None and "longest_streak" not in totals_columns:
+            conn.execute(text("ALTER TABLE user_study_totals ADD COLUMN longest_streak INT NOT NULL DEFAULT 0"))
+            # 새 컬럼의 초기값; 정확한 값은 stats.backfill 재실행으로 채운다
+            conn.execute(text("UPDATE user_study_totals SET longest_streak = current_streak"))
+
+        # --- Secondary indexes added after the tables were first created ---
+        startup_indexes = {
+            "vocab_entries": {
+                "ix_vocab_entries_user_created": "(user_id, created_at, id)",
+                "ix_vocab_entries_user_word": "(user_id, word)",
+            },
+            "level_feedback_events": {
+                "ix_level_feedback_events_user_created": "(user_id, created_at)",
+            },
+            "study_sessions": {
+                "ix_study_sessions_user_started": "(user_id, started_at)",
+            },
+        }
+        for tbl, indexes in startup_indexes.items():
+            try:
+                existing = {index["name"] for index in inspector.get_indexes(tbl)}
+            except Exception:
+                continue
+            for index_name, columns in indexes.items():
+                if index_name not in existing:
+                    conn.execute(text(f"CREATE INDEX `{index_name}` ON `{tbl}` {columns}"))
+
         # --- Ensure FK constraints referencing users use ON DELETE CASCADE ---
         # For tables that reference users.id, alter the foreign key to cascade on delete.
         # This mimics the lightweight startup-migration approach used elsewhere.
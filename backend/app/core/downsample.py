@@ -0,0 +1,49 @@
+"""Time-series downsampling for charts.
+
+``lttb_indices`` implements Largest-Triangle-Three-Buckets (Steinarsson, 2013):
+the first and last points are kept and every bucket in between contributes the
+point forming the largest triangle with the previously selected point and the
+average of the next bucket. Peaks and trend changes survive, unlike plain
+striding or averaging.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """Indices of the ``threshold`` points LTTB keeps from the series (x, y).
+
+    ``x`` must be sorted ascending. When the series is already short enough, all
+    indices are returned.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.shape[0]
+    if threshold >= n or n <= 2:
+        return np.arange(n)
+    if threshold < 3:
+        raise ValueError("threshold must be at least 3")
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # 처음/마지막 점을 제외한 n-2개 점을 threshold-2개 버킷으로 나눈다
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64)
+    edges[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], (edges[i + 2] if i + 2 < edges.shape[0] else n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
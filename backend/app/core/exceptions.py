@@ -156,9 +156,29 @@ class InvalidAuthHeaderException(AppException):
         super().__init__(401, "INVALID_AUTH_HEADER", "Invalid authorization header")
 
 
+# admin
+class InvalidAdminKeyException(AppException):
+    def __init__(self):
+        super().__init__(403, "INVALID_ADMIN_KEY", "Admin key is missing or invalid.")
+
+
 # script vocabs
 class ScriptVocabsNotFoundException(AppException):
     def __init__(self):
         super().__init__(404, "SCRIPT_VOCABS_NOT_FOUND", "Contextual vocab data (script_vocabs) is not available for this content.")
 
 
+class VocabSaveConflictException(AppException):
+    def __init__(self):
+        super().__init__(409, "VOCAB_SAVE_CONFLICT", "The same words are being saved by another request. Please try again.")
+
+
+# playback
+class PlaybackIngestDisabledException(AppException):
+    def __init__(self):
+        super().__init__(503, "PLAYBACK_INGEST_DISABLED", "재생 이벤트 수집이 비활성화되어 있습니다.")
+
+
+class PlaybackBufferFullException(AppException):
+    def __init__(self):
+        super().__init__(503, "PLAYBACK_BUFFER_FULL", "재생 이벤트 버퍼가 가득 찼습니다. 잠시 후 다시 시도해주세요.")
@@ -1,29 +1,96 @@
+import time
+from typing import Optional
+
 from .strategy import LevelServiceStrategy
+from .shadow import ShadowEvaluator, snapshot_levels
 from ..logger import logger
 
 class LevelContext:
-    def __init__(self, strategy: LevelServiceStrategy):
+    def __init__(self, strategy: LevelServiceStrategy, shadow: Optional[ShadowEvaluator] = None):
         self.strategy = strategy
+        self.shadow = shadow
         logger.info(f"LevelContext initialized with strategy: {strategy.__class__.__name__}")
 
     def set_strategy(self, strategy: LevelServiceStrategy):
         logger.info(f"Changing strategy to: {strategy.__class__.__name__}")
         self.strategy = strategy
 
+    def set_shadow(self, shadow: Optional[ShadowEvaluator]):
+        """Enable (or disable with None) shadow evaluation of a secondary strategy."""
+        if shadow is not None:
+            logger.info(f"Shadow strategy: {shadow.name} (sample_rate={shadow.sample_rate})")
+        self.shadow = shadow
+
+    def _sample_shadow(self, method: str) -> Optional[ShadowEvaluator]:
+        return self.shadow if self.shadow is not None and self.shadow.should_sample(method) else None
+
+    def _submit_shadow(self, shadow, method: str, user, payload, result, started: float, levels_before):
+        # primary 응답이 만들어진 뒤 백그라운드에서 실행 (응답 지연 없음)
+        shadow.submit(
+            method,
+            user_id=user.id,
+            payload=payload,
+            primary_strategy=self.strategy.__class__.__name__,
+            primary_result=result,
+            primary_latency_ms=(time.perf_counter() - started) * 1000,
+            levels_before=levels_before,
+        )
+
+    def _evaluate_with_shadow(self, method: str, db, user, payload):
+        shadow = self._sample_shadow(method)
+        levels_before = snapshot_levels(user) if shadow else None
+
+        started = time.perf_counter()
+        result = getattr(self.strategy, method)(db, user, payload)
+
+        if shadow:
+            self._submit_shadow(shadow, method, user, payload, result, started, levels_before)
+        return result
+
+    async def _evaluate_with_shadow_async(self, method: str, db, user, payload):
+        # shadow 쪽은 동기 method 이름으로 기록/실행된다
+        shadow = self._sample_shadow(method)
+        levels_before = snapshot_levels(user) if shadow else None
+
+        started = time.perf_counter()
+        result = await getattr(self.strategy, f"{method}_async")(db, user, payload)
+
+        if shadow:
+            self._submit_shadow(shadow, method, user, payload, result, started, levels_before)
+        return result
+
     def evaluate_level_test(self, db, user, payload):
         logger.info(f"evaluate_level_test called for user_id={user.id}")
-        result = self.strategy.evaluate_level_test(db, user, payload)
+        result = self._evaluate_with_shadow("evaluate_level_test", db, user, payload)
         logger.info(f"evaluate_level_test completed for user_id={user.id}, result: {result}")
         return result
 
     def evaluate_session_feedback(self, db, user, payload):
         logger.info(f"evaluate_session_feedback called for user_id={user.id}, generated_content_id={payload.generated_content_id}")
-        result = self.strategy.evaluate_session_feedback(db, user, payload)
+        result = self._evaluate_with_shadow("evaluate_session_feedback", db, user, payload)
         logger.info(f"evaluate_session_feedback completed for user_id={user.id}")
         return result
 
+    async def evaluate_level_test_async(self, db, user, payload):
+        logger.info(f"evaluate_level_test_async called for user_id={user.id}")
+        result = await self._evaluate_with_shadow_async("evaluate_level_test", db, user, payload)
+        logger.info(f"evaluate_level_test_async completed for user_id={user.id}")
+        return result
+
+    async def evaluate_session_feedback_async(self, db, user, payload):
+        logger.info(f"evaluate_session_feedback_async called for user_id={user.id}")
+        result = await self._evaluate_with_shadow_async("evaluate_session_feedback", db, user, payload)
+        logger.info(f"evaluate_session_feedback_async completed for user_id={user.id}")
+        return result
+
+    def evaluate_session_feedback_batch(self, db, user, payloads):
+        logger.info(f"evaluate_session_feedback_batch called for user_id={user.id}, count={len(payloads)}")
+        result = self.strategy.evaluate_session_feedback_batch(db, user, payloads)
+        logger.info(f"evaluate_session_feedback_batch completed for user_id={user.id}")
+        return result
+
     def set_manual_level(self, db, user, payload):
         logger.info(f"set_manual_level called for user_id={user.id}, target_level={payload.level}")
         result = self.strategy.set_manual_level(db, user, payload)
         logger.info(f"set_manual_level completed for user_id={user.id}")
-        return result
\ No newline at end of file
+        return result
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy.sql import func
+
+from ..config import Base
+
+
+class LevelShadowComparison(Base):
+    """One sampled request evaluated by both the primary and the shadow strategy.
+
+    ``shadow_result`` comes from a rolled-back transaction: it is what the shadow
+    strategy *would* have returned, nothing it wrote was kept.
+    """
+
+    __tablename__ = "level_shadow_comparisons"
+    __table_args__ = (
+        Index("ix_level_shadow_comparisons_method_created", "method", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    method = Column(String(64), nullable=False)  # evaluate_session_feedback 등 LevelContext 메서드명
+    primary_strategy = Column(String(64), nullable=False)
+    shadow_strategy = Column(String(64), nullable=False)
+    levels_before = Column(JSON, nullable=True)
+    primary_result = Column(JSON, nullable=True)
+    shadow_result = Column(JSON, nullable=True)
+    shadow_error = Column(Text, nullable=True)
+    primary_latency_ms = Column(Float, nullable=False)
+    shadow_latency_ms = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
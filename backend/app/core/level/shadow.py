@@ -0,0 +1,187 @@
+"""Shadow evaluation for LevelContext.
+
+On a sampled fraction of requests a secondary ("shadow") strategy is run after
+the primary strategy has produced the response. The shadow runs in the
+background task supervisor, off the request path, inside a database
+transaction that is always rolled back, so it can never change user levels.
+Both outcomes and their latencies are stored in ``level_shadow_comparisons``.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from ..logger import logger
+from ..tasks import task_supervisor
+from .models import LevelShadowComparison
+from .strategy import LevelServiceStrategy
+
+# 레벨을 *계산*하는 메서드만 비교한다 (set_manual_level은 결과가 입력과 같음)
+SHADOW_METHODS = ("evaluate_level_test", "evaluate_session_feedback")
+SHADOW_TIMEOUT_SECONDS = 120.0
+
+PayloadAdapter = Callable[[Any], Optional[Any]]
+
+_LEVEL_ATTRIBUTES = ("lexical_level", "syntactic_level", "speed_level", "level", "level_score")
+
+
+def snapshot_levels(user) -> Dict[str, Any]:
+    """JSON-safe copy of the user's level fields before the primary strategy runs."""
+    snapshot: Dict[str, Any] = {}
+    for name in _LEVEL_ATTRIBUTES:
+        value = getattr(user, name, None)
+        if isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, (int, float, Decimal)):
+            snapshot[name] = float(value)
+        elif isinstance(value, str):
+            snapshot[name] = value
+    return snapshot
+
+
+@contextmanager
+def rollback_only_session(bind) -> Iterator[Session]:
+    """Session whose commits are never persisted: the outer transaction is always rolled back."""
+    connection = bind.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="rollback_only", autoflush=False)
+    try:
+        yield session
+    finally:
+        session.close()
+        if transaction.is_active:
+            transaction.rollback()
+        connection.close()
+
+
+class ShadowEvaluator:
+    """Runs ``strategy`` as a shadow of the primary strategy on sampled requests.
+
+    ``adapters`` maps a method name to a function converting the primary payload
+    into the shadow strategy's payload (return None to skip the request), for
+    strategies whose request schemas differ.
+    """
+
+    def __init__(
+        self,
+        strategy: LevelServiceStrategy,
+        *,
+        sample_rate: float,
+        adapters: Optional[Dict[str, PayloadAdapter]] = None,
+        bind=None,
+    ):
+        self.strategy = strategy
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self._adapters = adapters or {}
+        self._bind = bind
+
+    @property
+    def name(self) -> str:
+        return self.strategy.__class__.__name__
+
+    def _get_bind(self):
+        if self._bind is None:
+            from ..config import engine
+
+            self._bind = engine
+        return self._bind
+
+    def should_sample(self, method: str) -> bool:
+        return method in SHADOW_METHODS and self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def submit(
+        self,
+        method: str,
+        *,
+        user_id: int,
+        payload: Any,
+        primary_strategy: str,
+        primary_result: Any,
+        primary_latency_ms: float,
+        levels_before: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Queue the shadow run in the background; never raises."""
+        try:
+            adapter = self._adapters.get(method)
+            shadow_payload = adapter(payload) if adapter else payload
+            if shadow_payload is None:
+                return False
+            primary_json = jsonable_encoder(primary_result)
+        except Exception as e:
+            logger.warning(f"[level-shadow] skipped {method} for user_id={user_id}: {e}")
+            return False
+
+        def run_in_thread():
+            return asyncio.to_thread(
+                self.run,
+                method,
+                user_id=user_id,
+                payload=shadow_payload,
+                primary_strategy=primary_strategy,
+                primary_result=primary_json,
+                primary_latency_ms=primary_latency_ms,
+                levels_before=levels_before,
+            )
+
+        return task_supervisor.submit(
+            f"level_shadow:{method}:{user_id}:{uuid.uuid4().hex}",
+            run_in_thread,
+            name="level_shadow",
+            timeout=SHADOW_TIMEOUT_SECONDS,
+            retries=0,
+        )
+
+    def run(
+        self,
+        method: str,
+        *,
+        user_id: int,
+        payload: Any,
+        primary_strategy: str,
+        primary_result: Any,
+        primary_latency_ms: float,
+        levels_before: Optional[Dict[str, Any]] = None,
+    ) -> Optional[int]:
+        """Evaluate the shadow strategy and store the comparison row; returns its id."""
+        from ...modules.users.models import User
+
+        bind = self._get_bind()
+        shadow_result = None
+        error = None
+        started = time.perf_counter()
+        try:
+            with rollback_only_session(bind) as session:
+                user = session.get(User, user_id)
+                if user is None:
+                    raise LookupError(f"user {user_id} not found")
+                shadow_result = jsonable_encoder(getattr(self.strategy, method)(session, user, payload))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.warning(f"[level-shadow] {self.name}.{method} failed for user_id={user_id}: {error}")
+        shadow_latency_ms = (time.perf_counter() - started) * 1000
+
+        with Session(bind=bind) as session:
+            row = LevelShadowComparison(
+                user_id=user_id,
+                method=method,
+                primary_strategy=primary_strategy,
+                shadow_strategy=self.name,
+                levels_before=levels_before,
+                primary_result=primary_result,
+                shadow_result=shadow_result,
+                shadow_error=error[:2000] if error else None,
+                primary_latency_ms=round(primary_latency_ms, 2),
+                shadow_latency_ms=round(shadow_latency_ms, 2),
+            )
+            session.add(row)
+            session.commit()
+            return row.id
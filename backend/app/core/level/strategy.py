@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
 
+from fastapi.concurrency import run_in_threadpool
+
+_LEVEL_FIELDS = ("lexical_level", "syntactic_level", "speed_level")
+
+
 class LevelServiceStrategy(ABC):
 
     @abstractmethod
@@ -12,4 +17,21 @@ class LevelServiceStrategy(ABC):
 
     @abstractmethod
     def set_manual_level(self, db, user, payload):
-        pass
\ No newline at end of file
+        pass
+
+    # 기본 구현: 피드백을 순서대로 하나씩 반영하고 SessionFeedbackBatchResponse 형태로 합친다
+    # (레벨은 마지막 결과, delta는 합산; 한 트랜잭션으로 반영할 수 있는 전략은 override)
+    def evaluate_session_feedback_batch(self, db, user, payloads):
+        results = [self.evaluate_session_feedback(db, user, payload) for payload in payloads]
+        batch = {"applied_count": len(results)}
+        for field in _LEVEL_FIELDS:
+            batch[field] = results[-1][field] if results else getattr(user, field)
+            batch[f"{field}_delta"] = round(sum(result[f"{field}_delta"] for result in results), 4)
+        return batch
+
+    # async 엔드포인트용: 기본 구현은 동기 메서드를 threadpool에서 실행한다
+    async def evaluate_level_test_async(self, db, user, payload):
+        return await run_in_threadpool(self.evaluate_level_test, db, user, payload)
+
+    async def evaluate_session_feedback_async(self, db, user, payload):
+        return await run_in_threadpool(self.evaluate_session_feedback, db, user, payload)
@@ -0,0 +1,130 @@
+"""CEFR lexical profiling of English text.
+
+The distribution is computed over *content words only*, matching the
+methodology used by the script-generation prompt (function words are excluded
+from the difficulty profile). The built-in wordlist is a small seed built from
+the prompt's calibration examples; point ``settings.cefr_wordlist_path`` at a
+``word<TAB>level`` file to use a full list.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+from .config import settings
+from .logger import logger
+
+CEFR_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+UNKNOWN_LEVEL = "unknown"
+
+FUNCTION_WORDS = frozenset(
+    """
+    a an the this that these those
+    i me my mine myself you your yours yourself yourselves he him his himself she her hers herself
+    it its itself we us our ours ourselves they them their theirs themselves
+    who whom whose which what
+    am is are was were be been being do does did done have has had having
+    will would shall should can could may might must
+    and or but nor so yet for if because although though while whereas unless until since
+    as than that whether
+    in on at by to from of with without about above below under over into onto upon
+    through during before after between among against around across along toward towards
+    there here not no
+    i'm you're he's she's it's we're they're i've you've we've they've i'll you'll he'll she'll we'll they'll
+    i'd you'd he'd she'd we'd they'd isn't aren't wasn't weren't don't doesn't didn't
+    haven't hasn't hadn't won't wouldn't can't couldn't shouldn't mustn't let's that's there's
+    """.split()
+)
+
+# 프롬프트의 LEXICAL CALIBRATION 예시 단어로 만든 seed wordlist (단일 단어만)
+_SEED_WORDLIST: Dict[str, str] = {
+    "A1": """play bicycle poor news pizza cream shopping five cover reporter card picture excited judge
+        science snow more street button buy well case mouth glass late black happy wednesday hotel grass
+        outside umbrella history spot thursday cold taxi""",
+    "A2": """difficulty pal trust mosque frightening competition appearance scale angel claim cross ruin
+        search fantastic normal fence talent high exhibition north fault appreciate superlative mysterious
+        shampoo possible few hey entertainment view pride spaceship journey grandson clerk aged""",
+    "B1": """timely laughter interact weakness forehead refusal nutritious dump historian strain board
+        sunrise compose stream tragic net complete currently unexpected toothpaste nervousness anyhow
+        facility monitor substitute direct twist southeast analysis tremendous publisher adviser advisor jug
+        continuous remainder transport roadside experience incredible""",
+    "B2": """faint reinforce fatal fine upgrade elemental flash inch gently tolerant royalty weakly grim
+        sufficiently observer conductor innovation remaining cherry imperative lest transitive editorial
+        exclusion nervously soliloquy win disappearance trivial retard bumper hyphen cuff cubism cascade
+        disrupt inspector""",
+    "C1": """rudimentary facilitation vegetation preacher detriment blankness reenact sacrifice inexplicable
+        prolific contextual aimlessly dither conditionally revere render bribery premise fanatic provocative
+        prophet exuberant insensitively carrier isolated formulate overdraft pertinent somersault quirky
+        jersey rustle anthropology dismay violet absolute commercially stoke commission maneuver manoeuvre""",
+    "C2": """kinetically philanthropic angsty facsimile colloquium flit agility infernally extant wistful
+        posterity ferocity ingrate circuit thicket consternation enabler maelstrom testimonial daunt
+        stringently avian adversely blurb diffuse annex drudgery formidably solitariness tetchy reverb
+        salivary tactic incipient hazard incumbent lassitude extracurricular""",
+}
+
+_WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+_SUFFIXES = ("ies", "es", "s", "ed", "ing", "ly")
+
+
+def _seed_wordlist() -> Dict[str, str]:
+    wordlist: Dict[str, str] = {}
+    for level in CEFR_LEVELS:
+        for word in _SEED_WORDLIST[level].split():
+            wordlist.setdefault(word, level)
+    return wordlist
+
+
+def _load_wordlist_file(path: str) -> Dict[str, str]:
+    wordlist: Dict[str, str] = {}
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            parts = line.strip().split("\t")
+            if len(parts) >= 2 and parts[1].upper() in CEFR_LEVELS:
+                wordlist.setdefault(parts[0].lower(), parts[1].upper())
+    return wordlist
+
+
+@lru_cache(maxsize=1)
+def get_wordlist() -> Dict[str, str]:
+    """word -> CEFR level, loaded once per process."""
+    path = settings.cefr_wordlist_path
+    if path:
+        try:
+            return _load_wordlist_file(path)
+        except OSError as e:
+            logger.warning(f"[lexical] failed to load CEFR wordlist '{path}': {e}; using seed list")
+    return _seed_wordlist()
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased English word tokens (contractions kept whole)."""
+    if not isinstance(text, str):
+        return []
+    return [token.lower() for token in _WORD_RE.findall(text)]
+
+
+def lookup_level(word: str, wordlist: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """CEFR level of ``word``, trying a few inflectional suffixes before giving up."""
+    wordlist = get_wordlist() if wordlist is None else wordlist
+    level = wordlist.get(word)
+    if level:
+        return level
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            stem = word[: -len(suffix)]
+            level = wordlist.get(stem) or wordlist.get(stem + "e") or (suffix == "ies" and wordlist.get(stem + "y"))
+            if level:
+                return level
+    return None
+
+
+def cefr_distribution(tokens: Iterable[str]) -> Dict[str, int]:
+    """Count content-word tokens per CEFR level (unlisted words go to ``unknown``)."""
+    wordlist = get_wordlist()
+    counts = {level: 0 for level in (*CEFR_LEVELS, UNKNOWN_LEVEL)}
+    for token in tokens:
+        if token in FUNCTION_WORDS:
+            continue
+        counts[lookup_level(token, wordlist) or UNKNOWN_LEVEL] += 1
+    return counts
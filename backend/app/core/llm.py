@@ -1,21 +1,45 @@
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Dict, Optional
 
 import yaml
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 from .config import settings
+from .logger import logger
 
 
 class LLMServiceError(RuntimeError):
     """Raised when the LLM call fails or returns malformed data."""
 
 
+class LLMCircuitOpenError(LLMServiceError):
+    """Raised without calling the provider while the circuit breaker is open."""
+
+
+class LLMDeadlineExceededError(LLMServiceError):
+    """Raised when retries could not finish within the request deadline."""
+
+
+# 일시적 장애로 보고 재시도하는 예외 (그 외 4xx 등은 바로 실패)
+_RETRYABLE_ERRORS = (APITimeoutError, APIConnectionError, RateLimitError, InternalServerError, asyncio.TimeoutError)
+
+
 @dataclass(frozen=True)
 class PromptTemplate:
     system: str
@@ -87,3 +111,261 @@ class OpenAILLMClient:
                 else:
                     break
         raise LLMServiceError("OpenAI completion failed.") from last_error
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half_open -> closed).
+
+    After ``failure_threshold`` consecutive failures calls are rejected for
+    ``reset_timeout_seconds``; then a single trial call is let through and its
+    outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Give back a half-open trial that ended without a provider outcome.
+
+        Used when the trial call was cancelled or failed on our side (a
+        non-retryable error), so the next request can run the trial instead
+        of the circuit staying half-open with no call allowed.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"[llm] circuit opened after {self._consecutive_failures} consecutive failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {"state": self._current_state(), "consecutive_failures": self._consecutive_failures}
+
+
+class LLMClientMetrics:
+    """Counters plus latency percentiles over the most recent calls."""
+
+    def __init__(self, window: int = 500):
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._counters: Dict[str, int] = {
+            "requests": 0,
+            "successes": 0,
+            "failures": 0,
+            "retries": 0,
+            "short_circuited": 0,
+            "deadline_exceeded": 0,
+        }
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counters = dict(self._counters)
+
+        def percentile(q: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3)
+
+        return {
+            **counters,
+            "latency_seconds": {"p50": percentile(0.5), "p95": percentile(0.95), "max": percentile(1.0)},
+        }
+
+
+class AsyncOpenAILLMClient:
+    """Non-blocking variant of ``OpenAILLMClient`` for async endpoints.
+
+    - exponential backoff with full jitter between attempts
+    - an overall deadline per ``generate_json`` call (attempt timeouts shrink to fit)
+    - a shared circuit breaker that fails fast with ``LLMCircuitOpenError`` so
+      callers drop to their fallback immediately while the provider is down
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        attempt_timeout_seconds: float = 15.0,
+        deadline_seconds: float = 25.0,
+        backoff_base_seconds: float = 0.3,
+        backoff_max_seconds: float = 4.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        resolved_key = api_key or settings.openai_api_key
+        if not resolved_key:
+            raise LLMServiceError("OpenAI API key is not configured.")
+        client_kwargs = {"api_key": resolved_key, "max_retries": 0}
+        if base_url or settings.openai_base_url:
+            client_kwargs["base_url"] = base_url or settings.openai_base_url
+        self._client = AsyncOpenAI(**client_kwargs)
+        self._attempt_timeout = attempt_timeout_seconds
+        self._deadline = deadline_seconds
+        self._backoff_base = backoff_base_seconds
+        self._backoff_max = backoff_max_seconds
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = LLMClientMetrics()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * (2 ** (attempt - 1))))
+
+    async def _complete(self, *, model, system_prompt, user_prompt, temperature, timeout) -> str:
+        completion = await self._client.chat.completions.create(
+            model=model,
+            temperature=temperature,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            timeout=timeout,
+        )
+        choice = completion.choices[0] if completion.choices else None
+        content = choice.message.content if choice else None
+        if not content:
+            raise LLMServiceError("LLM returned an empty response.")
+        return content
+
+    async def generate_json(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_retries: int = 3,
+        deadline_seconds: Optional[float] = None,
+    ) -> str:
+        self.metrics.incr("requests")
+        deadline = time.monotonic() + (deadline_seconds or self._deadline)
+        last_error: Optional[Exception] = None
+        out_of_time = False
+
+        for attempt in range(1, max_retries + 1):
+            if not self.breaker.allow_request():
+                self.metrics.incr("short_circuited")
+                raise LLMCircuitOpenError("LLM circuit breaker is open.") from last_error
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                out_of_time = True
+                break
+            started = time.monotonic()
+            try:
+                content = await asyncio.wait_for(
+                    self._complete(
+                        model=model,
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=temperature,
+                        timeout=min(self._attempt_timeout, remaining),
+                    ),
+                    timeout=remaining,
+                )
+            except Exception as exc:  # noqa: BLE001
+                self.metrics.observe(time.monotonic() - started)
+                last_error = exc
+                retryable = isinstance(exc, _RETRYABLE_ERRORS) or isinstance(exc, LLMServiceError)
+                # 제공자 장애(재시도 대상)만 breaker 실패로 센다; 4xx 등은 trial만 반납
+                if retryable:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.release_trial()
+                if not retryable or attempt == max_retries:
+                    break
+                delay = self._backoff_delay(attempt)
+                if time.monotonic() + delay >= deadline:
+                    out_of_time = True
+                    break
+                self.metrics.incr("retries")
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # 취소(CancelledError) 등으로 결과 없이 끝난 호출: half-open trial을 반납하고 그대로 전파
+                self.breaker.release_trial()
+                raise
+
+            self.metrics.observe(time.monotonic() - started)
+            self.breaker.record_success()
+            self.metrics.incr("successes")
+            return content
+
+        self.metrics.incr("failures")
+        if out_of_time or isinstance(last_error, asyncio.TimeoutError):
+            self.metrics.incr("deadline_exceeded")
+            raise LLMDeadlineExceededError("OpenAI completion did not finish before the deadline.") from last_error
+        raise LLMServiceError("OpenAI completion failed.") from last_error
+
+    def stats(self) -> Dict[str, object]:
+        return {"circuit": self.breaker.snapshot(), **self.metrics.snapshot()}
+
+
+_async_client: Optional[AsyncOpenAILLMClient] = None
+_async_client_lock = threading.Lock()
+
+
+def get_async_llm_client() -> AsyncOpenAILLMClient:
+    """Process-wide async client, so the circuit breaker and metrics are shared."""
+    global _async_client
+    with _async_client_lock:
+        if _async_client is None:
+            _async_client = AsyncOpenAILLMClient()
+        return _async_client
+
+
+def async_llm_client_stats() -> Dict[str, object]:
+    """Stats of the shared async client ({} until it has been created)."""
+    return _async_client.stats() if _async_client is not None else {}
@@ -0,0 +1,134 @@
+"""Order-statistic index over non-negative integer scores.
+
+Leaderboard scores (weekly minutes, streak days) are small integers, so a
+Fenwick tree indexed by score value counts members per score and answers
+"how many score higher" and "which score is k-th" in O(log S), S being the
+largest score seen (the tree doubles when a bigger score arrives). Members
+with the same score share a bucket kept sorted by member id, which is the
+tie-break for ``top``. Ranks are competition ranks (1, 2, 2, 4).
+
+Members with a score of 0 are not stored. Not thread-safe; callers lock.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+_DEFAULT_CAPACITY = 1024
+
+
+class RankIndex:
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY):
+        self._size = 1
+        while self._size < capacity:
+            self._size <<= 1
+        # _tree[i]: Fenwick 노드 (1-based, 인덱스 = 점수)
+        self._tree: List[int] = [0] * (self._size + 1)
+        self._scores: Dict[int, int] = {}
+        self._buckets: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, member: object) -> bool:
+        return member in self._scores
+
+    def score(self, member: int) -> Optional[int]:
+        return self._scores.get(member)
+
+    # ------------------------------------------------------------------ updates
+    def update(self, member: int, score: int) -> None:
+        """Set ``member``'s score (0 or less removes it)."""
+        score = int(score)
+        previous = self._scores.get(member)
+        if previous == score:
+            return
+        if previous is not None:
+            self._detach(member, previous)
+        if score <= 0:
+            return
+        if score > self._size:
+            self._grow(score)
+        self._scores[member] = score
+        insort(self._buckets.setdefault(score, []), member)
+        self._add(score, 1)
+
+    def remove(self, member: int) -> bool:
+        previous = self._scores.get(member)
+        if previous is None:
+            return False
+        self._detach(member, previous)
+        return True
+
+    def _detach(self, member: int, score: int) -> None:
+        del self._scores[member]
+        bucket = self._buckets[score]
+        del bucket[bisect_left(bucket, member)]
+        if not bucket:
+            del self._buckets[score]
+        self._add(score, -1)
+
+    # ------------------------------------------------------------------ queries
+    def count_above(self, score: int) -> int:
+        """Number of members with a strictly higher score."""
+        if score <= 0:
+            return len(self._scores)
+        if score >= self._size:
+            return 0
+        return len(self._scores) - self._prefix(score)
+
+    def rank(self, member: int) -> Optional[int]:
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        return self.count_above(score) + 1
+
+    def top(self, k: int) -> List[Tuple[int, int]]:
+        """(member, score) of the ``k`` highest scores, ties by member id."""
+        result: List[Tuple[int, int]] = []
+        total = len(self._scores)
+        position = 1  # 내림차순 위치 (1 = 최고점)
+        while len(result) < k and position <= total:
+            score = self._kth_smallest(total - position + 1)
+            bucket = self._buckets[score]
+            result.extend((member, score) for member in bucket[: k - len(result)])
+            position += len(bucket)
+        return result
+
+    # ------------------------------------------------------------------ Fenwick tree
+    def _add(self, index: int, delta: int) -> None:
+        while index <= self._size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def _prefix(self, index: int) -> int:
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def _kth_smallest(self, k: int) -> int:
+        """Smallest score whose prefix count reaches ``k`` (binary descent)."""
+        position = 0
+        step = self._size
+        while step:
+            nxt = position + step
+            if nxt <= self._size and self._tree[nxt] < k:
+                position = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return position + 1
+
+    def _grow(self, score: int) -> None:
+        while self._size < score:
+            self._size <<= 1
+        # 버킷 크기로 O(S) 재구성
+        tree = [0] * (self._size + 1)
+        for bucket_score, bucket in self._buckets.items():
+            tree[bucket_score] = len(bucket)
+        for index in range(1, self._size + 1):
+            parent = index + (index & -index)
+            if parent <= self._size:
+                tree[parent] += tree[index]
+        self._tree = tree
@@ -35,6 +35,11 @@ def generate_example_audio_key(ext: str = "mp3") -> str:
     return key
 
 
+def s3_url_prefix() -> str:
+    """Public URL prefix of the objects uploaded by upload_audio_to_s3."""
+    return f"https://{AWS_S3_BUCKET}.s3.{AWS_REGION}.amazonaws.com/"
+
+
 def upload_audio_to_s3(audio_bytes: bytes, key: str) -> str:
     s3_client.upload_fileobj(
         io.BytesIO(audio_bytes),
@@ -42,4 +47,15 @@ def upload_audio_to_s3(audio_bytes: bytes, key: str) -> str:
         key,
         ExtraArgs={"ContentType": "audio/mpeg"},
     )
-    return f"https://{AWS_S3_BUCKET}.s3.{AWS_REGION}.amazonaws.com/{key}"
\ No newline at end of file
+    return f"{s3_url_prefix()}{key}"
+
+
+def delete_audio_from_s3(urls) -> None:
+    """Delete objects uploaded by upload_audio_to_s3; URLs of other hosts are ignored."""
+    prefix = s3_url_prefix()
+    keys = [url[len(prefix):] for url in urls if isinstance(url, str) and url.startswith(prefix)]
+    if keys:
+        s3_client.delete_objects(
+            Bucket=AWS_S3_BUCKET,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
\ No newline at end of file
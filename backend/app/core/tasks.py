@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from .logger import logger
+
+TaskFactory = Callable[[], Awaitable[Any]]
+
+
+class _NoTimeout:
+    def __repr__(self) -> str:
+        return "NO_TIMEOUT"
+
+
+# submit(timeout=NO_TIMEOUT): 앱 수명 동안 도는 루프처럼 시간 제한 없이 실행
+# (timeout=None은 default_timeout을 뜻한다)
+NO_TIMEOUT = _NoTimeout()
+
+
+@dataclass
+class _TaskTimings:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+
+    def as_dict(self) -> Dict[str, float]:
+        average = self.total_seconds / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "avg_seconds": round(average, 3),
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+@dataclass
+class _TaskSpec:
+    key: str
+    name: str
+    factory: TaskFactory
+    timeout: Optional[float]
+    retries: int
+
+
+class TaskSupervisor:
+    """Runs fire-and-forget coroutines with strong references and bookkeeping.
+
+    Every task is registered under a de-duplication key (e.g. ``contextual_vocab:42``);
+    submitting a key that is already queued or running is a no-op. Tasks share a
+    concurrency limit, get a per-attempt timeout and are retried with exponential
+    backoff. ``submit`` can be called from the event loop or from the sync endpoint
+    threadpool once ``start`` has bound the supervisor to the running loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 8,
+        default_timeout: Optional[float] = 300.0,
+        default_retries: int = 0,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 30.0,
+    ):
+        self._max_concurrency = max_concurrency
+        self._default_timeout = default_timeout
+        self._default_retries = default_retries
+        self._backoff_base = backoff_base_seconds
+        self._backoff_max = backoff_max_seconds
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._reserved: set[str] = set()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._closing = False
+
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._timings: Dict[str, _TaskTimings] = defaultdict(_TaskTimings)
+
+    # ------------------------------------------------------------------ lifecycle
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Bind the supervisor to the application event loop (called from lifespan)."""
+        self._loop = loop or asyncio.get_running_loop()
+        self._semaphore = None
+        self._closing = False
+
+    async def drain(self, timeout: float = 30.0) -> None:
+        """Stop accepting work and wait for in-flight tasks; cancel what is left."""
+        self._closing = True
+        pending = [task for task in list(self._tasks.values()) if not task.done()]
+        if not pending:
+            return
+
+        logger.info(f"[tasks] draining {len(pending)} background task(s)...")
+        _, still_running = await asyncio.wait(pending, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            logger.warning(f"[tasks] cancelled {len(still_running)} task(s) still running after {timeout:.0f}s")
+            await asyncio.gather(*still_running, return_exceptions=True)
+
+    # ------------------------------------------------------------------ submission
+    def submit(
+        self,
+        key: str,
+        factory: TaskFactory,
+        *,
+        name: Optional[str] = None,
+        timeout: Union[float, None, _NoTimeout] = None,
+        retries: Optional[int] = None,
+    ) -> bool:
+        """Schedule ``factory()`` under ``key``.
+
+        Returns False when the key is already queued/running or the supervisor is
+        shutting down. ``factory`` is called once per attempt so retries get a
+        fresh coroutine. ``timeout=None`` uses ``default_timeout``; pass
+        ``NO_TIMEOUT`` for long-running loops.
+        """
+        if timeout is NO_TIMEOUT:
+            resolved_timeout = None
+        else:
+            resolved_timeout = self._default_timeout if timeout is None else timeout
+        spec = _TaskSpec(
+            key=key,
+            name=name or key.split(":", 1)[0],
+            factory=factory,
+            timeout=resolved_timeout,
+            retries=self._default_retries if retries is None else retries,
+        )
+
+        with self._lock:
+            if self._closing:
+                self._counters["rejected"] += 1
+                logger.warning(f"[tasks] rejected '{key}': supervisor is shutting down")
+                return False
+            if key in self._reserved:
+                self._counters["deduplicated"] += 1
+                logger.warning(f"[tasks] skipping duplicate task '{key}'")
+                return False
+            self._reserved.add(key)
+            self._counters["submitted"] += 1
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is not None:
+            self._spawn(spec)
+        elif self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._spawn, spec)
+        else:
+            with self._lock:
+                self._reserved.discard(key)
+                self._counters["rejected"] += 1
+            logger.warning(f"[tasks] rejected '{key}': no running event loop")
+            return False
+        return True
+
+    def is_active(self, key: str) -> bool:
+        with self._lock:
+            return key in self._reserved
+
+    def _spawn(self, spec: _TaskSpec) -> None:
+        task = asyncio.get_running_loop().create_task(self._run(spec), name=spec.key)
+        self._tasks[spec.key] = task
+        task.add_done_callback(lambda _: self._release(spec.key))
+
+    def _release(self, key: str) -> None:
+        self._tasks.pop(key, None)
+        with self._lock:
+            self._reserved.discard(key)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = min(self._backoff_max, self._backoff_base * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _run(self, spec: _TaskSpec) -> None:
+        async with self._get_semaphore():
+            started = time.monotonic()
+            self._counters["running"] += 1
+            outcome = "failed"
+            try:
+                for attempt in range(1, spec.retries + 2):
+                    try:
+                        await asyncio.wait_for(spec.factory(), spec.timeout)
+                        outcome = "succeeded"
+                        break
+                    except asyncio.TimeoutError:
+                        outcome = "timed_out"
+                        logger.warning(f"[tasks] '{spec.key}' timed out after {spec.timeout}s (attempt {attempt})")
+                    except Exception as exc:  # noqa: BLE001
+                        outcome = "failed"
+                        logger.warning(f"[tasks] '{spec.key}' failed (attempt {attempt}): {exc}")
+
+                    if attempt <= spec.retries:
+                        self._counters["retried"] += 1
+                        await asyncio.sleep(self._backoff_delay(attempt))
+                    else:
+                        break
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                raise
+            finally:
+                elapsed = time.monotonic() - started
+                self._counters["running"] -= 1
+                self._counters[outcome] += 1
+                self._timings[spec.name].record(elapsed)
+                logger.info(f"[tasks] '{spec.key}' {outcome} in {elapsed:.2f}s")
+
+    # ------------------------------------------------------------------ metrics
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            queued_or_running = len(self._reserved)
+        return {
+            "active": queued_or_running,
+            "running": self._counters["running"],
+            "counters": {
+                key: value
+                for key, value in self._counters.items()
+                if key != "running"
+            },
+            "durations": {name: timing.as_dict() for name, timing in self._timings.items()},
+        }
+
+
+task_supervisor = TaskSupervisor()
@@ -1,4 +1,6 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .modules.auth.endpoints import router as auth_router
 from .modules.users.endpoints import router as users_router
@@ -8,10 +10,40 @@ from .modules.level_management.endpoints import router as level_management_route
 from .modules.stats.endpoints import router as stats_router
 from .modules.vocab.endpoints import router as vocab_router
 from .modules.level_system.endpoints import router as level_system_router
+from .modules.playback.endpoints import router as playback_router
 from .core.config import engine, Base
 from .core.config import engine, Base, apply_startup_migrations
+from .core.auth import verify_admin_key
 from .core.exceptions import register_exception_handlers
-app = FastAPI(title="LingoFit")
+from .core.llm import async_llm_client_stats
+from .core.tasks import task_supervisor
+from .modules.level_system.service import load_weight_config
+from .modules.level_management.evaluation_cache import schedule_purge as purge_level_eval_cache
+from .modules.level_management.script_catalog import load_catalog_at_startup as load_level_test_scripts
+from .modules.level_management.service import fail_stale_evaluation_jobs_at_startup as fail_stale_level_eval_jobs
+from .modules.stats.service import load_achievement_definitions_at_startup as load_achievement_definitions
+from .modules.stats.service import load_leaderboards_at_startup as load_leaderboards
+from .modules.playback import service as playback_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    task_supervisor.start()
+    load_weight_config()
+    load_level_test_scripts()
+    fail_stale_level_eval_jobs()
+    load_achievement_definitions()
+    load_leaderboards()
+    purge_level_eval_cache()
+    playback_service.start_pipeline()
+    yield
+    # 재생 이벤트 루프는 마지막 flush + 집계 후 종료 (drain에서 대기)
+    playback_service.stop_pipeline()
+    # 진행 중인 백그라운드 작업(contextual vocab 등)을 마무리한 뒤 종료
+    await task_supervisor.drain()
+
+
+app = FastAPI(title="LingoFit", lifespan=lifespan)
 
 # CORS 설정 추가
 app.add_middleware(
@@ -20,6 +52,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # 테이블 생성
@@ -37,9 +70,28 @@ app.include_router(level_management_router, prefix = "/api/v1")
 app.include_router(stats_router, prefix = "/api/v1")
 app.include_router(vocab_router, prefix = "/api/v1")
 app.include_router(level_system_router, prefix = "/api/v1")
+app.include_router(playback_router, prefix = "/api/v1")
 
 
 
 @app.get("/")
 def read_root():
     return {"message": "Hello World"}
+
+
+@app.get("/health/tasks", dependencies=[Depends(verify_admin_key)])
+def read_task_stats():
+    """Background task supervisor counters and durations."""
+    return task_supervisor.stats()
+
+
+@app.get("/health/playback", dependencies=[Depends(verify_admin_key)])
+def read_playback_stats():
+    """Playback-event buffer and aggregator counters."""
+    return playback_service.pipeline.stats()
+
+
+@app.get("/health/llm", dependencies=[Depends(verify_admin_key)])
+def read_llm_stats():
+    """Async LLM client circuit-breaker state, counters and latency percentiles."""
+    return async_llm_client_stats()
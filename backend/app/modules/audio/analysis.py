@@ -0,0 +1,75 @@
+from typing import Any, Dict, List, Optional
+
+from ...core.lexical import cefr_distribution, tokenize
+
+
+def split_script_sentences(script: str) -> List[str]:
+    """
+    Split the generated script (already newline-separated by GPT)
+    into a clean list of sentences.
+    Empty lines and stray whitespace are removed.
+    """
+    if not isinstance(script, str):
+        return []
+    return [s.strip() for s in script.split("\n") if s.strip()]
+
+
+def compute_audio_duration_seconds_from_sentences(sentences: list[dict]) -> float:
+    """Compute approximate audio duration in seconds from sentence timestamp info.
+
+    The function looks for common timestamp keys in each sentence dict in this
+    order: 'end', 'end_time', 'end_time_seconds', 'start_time', 'start'. It uses
+    the maximum value found as the audio length. Returns 0.0 if nothing found.
+    """
+    if not sentences:
+        return 0.0
+
+    candidates = []
+    keys = ("end", "end_time", "end_time_seconds", "start_time", "start")
+    for s in sentences:
+        for k in keys:
+            v = s.get(k)
+            if v is None:
+                continue
+            try:
+                fv = float(v)
+            except Exception:
+                continue
+            candidates.append(fv)
+
+    return max(candidates) if candidates else 0.0
+
+
+def compute_alignment_duration_seconds(alignment: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Exact audio length: the end time of the last aligned character."""
+    if not alignment:
+        return None
+    ends = alignment.get("character_end_times_seconds") or []
+    return float(max(ends)) if ends else None
+
+
+def analyze_content(script: str, duration_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Compute the content_analysis row for a generated script.
+
+    ``word_count`` uses whitespace tokens (the definition the level system's
+    lookup/save thresholds were tuned on); the CEFR distribution counts content
+    words only.
+    """
+    sentences = split_script_sentences(script)
+    word_count = sum(len(sentence.split()) for sentence in sentences)
+    distribution = cefr_distribution(token for sentence in sentences for token in tokenize(sentence))
+
+    words_per_minute = None
+    if duration_seconds and duration_seconds > 0:
+        words_per_minute = round(word_count / (duration_seconds / 60), 1)
+
+    return {
+        "word_count": word_count,
+        "sentence_count": len(sentences),
+        "avg_sentence_length": round(word_count / len(sentences), 2) if sentences else 0.0,
+        "content_word_count": sum(distribution.values()),
+        "cefr_distribution": distribution,
+        "duration_seconds": round(duration_seconds, 3) if duration_seconds else None,
+        "words_per_minute": words_per_minute,
+    }
@@ -1,8 +1,9 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List
 from datetime import datetime
-from .model import GeneratedContent
+from .analysis import analyze_content, compute_audio_duration_seconds_from_sentences
+from .model import ContentAnalysis, GeneratedContent
 
 
 def insert_generated_content(
@@ -93,6 +94,7 @@ def get_generated_contents_by_user(
     """
     return (
         db.query(GeneratedContent)
+        .options(joinedload(GeneratedContent.analysis))
         .filter(GeneratedContent.user_id == user_id)
         .order_by(GeneratedContent.created_at.desc())
         .offset(offset)
@@ -129,3 +131,72 @@ def get_generated_content_by_id(
         .filter(GeneratedContent.generated_content_id == content_id)
         .first()
     )
+
+
+def upsert_content_analysis(
+    db: Session,
+    *,
+    content_id: int,
+    analysis: Dict[str, Any],
+) -> ContentAnalysis:
+    """
+    Store (or replace) the precomputed analysis of a GeneratedContent.
+    """
+    record = db.merge(ContentAnalysis(generated_content_id=content_id, **analysis))
+    db.commit()
+    return record
+
+
+def get_content_analysis(
+    db: Session,
+    *,
+    content_id: int,
+) -> Optional[ContentAnalysis]:
+    """
+    Primary-key read of a content's analysis (None if not computed yet).
+    """
+    return db.get(ContentAnalysis, content_id)
+
+
+def get_content_analyses(
+    db: Session,
+    *,
+    content_ids: Iterable[int],
+) -> List[ContentAnalysis]:
+    """
+    Load several analyses in one query (later db.get() calls hit the identity map).
+    """
+    content_ids = list(content_ids)
+    if not content_ids:
+        return []
+    return (
+        db.query(ContentAnalysis)
+        .filter(ContentAnalysis.generated_content_id.in_(content_ids))
+        .all()
+    )
+
+
+def get_or_create_content_analysis(
+    db: Session,
+    *,
+    content_id: int,
+) -> Optional[ContentAnalysis]:
+    """
+    Return the content analysis, computing it once from script_data for contents
+    generated before the analysis existed. None if the content or its script is missing.
+    """
+    record = get_content_analysis(db, content_id=content_id)
+    if record is not None:
+        return record
+
+    content = get_generated_content_by_id(db, content_id=content_id)
+    if content is None or not content.script_data:
+        return None
+
+    # legacy rows: only sentence start times are stored, so the duration is approximate
+    duration = compute_audio_duration_seconds_from_sentences(content.sentences or []) or None
+    return upsert_content_analysis(
+        db,
+        content_id=content_id,
+        analysis=analyze_content(content.script_data, duration),
+    )
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ...core.config import Base
 
@@ -25,6 +26,13 @@ class GeneratedContent(Base):
         nullable=False,
     )
 
+    analysis = relationship(
+        "ContentAnalysis",
+        uselist=False,
+        back_populates="content",
+        passive_deletes=True,
+    )
+
     @property
     def sentences(self):
         """Expose parsed sentences stored inside response_json."""
@@ -33,3 +41,28 @@ class GeneratedContent(Base):
         if isinstance(self.response_json, dict):
             return self.response_json.get("sentences")
         return None
+
+
+class ContentAnalysis(Base):
+    """
+    Script/audio statistics computed once when generation finishes, so readers
+    (level feedback, stats, history) never re-parse script_data or response_json.
+    """
+
+    __tablename__ = "content_analysis"
+
+    generated_content_id = Column(
+        Integer,
+        ForeignKey("generated_contents.generated_content_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    word_count = Column(Integer, nullable=False)
+    sentence_count = Column(Integer, nullable=False)
+    avg_sentence_length = Column(Float, nullable=False)  # ASL (words / sentence)
+    content_word_count = Column(Integer, nullable=False)
+    cefr_distribution = Column(JSON, nullable=False)  # {"A1": n, ..., "C2": n, "unknown": n}
+    duration_seconds = Column(Float, nullable=True)  # exact, from the TTS alignment
+    words_per_minute = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    content = relationship("GeneratedContent", back_populates="analysis")
@@ -45,6 +45,20 @@ class GeneratedScriptResponse(BaseModel):
     script: str
 
 
+class ContentAnalysisSummary(BaseModel):
+    """
+    Precomputed script/audio statistics of a GeneratedContent.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    word_count: int
+    sentence_count: int
+    avg_sentence_length: float
+    cefr_distribution: dict[str, int]
+    duration_seconds: Optional[float] = None
+    words_per_minute: Optional[float] = None
+
+
 class GeneratedContentListItem(BaseModel):
     """
     Summary of a GeneratedContent row for list views.
@@ -57,6 +71,7 @@ class GeneratedContentListItem(BaseModel):
     audio_url: Optional[str] = None
     script_data: Optional[str] = None
     sentences: Optional[List[SentenceTimestamp]] = None
+    analysis: Optional[ContentAnalysisSummary] = None
     created_at: datetime
     updated_at: datetime
 
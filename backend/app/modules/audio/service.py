@@ -6,6 +6,7 @@ import random
 import re
 import base64
 import asyncio
+from typing import Optional
 from openai import AsyncOpenAI
 from fastapi import HTTPException, WebSocket
 from elevenlabs import ElevenLabs, VoiceSettings
@@ -13,6 +14,7 @@ from sqlalchemy.orm import Session
 from ...core.config import SessionLocal
 from ..users.models import User, CEFRLevel
 from .schemas import AudioGenerateRequest
+from .analysis import analyze_content, compute_alignment_duration_seconds, split_script_sentences
 from .utils import parse_tts_by_newlines, get_elevenlabs_client, insert_study_session_from_sentences
 from ..level_system.utils import get_cefr_level_from_score, get_speed_from_level_score
 from . import crud
@@ -438,6 +440,7 @@ class AudioService:
             return {
                 "audio_base_64": response_dict.get("audio_base_64"),
                 "sentences": sentences_with_timestamps,
+                "duration_seconds": compute_alignment_duration_seconds(response_dict.get("alignment")),
             }
 
         except Exception as e:
@@ -531,7 +534,7 @@ class AudioService:
         try:
             sentences = cls._split_script_by_newlines(script)
             logger.info(f"Launching contextual vocab processing for {len(sentences)} sentences...")
-            asyncio.create_task(VocabService.build_contextual_vocab(sentences, generated_id))
+            VocabService.schedule_contextual_vocab(sentences, generated_id)
         except Exception as e:
             logger.error(f"Failed to launch VocabService: {e}", exc_info=True)
 
@@ -571,9 +574,14 @@ class AudioService:
         logger.info(f"Audio uploaded to S3 | key={key}")
 
 
-        # === Step 3.5: Insert study session into stats based on audio duration ===
+        # === Step 3.5: Content analysis + study session (exact duration from the alignment) ===
+        analysis = cls._record_content_analysis(generated_id, script, audio_result.get("duration_seconds"))
         try:
-            insert_study_session_from_sentences(user.id, audio_result.get("sentences", []) if audio_result else [])
+            insert_study_session_from_sentences(
+                user.id,
+                audio_result.get("sentences", []) if audio_result else [],
+                duration_seconds=analysis["duration_seconds"],
+            )
         except Exception as e:
             logger.error(f"Error computing/inserting study session: {e}", exc_info=True)
 
@@ -668,7 +676,7 @@ class AudioService:
             # === Step 2-1: Background contextual vocab (No update needed) ===
             try:
                 sentences = cls._split_script_by_newlines(script)
-                asyncio.create_task(VocabService.build_contextual_vocab(sentences, generated_id))
+                VocabService.schedule_contextual_vocab(sentences, generated_id)
             except Exception as e:
                 logger.error(f"[WS] Failed to launch VocabService: {e}", exc_info=True)
 
@@ -714,9 +722,14 @@ class AudioService:
             logger.info(f"[WS] Audio uploaded to S3 | key={key}")
 
 
-            # === Step 3.5: Insert study session ===
+            # === Step 3.5: Content analysis + study session ===
+            analysis = cls._record_content_analysis(generated_id, script, audio_result.get("duration_seconds"))
             try:
-                insert_study_session_from_sentences(user.id, audio_result.get("sentences", []) if audio_result else [])
+                insert_study_session_from_sentences(
+                    user.id,
+                    audio_result.get("sentences", []) if audio_result else [],
+                    duration_seconds=analysis["duration_seconds"],
+                )
             except Exception as e:
                 logger.error(f"[WS] Error computing/inserting study session: {e}", exc_info=True)
 
@@ -770,15 +783,28 @@ class AudioService:
         """
         Split the generated script (already newline-separated by GPT)
         into a clean list of sentences.
-        Empty lines and stray whitespace are removed.
         """
-        if not isinstance(script, str):
-            return []
-
-        # Split by literal newline
-        raw_sentences = script.split("\n")
+        return split_script_sentences(script)
 
-        # Clean and remove empty lines
-        sentences = [s.strip() for s in raw_sentences if s.strip()]
+    @staticmethod
+    def _record_content_analysis(
+        generated_id: Optional[int],
+        script: str,
+        duration_seconds: Optional[float],
+    ) -> dict:
+        """
+        Compute the content analysis once and persist it (best-effort).
+        Returns the computed values even if saving fails.
+        """
+        analysis = analyze_content(script, duration_seconds)
+        if generated_id is None:
+            return analysis
 
-        return sentences
+        db = SessionLocal()
+        try:
+            crud.upsert_content_analysis(db, content_id=generated_id, analysis=analysis)
+        except Exception as e:
+            logger.error(f"Failed to store content analysis for id={generated_id}: {e}", exc_info=True)
+        finally:
+            db.close()
+        return analysis
@@ -3,6 +3,7 @@ from elevenlabs import ElevenLabs
 from ...core.config import settings
 from ...core.config import SessionLocal
 from ..stats import crud as stats_crud
+from .analysis import compute_audio_duration_seconds_from_sentences  # noqa: F401 (re-export)
 import math
 
 def get_elevenlabs_client(): # for circular dependency resolution
@@ -74,40 +75,26 @@ def parse_tts_by_newlines(tts_response: dict):
     return sentences
 
 
-def compute_audio_duration_seconds_from_sentences(sentences: list[dict]) -> float:
-    """Compute approximate audio duration in seconds from sentence timestamp info.
-
-    The function looks for common timestamp keys in each sentence dict in this
-    order: 'end', 'end_time', 'end_time_seconds', 'start_time', 'start'. It uses
-    the maximum value found as the audio length. Returns 0.0 if nothing found.
-    """
-    if not sentences:
-        return 0.0
-
-    candidates = []
-    keys = ("end", "end_time", "end_time_seconds", "start_time", "start")
-    for s in sentences:
-        for k in keys:
-            v = s.get(k)
-            if v is None:
-                continue
-            try:
-                fv = float(v)
-            except Exception:
-                continue
-            candidates.append(fv)
-
-    return max(candidates) if candidates else 0.0
-
-
-def insert_study_session_from_sentences(user_id: int, sentences: list[dict], activity_type: str = "audio") -> None:
+def insert_study_session_from_sentences(
+    user_id: int,
+    sentences: list[dict],
+    activity_type: str = "audio",
+    duration_seconds: float | None = None,
+) -> None:
     """Compute duration from sentences and insert a StudySession record.
 
+    ``duration_seconds`` (the exact length from the content analysis) is used
+    when given; otherwise the last sentence timestamp is used as an estimate.
+
     This helper opens its own DB session and logs failures but does not raise
     so callers (like the audio pipeline) won't fail because of stats errors.
+    With ``playback_ingest_enabled`` nothing is recorded here: the playback
+    aggregator writes the minutes actually listened instead.
     """
+    if settings.playback_ingest_enabled:
+        return
     try:
-        last_sec = compute_audio_duration_seconds_from_sentences(sentences)
+        last_sec = duration_seconds or compute_audio_duration_seconds_from_sentences(sentences)
         if not last_sec or last_sec <= 0:
             return
 
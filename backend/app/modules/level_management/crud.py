@@ -1,9 +1,19 @@
 from collections import defaultdict
-from typing import Mapping, Sequence
+from datetime import datetime
+from typing import Mapping, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
-from .models import CEFRLevel, LevelTestScript, UserLevelHistory
+from .models import (
+    LEVEL_EVAL_JOB_FAILED,
+    LEVEL_EVAL_JOB_PENDING,
+    CEFRLevel,
+    LevelEvaluationCache,
+    LevelEvaluationJob,
+    LevelTestScript,
+    UserLevelHistory,
+)
 from ..audio.model import GeneratedContent
 
 
@@ -21,11 +31,16 @@ def get_scripts_by_ids(db: Session, script_ids: Sequence[str]) -> Mapping[str, L
     return lookup
 
 
+def list_level_test_scripts(db: Session) -> Sequence[LevelTestScript]:
+    return db.query(LevelTestScript).order_by(LevelTestScript.id).all()
+
+
 def get_generated_contents_by_ids(db: Session, content_ids: Sequence[int]) -> Mapping[int, GeneratedContent]:
     if not content_ids:
         return {}
     rows = (
         db.query(GeneratedContent)
+        .options(selectinload(GeneratedContent.analysis))  # 프롬프트용 난이도 특징
         .filter(GeneratedContent.generated_content_id.in_(content_ids))
         .all()
     )
@@ -55,3 +70,112 @@ def insert_level_history(
     )
     db.add(record)
     return record
+
+
+def get_cached_evaluation(
+    db: Session,
+    *,
+    cache_key: str,
+    version: str,
+    now: datetime,
+) -> Optional[dict]:
+    record = (
+        db.query(LevelEvaluationCache.payload)
+        .filter(
+            LevelEvaluationCache.cache_key == cache_key,
+            LevelEvaluationCache.version == version,
+            LevelEvaluationCache.expires_at > now,
+        )
+        .first()
+    )
+    return record.payload if record is not None else None
+
+
+def put_cached_evaluation(
+    db: Session,
+    *,
+    cache_key: str,
+    version: str,
+    payload: dict,
+    now: datetime,
+    expires_at: datetime,
+) -> None:
+    """Insert or refresh a cache row inside a savepoint; the caller's commit persists it.
+
+    A concurrent insert of the same key only rolls back the savepoint, never the
+    caller's transaction (the level update committed together with it).
+    """
+    try:
+        with db.begin_nested():
+            record = db.get(LevelEvaluationCache, cache_key)
+            if record is None:
+                db.add(
+                    LevelEvaluationCache(
+                        cache_key=cache_key,
+                        version=version,
+                        payload=payload,
+                        created_at=now,
+                        expires_at=expires_at,
+                    )
+                )
+            else:
+                record.version = version
+                record.payload = payload
+                record.created_at = now
+                record.expires_at = expires_at
+    except IntegrityError:
+        pass
+
+
+def delete_stale_evaluations(db: Session, *, version_prefix: str, now: datetime) -> int:
+    """Drop expired rows and rows whose version does not start with ``version_prefix``."""
+    deleted = (
+        db.query(LevelEvaluationCache)
+        .filter(
+            ~LevelEvaluationCache.version.startswith(version_prefix, autoescape=True)
+            | (LevelEvaluationCache.expires_at <= now)
+        )
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def get_latest_level_history_id(db: Session, user_id: int) -> Optional[int]:
+    return (
+        db.query(UserLevelHistory.id)
+        .filter(UserLevelHistory.user_id == user_id)
+        .order_by(UserLevelHistory.id.desc())
+        .limit(1)
+        .scalar()
+    )
+
+
+def create_evaluation_job(db: Session, *, user_id: int, provisional_history_id: int) -> LevelEvaluationJob:
+    job = LevelEvaluationJob(
+        user_id=user_id,
+        status=LEVEL_EVAL_JOB_PENDING,
+        provisional_history_id=provisional_history_id,
+    )
+    db.add(job)
+    return job
+
+
+def get_evaluation_job(db: Session, job_id: int) -> Optional[LevelEvaluationJob]:
+    return db.get(LevelEvaluationJob, job_id)
+
+
+def fail_pending_evaluation_jobs(
+    db: Session,
+    *,
+    now: datetime,
+    job_ids: Optional[Sequence[int]] = None,
+) -> int:
+    """Mark pending jobs (all of them, or ``job_ids``) as failed; the caller commits."""
+    query = db.query(LevelEvaluationJob).filter(LevelEvaluationJob.status == LEVEL_EVAL_JOB_PENDING)
+    if job_ids is not None:
+        query = query.filter(LevelEvaluationJob.id.in_(list(job_ids)))
+    return query.update(
+        {LevelEvaluationJob.status: LEVEL_EVAL_JOB_FAILED, LevelEvaluationJob.completed_at: now},
+        synchronize_session=False,
+    )
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, Header
 from sqlalchemy.orm import Session
 
-from ...core.auth import TokenType, verify_token
+from ...core.auth import TokenType, verify_admin_key, verify_token
 from ...core.config import get_db
 from ...core.exceptions import (
     AppException,
     AuthTokenExpiredException,
+    InvalidAdminKeyException,
     InvalidAuthHeaderException,
     InvalidTokenException,
     InvalidTokenTypeException,
@@ -15,9 +16,11 @@ from ..users import crud as user_crud
 from . import schemas
 from .service import (
     LevelManagementService,
+    LevelEvaluationNotFoundException,
     LevelTestScriptNotFoundException,
     GeneratedContentNotFoundException,
 )
+from .script_catalog import load_catalog
 from ...core.level.context import LevelContext            
 from .strategy_impl import AILevelManagementStrategy  
 
@@ -25,6 +28,7 @@ from .strategy_impl import AILevelManagementStrategy
 router = APIRouter(prefix="/level-management", tags=["level-management"])
 
 context = LevelContext(AILevelManagementStrategy())  
+level_service = LevelManagementService()
 
 
 def get_current_user(authorization: str = Header(...), db: Session = Depends(get_db)):
@@ -55,12 +59,12 @@ def get_current_user(authorization: str = Header(...), db: Session = Depends(get
         ]
     ),
 )
-def evaluate_level(
+async def evaluate_level(
     payload: schemas.LevelTestRequest,
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    return context.evaluate_initial_level(db=db, user=current_user, payload=payload)
+    return await context.evaluate_level_test_async(db=db, user=current_user, payload=payload)
 
 
 @router.post(
@@ -78,12 +82,35 @@ def evaluate_level(
         ]
     ),
 )
-def evaluate_session_feedback(
+async def evaluate_session_feedback(
     payload: schemas.LevelTestRequest,
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    return context.evaluate_session_feedback(db=db, user=current_user, payload=payload)
+    return await context.evaluate_session_feedback_async(db=db, user=current_user, payload=payload)
+
+
+@router.get(
+    "/evaluations/{evaluation_id}",
+    response_model=schemas.LevelEvaluationStatusResponse,
+    responses=AppException.to_openapi_examples(
+        [
+            InvalidAuthHeaderException,
+            UserNotFoundException,
+            AuthTokenExpiredException,
+            InvalidTokenException,
+            InvalidTokenTypeException,
+            LevelEvaluationNotFoundException,
+        ]
+    ),
+)
+def get_level_evaluation(
+    evaluation_id: int,
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Poll a provisional level-test result (two-phase mode) for its LLM refinement."""
+    return level_service.get_evaluation_status(db=db, user=current_user, evaluation_id=evaluation_id)
 
 
 @router.post(
@@ -105,3 +132,20 @@ def set_manual_level(
     db: Session = Depends(get_db),
 ):
     return context.set_manual_level(db=db, user=current_user, payload=payload)
+
+
+@router.post(
+    "/scripts/reload",
+    response_model=schemas.ScriptCatalogReloadResponse,
+    responses=AppException.to_openapi_examples([InvalidAdminKeyException]),
+    dependencies=[Depends(verify_admin_key)],
+)
+def reload_script_catalog(db: Session = Depends(get_db)):
+    """Rebuild the in-memory level-test script catalog from the DB (admin only)."""
+    catalog, changed = load_catalog(db)
+    return schemas.ScriptCatalogReloadResponse(
+        version=catalog.version,
+        script_count=len(catalog),
+        changed=changed,
+        loaded_at=catalog.loaded_at,
+    )
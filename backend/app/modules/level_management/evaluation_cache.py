@@ -0,0 +1,153 @@
+"""Deterministic result cache for the LLM level evaluation.
+
+Level tests draw from a fixed script set and self-reported understanding takes
+few values, so many evaluation prompts are identical. The parsed LLM payload is
+cached under a hash of everything the answer depends on:
+
+- version: ``settings.level_eval_cache_version`` + model + prompt template hash
+  (editing the YAML prompt or bumping the setting invalidates every entry)
+- the test payload and CEFR bands sent to the model
+- the profile fields that describe the learner (timestamps are left out)
+
+An in-process LRU (with TTL) sits in front of the ``level_evaluation_cache``
+table, which is shared by all workers.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Mapping, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ...core.cache import LRUCache
+from ...core.config import SessionLocal, settings
+from ...core.llm import PromptTemplate
+from ...core.logger import logger
+from ...core.tasks import task_supervisor
+from . import crud
+
+# 캐시 키에 포함하는 프로필 필드 (level_updated_at 같은 시각 값은 결과에 영향이 없으므로 제외)
+CACHE_PROFILE_FIELDS = ("context", "current_level", "level_score", "llm_confidence", "initial_level_completed")
+
+
+def _canonical_hash(value: object) -> str:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def cache_version(model: str, prompt: PromptTemplate) -> str:
+    prompt_hash = _canonical_hash([prompt.system, prompt.user])[:16]
+    return f"{settings.level_eval_cache_version}:{model}:{prompt_hash}"[:64]
+
+
+def build_cache_key(
+    *,
+    version: str,
+    tests: object,
+    cefr_bands: object,
+    profile: Optional[Mapping[str, object]],
+) -> str:
+    relevant_profile = {field: (profile or {}).get(field) for field in CACHE_PROFILE_FIELDS}
+    return _canonical_hash(
+        {"version": version, "tests": tests, "cefr_bands": cefr_bands, "profile": relevant_profile}
+    )
+
+
+class EvaluationCache:
+    """Two-tier (memory LRU -> DB) cache of parsed LLM evaluation payloads."""
+
+    def __init__(self, *, maxsize: int = 2048, ttl_seconds: Optional[int] = None):
+        self._ttl = settings.level_eval_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._memory: LRUCache = LRUCache(maxsize=maxsize, ttl_seconds=self._ttl or None)
+        self._lock = threading.Lock()
+        self._counts = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def get(self, db: Optional[Session], *, key: str, version: str) -> Optional[Dict[str, object]]:
+        if not self.enabled:
+            return None
+        payload = self._memory.get(key)
+        if payload is not None:
+            self._count("memory_hits")
+            logger.info(f"[level-eval-cache] hit tier=memory key={key[:12]}")
+            return payload
+
+        if db is not None:
+            try:
+                payload = crud.get_cached_evaluation(db, cache_key=key, version=version, now=datetime.utcnow())
+            except SQLAlchemyError as e:
+                # 캐시 장애로 레벨 평가가 실패하지 않도록 miss로 처리
+                logger.warning(f"[level-eval-cache] db lookup failed: {e}")
+                payload = None
+            if payload is not None:
+                self._memory.put(key, payload)
+                self._count("db_hits")
+                logger.info(f"[level-eval-cache] hit tier=db key={key[:12]}")
+                return payload
+
+        self._count("misses")
+        logger.info(f"[level-eval-cache] miss key={key[:12]}")
+        return None
+
+    def put(self, db: Optional[Session], *, key: str, version: str, payload: Dict[str, object]) -> None:
+        if not self.enabled:
+            return
+        self._memory.put(key, payload)
+        if db is not None:
+            now = datetime.utcnow()
+            try:
+                crud.put_cached_evaluation(
+                    db,
+                    cache_key=key,
+                    version=version,
+                    payload=payload,
+                    now=now,
+                    expires_at=now + timedelta(seconds=self._ttl),
+                )
+            except SQLAlchemyError as e:
+                logger.warning(f"[level-eval-cache] db store failed: {e}")
+        self._count("stores")
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["memory_hits"] + counts["db_hits"] + counts["misses"]
+        hit_ratio = (counts["memory_hits"] + counts["db_hits"]) / lookups if lookups else 0.0
+        return {**counts, "hit_ratio": round(hit_ratio, 4), "memory_entries": len(self._memory)}
+
+
+def purge_stale_entries() -> int:
+    """Delete expired rows and rows written under another ``level_eval_cache_version``."""
+    db = SessionLocal()
+    try:
+        deleted = crud.delete_stale_evaluations(
+            db, version_prefix=f"{settings.level_eval_cache_version}:", now=datetime.utcnow()
+        )
+    finally:
+        db.close()
+    logger.info(f"[level-eval-cache] purged {deleted} stale rows")
+    return deleted
+
+
+def schedule_purge() -> bool:
+    """Run ``purge_stale_entries`` in the background (called from the app lifespan)."""
+    return task_supervisor.submit(
+        "level_eval_cache_purge",
+        lambda: asyncio.to_thread(purge_stale_entries),
+        retries=0,
+    )
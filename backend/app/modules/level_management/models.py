@@ -1,5 +1,5 @@
 from enum import Enum
-from sqlalchemy import Column, DateTime, Enum as SAEnum, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Enum as SAEnum, ForeignKey, Integer, String, Text
 from sqlalchemy.sql import func
 
 from ...core.config import Base
@@ -35,3 +35,37 @@ class UserLevelHistory(Base):
     sample_count = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+
+
+class LevelEvaluationCache(Base):
+    """Shared tier of the LLM level-evaluation result cache (see evaluation_cache.py)."""
+
+    __tablename__ = "level_evaluation_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    version = Column(String(64), nullable=False, index=True)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
+LEVEL_EVAL_JOB_PENDING = "pending"
+LEVEL_EVAL_JOB_REFINED = "refined"
+LEVEL_EVAL_JOB_FAILED = "failed"  # LLM 실패: 임시(휴리스틱) 결과 유지
+LEVEL_EVAL_JOB_SUPERSEDED = "superseded"  # 그 사이 레벨이 다시 바뀌어 결과를 반영하지 않음
+
+
+class LevelEvaluationJob(Base):
+    """Background LLM refinement of a provisional (heuristic) level-test result."""
+
+    __tablename__ = "level_evaluation_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    status = Column(String(16), nullable=False, default=LEVEL_EVAL_JOB_PENDING)
+    provisional_history_id = Column(Integer, ForeignKey("user_level_history.id"), nullable=False)
+    refined_history_id = Column(Integer, ForeignKey("user_level_history.id"), nullable=True)
+    # 최종 응답 (LevelTestResponse의 level/scores/rationale)
+    result = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
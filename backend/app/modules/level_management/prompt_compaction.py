@@ -0,0 +1,94 @@
+"""Compact, feature-based test payloads for the LLM level evaluation.
+
+Instead of full transcripts the prompt carries each script's difficulty
+features (ASL, CEFR word profile, WPM when known) plus a short excerpt, as
+compact JSON. ``fit_to_budget`` shortens the excerpts until the estimated
+token count fits ``settings.level_eval_prompt_token_budget``.
+"""
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Callable, Dict, List, Optional
+
+from .script_catalog import compute_features
+
+EXCERPT_WORD_STEPS = (40, 24, 12, 0)
+
+_TOKEN_PIECE_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough BPE token count: one per word / number / symbol, plus one per 6 extra letters."""
+    return sum(1 + max(0, len(piece) - 1) // 6 for piece in _TOKEN_PIECE_RE.findall(text))
+
+
+def compact_json(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def excerpt(transcript: str, max_words: int) -> str:
+    if max_words <= 0:
+        return ""
+    words = transcript.split()
+    if len(words) <= max_words:
+        return " ".join(words)
+    return " ".join(words[:max_words]) + " …"
+
+
+def script_features(script_entry: object, transcript: str) -> Dict[str, object]:
+    """Difficulty features of a level-test script or generated content.
+
+    Uses the catalog's precomputed features or the stored content_analysis row
+    when present; otherwise computes them from the transcript.
+    """
+    features = getattr(script_entry, "features", None)
+    if features is not None and hasattr(features, "as_dict"):
+        result = features.as_dict()
+    else:
+        analysis = getattr(script_entry, "analysis", None)
+        if analysis is not None and getattr(analysis, "cefr_distribution", None) is not None:
+            result = {
+                "word_count": analysis.word_count,
+                "sentence_count": analysis.sentence_count,
+                "avg_sentence_length": analysis.avg_sentence_length,
+                "content_word_count": analysis.content_word_count,
+                "cefr_distribution": dict(analysis.cefr_distribution),
+            }
+            if analysis.words_per_minute:
+                result["words_per_minute"] = analysis.words_per_minute
+        else:
+            result = compute_features(transcript).as_dict()
+
+    # 0인 CEFR 구간은 생략해 토큰을 아낀다
+    result["cefr_distribution"] = {level: n for level, n in result["cefr_distribution"].items() if n}
+    return result
+
+
+def fit_to_budget(
+    entries: List[Dict[str, object]],
+    transcripts: List[str],
+    render: Callable[[List[Dict[str, object]]], str],
+    *,
+    budget: int,
+) -> tuple[str, int]:
+    """Fill in ``excerpt`` for every entry, shortening it until ``render(entries)`` fits.
+
+    Returns (rendered prompt, estimated tokens). If even excerpt-free entries do
+    not fit, the smallest version is returned (features are never dropped).
+    """
+    rendered: Optional[str] = None
+    tokens = 0
+    for max_words in EXCERPT_WORD_STEPS:
+        for entry, transcript in zip(entries, transcripts):
+            text = excerpt(transcript, max_words)
+            if text:
+                entry["excerpt"] = text
+            else:
+                entry.pop("excerpt", None)
+        rendered = render(entries)
+        tokens = estimate_tokens(rendered)
+        if tokens <= budget:
+            break
+    return rendered or "", tokens
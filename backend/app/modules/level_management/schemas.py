@@ -57,6 +57,16 @@ class LevelTestResponse(BaseModel):
     scores: LevelScores
     rationale: str = Field(..., max_length=2048)
     updated_at: datetime
+    # two-phase 모드: 휴리스틱 임시 결과이며 evaluation_id로 LLM 결과를 조회
+    provisional: bool = False
+    evaluation_id: Optional[int] = None
+
+
+class LevelEvaluationStatusResponse(BaseModel):
+    evaluation_id: int
+    status: str
+    result: Optional[LevelTestResponse] = None
+    completed_at: Optional[datetime] = None
 
 
 class ManualLevelUpdateRequest(BaseModel):
@@ -67,3 +77,10 @@ class ManualLevelUpdateResponse(BaseModel):
     level: CEFRLevel
     level_description: str
     updated_at: datetime
+
+
+class ScriptCatalogReloadResponse(BaseModel):
+    version: str
+    script_count: int
+    changed: bool
+    loaded_at: datetime
@@ -0,0 +1,148 @@
+"""In-process catalog of the level-test scripts.
+
+``level_test_scripts`` is small and effectively static (one row per WAV in
+``survey/testsets``), so it is loaded once in the app lifespan and every level
+test reads from memory. Each entry carries the transcript features computed at
+load time (word / sentence counts, average sentence length, CEFR profile).
+
+The catalog is immutable; ``load_catalog`` builds a new one and swaps the
+module reference, so readers never see a half-built catalog. It is reloaded
+at startup and via ``POST /level-management/scripts/reload`` (X-Admin-Key).
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from ...core.config import SessionLocal
+from ...core.lexical import cefr_distribution, tokenize
+from ...core.logger import logger
+from . import crud
+from .models import CEFRLevel
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+@dataclass(frozen=True)
+class ScriptFeatures:
+    word_count: int
+    sentence_count: int
+    avg_sentence_length: float
+    content_word_count: int
+    # (level, count) 쌍; A1..C2, unknown 순서
+    cefr_distribution: Tuple[Tuple[str, int], ...]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "word_count": self.word_count,
+            "sentence_count": self.sentence_count,
+            "avg_sentence_length": self.avg_sentence_length,
+            "content_word_count": self.content_word_count,
+            "cefr_distribution": dict(self.cefr_distribution),
+        }
+
+
+@dataclass(frozen=True)
+class CatalogScript:
+    """Read-only stand-in for a ``LevelTestScript`` row (same ``transcript`` / ``target_level``)."""
+
+    id: str
+    transcript: str
+    target_level: CEFRLevel
+    features: ScriptFeatures
+
+
+def compute_features(transcript: str) -> ScriptFeatures:
+    sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(transcript or "") if s.strip()]
+    word_count = sum(len(sentence.split()) for sentence in sentences)
+    distribution = cefr_distribution(token for sentence in sentences for token in tokenize(sentence))
+    return ScriptFeatures(
+        word_count=word_count,
+        sentence_count=len(sentences),
+        avg_sentence_length=round(word_count / len(sentences), 2) if sentences else 0.0,
+        content_word_count=sum(distribution.values()),
+        cefr_distribution=tuple(distribution.items()),
+    )
+
+
+class ScriptCatalog:
+    def __init__(self, scripts: Iterable[CatalogScript]):
+        entries = {script.id: script for script in scripts}
+        self._scripts: Mapping[str, CatalogScript] = MappingProxyType(entries)
+        digest = hashlib.sha256()
+        for script_id in sorted(entries):
+            script = entries[script_id]
+            digest.update(f"{script_id}\0{script.target_level.value}\0{script.transcript}\0".encode("utf-8"))
+        # 내용 기반 버전: reload 시 실제 변경 여부 판단에 사용
+        self.version = digest.hexdigest()[:16]
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def get(self, script_id: str) -> Optional[CatalogScript]:
+        return self._scripts.get(script_id)
+
+    def get_many(self, script_ids: Sequence[str]) -> Dict[str, CatalogScript]:
+        return {script_id: self._scripts[script_id] for script_id in script_ids if script_id in self._scripts}
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
+    def __contains__(self, script_id: object) -> bool:
+        return script_id in self._scripts
+
+
+def build_catalog(rows: Iterable[object]) -> ScriptCatalog:
+    return ScriptCatalog(
+        CatalogScript(
+            id=row.id,
+            transcript=row.transcript,
+            target_level=CEFRLevel(getattr(row.target_level, "value", row.target_level)),
+            features=compute_features(row.transcript),
+        )
+        for row in rows
+    )
+
+
+_catalog: Optional[ScriptCatalog] = None
+_reload_lock = threading.Lock()
+
+
+def get_catalog() -> Optional[ScriptCatalog]:
+    """The loaded catalog, or None before the first successful load."""
+    return _catalog
+
+
+def load_catalog(db: Session) -> Tuple[ScriptCatalog, bool]:
+    """Rebuild the catalog from the DB; returns (catalog, changed)."""
+    global _catalog
+    with _reload_lock:
+        catalog = build_catalog(crud.list_level_test_scripts(db))
+        previous = _catalog
+        changed = previous is None or previous.version != catalog.version
+        if changed:
+            _catalog = catalog
+            logger.info(f"[script-catalog] loaded {len(catalog)} scripts (version={catalog.version})")
+        return (catalog if changed else previous), changed
+
+
+def load_catalog_at_startup() -> None:
+    """Lifespan hook: a DB failure leaves the catalog empty and reads fall back to the DB."""
+    db = SessionLocal()
+    try:
+        load_catalog(db)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"[script-catalog] initial load failed, falling back to DB reads: {e}")
+    finally:
+        db.close()
+
+
+def reset_catalog() -> None:
+    global _catalog
+    with _reload_lock:
+        _catalog = None
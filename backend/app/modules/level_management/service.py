@@ -1,19 +1,40 @@
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 import json
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ...core.llm import LLMServiceError, OpenAILLMClient, PromptStore
+from ...core.llm import (
+    AsyncOpenAILLMClient,
+    LLMServiceError,
+    OpenAILLMClient,
+    PromptStore,
+    get_async_llm_client,
+)
 
+from ...core.config import SessionLocal, settings
 from ...core.exceptions import AppException
+from ...core.logger import logger
+from ...core.tasks import task_supervisor
+from ..stats.cache import invalidate_user_stats
 from ..users import crud as user_crud
 from ..users.models import User
 from . import crud, schemas
-from .models import CEFRLevel
+from .evaluation_cache import EvaluationCache, build_cache_key, cache_version
+from .models import (
+    LEVEL_EVAL_JOB_FAILED,
+    LEVEL_EVAL_JOB_PENDING,
+    LEVEL_EVAL_JOB_REFINED,
+    LEVEL_EVAL_JOB_SUPERSEDED,
+    CEFRLevel,
+)
+from .prompt_compaction import compact_json, fit_to_budget, script_features
+from .script_catalog import get_catalog
 
 
 class LevelTestScriptNotFoundException(AppException):
@@ -25,6 +46,15 @@ class LevelTestScriptNotFoundException(AppException):
         )
 
 
+class LevelEvaluationNotFoundException(AppException):
+    def __init__(self, evaluation_id: int | str = "unknown"):
+        super().__init__(
+            status_code=404,
+            custom_code="LEVEL_EVALUATION_NOT_FOUND",
+            detail=f"요청한 레벨 평가({evaluation_id})를 찾을 수 없습니다.",
+        )
+
+
 class GeneratedContentNotFoundException(AppException):
     def __init__(self, content_id: int | str = "unknown"):
         super().__init__(
@@ -43,7 +73,20 @@ class LevelEvaluationResult:
     sample_count: int
     rationale: str
     llm_success: bool
-    
+
+
+@dataclass
+class _EvaluationRequest:
+    """Prompt and heuristic fallback inputs shared by the sync and async LLM paths."""
+    average_understanding: int
+    sample_count: int
+    fallback_level: CEFRLevel
+    system_prompt: str
+    user_prompt: str
+    cache_key: str
+    cache_version: str
+
+
 # 프롬프트 캐싱
 _PROMPT_STORE = PromptStore(Path(__file__).resolve().parent / "prompts")
 _CEFR_SCORING_BANDS: Sequence[Tuple[CEFRLevel, Tuple[int, int]]] = (
@@ -57,10 +100,24 @@ _CEFR_SCORING_BANDS: Sequence[Tuple[CEFRLevel, Tuple[int, int]]] = (
 _CEFR_SCORING_LOOKUP: Dict[CEFRLevel, Tuple[int, int]] = {
     level: bounds for level, bounds in _CEFR_SCORING_BANDS
 }
+_LEVEL_EVALUATION_MODEL = "gpt-5-nano"
+# 프로세스 공용 평가 결과 캐시 (DB tier는 요청의 세션으로 조회/저장)
+_EVALUATION_CACHE = EvaluationCache()
 
 class LevelManagementService:
-    def __init__(self, *, llm_client: Optional[OpenAILLMClient] = None):
+    def __init__(
+        self,
+        *,
+        llm_client: Optional[OpenAILLMClient] = None,
+        async_llm_client: Optional[AsyncOpenAILLMClient] = None,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
         self._llm_client = llm_client
+        self._async_llm_client = async_llm_client
+        self._evaluation_cache = evaluation_cache or _EVALUATION_CACHE
+        # 백그라운드 LLM 보정 작업은 요청 세션이 닫힌 뒤 실행되므로 자체 세션을 연다
+        self._session_factory = session_factory or SessionLocal
 
     def _build_user_profile(self, user: User, *, context: str) -> Dict[str, object]:
         level = getattr(user, "level", None)
@@ -83,6 +140,7 @@ class LevelManagementService:
         }
         return profile
         
+    # ------------------------------------------------------------------ public API
     def evaluate_initial_level(
         self,
         *,
@@ -90,83 +148,126 @@ class LevelManagementService:
         user: User,
         payload: schemas.LevelTestRequest,
     ) -> schemas.LevelTestResponse:
-        script_ids: List[str] = []
-        for item in payload.tests:
-            if item.script_id is None:
-                raise LevelTestScriptNotFoundException()
-            script_ids.append(item.script_id)
-
-        scripts = crud.get_scripts_by_ids(db, script_ids)
-
-        for script_id in script_ids:
-            if scripts.get(script_id) is None:
-                raise LevelTestScriptNotFoundException(script_id)
-
+        scripts = self._load_level_test_scripts(db, payload)
         evaluation = self._summarize_level_test(
+            db=db,
             tests=payload.tests,
             scripts=scripts,
             current_profile=self._build_user_profile(user, context="initial_level_assessment"),
         )
+        return self._apply_evaluation(db, user, evaluation)
 
-        if not evaluation.llm_success:
-            db.refresh(user)
-            current_level = self._coerce_user_level(user, fallback=evaluation.level)
-            level_score = self._clamp_score(getattr(user, "level_score", None), evaluation.level_score)
-            llm_confidence = self._clamp_score(getattr(user, "llm_confidence", None), evaluation.llm_confidence)
-            updated_at = getattr(user, "level_updated_at", None) or datetime.now(timezone.utc)
+    async def evaluate_initial_level_async(
+        self,
+        *,
+        db: Session,
+        user: User,
+        payload: schemas.LevelTestRequest,
+    ) -> schemas.LevelTestResponse:
+        """evaluate_initial_level for async endpoints: DB work in the threadpool, LLM call awaited."""
+        scripts = await run_in_threadpool(self._load_level_test_scripts, db, payload)
+        evaluation = await self._summarize_level_test_async(
+            db=db,
+            tests=payload.tests,
+            scripts=scripts,
+            current_profile=self._build_user_profile(user, context="initial_level_assessment"),
+        )
+        return await run_in_threadpool(self._apply_evaluation, db, user, evaluation)
 
-            return schemas.LevelTestResponse(
-                level=current_level,
-                level_description=schemas.CEFR_LEVEL_DESCRIPTIONS[current_level],
-                scores=schemas.LevelScores(
-                    level_score=level_score,
-                    llm_confidence=llm_confidence,
-                ),
-                rationale=evaluation.rationale,
-                updated_at=updated_at,
-            )
+    def evaluate_session_feedback(
+        self,
+        *,
+        db: Session,
+        user: User,
+        payload: schemas.LevelTestRequest,
+    ) -> schemas.LevelTestResponse:
+        script_lookup, default_target_level = self._load_feedback_scripts(db, user, payload)
+        evaluation = self._summarize_level_test(
+            db=db,
+            tests=payload.tests,
+            scripts=script_lookup,
+            current_profile=self._build_user_profile(user, context="session_feedback"),
+            default_target_level=default_target_level,
+        )
+        return self._apply_evaluation(db, user, evaluation)
+
+    async def evaluate_session_feedback_async(
+        self,
+        *,
+        db: Session,
+        user: User,
+        payload: schemas.LevelTestRequest,
+    ) -> schemas.LevelTestResponse:
+        script_lookup, default_target_level = await run_in_threadpool(self._load_feedback_scripts, db, user, payload)
+        evaluation = await self._summarize_level_test_async(
+            db=db,
+            tests=payload.tests,
+            scripts=script_lookup,
+            current_profile=self._build_user_profile(user, context="session_feedback"),
+            default_target_level=default_target_level,
+        )
+        return await run_in_threadpool(self._apply_evaluation, db, user, evaluation)
 
+    def set_manual_level(
+        self,
+        *,
+        db: Session,
+        user: User,
+        payload: schemas.ManualLevelUpdateRequest,
+    ) -> schemas.ManualLevelUpdateResponse:
         user_record = user_crud.update_user_level(
             db,
             user_id=user.id,
-            level=evaluation.level,
-            level_score=evaluation.level_score,
-            llm_confidence=evaluation.llm_confidence,
+            level=payload.level,
             initial_level_completed=True,
             commit=False,
         )
         history_record = crud.insert_level_history(
             db,
             user_id=user.id,
-            level=evaluation.level,
-            level_score=evaluation.level_score,
-            llm_confidence=evaluation.llm_confidence,
-            average_understanding=evaluation.average_understanding,
-            sample_count=evaluation.sample_count,
+            level=payload.level,
         )
 
         db.commit()
+        invalidate_user_stats(user.id)
         db.refresh(user_record)
         db.refresh(history_record)
 
-        return schemas.LevelTestResponse(
-            level=evaluation.level,
-            level_description=schemas.CEFR_LEVEL_DESCRIPTIONS[evaluation.level],
-            scores=schemas.LevelScores(
-                level_score=evaluation.level_score,
-                llm_confidence=evaluation.llm_confidence,
-            ),
-            rationale=evaluation.rationale,
+        return schemas.ManualLevelUpdateResponse(
+            level=payload.level,
+            level_description=schemas.CEFR_LEVEL_DESCRIPTIONS[payload.level],
             updated_at=user_record.level_updated_at,
         )
 
-    def evaluate_session_feedback(
+    # ------------------------------------------------------------------ DB steps
+    def _load_level_test_scripts(self, db: Session, payload: schemas.LevelTestRequest) -> Mapping[str, object]:
+        script_ids: List[str] = []
+        for item in payload.tests:
+            if item.script_id is None:
+                raise LevelTestScriptNotFoundException()
+            script_ids.append(item.script_id)
+
+        catalog = get_catalog()
+        if catalog is None:
+            scripts = crud.get_scripts_by_ids(db, script_ids)
+        else:
+            scripts = catalog.get_many(script_ids)
+            missing = [script_id for script_id in script_ids if script_id not in scripts]
+            if missing:
+                # reload 전에 추가된 스크립트일 수 있으므로 DB에서 한 번 더 확인
+                scripts.update({key: row for key, row in crud.get_scripts_by_ids(db, missing).items() if row})
+
+        for script_id in script_ids:
+            if scripts.get(script_id) is None:
+                raise LevelTestScriptNotFoundException(script_id)
+        return scripts
+
+    def _load_feedback_scripts(
         self,
-        *,
         db: Session,
         user: User,
         payload: schemas.LevelTestRequest,
-    ) -> schemas.LevelTestResponse:
+    ) -> Tuple[Dict[str, SimpleNamespace], CEFRLevel]:
         content_ids: List[int] = []
         for item in payload.tests:
             if item.generated_content_id is None:
@@ -189,16 +290,16 @@ class LevelManagementService:
                 transcript=record.script_data,
                 target_level=default_target_level,
                 title=record.title,
+                analysis=getattr(record, "analysis", None),
             )
+        return script_lookup, default_target_level
 
-
-        evaluation = self._summarize_level_test(
-            tests=payload.tests,
-            scripts=script_lookup,
-            current_profile=self._build_user_profile(user, context="session_feedback"),
-            default_target_level=default_target_level,
-        )
-
+    def _apply_evaluation(
+        self,
+        db: Session,
+        user: User,
+        evaluation: LevelEvaluationResult,
+    ) -> schemas.LevelTestResponse:
         if not evaluation.llm_success:
             db.refresh(user)
             current_level = self._coerce_user_level(user, fallback=evaluation.level)
@@ -217,9 +318,17 @@ class LevelManagementService:
                 updated_at=updated_at,
             )
 
+        user_record, history_record = self._persist_evaluation(db, user.id, evaluation)
+        db.commit()
+        invalidate_user_stats(user.id)
+        db.refresh(user_record)
+        db.refresh(history_record)
+        return self._to_response(evaluation, user_record.level_updated_at)
+
+    def _persist_evaluation(self, db: Session, user_id: int, evaluation: LevelEvaluationResult):
         user_record = user_crud.update_user_level(
             db,
-            user_id=user.id,
+            user_id=user_id,
             level=evaluation.level,
             level_score=evaluation.level_score,
             llm_confidence=evaluation.llm_confidence,
@@ -228,18 +337,17 @@ class LevelManagementService:
         )
         history_record = crud.insert_level_history(
             db,
-            user_id=user.id,
+            user_id=user_id,
             level=evaluation.level,
             level_score=evaluation.level_score,
             llm_confidence=evaluation.llm_confidence,
             average_understanding=evaluation.average_understanding,
             sample_count=evaluation.sample_count,
         )
+        return user_record, history_record
 
-        db.commit()
-        db.refresh(user_record)
-        db.refresh(history_record)
-
+    @staticmethod
+    def _to_response(evaluation: LevelEvaluationResult, updated_at: datetime, **extra) -> schemas.LevelTestResponse:
         return schemas.LevelTestResponse(
             level=evaluation.level,
             level_description=schemas.CEFR_LEVEL_DESCRIPTIONS[evaluation.level],
@@ -248,48 +356,254 @@ class LevelManagementService:
                 llm_confidence=evaluation.llm_confidence,
             ),
             rationale=evaluation.rationale,
-            updated_at=user_record.level_updated_at,
+            updated_at=updated_at,
+            **extra,
         )
 
-    def set_manual_level(
+    # ------------------------------------------------------------------ two-phase level test
+    def _apply_provisional(
         self,
-        *,
         db: Session,
         user: User,
-        payload: schemas.ManualLevelUpdateRequest,
-    ) -> schemas.ManualLevelUpdateResponse:
-        user_record = user_crud.update_user_level(
-            db,
-            user_id=user.id,
-            level=payload.level,
-            initial_level_completed=True,
-            commit=False,
-        )
-        history_record = crud.insert_level_history(
-            db,
-            user_id=user.id,
-            level=payload.level,
+        evaluation: LevelEvaluationResult,
+    ) -> Tuple[schemas.LevelTestResponse, int]:
+        user_record, history_record = self._persist_evaluation(db, user.id, evaluation)
+        db.flush()
+        job = crud.create_evaluation_job(db, user_id=user.id, provisional_history_id=history_record.id)
+        db.commit()
+        invalidate_user_stats(user.id)
+        db.refresh(user_record)
+        response = self._to_response(
+            evaluation,
+            user_record.level_updated_at,
+            provisional=True,
+            evaluation_id=job.id,
         )
+        return response, job.id
+
+    def _apply_refinement(self, db: Session, job_id: int, evaluation: LevelEvaluationResult) -> str:
+        job = crud.get_evaluation_job(db, job_id)
+        if job is None or job.status != LEVEL_EVAL_JOB_PENDING:
+            return job.status if job is not None else LEVEL_EVAL_JOB_FAILED
 
+        now = datetime.now(timezone.utc)
+        if not evaluation.llm_success:
+            job.status = LEVEL_EVAL_JOB_FAILED
+        elif crud.get_latest_level_history_id(db, job.user_id) != job.provisional_history_id:
+            # 임시 결과 이후 수동 변경/재시험이 있었으면 덮어쓰지 않는다
+            job.status = LEVEL_EVAL_JOB_SUPERSEDED
+        else:
+            _, history_record = self._persist_evaluation(db, job.user_id, evaluation)
+            db.flush()
+            job.status = LEVEL_EVAL_JOB_REFINED
+            job.refined_history_id = history_record.id
+            job.result = {
+                "level": evaluation.level.value,
+                "level_score": evaluation.level_score,
+                "llm_confidence": evaluation.llm_confidence,
+                "rationale": evaluation.rationale,
+            }
+        job.completed_at = now
         db.commit()
-        db.refresh(user_record)
-        db.refresh(history_record)
+        if job.status == LEVEL_EVAL_JOB_REFINED:
+            invalidate_user_stats(job.user_id)
+        logger.info(f"[level-eval] refinement job={job_id} user_id={job.user_id} status={job.status}")
+        return job.status
+
+    def _fail_pending_job(self, job_id: int) -> None:
+        """Mark a job that will not run (or finish) as failed, so polling ends; the provisional level stays."""
+        db = self._session_factory()
+        try:
+            crud.fail_pending_evaluation_jobs(db, now=datetime.now(timezone.utc), job_ids=[job_id])
+            db.commit()
+        finally:
+            db.close()
+        logger.warning(f"[level-eval] refinement job={job_id} marked failed (not run to completion)")
+
+    async def _refine_in_background(self, job_id: int, request: _EvaluationRequest) -> None:
+        db = self._session_factory()
+        try:
+            try:
+                evaluation = await self._evaluate_request_async(db, request)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"[level-eval] refinement job={job_id} crashed")
+                await run_in_threadpool(db.rollback)
+                evaluation = self._fallback_evaluation(request)
+            await run_in_threadpool(self._apply_refinement, db, job_id, evaluation)
+        except asyncio.CancelledError:
+            # drain 또는 supervisor timeout으로 취소됨: pending으로 남지 않도록 실패 처리
+            await run_in_threadpool(self._fail_pending_job, job_id)
+            raise
+        finally:
+            await run_in_threadpool(db.close)
+
+    async def evaluate_initial_level_two_phase(
+        self,
+        *,
+        db: Session,
+        user: User,
+        payload: schemas.LevelTestRequest,
+    ) -> schemas.LevelTestResponse:
+        """Answer with the heuristic level right away; the LLM result is applied in the background.
+
+        The response has ``provisional=True`` and an ``evaluation_id`` to poll
+        (``GET /level-management/evaluations/{id}``). A cached LLM result is
+        returned directly as a final answer.
+        """
+        scripts = await run_in_threadpool(self._load_level_test_scripts, db, payload)
+        request = self._build_evaluation_request(
+            tests=payload.tests,
+            scripts=scripts,
+            current_profile=self._build_user_profile(user, context="initial_level_assessment"),
+        )
+        cached = await run_in_threadpool(
+            self._evaluation_cache.get, db, key=request.cache_key, version=request.cache_version
+        )
+        if cached is not None:
+            evaluation = self._evaluation_from_llm_payload(request, cached)
+            return await run_in_threadpool(self._apply_evaluation, db, user, evaluation)
 
-        return schemas.ManualLevelUpdateResponse(
-            level=payload.level,
-            level_description=schemas.CEFR_LEVEL_DESCRIPTIONS[payload.level],
-            updated_at=user_record.level_updated_at,
+        provisional = replace(
+            self._fallback_evaluation(request),
+            rationale="자기 보고 이해도 기반의 임시 결과입니다. LLM 평가가 끝나면 레벨이 갱신됩니다.",
+        )
+        response, job_id = await run_in_threadpool(self._apply_provisional, db, user, provisional)
+        scheduled = task_supervisor.submit(
+            f"level_eval_refine:{job_id}",
+            lambda: self._refine_in_background(job_id, request),
+            name="level_eval_refine",
+            retries=0,
         )
+        if not scheduled:
+            # 종료 중이라 예약되지 않음: 클라이언트가 pending을 끝없이 polling하지 않도록
+            await run_in_threadpool(self._fail_pending_job, job_id)
+        return response
 
+    def get_evaluation_status(
+        self,
+        *,
+        db: Session,
+        user: User,
+        evaluation_id: int,
+    ) -> schemas.LevelEvaluationStatusResponse:
+        job = crud.get_evaluation_job(db, evaluation_id)
+        if job is None or job.user_id != user.id:
+            raise LevelEvaluationNotFoundException(evaluation_id)
+
+        result = None
+        if job.status == LEVEL_EVAL_JOB_REFINED and job.result:
+            level = CEFRLevel(job.result["level"])
+            result = schemas.LevelTestResponse(
+                level=level,
+                level_description=schemas.CEFR_LEVEL_DESCRIPTIONS[level],
+                scores=schemas.LevelScores(
+                    level_score=job.result["level_score"],
+                    llm_confidence=job.result["llm_confidence"],
+                ),
+                rationale=job.result["rationale"],
+                updated_at=job.completed_at,
+                evaluation_id=job.id,
+            )
+        return schemas.LevelEvaluationStatusResponse(
+            evaluation_id=job.id,
+            status=job.status,
+            result=result,
+            completed_at=job.completed_at,
+        )
 
+    # ------------------------------------------------------------------ LLM evaluation
     def _summarize_level_test(
         self,
         *,
+        db: Optional[Session] = None,
+        tests: List[schemas.LevelTestItem],
+        scripts: Mapping[str, object],
+        current_profile: Optional[Dict[str, object]] = None,
+        default_target_level: Optional[CEFRLevel] = None,
+    ) -> LevelEvaluationResult:
+        request = self._build_evaluation_request(
+            tests=tests,
+            scripts=scripts,
+            current_profile=current_profile,
+            default_target_level=default_target_level,
+        )
+        cached = self._evaluation_cache.get(db, key=request.cache_key, version=request.cache_version)
+        if cached is not None:
+            return self._evaluation_from_llm_payload(request, cached)
+
+        try:
+            raw = self._resolve_llm_client().generate_json(
+                model=_LEVEL_EVALUATION_MODEL,
+                system_prompt=request.system_prompt,
+                user_prompt=request.user_prompt,
+                temperature=0.2,
+            )
+            llm_payload = json.loads(raw)
+        except (LLMServiceError, json.JSONDecodeError):
+            return self._fallback_evaluation(request)
+
+        if isinstance(llm_payload, dict):
+            self._evaluation_cache.put(db, key=request.cache_key, version=request.cache_version, payload=llm_payload)
+        return self._evaluation_from_llm_payload(request, llm_payload)
+
+    async def _summarize_level_test_async(
+        self,
+        *,
+        db: Optional[Session] = None,
         tests: List[schemas.LevelTestItem],
         scripts: Mapping[str, object],
         current_profile: Optional[Dict[str, object]] = None,
         default_target_level: Optional[CEFRLevel] = None,
     ) -> LevelEvaluationResult:
+        request = self._build_evaluation_request(
+            tests=tests,
+            scripts=scripts,
+            current_profile=current_profile,
+            default_target_level=default_target_level,
+        )
+        return await self._evaluate_request_async(db, request)
+
+    async def _evaluate_request_async(
+        self,
+        db: Optional[Session],
+        request: _EvaluationRequest,
+    ) -> LevelEvaluationResult:
+        cached = await run_in_threadpool(
+            self._evaluation_cache.get, db, key=request.cache_key, version=request.cache_version
+        )
+        if cached is not None:
+            return self._evaluation_from_llm_payload(request, cached)
+
+        try:
+            raw = await self._resolve_async_llm_client().generate_json(
+                model=_LEVEL_EVALUATION_MODEL,
+                system_prompt=request.system_prompt,
+                user_prompt=request.user_prompt,
+                temperature=0.2,
+            )
+            llm_payload = json.loads(raw)
+        except (LLMServiceError, json.JSONDecodeError):
+            # circuit open / deadline 초과도 LLMServiceError -> 즉시 휴리스틱 결과
+            return self._fallback_evaluation(request)
+
+        if isinstance(llm_payload, dict):
+            await run_in_threadpool(
+                self._evaluation_cache.put,
+                db,
+                key=request.cache_key,
+                version=request.cache_version,
+                payload=llm_payload,
+            )
+        return self._evaluation_from_llm_payload(request, llm_payload)
+
+    def _build_evaluation_request(
+        self,
+        *,
+        tests: List[schemas.LevelTestItem],
+        scripts: Mapping[str, object],
+        current_profile: Optional[Dict[str, object]] = None,
+        default_target_level: Optional[CEFRLevel] = None,
+    ) -> _EvaluationRequest:
         average_understanding = round(
             sum(item.understanding for item in tests) / len(tests)
         )
@@ -298,6 +612,7 @@ class LevelManagementService:
         default_target_level = default_target_level or fallback_level
 
         test_payload = []
+        transcripts: List[str] = []
         for item in tests:
             identifier = self._resolve_test_identifier(item)
             script_entry = scripts.get(identifier)
@@ -310,10 +625,11 @@ class LevelManagementService:
             target_level = self._coerce_target_level(script_entry, default_target_level)
             transcript = self._extract_transcript(script_entry)
 
+            # 전체 transcript 대신 난이도 특징 + 발췌문 (발췌 길이는 fit_to_budget이 정함)
             payload_entry = {
                 "identifier": identifier,
                 "target_level": target_level.value,
-                "transcript": transcript,
+                "features": script_features(script_entry, transcript),
                 "self_reported_understanding": item.understanding,
             }
             if item.script_id is not None:
@@ -325,6 +641,7 @@ class LevelManagementService:
                 payload_entry["title"] = title.strip()
 
             test_payload.append(payload_entry)
+            transcripts.append(transcript)
 
         cefr_payload = [
             {
@@ -341,32 +658,52 @@ class LevelManagementService:
             "note": "No prior learner profile was provided.",
         }
         prompt = _PROMPT_STORE.load("level_evaluation")
-        user_prompt = prompt.user.format(
-            cefr_bands=json.dumps(cefr_payload, ensure_ascii=False, indent=2),
-            current_profile=json.dumps(profile_payload, ensure_ascii=False, indent=2),
-            tests=json.dumps(test_payload, ensure_ascii=False, indent=2),
+        cefr_bands = compact_json(cefr_payload)
+        profile_json = compact_json(profile_payload)
+        user_prompt, prompt_tokens = fit_to_budget(
+            test_payload,
+            transcripts,
+            lambda entries: prompt.user.format(
+                cefr_bands=cefr_bands,
+                current_profile=profile_json,
+                tests=compact_json(entries),
+            ),
+            budget=settings.level_eval_prompt_token_budget,
+        )
+        logger.info(f"[level-eval] prompt ~{prompt_tokens} tokens for {sample_count} samples")
+        version = cache_version(_LEVEL_EVALUATION_MODEL, prompt)
+        return _EvaluationRequest(
+            average_understanding=average_understanding,
+            sample_count=sample_count,
+            fallback_level=fallback_level,
+            system_prompt=prompt.system,
+            user_prompt=user_prompt,
+            cache_key=build_cache_key(
+                version=version,
+                tests=test_payload,
+                cefr_bands=cefr_payload,
+                profile=profile_payload,
+            ),
+            cache_version=version,
         )
 
-        try:
-            raw = self._resolve_llm_client().generate_json(
-                model="gpt-5-nano",
-                system_prompt=prompt.system,
-                user_prompt=user_prompt,
-                temperature=0.2,
-            )
-            llm_payload = json.loads(raw)
-        except (LLMServiceError, json.JSONDecodeError):
-            return LevelEvaluationResult(
-                level=fallback_level,
-                level_score=self._default_band_midpoint(fallback_level),
-                llm_confidence=average_understanding,
-                average_understanding=average_understanding,
-                sample_count=sample_count,
-                rationale="LLM 평가가 실패하여 자기 보고 이해도 기반의 휴리스틱 결과를 사용했습니다.",
-                llm_success=False,
-            )
+    def _fallback_evaluation(self, request: _EvaluationRequest) -> LevelEvaluationResult:
+        return LevelEvaluationResult(
+            level=request.fallback_level,
+            level_score=self._default_band_midpoint(request.fallback_level),
+            llm_confidence=request.average_understanding,
+            average_understanding=request.average_understanding,
+            sample_count=request.sample_count,
+            rationale="LLM 평가가 실패하여 자기 보고 이해도 기반의 휴리스틱 결과를 사용했습니다.",
+            llm_success=False,
+        )
 
-        assigned_level = self._extract_level(llm_payload, fallback_level)
+    def _evaluation_from_llm_payload(
+        self,
+        request: _EvaluationRequest,
+        llm_payload: Dict[str, object],
+    ) -> LevelEvaluationResult:
+        assigned_level = self._extract_level(llm_payload, request.fallback_level)
         level_score = self._clamp_score(
             llm_payload.get("level_score"),
             self._default_band_midpoint(assigned_level),
@@ -381,8 +718,8 @@ class LevelManagementService:
             level=assigned_level,
             level_score=level_score,
             llm_confidence=llm_confidence,
-            average_understanding=average_understanding,
-            sample_count=sample_count,
+            average_understanding=request.average_understanding,
+            sample_count=request.sample_count,
             rationale=rationale,
             llm_success=True,
         )
@@ -392,6 +729,10 @@ class LevelManagementService:
             self._llm_client = OpenAILLMClient()
         return self._llm_client
 
+    def _resolve_async_llm_client(self) -> AsyncOpenAILLMClient:
+        # 기본값은 프로세스 공용 클라이언트 (circuit breaker / 지표 공유)
+        return self._async_llm_client or get_async_llm_client()
+
     @staticmethod
     def _clamp_score(value: object, default: int) -> int:
         try:
@@ -472,3 +813,17 @@ class LevelManagementService:
         if isinstance(script_data, str):
             return script_data
         return ""
+
+
+def fail_stale_evaluation_jobs_at_startup() -> None:
+    """Lifespan hook: pending jobs left by a previous process never run (their LLM request is not stored)."""
+    db = SessionLocal()
+    try:
+        count = crud.fail_pending_evaluation_jobs(db, now=datetime.now(timezone.utc))
+        db.commit()
+        if count:
+            logger.warning(f"[level-eval] marked {count} stale pending refinement job(s) failed")
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"[level-eval] stale job cleanup failed: {e}")
+    finally:
+        db.close()
@@ -1,3 +1,4 @@
+from ...core.config import settings
 from ...core.level.strategy import LevelServiceStrategy
 from .service import LevelManagementService
 
@@ -5,11 +6,22 @@ class AILevelManagementStrategy(LevelServiceStrategy):
     def __init__(self):
         self.service = LevelManagementService() 
 
+    # LevelManagementService 메서드는 keyword-only 인자를 받는다
     def evaluate_level_test(self, db, user, payload):
-        return self.service.evaluate_initial_level(db, user, payload)
+        return self.service.evaluate_initial_level(db=db, user=user, payload=payload)
 
     def evaluate_session_feedback(self, db, user, payload):
-        return self.service.evaluate_session_feedback(db, user, payload)
+        return self.service.evaluate_session_feedback(db=db, user=user, payload=payload)
+
+    # LLM 호출을 await 하는 비동기 경로 (DB 작업만 threadpool)
+    async def evaluate_level_test_async(self, db, user, payload):
+        if settings.level_eval_two_phase:
+            # 휴리스틱 임시 결과를 즉시 반환, LLM 결과는 백그라운드에서 반영
+            return await self.service.evaluate_initial_level_two_phase(db=db, user=user, payload=payload)
+        return await self.service.evaluate_initial_level_async(db=db, user=user, payload=payload)
+
+    async def evaluate_session_feedback_async(self, db, user, payload):
+        return await self.service.evaluate_session_feedback_async(db=db, user=user, payload=payload)
 
     def set_manual_level(self, db, user, payload):
-        return self.service.set_manual_level(db, user, payload)
+        return self.service.set_manual_level(db=db, user=user, payload=payload)
@@ -0,0 +1,138 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ..users.models import User
+from .models import EVENT_BASELINE, EVENT_FEEDBACK, EVENT_REPLAY, EVENT_RESET, LevelFeedbackEvent
+
+Levels = Tuple[float, float, float]
+
+
+def _event(user_id: int, event_type: str, levels: Levels, **extra) -> LevelFeedbackEvent:
+    lexical, syntactic, speed = levels
+    return LevelFeedbackEvent(
+        user_id=user_id,
+        event_type=event_type,
+        lexical_level=lexical,
+        syntactic_level=syntactic,
+        speed_level=speed,
+        **extra,
+    )
+
+
+def ensure_baseline_event(db: Session, *, user_id: int) -> Optional[Levels]:
+    """Lock the user's row and record its levels as a baseline if the event log is empty.
+
+    Must run before the first feedback UPDATE so a replay has an absolute start.
+    The row is read FOR UPDATE and the lock is held until the caller commits, so
+    concurrent first feedbacks serialize here (only one writes the baseline) and
+    the level UPDATE that follows runs under the same lock. Returns the current
+    levels, or None if the user does not exist.
+    """
+    row = db.execute(
+        select(User.lexical_level, User.syntactic_level, User.speed_level)
+        .where(User.id == user_id)
+        .with_for_update()
+    ).one_or_none()
+    if row is None:
+        return None
+    levels = (float(row[0]), float(row[1]), float(row[2]))
+    has_events = (
+        db.query(LevelFeedbackEvent.id)
+        .filter(LevelFeedbackEvent.user_id == user_id)
+        .limit(1)
+        .first()
+    )
+    if not has_events:
+        db.add(_event(user_id, EVENT_BASELINE, levels))
+    return levels
+
+
+def add_feedback_event(
+    db: Session,
+    *,
+    user_id: int,
+    generated_content_id: Optional[int],
+    vector: Sequence[float],
+    levels: Levels,
+) -> None:
+    """Queue a feedback event (committed together with the level update)."""
+    db.add(
+        _event(
+            user_id,
+            EVENT_FEEDBACK,
+            levels,
+            generated_content_id=generated_content_id,
+            vector=[float(v) for v in vector],
+        )
+    )
+
+
+def add_reset_event(db: Session, *, user_id: int, levels: Levels, event_type: str = EVENT_RESET) -> None:
+    """Queue an event for levels overwritten with absolute values (reset, level_test or replay)."""
+    db.add(_event(user_id, event_type, levels))
+
+
+def load_events(db: Session, *, user_ids: Optional[Iterable[int]] = None, batch_size: int = 10000):
+    """Stream (id, user_id, event_type, vector, lexical, syntactic, speed) ordered by (user_id, id).
+
+    ``replay`` events are left out: they only record the result of an earlier
+    replay, and the input is always the original baseline/feedback history.
+    """
+    stmt = select(
+        LevelFeedbackEvent.id,
+        LevelFeedbackEvent.user_id,
+        LevelFeedbackEvent.event_type,
+        LevelFeedbackEvent.vector,
+        LevelFeedbackEvent.lexical_level,
+        LevelFeedbackEvent.syntactic_level,
+        LevelFeedbackEvent.speed_level,
+    ).where(
+        LevelFeedbackEvent.event_type != EVENT_REPLAY
+    ).order_by(LevelFeedbackEvent.user_id, LevelFeedbackEvent.id)
+    if user_ids is not None:
+        stmt = stmt.where(LevelFeedbackEvent.user_id.in_(list(user_ids)))
+    return db.execute(stmt.execution_options(yield_per=batch_size))
+
+
+def get_user_levels(db: Session, *, user_ids: Iterable[int], chunk_size: int = 1000) -> dict[int, Levels]:
+    user_ids = list(user_ids)
+    levels: dict[int, Levels] = {}
+    for start in range(0, len(user_ids), chunk_size):
+        rows = db.execute(
+            select(User.id, User.lexical_level, User.syntactic_level, User.speed_level).where(
+                User.id.in_(user_ids[start : start + chunk_size])
+            )
+        )
+        levels.update({row[0]: (float(row[1]), float(row[2]), float(row[3])) for row in rows})
+    return levels
+
+
+def bulk_update_user_levels(db: Session, rows: Sequence[dict], *, chunk_size: int = 1000) -> None:
+    """rows: {"id", "lexical_level", "syntactic_level", "speed_level"}; executemany per chunk."""
+    for start in range(0, len(rows), chunk_size):
+        db.execute(update(User), list(rows[start : start + chunk_size]))
+
+
+def get_level_history(
+    db: Session,
+    *,
+    user_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[Tuple[datetime, float, float, float]]:
+    """(created_at, lexical, syntactic, speed) of every level change in the range, oldest first."""
+    stmt = select(
+        LevelFeedbackEvent.created_at,
+        LevelFeedbackEvent.lexical_level,
+        LevelFeedbackEvent.syntactic_level,
+        LevelFeedbackEvent.speed_level,
+    ).where(LevelFeedbackEvent.user_id == user_id)
+    if start is not None:
+        stmt = stmt.where(LevelFeedbackEvent.created_at >= start)
+    if end is not None:
+        stmt = stmt.where(LevelFeedbackEvent.created_at <= end)
+    stmt = stmt.order_by(LevelFeedbackEvent.created_at, LevelFeedbackEvent.id)
+    return [(row[0], float(row[1]), float(row[2]), float(row[3])) for row in db.execute(stmt)]
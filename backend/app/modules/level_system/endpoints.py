@@ -1,17 +1,25 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from ...core.config import get_db
+from ...core.config import get_db, settings
 from ...core.exceptions import UserNotFoundException
 from ..users import crud as user_crud
 from . import schemas
 from ...core.logger import logger
 from ...core.auth import oauth2_scheme, verify_token, TokenType
 from ...core.level.context import LevelContext
+from .service import LevelSystemService
+from .shadow import build_llm_shadow
 from .strategy_impl import HeuristicLevelSystemStrategy
 
 
 router = APIRouter(prefix="/level-system", tags=["level-system"])
 context = LevelContext(HeuristicLevelSystemStrategy())
+if settings.level_shadow_sample_rate > 0:
+    context.set_shadow(build_llm_shadow(settings.level_shadow_sample_rate))
+level_service = LevelSystemService()
 
 def get_current_user(token=Depends(oauth2_scheme), db: Session = Depends(get_db)):
     payload = verify_token(token.credentials, TokenType.ACCESS_TOKEN)
@@ -49,6 +57,25 @@ def submit_session_feedback(
     return result
 
 
+@router.post("/session-feedback/batch", response_model=schemas.SessionFeedbackBatchResponse)
+def submit_session_feedback_batch(
+    payload: schemas.SessionFeedbackBatchRequest,
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """오프라인에서 모아둔 세션 피드백 여러 건을 한 트랜잭션으로 반영하는 엔드포인트."""
+    logger.info(
+        "Session feedback batch - user: %d, count: %d",
+        current_user.id,
+        len(payload.feedbacks),
+    )
+    return context.evaluate_session_feedback_batch(
+        db=db,
+        user=current_user,
+        payloads=payload.feedbacks,
+    )
+
+
 @router.post("/level-test", response_model=schemas.LevelTestResponse)
 def evaluate_level_test(
         payload: schemas.LevelTestRequest,
@@ -82,5 +109,13 @@ def set_manual_level(
     return context.set_manual_level(db=db, user=current_user, payload=payload)
 
 
-
-
+@router.get("/history", response_model=schemas.LevelHistoryResponse)
+def get_level_history(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    points: int = Query(100, ge=3, le=1000, description="max points to return (LTTB downsampled)"),
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """진척도 차트용 레벨 변화 시계열. 구간 내 변경이 많으면 points개로 다운샘플링한다."""
+    return level_service.get_level_history(db, current_user, start=start, end=end, points=points)
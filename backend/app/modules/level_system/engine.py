@@ -0,0 +1,226 @@
+"""Vectorized (NumPy) version of the level update rule for bulk replay.
+
+The per-request path (`_compute_levels_delta_from_weights` + the clamped SQL
+UPDATE) handles one feedback at a time. This module applies the same rule to
+the whole feedback event log at once so new weight matrices / clip ranges can be
+evaluated (dry-run) or applied to every user.
+
+Replay is sequential per user (each step is clamped to [0, 300]), but vectorized
+*across* users: step t processes the t-th event of every user in one NumPy
+operation, so the Python loop runs max(events per user) times, not N times.
+"""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import RESET_EVENT_TYPES
+
+LEVEL_MIN = 0.0
+LEVEL_MAX = 300.0
+DIMENSIONS = ("lexical", "syntactic", "speed")
+
+
+@dataclass(frozen=True)
+class LevelParameters:
+    """Weight matrix (6x3) and per-dimension clip ranges of the level update rule."""
+
+    weight_matrix: np.ndarray
+    clip_ranges: Mapping[str, Tuple[float, float]]
+    version: str = "default"
+
+    @classmethod
+    def from_values(
+        cls,
+        weight_matrix: Sequence[Sequence[float]],
+        clip_ranges: Optional[Mapping[str, Sequence[float]]] = None,
+        version: str = "default",
+    ) -> "LevelParameters":
+        W = np.asarray(weight_matrix, dtype=np.float64)
+        if W.shape != (6, 3):
+            raise ValueError("weight matrix W must be 6x3")
+        ranges = {
+            name: (float(lo), float(hi)) for name, (lo, hi) in (clip_ranges or {}).items() if name in DIMENSIONS
+        }
+        return cls(weight_matrix=W, clip_ranges=ranges, version=str(version))
+
+    @classmethod
+    def from_json_file(cls, path: str) -> "LevelParameters":
+        """Load a weight config (``weight_matrix``, optional ``clip_ranges`` / ``version``)."""
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        return cls.from_values(data["weight_matrix"], data.get("clip_ranges"), data.get("version", "default"))
+
+    def clip_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        lower = np.array([self.clip_ranges.get(name, (-np.inf, np.inf))[0] for name in DIMENSIONS])
+        upper = np.array([self.clip_ranges.get(name, (-np.inf, np.inf))[1] for name in DIMENSIONS])
+        return lower, upper
+
+
+def compute_deltas(vectors: np.ndarray, params: LevelParameters) -> np.ndarray:
+    """(N, 6) feedback vectors -> (N, 3) clipped level deltas.
+
+    Same rule as ``_compute_levels_delta_from_weights``: weighted sum, round to
+    2 decimals, then clip each dimension.
+    """
+    vectors = np.asarray(vectors, dtype=np.float64).reshape(-1, 6)
+    lower, upper = params.clip_bounds()
+    return np.clip(np.round(vectors @ params.weight_matrix, 2), lower, upper)
+
+
+def step_levels(levels: np.ndarray, deltas: np.ndarray) -> np.ndarray:
+    """Apply deltas the way the SQL UPDATE does: clamp to [0, 300], store at 0.1 precision."""
+    # users.lexical_level 등은 DECIMAL(4, 1)이므로 매 단계 0.1 단위로 저장된다
+    return np.round(np.clip(levels + deltas, LEVEL_MIN, LEVEL_MAX), 1)
+
+
+def replay(
+    user_index: np.ndarray,
+    is_reset: np.ndarray,
+    vectors: np.ndarray,
+    reset_levels: np.ndarray,
+    params: LevelParameters,
+    *,
+    n_users: int,
+    initial_levels: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Replay event sequences for many users.
+
+    Args:
+        user_index: (N,) dense user index 0..n_users-1; events must be sorted by
+            (user_index, event order).
+        is_reset: (N,) True for baseline/reset events (absolute levels).
+        vectors: (N, 6) normalized feedback vectors (ignored for reset events).
+        reset_levels: (N, 3) absolute levels of reset events (ignored otherwise).
+        initial_levels: (n_users, 3) levels before the first event (zeros if None).
+
+    Returns:
+        (final_levels (n_users, 3), trajectory (N, 3) levels after each event)
+    """
+    user_index = np.asarray(user_index, dtype=np.int64)
+    is_reset = np.asarray(is_reset, dtype=bool)
+    n_events = user_index.shape[0]
+
+    levels = (
+        np.zeros((n_users, 3), dtype=np.float64)
+        if initial_levels is None
+        else np.array(initial_levels, dtype=np.float64, copy=True)
+    )
+    trajectory = np.zeros((n_events, 3), dtype=np.float64)
+    if n_events == 0:
+        return levels, trajectory
+
+    if np.any(np.diff(user_index) < 0):
+        raise ValueError("events must be sorted by user")
+
+    deltas = compute_deltas(vectors, params)
+    reset_levels = np.asarray(reset_levels, dtype=np.float64).reshape(-1, 3)
+
+    # rank of each event within its user's sequence
+    group_starts = np.flatnonzero(np.r_[True, user_index[1:] != user_index[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, n_events])
+    rank = np.arange(n_events) - np.repeat(group_starts, group_sizes)
+
+    # events grouped by rank: step t touches each user at most once
+    order = np.argsort(rank, kind="stable")
+    step_bounds = np.r_[0, np.cumsum(np.bincount(rank))]
+
+    for step in range(step_bounds.shape[0] - 1):
+        idx = order[step_bounds[step] : step_bounds[step + 1]]
+        users = user_index[idx]
+        stepped = step_levels(levels[users], deltas[idx])
+        new_levels = np.where(is_reset[idx, None], np.round(reset_levels[idx], 1), stepped)
+        levels[users] = new_levels
+        trajectory[idx] = new_levels
+
+    return levels, trajectory
+
+
+@dataclass
+class EventArrays:
+    """Columnar form of the event log, sorted by (user_id, id)."""
+
+    event_ids: np.ndarray
+    user_ids: np.ndarray  # distinct user ids, position = dense index
+    user_index: np.ndarray
+    is_reset: np.ndarray
+    vectors: np.ndarray
+    levels: np.ndarray  # stored levels after each event
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> "EventArrays":
+        """rows: (id, user_id, event_type, vector, lexical, syntactic, speed) sorted by (user_id, id)."""
+        event_ids: List[int] = []
+        user_id_col: List[int] = []
+        is_reset: List[bool] = []
+        vectors: List[Sequence[float]] = []
+        levels: List[Tuple[float, float, float]] = []
+        zero = (0.0,) * 6
+        for event_id, user_id, event_type, vector, lexical, syntactic, speed in rows:
+            event_ids.append(event_id)
+            user_id_col.append(user_id)
+            reset = event_type in RESET_EVENT_TYPES
+            is_reset.append(reset)
+            vectors.append(zero if reset or not vector else vector)
+            levels.append((float(lexical), float(syntactic), float(speed)))
+
+        user_id_arr = np.asarray(user_id_col, dtype=np.int64)
+        distinct, user_index = np.unique(user_id_arr, return_inverse=True)
+        return cls(
+            event_ids=np.asarray(event_ids, dtype=np.int64),
+            user_ids=distinct,
+            user_index=user_index.reshape(-1),
+            is_reset=np.asarray(is_reset, dtype=bool),
+            vectors=np.asarray(vectors, dtype=np.float64).reshape(-1, 6),
+            levels=np.asarray(levels, dtype=np.float64).reshape(-1, 3),
+        )
+
+
+@dataclass
+class ReplayReport:
+    users: int
+    events: int
+    elapsed_seconds: float
+    applied: bool
+    mean_abs_change: Dict[str, float] = field(default_factory=dict)
+    max_abs_change: Dict[str, float] = field(default_factory=dict)
+    changed_users: int = 0
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "users": self.users,
+            "events": self.events,
+            "changed_users": self.changed_users,
+            "mean_abs_change": self.mean_abs_change,
+            "max_abs_change": self.max_abs_change,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "applied": self.applied,
+        }
+
+
+def summarize(
+    current: np.ndarray,
+    replayed: np.ndarray,
+    *,
+    n_events: int,
+    started: float,
+    applied: bool,
+) -> ReplayReport:
+    diff = np.abs(replayed - current) if current.size else np.zeros((0, 3))
+    return ReplayReport(
+        users=int(current.shape[0]),
+        events=n_events,
+        elapsed_seconds=time.monotonic() - started,
+        applied=applied,
+        mean_abs_change={
+            name: round(float(diff[:, i].mean()), 3) if diff.size else 0.0 for i, name in enumerate(DIMENSIONS)
+        },
+        max_abs_change={
+            name: round(float(diff[:, i].max()), 3) if diff.size else 0.0 for i, name in enumerate(DIMENSIONS)
+        },
+        changed_users=int(np.count_nonzero(np.any(diff > 1e-9, axis=1))) if diff.size else 0,
+    )
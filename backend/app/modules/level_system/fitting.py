@@ -0,0 +1,245 @@
+"""Offline fitting of the 6x3 weight matrix W from the level event log.
+
+Training samples come from level tests: between an absolute anchor (baseline,
+reset or an earlier level test) and the next ``level_test`` event of the same
+user, the feedback vectors should explain the measured level change::
+
+    sum(feedback vectors in the interval) @ W  ~=  level_test levels - anchor levels
+
+W is fitted with ridge regression shrunk toward the weights currently in use,
+so dimensions with little data keep their hand-picked values. Only the
+sufficient statistics (X^T X, X^T Y, ...) are accumulated, chunk by chunk, so
+memory does not depend on the number of feedback rows.
+
+Usage (from backend/):
+    python -m app.modules.level_system.fitting --out-dir weights/ --alpha 10
+    # then set LEVEL_WEIGHTS_PATH=weights/level_weights_<version>.json
+
+Per-step clipping and the [0, 300] clamp are not modelled; intervals that hit
+the level bounds add noise to the fit.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from . import crud as level_crud
+from .engine import DIMENSIONS, LevelParameters
+from .models import EVENT_LEVEL_TEST, RESET_EVENT_TYPES
+
+FEATURES = ("pause", "rewind", "vocab_lookup", "vocab_save", "understanding", "speed")
+FIT_CHUNK_SIZE = 10000
+
+
+def iter_training_samples(rows: Iterable[Sequence]) -> Iterator[Tuple[np.ndarray, np.ndarray, int]]:
+    """Yield (summed feedback vector, level change, feedback count) per level-test interval.
+
+    rows: (id, user_id, event_type, vector, lexical, syntactic, speed) sorted by (user_id, id),
+    i.e. the output of ``crud.load_events``.
+    """
+    current_user = None
+    anchor: Optional[np.ndarray] = None
+    feature_sum = np.zeros(6)
+    count = 0
+
+    for _event_id, user_id, event_type, vector, lexical, syntactic, speed in rows:
+        if user_id != current_user:
+            current_user, anchor, feature_sum, count = user_id, None, np.zeros(6), 0
+
+        if event_type in RESET_EVENT_TYPES:
+            levels = np.array([float(lexical), float(syntactic), float(speed)])
+            if event_type == EVENT_LEVEL_TEST and anchor is not None and count:
+                yield feature_sum, levels - anchor, count
+            anchor, feature_sum, count = levels, np.zeros(6), 0
+        elif vector:
+            feature_sum = feature_sum + np.asarray(vector, dtype=np.float64)
+            count += 1
+
+
+@dataclass
+class RidgeAccumulator:
+    """Streaming sufficient statistics for a multi-output linear regression Y ~ X @ W."""
+
+    xtx: np.ndarray = field(default_factory=lambda: np.zeros((6, 6)))
+    xty: np.ndarray = field(default_factory=lambda: np.zeros((6, 3)))
+    yty: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    y_sum: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    n_samples: int = 0
+    n_feedback: int = 0
+
+    def add(self, X: np.ndarray, Y: np.ndarray, n_feedback: int = 0) -> None:
+        X = np.asarray(X, dtype=np.float64).reshape(-1, 6)
+        Y = np.asarray(Y, dtype=np.float64).reshape(-1, 3)
+        self.xtx += X.T @ X
+        self.xty += X.T @ Y
+        self.yty += np.einsum("ij,ij->j", Y, Y)
+        self.y_sum += Y.sum(axis=0)
+        self.n_samples += X.shape[0]
+        self.n_feedback += n_feedback
+
+    def solve(self, alpha: float, prior: np.ndarray) -> np.ndarray:
+        """argmin ||XW - Y||^2 + alpha * ||W - prior||^2."""
+        return np.linalg.solve(self.xtx + alpha * np.eye(6), self.xty + alpha * prior)
+
+    def sse(self, W: np.ndarray) -> np.ndarray:
+        """Per-dimension sum of squared errors of W, computed from the statistics alone."""
+        return np.maximum(
+            self.yty - 2 * np.einsum("ij,ij->j", W, self.xty) + np.einsum("ij,ik,kj->j", W, self.xtx, W),
+            0.0,
+        )
+
+    def rmse(self, W: np.ndarray) -> np.ndarray:
+        return np.sqrt(self.sse(W) / max(self.n_samples, 1))
+
+    def r2(self, W: np.ndarray) -> np.ndarray:
+        sst = self.yty - self.y_sum**2 / max(self.n_samples, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(sst > 0, 1 - self.sse(W) / sst, 0.0)
+
+
+@dataclass
+class FitResult:
+    weight_matrix: np.ndarray
+    n_samples: int
+    n_feedback: int
+    alpha: float
+    rmse: Dict[str, float]
+    r2: Dict[str, float]
+    baseline_rmse: Dict[str, float]
+    # sensitivity[feature][dimension]: RMSE increase when that weight is set to 0
+    sensitivity: Dict[str, Dict[str, float]]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "n_samples": self.n_samples,
+            "n_feedback": self.n_feedback,
+            "alpha": self.alpha,
+            "rmse": self.rmse,
+            "r2": self.r2,
+            "baseline_rmse": self.baseline_rmse,
+            "sensitivity": self.sensitivity,
+        }
+
+
+def _per_dimension(values: np.ndarray) -> Dict[str, float]:
+    return {name: round(float(values[i]), 4) for i, name in enumerate(DIMENSIONS)}
+
+
+def fit_from_accumulator(acc: RidgeAccumulator, prior: LevelParameters, *, alpha: float) -> FitResult:
+    prior_W = prior.weight_matrix
+    if acc.n_samples == 0:
+        W = prior_W.copy()
+    else:
+        W = np.round(acc.solve(alpha, prior_W), 4)
+
+    rmse = acc.rmse(W)
+    sensitivity: Dict[str, Dict[str, float]] = {}
+    for i, feature in enumerate(FEATURES):
+        dropped = W.copy()
+        dropped[i, :] = 0.0
+        sensitivity[feature] = _per_dimension(acc.rmse(dropped) - rmse)
+
+    return FitResult(
+        weight_matrix=W,
+        n_samples=acc.n_samples,
+        n_feedback=acc.n_feedback,
+        alpha=alpha,
+        rmse=_per_dimension(rmse),
+        r2=_per_dimension(acc.r2(W)),
+        baseline_rmse=_per_dimension(acc.rmse(prior_W)),
+        sensitivity=sensitivity,
+    )
+
+
+def accumulate_samples(
+    samples: Iterable[Tuple[np.ndarray, np.ndarray, int]], *, chunk_size: int = FIT_CHUNK_SIZE
+) -> RidgeAccumulator:
+    acc = RidgeAccumulator()
+    xs: List[np.ndarray] = []
+    ys: List[np.ndarray] = []
+    counts = 0
+    for x, y, n in samples:
+        xs.append(x)
+        ys.append(y)
+        counts += n
+        if len(xs) >= chunk_size:
+            acc.add(np.vstack(xs), np.vstack(ys), counts)
+            xs, ys, counts = [], [], 0
+    if xs:
+        acc.add(np.vstack(xs), np.vstack(ys), counts)
+    return acc
+
+
+def fit_weights(
+    db: Session,
+    prior: LevelParameters,
+    *,
+    alpha: float = 10.0,
+    chunk_size: int = FIT_CHUNK_SIZE,
+    user_ids: Optional[Iterable[int]] = None,
+) -> FitResult:
+    """Stream the event log from the DB and fit W (see module docstring)."""
+    rows = level_crud.load_events(db, user_ids=user_ids, batch_size=chunk_size)
+    acc = accumulate_samples(iter_training_samples(rows), chunk_size=chunk_size)
+    return fit_from_accumulator(acc, prior, alpha=alpha)
+
+
+def write_weight_config(
+    out_dir: str,
+    result: FitResult,
+    prior: LevelParameters,
+    *,
+    version: Optional[str] = None,
+) -> str:
+    """Write ``level_weights_<version>.json`` (never overwrites) and return its path."""
+    version = version or datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    path = os.path.join(out_dir, f"level_weights_{version}.json")
+    payload = {
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "previous_version": prior.version,
+        "weight_matrix": result.weight_matrix.tolist(),
+        "clip_ranges": {name: list(bounds) for name, bounds in prior.clip_ranges.items()},
+        "fit": result.as_dict(),
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    with open(path, "x", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out-dir", help="write level_weights_<version>.json here (default: report only)")
+    parser.add_argument("--version", help="config version (default: UTC timestamp)")
+    parser.add_argument("--alpha", type=float, default=10.0, help="ridge strength toward the current weights")
+    parser.add_argument("--chunk-size", type=int, default=FIT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    from ...core.config import SessionLocal
+    from .replay import current_parameters
+    from .service import load_weight_config
+
+    load_weight_config()
+    prior = current_parameters()
+    db = SessionLocal()
+    try:
+        result = fit_weights(db, prior, alpha=args.alpha, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+
+    report = {"previous_version": prior.version, "weight_matrix": result.weight_matrix.tolist(), **result.as_dict()}
+    if args.out_dir:
+        report["path"] = write_weight_config(args.out_dir, result, prior, version=args.version)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
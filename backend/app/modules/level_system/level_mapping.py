@@ -0,0 +1,169 @@
+"""Score -> CEFR level / playback speed mapping.
+
+The tables are built once from ``LEVEL_THRESHOLDS`` at import time; scalar
+lookups use ``bisect`` and the batch versions (``cefr_levels_from_scores``,
+``speeds_from_level_scores``, ``average_scores_and_levels``) use
+``np.searchsorted`` and the same float expressions so replay and analytics jobs
+can map whole arrays at once with results identical to the scalar functions
+(including Python's exact ``round``). ``utils`` re-exports the scalar API, so existing imports keep
+working.
+
+Benchmark: ``python -m app.modules.level_system.mapping_benchmark``
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from enum import Enum
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+
+class CEFRLevel(Enum):
+    """CEFR 레벨 정의"""
+    A1 = "A1"
+    A2 = "A2"
+    B1 = "B1"
+    B2 = "B2"
+    C1 = "C1"
+    C2 = "C2"
+
+
+# TODO: 실제로 저장할 레벨 별 구간값들 정하기
+LEVEL_THRESHOLDS = {
+    CEFRLevel.A1: 0,
+    CEFRLevel.A2: 25,
+    CEFRLevel.B1: 50,
+    CEFRLevel.B2: 100,
+    CEFRLevel.C1: 150,
+    CEFRLevel.C2: 200,
+}
+MIN_SCORE = 0 # 최소 스코어
+MAX_SCORE = 300  # 최대 스코어
+
+# 각 레벨 시작 스코어에서의 재생 속도 (C2 시작점 이후는 최고 속도로 고정)
+SPEED_AT_THRESHOLD = {
+    CEFRLevel.A1: 0.70,
+    CEFRLevel.A2: 0.80,
+    CEFRLevel.B1: 0.90,
+    CEFRLevel.B2: 1.00,
+    CEFRLevel.C1: 1.10,
+    CEFRLevel.C2: 1.15,
+}
+
+# --- 미리 계산된 테이블 (import 시 한 번) ---
+_ORDERED_LEVELS: Tuple[CEFRLevel, ...] = tuple(sorted(LEVEL_THRESHOLDS, key=LEVEL_THRESHOLDS.get))
+_LEVEL_BOUNDS: Tuple[float, ...] = tuple(float(LEVEL_THRESHOLDS[level]) for level in _ORDERED_LEVELS)
+_SPEED_VALUES: Tuple[float, ...] = tuple(SPEED_AT_THRESHOLD[level] for level in _ORDERED_LEVELS)
+
+_LEVEL_BOUNDS_ARRAY = np.array(_LEVEL_BOUNDS)
+_SPEED_VALUES_ARRAY = np.array(_SPEED_VALUES)
+_LEVELS_ARRAY = np.array(_ORDERED_LEVELS, dtype=object)
+
+
+def get_cefr_level_from_score(score: float) -> CEFRLevel:
+    """
+    스코어(0~300)로부터 CEFR 레벨(A1~C2)을 반환합니다.
+
+    Args:
+        score: 0~300 범위의 레벨 스코어
+
+    Returns:
+        CEFRLevel Enum 객체
+    """
+    score = max(MIN_SCORE, min(MAX_SCORE, score))
+    return _ORDERED_LEVELS[bisect_right(_LEVEL_BOUNDS, score) - 1]
+
+
+def get_speed_from_level_score(level_score: float) -> float:
+    """레벨 스코어 -> 재생 속도 (구간별 선형 보간, 소수 둘째 자리 반올림)."""
+    if level_score <= _LEVEL_BOUNDS[0]:
+        return _SPEED_VALUES[0]
+    if level_score >= _LEVEL_BOUNDS[-1]:
+        return _SPEED_VALUES[-1]
+
+    i = bisect_right(_LEVEL_BOUNDS, level_score) - 1
+    start_s, end_s = _LEVEL_BOUNDS[i], _LEVEL_BOUNDS[i + 1]
+    start_v, end_v = _SPEED_VALUES[i], _SPEED_VALUES[i + 1]
+    ratio = (level_score - start_s) / (end_s - start_s)
+    return round(start_v + (end_v - start_v) * ratio, 2)
+
+
+def get_average_score_and_level(
+    lexical_score: float,
+    syntactic_score: float,
+    speed_score: float
+) -> dict[str, float | CEFRLevel]:
+    """
+    3개의 레벨 스코어를 받아 평균 스코어와 평균 CEFR 레벨을 반환합니다.
+
+    Returns:
+        {
+            "average_score": 평균 스코어 (float),
+            "average_level": CEFRLevel Enum 객체
+        }
+    """
+    average_score = round((lexical_score + syntactic_score + speed_score) / 3, 1)
+    return {
+        "average_score": average_score,
+        "average_level": get_cefr_level_from_score(average_score),
+    }
+
+
+# --- NumPy batch 버전 ---
+
+def _round_like_python(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """Element-wise ``round(value, ndigits)`` with Python's exact decimal rounding.
+
+    np.round scales by 10**ndigits first, which can land on the other side of a
+    half (e.g. 1.145 -> 1.15 vs Python's 1.14); those near-tie elements are
+    rounded with Python's round instead.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0**ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(float(value), ndigits) for value in values[near_tie]]
+    return rounded
+
+
+def cefr_indices_from_scores(scores: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Index into A1..C2 (0..5) for every score; cheap to aggregate with np.bincount."""
+    clipped = np.clip(np.asarray(scores, dtype=np.float64), MIN_SCORE, MAX_SCORE)
+    return np.searchsorted(_LEVEL_BOUNDS_ARRAY, clipped, side="right") - 1
+
+
+def cefr_levels_from_scores(scores: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Batch ``get_cefr_level_from_score``: object array of CEFRLevel."""
+    return _LEVELS_ARRAY[cefr_indices_from_scores(scores)]
+
+
+def speeds_from_level_scores(level_scores: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Batch ``get_speed_from_level_score`` (same interpolation expression and rounding)."""
+    scores = np.asarray(level_scores, dtype=np.float64)
+    i = np.clip(np.searchsorted(_LEVEL_BOUNDS_ARRAY, scores, side="right") - 1, 0, len(_LEVEL_BOUNDS) - 2)
+    start_s, end_s = _LEVEL_BOUNDS_ARRAY[i], _LEVEL_BOUNDS_ARRAY[i + 1]
+    start_v, end_v = _SPEED_VALUES_ARRAY[i], _SPEED_VALUES_ARRAY[i + 1]
+    ratio = (scores - start_s) / (end_s - start_s)
+    speeds = _round_like_python(start_v + (end_v - start_v) * ratio, 2)
+    # 테이블 밖은 양 끝 속도로 고정 (scalar와 같이 반올림 없이)
+    speeds = np.where(scores <= _LEVEL_BOUNDS[0], _SPEED_VALUES[0], speeds)
+    return np.where(scores >= _LEVEL_BOUNDS[-1], _SPEED_VALUES[-1], speeds)
+
+
+def average_scores_and_levels(
+    lexical_scores: Sequence[float] | np.ndarray,
+    syntactic_scores: Sequence[float] | np.ndarray,
+    speed_scores: Sequence[float] | np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Batch ``get_average_score_and_level``: arrays under the same keys."""
+    average = _round_like_python(
+        (
+            np.asarray(lexical_scores, dtype=np.float64)
+            + np.asarray(syntactic_scores, dtype=np.float64)
+            + np.asarray(speed_scores, dtype=np.float64)
+        )
+        / 3,
+        1,
+    )
+    return {"average_score": average, "average_level": cefr_levels_from_scores(average)}
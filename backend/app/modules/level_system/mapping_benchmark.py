@@ -0,0 +1,104 @@
+"""Micro-benchmark: CEFR / speed mapping, previous if-chain vs bisect vs NumPy batch.
+
+Usage (from backend/):
+    python -m app.modules.level_system.mapping_benchmark [--n 1000000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from .level_mapping import (
+    LEVEL_THRESHOLDS,
+    MAX_SCORE,
+    MIN_SCORE,
+    CEFRLevel,
+    cefr_levels_from_scores,
+    get_cefr_level_from_score,
+    get_speed_from_level_score,
+    speeds_from_level_scores,
+)
+
+
+def _previous_cefr_level(score: float) -> CEFRLevel:
+    """The if/elif chain used before level_mapping (kept as the baseline)."""
+    score = max(MIN_SCORE, min(MAX_SCORE, score))
+    if score >= LEVEL_THRESHOLDS[CEFRLevel.C2]:
+        return CEFRLevel.C2
+    elif score >= LEVEL_THRESHOLDS[CEFRLevel.C1]:
+        return CEFRLevel.C1
+    elif score >= LEVEL_THRESHOLDS[CEFRLevel.B2]:
+        return CEFRLevel.B2
+    elif score >= LEVEL_THRESHOLDS[CEFRLevel.B1]:
+        return CEFRLevel.B1
+    elif score >= LEVEL_THRESHOLDS[CEFRLevel.A2]:
+        return CEFRLevel.A2
+    return CEFRLevel.A1
+
+
+def _previous_speed(level_score: float) -> float:
+    """The per-call LEVEL_RANGES scan used before level_mapping (kept as the baseline)."""
+    if level_score <= MIN_SCORE:
+        return 0.70
+    if level_score >= 200:
+        return 1.15
+    LEVEL_RANGES = [
+        (0, 25, 0.70, 0.80),
+        (25, 50, 0.80, 0.90),
+        (50, 100, 0.90, 1.00),
+        (100, 150, 1.00, 1.1),
+        (150, 200, 1.1, 1.15),
+    ]
+    for start_s, end_s, start_v, end_v in LEVEL_RANGES:
+        if start_s <= level_score <= end_s:
+            ratio = (level_score - start_s) / (end_s - start_s)
+            return round(start_v + (end_v - start_v) * ratio, 2)
+    return 1.00
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(n: int = 200000, *, repeat: int = 3, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Best-of-``repeat`` seconds for mapping ``n`` random scores with each implementation."""
+    scores = np.random.default_rng(seed).uniform(-10, 310, n)
+    as_list: List[float] = scores.tolist()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, previous, scalar, batch in (
+        ("cefr", _previous_cefr_level, get_cefr_level_from_score, cefr_levels_from_scores),
+        ("speed", _previous_speed, get_speed_from_level_score, speeds_from_level_scores),
+    ):
+        t_previous = _time(lambda: [previous(s) for s in as_list], repeat)
+        t_scalar = _time(lambda: [scalar(s) for s in as_list], repeat)
+        t_batch = _time(lambda: batch(scores), repeat)
+        results[name] = {
+            "previous_s": round(t_previous, 4),
+            "bisect_s": round(t_scalar, 4),
+            "numpy_batch_s": round(t_batch, 4),
+            "bisect_speedup": round(t_previous / t_scalar, 2),
+            "batch_speedup": round(t_previous / t_batch, 1),
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=1000000, help="scores per run")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    print(json.dumps({"n": args.n, **run_benchmark(args.n, repeat=args.repeat)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, DateTime, DECIMAL, ForeignKey, Index, Integer, JSON, String
+from sqlalchemy.sql import func
+
+from ...core.config import Base
+
+# event_type 값
+EVENT_BASELINE = "baseline"  # 로그 시작 시점의 레벨 (기존 사용자)
+EVENT_FEEDBACK = "feedback"  # 세션 피드백 (vector에 정규화된 6차원 입력 저장)
+EVENT_RESET = "reset"  # 수동 설정 / 초기화처럼 레벨을 절대값으로 덮어쓴 경우
+EVENT_LEVEL_TEST = "level_test"  # 레벨 테스트 결과 (가중치 fitting의 정답으로도 사용)
+# replay --apply로 레벨을 다시 계산해 덮어쓴 시점 (레벨 이력용; replay/fitting 입력에서는 제외)
+EVENT_REPLAY = "replay"
+RESET_EVENT_TYPES = (EVENT_BASELINE, EVENT_RESET, EVENT_LEVEL_TEST)
+
+
+class LevelFeedbackEvent(Base):
+    """Append-only log of every change to a user's lexical/syntactic/speed levels.
+
+    Feedback events keep the normalized input vector so the whole history can be
+    replayed with new weights; baseline/reset events carry absolute levels. The
+    level columns always hold the levels *after* the event, so the table is also
+    the per-user level time series (see ``crud.get_level_history``). Rows are
+    never updated: ``replay --apply`` appends ``replay`` events instead.
+    """
+
+    __tablename__ = "level_feedback_events"
+    __table_args__ = (
+        Index("ix_level_feedback_events_user_id_id", "user_id", "id"),
+        Index("ix_level_feedback_events_user_created", "user_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    event_type = Column(String(16), nullable=False)
+    generated_content_id = Column(Integer, nullable=True)
+    vector = Column(JSON, nullable=True)  # [pause, rewind, vlookup, vsave, understanding, speed]
+    lexical_level = Column(DECIMAL(4, 1), nullable=False)
+    syntactic_level = Column(DECIMAL(4, 1), nullable=False)
+    speed_level = Column(DECIMAL(4, 1), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,127 @@
+"""Dry-run or apply new level parameters to every user by replaying the event log.
+
+Usage (from backend/):
+    python -m app.modules.level_system.replay --weights new_weights.json
+    python -m app.modules.level_system.replay --weights new_weights.json --apply
+    python -m app.modules.level_system.replay --user-id 12 --user-id 34
+
+The weights file is JSON: {"weight_matrix": [[...] x6], "clip_ranges": {"lexical": [lo, hi], ...}}.
+Without --weights the service's active weights are used (``settings.level_weights_path``
+if set, else the defaults), which checks that the log reproduces the stored levels.
+--apply writes the replayed levels to the users whose levels change and appends a
+``replay`` event for each of them; the existing events are never modified. Run it
+while feedback traffic is paused.
+
+--apply only accepts the weights the service itself loads: point LEVEL_WEIGHTS_PATH
+at the new weights file and restart the API first. Otherwise levels replayed with
+the new weights would keep moving with the old ones on the next feedback.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Iterable, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from . import crud as level_crud
+from .engine import EventArrays, LevelParameters, ReplayReport, replay, summarize
+from .models import EVENT_REPLAY
+
+
+def current_parameters() -> LevelParameters:
+    """Parameters the service is using right now (default or loaded weight config)."""
+    from .service import get_active_weights
+
+    weight_matrix, clip_ranges, version = get_active_weights()
+    return LevelParameters.from_values(weight_matrix, clip_ranges, version)
+
+
+def same_update_rule(a: LevelParameters, b: LevelParameters) -> bool:
+    """True when both parameter sets move levels identically (weights and clip bounds)."""
+    return bool(
+        np.allclose(a.weight_matrix, b.weight_matrix)
+        and all(np.array_equal(x, y) for x, y in zip(a.clip_bounds(), b.clip_bounds()))
+    )
+
+
+def run_replay(
+    db: Session,
+    params: LevelParameters,
+    *,
+    apply: bool = False,
+    user_ids: Optional[Iterable[int]] = None,
+) -> ReplayReport:
+    started = time.monotonic()
+    events = EventArrays.from_rows(level_crud.load_events(db, user_ids=user_ids))
+
+    final_levels, trajectory = replay(
+        events.user_index,
+        events.is_reset,
+        events.vectors,
+        events.levels,
+        params,
+        n_users=events.user_ids.shape[0],
+    )
+
+    stored = level_crud.get_user_levels(db, user_ids=events.user_ids.tolist())
+    current = np.array(
+        [stored.get(int(user_id), tuple(final_levels[i])) for i, user_id in enumerate(events.user_ids)],
+        dtype=np.float64,
+    ).reshape(-1, 3)
+
+    if apply:
+        changed = np.flatnonzero(np.any(np.abs(final_levels - current) > 1e-9, axis=1))
+        user_rows = []
+        for i in changed:
+            user_id = int(events.user_ids[i])
+            if user_id not in stored:
+                continue
+            levels = (float(final_levels[i, 0]), float(final_levels[i, 1]), float(final_levels[i, 2]))
+            user_rows.append(
+                {"id": user_id, "lexical_level": levels[0], "syntactic_level": levels[1], "speed_level": levels[2]}
+            )
+            # 기존 이벤트는 그대로 두고 새 레벨을 이력에 추가한다
+            level_crud.add_reset_event(db, user_id=user_id, levels=levels, event_type=EVENT_REPLAY)
+        level_crud.bulk_update_user_levels(db, user_rows)
+        db.commit()
+
+    return summarize(current, final_levels, n_events=events.event_ids.shape[0], started=started, applied=apply)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--weights", help="JSON file with weight_matrix and clip_ranges")
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="write the replayed levels (default: dry-run); the weights must be the ones LEVEL_WEIGHTS_PATH loads",
+    )
+    parser.add_argument("--user-id", type=int, action="append", dest="user_ids", help="limit to these users")
+    args = parser.parse_args(argv)
+
+    from ...core.config import SessionLocal
+
+    from .service import load_weight_config
+
+    # 서비스 시작 시와 같이 settings.level_weights_path를 불러온다 (없으면 기본 가중치)
+    load_weight_config()
+    active = current_parameters()
+    params = LevelParameters.from_json_file(args.weights) if args.weights else active
+    if args.apply and not same_update_rule(params, active):
+        parser.error(
+            f"--apply: {args.weights} differs from the weights the service loads (version {active.version}); "
+            "set LEVEL_WEIGHTS_PATH to it and restart the API first"
+        )
+    db = SessionLocal()
+    try:
+        report = run_replay(db, params, apply=args.apply, user_ids=args.user_ids)
+    finally:
+        db.close()
+    print(json.dumps(report.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
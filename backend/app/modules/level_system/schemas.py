@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # feedback request
@@ -24,6 +25,30 @@ class SessionFeedbackResponse(BaseModel):
     speed_level_delta: float  # 청취 레벨 변화량
 
 
+# batched feedback (모바일 앱이 오프라인에서 모아둔 피드백)
+class SessionFeedbackBatchRequest(BaseModel):
+    feedbacks: List[SessionFeedbackRequest] = Field(..., min_length=1, max_length=100)
+
+
+class SessionFeedbackBatchResponse(SessionFeedbackResponse):
+    applied_count: int  # 반영된 피드백 수 (delta는 합산값)
+
+
+# level history (progress chart)
+class LevelHistoryPoint(BaseModel):
+    timestamp: datetime
+    lexical_level: float
+    syntactic_level: float
+    speed_level: float
+    overall_level: float  # 세 레벨의 평균 (다운샘플링 기준)
+
+
+class LevelHistoryResponse(BaseModel):
+    points: List[LevelHistoryPoint]
+    total_points: int  # 다운샘플링 전 구간 내 레벨 변경 수
+    downsampled: bool
+
+
 # level-test request
 class LevelTestItem(BaseModel):
     script_id: str
@@ -1,8 +1,20 @@
+from datetime import datetime
 from typing import Optional, Any
+import numpy as np
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from ..users.models import User
+from ..users import crud as user_crud
+from ..audio import crud as audio_crud
+from ..playback import crud as playback_crud
+from ..stats.cache import invalidate_user_stats
 from . import schemas
+from . import crud as level_crud
+from .engine import LevelParameters, step_levels
+from .models import EVENT_LEVEL_TEST
+from ...core.config import settings
+from ...core.exceptions import UserNotFoundException
+from ...core.downsample import lttb_indices
 from ...core.logger import logger
 from .utils import (
     _feedback_to_vector,
@@ -34,6 +46,51 @@ DEFAULT_CLIP_RANGES = {
     "speed": (-8.0, 8.0),
 }
 
+# 현재 적용 중인 가중치 (load_weight_config로 fitting 결과를 불러오면 교체됨)
+_active_weights: Dict[str, Any] = {
+    "version": "default",
+    "weight_matrix": DEFAULT_WEIGHT_MATRIX,
+    "clip_ranges": DEFAULT_CLIP_RANGES,
+}
+
+
+def load_weight_config(path: Optional[str] = None) -> str:
+    """
+    fitting 도구가 만든 가중치 설정 파일(JSON)을 읽어 서비스에 적용합니다.
+
+    path가 없으면 settings.level_weights_path를 사용하고, 그것도 없거나 파일이
+    잘못된 경우 기존 가중치를 유지합니다. 적용된 버전 문자열을 반환합니다.
+    """
+    path = path or settings.level_weights_path
+    if not path:
+        return _active_weights["version"]
+    try:
+        params = LevelParameters.from_json_file(path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"[level_system] failed to load weight config '{path}': {e}; keeping current weights")
+        return _active_weights["version"]
+
+    clip_ranges = dict(DEFAULT_CLIP_RANGES)
+    clip_ranges.update(params.clip_ranges)
+    _active_weights.update(
+        version=params.version,
+        weight_matrix=params.weight_matrix.tolist(),
+        clip_ranges=clip_ranges,
+    )
+    logger.info(f"[level_system] loaded weight config version={params.version} from {path}")
+    return params.version
+
+
+def get_active_weights() -> tuple[List[List[float]], Dict[str, tuple], str]:
+    """(weight_matrix, clip_ranges, version) currently used for session feedback."""
+    return _active_weights["weight_matrix"], _active_weights["clip_ranges"], _active_weights["version"]
+
+
+def _deltas_from_vector(vector: list[float]) -> tuple[float, float, float]:
+    weight_matrix, clip_ranges, _ = get_active_weights()
+    return _compute_levels_delta_from_weights(vector, weight_matrix, clip_ranges)
+
+
 class LevelSystemService:
     """레벨 시스템 서비스 - static 메서드 기반"""
 
@@ -64,65 +121,145 @@ class LevelSystemService:
         """
 
 
-        # [1] Builder 선택
-        builder = NormalizedInputVectorBuilder(
-            db=db,
-            feedback=feedback_request_payload
-        )
-
-        # [2[] Director 생성
-        director = Director(builder)
-
-        # [3] 입력 벡터 생성
-        vector = director.buildInputVector()
-
-        logger.info("Built feedback vector via Builder: %s", vector)
+        # [1]~[3] 입력 벡터 생성
+        vector = self._build_feedback_vector(db, feedback_request_payload, user_id=user.id)
 
+        # [4] weight matrix로 각 level 별 변화량 계산
+        lexical_delta, syntactic_delta, speed_delta = _deltas_from_vector(vector)
 
-        # [4] weight matrix를 이용하여 각 level 별 변화량 계산
-        W = DEFAULT_WEIGHT_MATRIX
-        CLIP_RANGE = DEFAULT_CLIP_RANGES
-        lexical_delta, syntactic_delta, speed_delta = _compute_levels_delta_from_weights(
-            vector, W, CLIP_RANGE
+        # [5] DB의 유저 level에 delta를 반영 (단일 원자적 UPDATE) + 이벤트 로그 기록
+        level_crud.ensure_baseline_event(db, user_id=user.id)
+        lexical, syntactic, speed = user_crud.apply_level_deltas(
+            db,
+            user_id=user.id,
+            lexical_delta=lexical_delta,
+            syntactic_delta=syntactic_delta,
+            speed_delta=speed_delta,
+            commit=False,
         )
-
-        # [5] DB의 유저 level에 delta를 반영 (업데이트)
-        prev_lexical = float(user.lexical_level)
-        prev_syntactic = float(user.syntactic_level)
-        prev_speed = float(user.speed_level)
+        level_crud.add_feedback_event(
+            db,
+            user_id=user.id,
+            generated_content_id=feedback_request_payload.generated_content_id,
+            vector=vector,
+            levels=(lexical, syntactic, speed),
+        )
+        db.commit()
+        invalidate_user_stats(user.id)
 
         logger.info(
-            "이전 레벨 - lexical=%.2f, syntactic=%.2f, speed=%.2f",
-            prev_lexical,
-            prev_syntactic,
-            prev_speed,
+            "업데이트 후 레벨 - lexical=%.2f, syntactic=%.2f, speed=%.2f",
+            lexical,
+            syntactic,
+            speed,
         )
 
-        user.lexical_level = max(0.0, min(300.0, prev_lexical + lexical_delta))
-        user.syntactic_level = max(0.0, min(300.0, prev_syntactic + syntactic_delta))
-        user.speed_level = max(0.0, min(300.0, prev_speed + speed_delta))
+        # [6] return response
+        return {
+            "lexical_level": lexical,
+            "syntactic_level": syntactic,
+            "speed_level": speed,
+            "lexical_level_delta": lexical_delta,
+            "syntactic_level_delta": syntactic_delta,
+            "speed_level_delta": speed_delta,
+        }
 
-        db.add(user)
+    def evaluate_session_feedback_batch(
+        self,
+        db: Session,
+        user: User,
+        feedbacks: List[schemas.SessionFeedbackRequest],
+    ) -> dict:
+        """
+        오프라인에서 쌓인 여러 세션 피드백을 한 번에 반영합니다.
+
+        모든 피드백의 벡터를 한 번에 만들고(content_analysis는 한 쿼리로 미리 로드),
+        사용자 행을 잠근 상태에서 피드백마다 순서대로 clamp해(단건 경로, replay와 같은 규칙)
+        단일 트랜잭션의 UPDATE 한 번으로 최종 레벨을 반영합니다. 이벤트에는 각 피드백 직후의 레벨을 기록합니다.
+        """
+        content_ids = {f.generated_content_id for f in feedbacks if f.generated_content_id is not None}
+        audio_crud.get_content_analyses(db, content_ids=content_ids)
+
+        vectors = [self._build_feedback_vector(db, feedback, user_id=user.id) for feedback in feedbacks]
+        deltas = [_deltas_from_vector(vector) for vector in vectors]
+        lexical_delta = round(sum(d[0] for d in deltas), 4)
+        syntactic_delta = round(sum(d[1] for d in deltas), 4)
+        speed_delta = round(sum(d[2] for d in deltas), 4)
+
+        # 사용자 행 잠금 (commit까지 유지) + 필요하면 baseline 기록
+        current = level_crud.ensure_baseline_event(db, user_id=user.id)
+        if current is None:
+            db.rollback()
+            raise UserNotFoundException()
+        levels = np.array(current, dtype=np.float64)
+        for feedback, vector, delta in zip(feedbacks, vectors, deltas):
+            levels = step_levels(levels, np.array(delta, dtype=np.float64))
+            level_crud.add_feedback_event(
+                db,
+                user_id=user.id,
+                generated_content_id=feedback.generated_content_id,
+                vector=vector,
+                levels=(float(levels[0]), float(levels[1]), float(levels[2])),
+            )
+        lexical, syntactic, speed = (float(value) for value in levels)
+        level_crud.bulk_update_user_levels(
+            db,
+            [{"id": user.id, "lexical_level": lexical, "syntactic_level": syntactic, "speed_level": speed}],
+        )
         db.commit()
-        db.refresh(user)
+        invalidate_user_stats(user.id)
 
         logger.info(
-            "업데이트 후 레벨 - lexical=%.2f, syntactic=%.2f, speed=%.2f",
-            float(user.lexical_level),
-            float(user.syntactic_level),
-            float(user.speed_level),
+            "배치 피드백 %d건 반영 - lexical=%.2f, syntactic=%.2f, speed=%.2f",
+            len(feedbacks),
+            lexical,
+            syntactic,
+            speed,
         )
 
-        # [6] return response
         return {
-            "lexical_level": float(user.lexical_level),
-            "syntactic_level": float(user.syntactic_level),
-            "speed_level": float(user.speed_level),
+            "applied_count": len(feedbacks),
+            "lexical_level": lexical,
+            "syntactic_level": syntactic,
+            "speed_level": speed,
             "lexical_level_delta": lexical_delta,
             "syntactic_level_delta": syntactic_delta,
             "speed_level_delta": speed_delta,
         }
 
+    @staticmethod
+    def _build_feedback_vector(
+        db: Session,
+        feedback: schemas.SessionFeedbackRequest,
+        *,
+        user_id: Optional[int] = None,
+    ) -> list[float]:
+        # 클라이언트가 보내지 않은 pause/rewind 횟수는 서버가 수집한 본인의 재생 이벤트 집계로 채운다
+        if (
+            settings.playback_ingest_enabled
+            and user_id is not None
+            and feedback.generated_content_id is not None
+            and (feedback.pause_cnt is None or feedback.rewind_cnt is None)
+        ):
+            counts = playback_crud.get_interaction_counts(
+                db, user_id=user_id, generated_content_id=feedback.generated_content_id
+            )
+            if counts is not None:
+                feedback = feedback.model_copy(
+                    update={
+                        "pause_cnt": feedback.pause_cnt if feedback.pause_cnt is not None else counts[0],
+                        "rewind_cnt": feedback.rewind_cnt if feedback.rewind_cnt is not None else counts[1],
+                    }
+                )
+
+        # [1] Builder 선택
+        builder = NormalizedInputVectorBuilder(db=db, feedback=feedback)
+
+        # [2] Director 생성 및 [3] 입력 벡터 생성
+        vector = Director(builder).buildInputVector()
+        logger.info("Built feedback vector via Builder: %s", vector)
+        return vector
+
     def initialize_level(
         self,
         db: Session,
@@ -155,7 +292,9 @@ class LevelSystemService:
         user.speed_level = 100
 
         db.add(user)
+        level_crud.add_reset_event(db, user_id=user.id, levels=(100.0, 100.0, 100.0))
         db.commit()
+        invalidate_user_stats(user.id)
         db.refresh(user)
 
         return {
@@ -216,7 +355,9 @@ class LevelSystemService:
         user.initial_level_completed = True
 
         db.add(user)
+        level_crud.add_reset_event(db, user_id=user.id, levels=(float(score),) * 3)
         db.commit()
+        invalidate_user_stats(user.id)
         db.refresh(user)
 
         return {
@@ -335,7 +476,15 @@ class LevelSystemService:
         user.initial_level_completed = True
 
         db.add(user)
+        # DECIMAL(4, 1) 컬럼과 같은 값을 이벤트에도 남긴다
+        level_crud.add_reset_event(
+            db,
+            user_id=user.id,
+            levels=(round(float(target_score), 1),) * 3,
+            event_type=EVENT_LEVEL_TEST,
+        )
         db.commit()
+        invalidate_user_stats(user.id)
         db.refresh(user)
 
         # 7) Response 구성
@@ -364,3 +513,41 @@ class LevelSystemService:
                 "score": overall_score
             }
         }
+
+    def get_level_history(
+        self,
+        db: Session,
+        user: User,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        points: int = 100,
+    ) -> dict:
+        """
+        구간 내 레벨 변화 시계열을 차트용으로 반환합니다.
+
+        변경 횟수가 points보다 많으면 세 레벨의 평균(overall)을 기준으로 LTTB
+        다운샘플링해, 선택된 시점의 세 레벨을 함께 돌려줍니다.
+        """
+        rows = level_crud.get_level_history(db, user_id=user.id, start=start, end=end)
+        total = len(rows)
+
+        if total > points:
+            timestamps = np.array([row[0].timestamp() for row in rows])
+            overall = np.array([(row[1] + row[2] + row[3]) / 3 for row in rows])
+            rows = [rows[i] for i in lttb_indices(timestamps, overall, points)]
+
+        return {
+            "points": [
+                {
+                    "timestamp": created_at,
+                    "lexical_level": lexical,
+                    "syntactic_level": syntactic,
+                    "speed_level": speed,
+                    "overall_level": round((lexical + syntactic + speed) / 3, 1),
+                }
+                for created_at, lexical, syntactic, speed in rows
+            ],
+            "total_points": total,
+            "downsampled": total > points,
+        }
@@ -0,0 +1,57 @@
+"""Shadow the heuristic level system with the LLM strategy (see core/level/shadow.py).
+
+The two strategies take different request schemas, so the heuristic payloads
+are converted to level_management requests; requests that cannot be expressed
+(no generated_content_id, no understanding rating, too many tests) are skipped.
+"""
+from typing import Optional
+
+from pydantic import ValidationError
+
+from ...core.level.shadow import ShadowEvaluator
+from ..level_management import schemas as llm_schemas
+from . import schemas
+
+
+def session_feedback_to_llm_request(
+    payload: schemas.SessionFeedbackRequest,
+) -> Optional[llm_schemas.LevelTestRequest]:
+    if payload.generated_content_id is None or payload.understanding_difficulty is None:
+        return None
+    try:
+        return llm_schemas.LevelTestRequest(
+            tests=[
+                {
+                    "generated_content_id": payload.generated_content_id,
+                    # 0(매우 어려움)~4(매우 쉬움) -> 0~100 이해도
+                    "understanding": max(0, min(100, payload.understanding_difficulty * 25)),
+                }
+            ]
+        )
+    except ValidationError:
+        return None
+
+
+def level_test_to_llm_request(payload: schemas.LevelTestRequest) -> Optional[llm_schemas.LevelTestRequest]:
+    try:
+        return llm_schemas.LevelTestRequest(
+            tests=[
+                {"script_id": item.script_id, "understanding": max(0, min(100, item.understanding))}
+                for item in payload.tests
+            ]
+        )
+    except ValidationError:
+        return None
+
+
+def build_llm_shadow(sample_rate: float) -> ShadowEvaluator:
+    from ..level_management.strategy_impl import AILevelManagementStrategy
+
+    return ShadowEvaluator(
+        AILevelManagementStrategy(),
+        sample_rate=sample_rate,
+        adapters={
+            "evaluate_session_feedback": session_feedback_to_llm_request,
+            "evaluate_level_test": level_test_to_llm_request,
+        },
+    )
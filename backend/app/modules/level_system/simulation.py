@@ -0,0 +1,250 @@
+"""Synthetic-learner simulator for the heuristic level system (no database).
+
+Each learner has hidden true levels. Every session serves content at the
+learner's *estimated* levels; the gap (true - estimated) drives the raw session
+feedback (pause/rewind counts, vocab lookups/saves, difficulty ratings) through
+a configurable noise model. Feedback is normalized with the same thresholds as
+``utils.normalize_*`` and fed through the production update rule
+(``engine.compute_deltas`` == ``_compute_levels_delta_from_weights``, then the
+[0, 300] clamp), vectorized over the whole population.
+
+Usage (from backend/):
+    python -m app.modules.level_system.simulation --learners 100000 --sessions 300
+    python -m app.modules.level_system.simulation --weights weights/level_weights_v2.json
+
+Without --weights the service's active weights are simulated
+(``settings.level_weights_path`` if set, else the defaults).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .engine import DIMENSIONS, LEVEL_MAX, LEVEL_MIN, LevelParameters, compute_deltas, step_levels
+from .utils import (
+    LOOKUP_HIGH_THRESHOLD_RATIO,
+    LOOKUP_THRESHOLD_RATIO,
+    SAVE_HIGH_THRESHOLD_RATIO,
+    SAVE_THRESHOLD_RATIO,
+)
+
+
+@dataclass
+class PopulationConfig:
+    n_learners: int = 10000
+    true_level_mean: float = 120.0
+    true_level_sd: float = 50.0
+    # 초기 추정치: None이면 true level + N(0, initial_error_sd) (레벨 테스트를 본 경우)
+    initial_level: Optional[float] = None
+    initial_error_sd: float = 40.0
+    # 세션마다 실제 실력이 오르는 양 (0이면 고정된 목표에 대한 수렴만 측정)
+    learning_per_session: float = 0.0
+
+
+@dataclass
+class NoiseModel:
+    """How a level gap (true - estimated) turns into raw session feedback."""
+
+    # gap이 이 값만큼이면 '한 단계 쉬움'으로 느낀다 (CEFR 한 구간 ~ 25-50점)
+    gap_scale: float = 40.0
+    # 세션마다 학습자의 컨디션 등으로 인한 잡음 (gap_scale 단위)
+    ease_noise_sd: float = 0.5
+    rating_noise_sd: float = 0.7
+    script_word_count: int = 150
+    base_pause: float = 2.0
+    base_rewind: float = 2.0
+    # ease가 0일 때 조회/저장 비율 (정상 범위의 중간쯤)
+    base_lookup_ratio: float = 0.08
+    save_per_lookup: float = 0.4
+
+
+@dataclass
+class SimulationReport:
+    learners: int
+    sessions: int
+    elapsed_seconds: float
+    tolerance: float
+    converged_ratio: float
+    # 수렴 세션 수 분포 (수렴한 학습자 기준)
+    convergence_sessions: Dict[str, float] = field(default_factory=dict)
+    # 최종 |estimate - true| 분포 (차원별)
+    final_abs_error: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # 세션별 평균 |error| (차원 평균) 곡선, report_every 간격
+    mean_abs_error_curve: List[float] = field(default_factory=list)
+    # 변화량 부호가 바뀐 횟수의 평균 (진동 지표)
+    mean_sign_flips: Dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, object]:
+        data = asdict(self)
+        data["elapsed_seconds"] = round(self.elapsed_seconds, 3)
+        return data
+
+
+def _vocab_scores(count: np.ndarray, word_count: int, low_ratio: float, high_ratio: float) -> np.ndarray:
+    """Vectorized normalize_vocab_factor for one counter (lookup or save)."""
+    low, high = word_count * low_ratio, word_count * high_ratio
+    return np.select(
+        [count == 0, count < low, count > high],
+        [1.0, 0.5, -1.0],
+        default=-0.5,
+    )
+
+
+def generate_feedback(
+    true_levels: np.ndarray,
+    estimates: np.ndarray,
+    noise: NoiseModel,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """(n, 3) true / estimated levels -> (n, 6) normalized feedback vectors."""
+    n = true_levels.shape[0]
+    ease = (true_levels - estimates) / noise.gap_scale + rng.normal(0.0, noise.ease_noise_sd, size=(n, 3))
+    ease_lex, ease_syn, ease_speed = ease[:, 0], ease[:, 1], ease[:, 2]
+
+    pause = rng.poisson(noise.base_pause * np.exp(-np.clip(ease_syn, -3, 3)))
+    rewind = rng.poisson(noise.base_rewind * np.exp(-np.clip((ease_syn + ease_speed) / 2, -3, 3)))
+
+    lookup_ratio = np.clip(noise.base_lookup_ratio * np.exp(-ease_lex), 0.0, 1.0)
+    lookup = rng.binomial(noise.script_word_count, lookup_ratio)
+    save = rng.binomial(lookup, noise.save_per_lookup)
+
+    understanding = np.clip(
+        np.rint(2 + (ease_lex + ease_syn) / 2 + rng.normal(0.0, noise.rating_noise_sd, n)), 0, 4
+    )
+    speed = np.clip(np.rint(2 + ease_speed + rng.normal(0.0, noise.rating_noise_sd, n)), 0, 4)
+
+    return np.column_stack(
+        [
+            pause - 2,
+            rewind - 2,
+            _vocab_scores(lookup, noise.script_word_count, LOOKUP_THRESHOLD_RATIO, LOOKUP_HIGH_THRESHOLD_RATIO),
+            _vocab_scores(save, noise.script_word_count, SAVE_THRESHOLD_RATIO, SAVE_HIGH_THRESHOLD_RATIO),
+            understanding - 2,
+            speed - 2,
+        ]
+    ).astype(np.float64)
+
+
+def _quantiles(values: np.ndarray) -> Dict[str, float]:
+    if values.size == 0:
+        return {}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "mean": round(float(values.mean()), 2),
+        "p50": round(float(p50), 2),
+        "p90": round(float(p90), 2),
+        "p99": round(float(p99), 2),
+    }
+
+
+def simulate(
+    params: LevelParameters,
+    *,
+    sessions: int = 200,
+    population: Optional[PopulationConfig] = None,
+    noise: Optional[NoiseModel] = None,
+    tolerance: float = 15.0,
+    seed: int = 0,
+    report_every: int = 10,
+) -> SimulationReport:
+    """Run ``sessions`` feedback rounds for a synthetic population.
+
+    A learner converges at the first session after which every dimension stays
+    within ``tolerance`` of the true level until the end of the run.
+    """
+    population = population or PopulationConfig()
+    noise = noise or NoiseModel()
+    rng = np.random.default_rng(seed)
+    started = time.monotonic()
+    n = population.n_learners
+
+    true_levels = np.clip(
+        rng.normal(population.true_level_mean, population.true_level_sd, size=(n, 3)), LEVEL_MIN, LEVEL_MAX
+    )
+    if population.initial_level is not None:
+        estimates = np.full((n, 3), float(population.initial_level))
+    else:
+        estimates = true_levels + rng.normal(0.0, population.initial_error_sd, size=(n, 3))
+    estimates = np.round(np.clip(estimates, LEVEL_MIN, LEVEL_MAX), 1)
+
+    last_outside = np.full(n, -1, dtype=np.int64)
+    previous_sign = np.zeros((n, 3), dtype=np.int8)
+    sign_flips = np.zeros((n, 3), dtype=np.int64)
+    curve: List[float] = []
+
+    for session in range(sessions):
+        vectors = generate_feedback(true_levels, estimates, noise, rng)
+        deltas = compute_deltas(vectors, params)
+        estimates = step_levels(estimates, deltas)
+
+        sign = np.sign(deltas).astype(np.int8)
+        sign_flips += (sign != 0) & (previous_sign != 0) & (sign != previous_sign)
+        previous_sign = np.where(sign != 0, sign, previous_sign)
+
+        if population.learning_per_session:
+            true_levels = np.clip(true_levels + population.learning_per_session, LEVEL_MIN, LEVEL_MAX)
+
+        error = np.abs(estimates - true_levels)
+        last_outside[np.any(error > tolerance, axis=1)] = session
+        if session % report_every == 0 or session == sessions - 1:
+            curve.append(round(float(error.mean()), 2))
+
+    final_error = np.abs(estimates - true_levels)
+    converged = last_outside < sessions - 1
+    return SimulationReport(
+        learners=n,
+        sessions=sessions,
+        elapsed_seconds=time.monotonic() - started,
+        tolerance=tolerance,
+        converged_ratio=round(float(converged.mean()), 4) if n else 0.0,
+        convergence_sessions=_quantiles((last_outside[converged] + 1).astype(np.float64)),
+        final_abs_error={name: _quantiles(final_error[:, i]) for i, name in enumerate(DIMENSIONS)},
+        mean_abs_error_curve=curve,
+        mean_sign_flips={name: round(float(sign_flips[:, i].mean()), 2) for i, name in enumerate(DIMENSIONS)},
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=100000)
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--tolerance", type=float, default=15.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--weights", help="weight config JSON (default: the service's active weights)")
+    parser.add_argument("--initial-level", type=float, help="start every learner here instead of a noisy level test")
+    parser.add_argument("--learning", type=float, default=0.0, help="true-level gain per session")
+    parser.add_argument("--noise", type=float, default=0.5, help="per-session ease noise (gap_scale units)")
+    args = parser.parse_args(argv)
+
+    if args.weights:
+        params = LevelParameters.from_json_file(args.weights)
+    else:
+        from .replay import current_parameters
+        from .service import load_weight_config
+
+        # 서비스 시작 시와 같이 settings.level_weights_path를 불러온다 (없으면 기본 가중치)
+        load_weight_config()
+        params = current_parameters()
+
+    report = simulate(
+        params,
+        sessions=args.sessions,
+        population=PopulationConfig(
+            n_learners=args.learners,
+            initial_level=args.initial_level,
+            learning_per_session=args.learning,
+        ),
+        noise=NoiseModel(ease_noise_sd=args.noise),
+        tolerance=args.tolerance,
+        seed=args.seed,
+    )
+    print(json.dumps({"weights_version": params.version, **report.as_dict()}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,5 +11,8 @@ class HeuristicLevelSystemStrategy(LevelServiceStrategy):
     def evaluate_session_feedback(self, db, user, payload):
         return self.service.evaluate_session_feedback(db, user, payload)
 
+    def evaluate_session_feedback_batch(self, db, user, payloads):
+        return self.service.evaluate_session_feedback_batch(db, user, payloads)
+
     def set_manual_level(self, db, user, payload):
         return self.service.set_manual_level(db, user, payload)
@@ -1,31 +1,17 @@
 from . import schemas
-from enum import Enum
 from sqlalchemy.orm import Session
-from ..audio.model import GeneratedContent
+from ..audio import crud as audio_crud
 from dataclasses import dataclass
-
-
-class CEFRLevel(Enum):
-    """CEFR 레벨 정의"""
-    A1 = "A1"
-    A2 = "A2"
-    B1 = "B1"
-    B2 = "B2"
-    C1 = "C1"
-    C2 = "C2"
-
-
-# TODO: 실제로 저장할 레벨 별 구간값들 정하기
-LEVEL_THRESHOLDS = {
-    CEFRLevel.A1: 0,
-    CEFRLevel.A2: 25,
-    CEFRLevel.B1: 50,
-    CEFRLevel.B2: 100,
-    CEFRLevel.C1: 150,
-    CEFRLevel.C2: 200,
-}
-MIN_SCORE = 0 # 최소 스코어
-MAX_SCORE = 300  # 최대 스코어
+# CEFR/속도 매핑은 level_mapping에서 (기존 import 경로 유지를 위해 re-export)
+from .level_mapping import (
+    CEFRLevel,
+    LEVEL_THRESHOLDS,
+    MAX_SCORE,
+    MIN_SCORE,
+    get_average_score_and_level,
+    get_cefr_level_from_score,
+    get_speed_from_level_score,
+)
 
 # 단어 조회(Lookup) 기준 비율
 LOOKUP_THRESHOLD_RATIO = 0.1  # 10% (이하: 긍정적, 초과: 부정적)
@@ -35,65 +21,6 @@ LOOKUP_HIGH_THRESHOLD_RATIO = 0.15 # 15% (이 이상 초과 시 더 큰 패널
 SAVE_THRESHOLD_RATIO = 0.05   # 5% (이하: 긍정적, 초과: 부정적)
 SAVE_HIGH_THRESHOLD_RATIO = 0.1 # 10% (이 이상 초과 시 더 큰 패널티)
 
-def get_cefr_level_from_score(score: float) -> CEFRLevel:
-    """
-    스코어(0~300)로부터 CEFR 레벨(A1~C2)을 반환합니다.
-    
-    Args:
-        score: 0~300 범위의 레벨 스코어
-        
-    Returns:
-        CEFRLevel Enum 객체
-    """
-    # 스코어를 클램프
-    score = max(MIN_SCORE, min(MAX_SCORE, score))
-    
-    # 레벨 결정 (내림차순으로 체크)
-    if score >= LEVEL_THRESHOLDS[CEFRLevel.C2]:
-        return CEFRLevel.C2
-    elif score >= LEVEL_THRESHOLDS[CEFRLevel.C1]:
-        return CEFRLevel.C1
-    elif score >= LEVEL_THRESHOLDS[CEFRLevel.B2]:
-        return CEFRLevel.B2
-    elif score >= LEVEL_THRESHOLDS[CEFRLevel.B1]:
-        return CEFRLevel.B1
-    elif score >= LEVEL_THRESHOLDS[CEFRLevel.A2]:
-        return CEFRLevel.A2
-    else:
-        return CEFRLevel.A1
-
-
-def get_average_score_and_level(
-    lexical_score: float,
-    syntactic_score: float,
-    speed_score: float
-) -> dict[str, float | CEFRLevel]:
-    """
-    3개의 레벨 스코어를 받아 평균 스코어와 평균 CEFR 레벨을 반환합니다.
-    
-    Args:
-        lexical_score: 어휘 레벨 스코어 
-        syntactic_score: 구문 레벨 스코어 
-        speed_score: 속도 레벨 스코어 
-    
-    Returns:
-        {
-            "average_score": 평균 스코어 (float),
-            "average_level": CEFRLevel Enum 객체
-        }
-    """
-    # 평균 계산
-    average_score = round((lexical_score + syntactic_score + speed_score) / 3, 1)
-    
-    # 평균 스코어로부터 레벨 결정
-    average_level = get_cefr_level_from_score(average_score)
-    
-    return {
-        "average_score": average_score,
-        "average_level": average_level
-    }
-
-
 @dataclass
 class NormalizedFeedback:
     """정규화된 피드백 데이터를 담는 데이터 클래스"""
@@ -168,16 +95,16 @@ def normalize_vocab_factor(
     vocab_lookup_cnt: int,
     vocab_save_cnt: int,
 ) -> tuple[float, float]:
-   # --- 0. script_wc 조회 ---
-    # generated_content_id를 사용해 DB에서 스크립트의 총 단어 수(script_wc)를 가져옵니다.
-    content = db.query(GeneratedContent).filter(GeneratedContent.generated_content_id == generated_content_id).first()
-    if not content:
-        raise ValueError(f"Generated content with id {generated_content_id} not found")
-    if not content.script_data:
-        raise ValueError(f"Script data is missing for generated content id {generated_content_id}")
-    
-    # script_data에서 단어 수 계산
-    script_wc = len(content.script_data.split())
+    # --- 0. script_wc 조회 ---
+    # 생성 시점에 미리 계산된 content_analysis에서 총 단어 수(script_wc)를 읽습니다.
+    # (분석이 없는 과거 콘텐츠만 한 번 script_data를 파싱해 저장)
+    analysis = audio_crud.get_or_create_content_analysis(db, content_id=generated_content_id)
+    if analysis is None:
+        raise ValueError(
+            f"Generated content with id {generated_content_id} not found or has no script data"
+        )
+
+    script_wc = analysis.word_count
 
     # --- 1. 초기 설정 ---
     lexical_level_update_lookup = 0.0
@@ -247,32 +174,3 @@ def normalize_understanding_factor(understanding_difficulty: int) -> float:
 def normalize_speed_factor(speed_difficulty: int) -> float: 
     # speed_difficulty는 0 1 2(적당) 3 4(매우 느림)으로 온다고 가정
     return speed_difficulty-2
-
-
-
-def get_speed_from_level_score(level_score: float) -> float:
-
-    if level_score <= MIN_SCORE:
-        return 0.70
-    
-    if level_score >= 200:
-        return 1.15
-
-    # (start_score, end_score, start_speed, end_speed)
-    LEVEL_RANGES = [
-        (0,   25,  0.70, 0.80),  # A1
-        (25,  50,  0.80, 0.90),  # A2
-        (50,  100, 0.90, 1.00),  # B1
-        (100, 150, 1.00, 1.1),  # B2
-        (150, 200, 1.1, 1.15),  # C1
-    ]
-
-
-    # Linear interpolation in the correct range
-    for start_s, end_s, start_v, end_v in LEVEL_RANGES:
-        if start_s <= level_score <= end_s:
-            ratio = (level_score - start_s) / (end_s - start_s)
-            value = start_v + (end_v - start_v) * ratio
-            return round(value, 2)
-
-    return 1.00
\ No newline at end of file
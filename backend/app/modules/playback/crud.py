@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..audio.model import ContentAnalysis, GeneratedContent
+from .models import PlaybackAggregationState, PlaybackEvent, PlaybackSession
+
+
+def bulk_insert_events(db: Session, rows: Sequence[Mapping[str, object]]) -> None:
+    """Single multi-row INSERT (no ORM objects); the caller commits."""
+    if rows:
+        db.execute(PlaybackEvent.__table__.insert(), list(rows))
+
+
+def get_watermark(db: Session) -> PlaybackAggregationState:
+    state = db.get(PlaybackAggregationState, 1)
+    if state is None:
+        state = PlaybackAggregationState(id=1, last_event_id=0)
+        db.add(state)
+    return state
+
+
+def list_events_after(db: Session, *, after_id: int, limit: int) -> List[PlaybackEvent]:
+    return (
+        db.query(PlaybackEvent)
+        .filter(PlaybackEvent.id > after_id)
+        .order_by(PlaybackEvent.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_sessions_by_keys(db: Session, keys: Sequence[Tuple[int, str]]) -> Dict[Tuple[int, str], PlaybackSession]:
+    if not keys:
+        return {}
+    user_ids = {user_id for user_id, _ in keys}
+    session_keys = {session_key for _, session_key in keys}
+    rows = (
+        db.query(PlaybackSession)
+        .filter(PlaybackSession.user_id.in_(user_ids), PlaybackSession.session_key.in_(session_keys))
+        .all()
+    )
+    wanted = set(keys)
+    return {(row.user_id, row.session_key): row for row in rows if (row.user_id, row.session_key) in wanted}
+
+
+def list_idle_sessions(db: Session, *, idle_before: datetime, limit: int) -> List[PlaybackSession]:
+    return (
+        db.query(PlaybackSession)
+        .filter(PlaybackSession.finalized_at.is_(None), PlaybackSession.last_received_at < idle_before)
+        .order_by(PlaybackSession.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_owned_content_keys(db: Session, keys: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+    """The (user_id, generated_content_id) pairs in ``keys`` whose content belongs to that user."""
+    wanted = set(keys)
+    if not wanted:
+        return set()
+    rows = (
+        db.query(GeneratedContent.user_id, GeneratedContent.generated_content_id)
+        .filter(GeneratedContent.generated_content_id.in_({content_id for _, content_id in wanted}))
+        .all()
+    )
+    return {(row.user_id, row.generated_content_id) for row in rows} & wanted
+
+
+def get_content_durations(db: Session, content_ids: Iterable[int]) -> Dict[int, float]:
+    """Audio length (seconds) of the given contents, where the analysis knows it."""
+    content_ids = set(content_ids) - {None}
+    if not content_ids:
+        return {}
+    rows = (
+        db.query(ContentAnalysis.generated_content_id, ContentAnalysis.duration_seconds)
+        .filter(
+            ContentAnalysis.generated_content_id.in_(content_ids),
+            ContentAnalysis.duration_seconds.isnot(None),
+        )
+        .all()
+    )
+    return {row.generated_content_id: float(row.duration_seconds) for row in rows}
+
+
+def get_interaction_counts(
+    db: Session, *, user_id: int, generated_content_id: int
+) -> Optional[Tuple[int, int]]:
+    """(pause, rewind) counts of the user's latest playback session of a content, if any."""
+    row = (
+        db.query(PlaybackSession.pause_count, PlaybackSession.rewind_count)
+        .filter(
+            PlaybackSession.user_id == user_id,
+            PlaybackSession.generated_content_id == generated_content_id,
+        )
+        .order_by(PlaybackSession.last_received_at.desc(), PlaybackSession.id.desc())
+        .first()
+    )
+    return (int(row.pause_count), int(row.rewind_count)) if row is not None else None
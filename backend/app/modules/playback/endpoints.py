@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends
+
+from ...core.exceptions import (
+    AppException,
+    AuthTokenExpiredException,
+    InvalidAuthHeaderException,
+    InvalidTokenException,
+    PlaybackBufferFullException,
+    PlaybackIngestDisabledException,
+    UserNotFoundException,
+)
+from ..users.endpoints import get_current_user
+from . import schemas, service
+
+router = APIRouter(prefix="/playback", tags=["playback"])
+
+
+@router.post(
+    "/events",
+    status_code=202,
+    response_model=schemas.PlaybackEventBatchResponse,
+    responses=AppException.to_openapi_examples(
+        [
+            InvalidAuthHeaderException,
+            AuthTokenExpiredException,
+            InvalidTokenException,
+            UserNotFoundException,
+            PlaybackIngestDisabledException,
+            PlaybackBufferFullException,
+        ]
+    ),
+)
+async def ingest_playback_events(
+    payload: schemas.PlaybackEventBatchRequest,
+    current_user=Depends(get_current_user),
+):
+    """재생 이벤트 배치를 버퍼에 넣고 바로 202 응답 (DB 기록은 백그라운드에서 일괄 처리)"""
+    return service.ingest_events(current_user.id, payload)
@@ -0,0 +1,62 @@
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+
+from ...core.config import Base
+
+PLAYBACK_EVENT_TYPES = ("play", "pause", "seek", "rewind", "heartbeat")
+
+# SQLite는 INTEGER PRIMARY KEY만 자동 증가하므로 테스트용 variant
+_EventId = BigInteger().with_variant(Integer, "sqlite")
+
+
+class PlaybackEvent(Base):
+    """Raw client playback event, bulk-inserted by the write-behind buffer."""
+
+    __tablename__ = "playback_events"
+    __table_args__ = (Index("ix_playback_events_user_session", "user_id", "session_key"),)
+
+    id = Column(_EventId, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # 클라이언트가 재생 세션마다 만드는 식별자
+    session_key = Column(String(64), nullable=False)
+    generated_content_id = Column(Integer, nullable=True)
+    event_type = Column(String(16), nullable=False)
+    position_seconds = Column(Float, nullable=False)
+    # seek / rewind 이전 위치
+    from_position_seconds = Column(Float, nullable=True)
+    client_ts = Column(DateTime(timezone=True), nullable=False)
+    received_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class PlaybackSession(Base):
+    """Aggregated state of one client playback session (maintained by the aggregator)."""
+
+    __tablename__ = "playback_sessions"
+    __table_args__ = (UniqueConstraint("user_id", "session_key", name="uq_playback_sessions_user_session"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    session_key = Column(String(64), nullable=False)
+    generated_content_id = Column(Integer, nullable=True, index=True)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    last_received_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    listened_seconds = Column(Float, nullable=False, default=0.0)
+    pause_count = Column(Integer, nullable=False, default=0)
+    rewind_count = Column(Integer, nullable=False, default=0)
+    seek_count = Column(Integer, nullable=False, default=0)
+    # 다음 배치에서 청취 시간을 이어서 계산하기 위한 마지막 상태
+    is_playing = Column(Boolean, nullable=False, default=False)
+    last_client_ts = Column(DateTime(timezone=True), nullable=True)
+    # study_sessions에 기록한 분 (finalized_at과 함께 설정)
+    study_minutes = Column(Integer, nullable=True)
+    finalized_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class PlaybackAggregationState(Base):
+    """Single-row watermark: the last playback_events.id folded into playback_sessions."""
+
+    __tablename__ = "playback_aggregation_state"
+
+    id = Column(Integer, primary_key=True)
+    last_event_id = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PlaybackEventIn(BaseModel):
+    session_id: str = Field(..., min_length=1, max_length=64)  # 클라이언트 재생 세션 식별자
+    generated_content_id: Optional[int] = None
+    type: Literal["play", "pause", "seek", "rewind", "heartbeat"]
+    position: float = Field(..., ge=0)  # 이벤트 시점의 재생 위치(초)
+    from_position: Optional[float] = Field(default=None, ge=0)  # seek / rewind 이전 위치(초)
+    client_ts: datetime  # 클라이언트 기기 시각
+
+
+class PlaybackEventBatchRequest(BaseModel):
+    events: List[PlaybackEventIn] = Field(..., min_length=1, max_length=500)
+
+
+class PlaybackEventBatchResponse(BaseModel):
+    accepted: int
@@ -0,0 +1,339 @@
+"""Playback-event ingestion: write-behind buffer + periodic aggregator.
+
+``POST /playback/events`` only appends the batch to an in-memory buffer, so the
+request costs the same however busy the database is. A background loop
+(``PlaybackPipeline.run``) then:
+
+1. flushes the buffer every ``playback_flush_interval_seconds`` with one
+   multi-row INSERT into ``playback_events``
+2. every ``playback_aggregate_interval_seconds`` folds events past the
+   watermark into ``playback_sessions`` (listened seconds, pause / rewind /
+   seek counts) and writes sessions idle for ``playback_session_idle_seconds``
+   to ``study_sessions`` as real listening minutes
+
+Listening time is the client-clock time between consecutive events while
+playing, with each gap capped at ``MAX_EVENT_GAP_SECONDS`` (heartbeats keep it
+going), so a killed app or a paused phone does not count. Client clocks are not
+trusted beyond that: a session never gets more than the server-side time it was
+sending events for (``received_at`` span plus one flush interval), nor more than
+the content's audio length when it is known.
+
+Buffered events are lost if the process dies before a flush (at most one flush
+interval); the lifespan stops the loop with a final flush + aggregation.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from ...core.config import SessionLocal, settings
+from ...core.exceptions import PlaybackBufferFullException, PlaybackIngestDisabledException
+from ...core.logger import logger
+from ...core.tasks import NO_TIMEOUT, task_supervisor
+from ..stats import crud as stats_crud
+from . import crud, schemas
+from .models import PlaybackEvent, PlaybackSession
+
+# 재생 중 이벤트 간격 상한 (heartbeat 주기보다 넉넉하게)
+MAX_EVENT_GAP_SECONDS = 60.0
+AGGREGATE_BATCH_SIZE = 5000
+FINALIZE_BATCH_SIZE = 500
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite는 tz 정보 없이 돌려주므로 UTC로 간주
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def fold_events(
+    session: PlaybackSession,
+    events: Iterable[PlaybackEvent],
+    *,
+    content_seconds: Optional[float] = None,
+) -> None:
+    """Apply events (in arrival order) to the session's counters and playing state.
+
+    ``listened_seconds`` is capped by the server-side elapsed time of the session
+    and by ``content_seconds`` (the audio length), whatever the client timestamps say.
+    """
+    for event in events:
+        client_ts = _as_utc(event.client_ts)
+        if session.is_playing and session.last_client_ts is not None:
+            gap = (client_ts - _as_utc(session.last_client_ts)).total_seconds()
+            if gap > 0:
+                session.listened_seconds = (session.listened_seconds or 0.0) + min(gap, MAX_EVENT_GAP_SECONDS)
+
+        if event.event_type in ("play", "heartbeat"):
+            session.is_playing = True
+        elif event.event_type == "pause":
+            session.is_playing = False
+            session.pause_count = (session.pause_count or 0) + 1
+        elif event.event_type == "rewind":
+            session.rewind_count = (session.rewind_count or 0) + 1
+        elif event.event_type == "seek":
+            session.seek_count = (session.seek_count or 0) + 1
+
+        if session.last_client_ts is None or client_ts >= _as_utc(session.last_client_ts):
+            session.last_client_ts = client_ts
+        received_at = _as_utc(event.received_at)
+        if session.last_received_at is None or received_at > _as_utc(session.last_received_at):
+            session.last_received_at = received_at
+        if session.generated_content_id is None:
+            session.generated_content_id = event.generated_content_id
+
+    # client_ts는 조작할 수 있으므로 서버 수신 시각 범위(+flush 주기 1회)와 콘텐츠 길이로 제한
+    limit = (
+        _as_utc(session.last_received_at) - _as_utc(session.started_at)
+    ).total_seconds() + settings.playback_flush_interval_seconds
+    if content_seconds is not None:
+        limit = min(limit, content_seconds)
+    session.listened_seconds = min(session.listened_seconds or 0.0, max(limit, 0.0))
+    # 세션이 끝난 뒤 이어서 재생하면 다시 열어 추가 시간만 기록
+    session.finalized_at = None
+
+
+def aggregate_pending(db: Session, *, batch_size: int = AGGREGATE_BATCH_SIZE) -> int:
+    """Fold all events past the watermark into playback_sessions; returns the event count.
+
+    Events whose ``generated_content_id`` is not the sender's own content are
+    skipped (the watermark still moves past them).
+    """
+    processed = 0
+    while True:
+        state = crud.get_watermark(db)
+        events = crud.list_events_after(db, after_id=state.last_event_id or 0, limit=batch_size)
+        if not events:
+            db.commit()
+            return processed
+
+        # 본인 소유가 아닌 콘텐츠의 이벤트는 버린다 (다른 사용자의 피드백 입력을 바꾸지 못하도록)
+        owned = crud.get_owned_content_keys(
+            db,
+            {(event.user_id, event.generated_content_id) for event in events if event.generated_content_id is not None},
+        )
+        grouped: Dict[tuple, List[PlaybackEvent]] = {}
+        dropped = 0
+        for event in events:
+            if event.generated_content_id is not None and (event.user_id, event.generated_content_id) not in owned:
+                dropped += 1
+                continue
+            grouped.setdefault((event.user_id, event.session_key), []).append(event)
+        if dropped:
+            logger.warning(f"[playback] dropped {dropped} events for content not owned by the sender")
+        sessions = crud.get_sessions_by_keys(db, list(grouped))
+        durations = crud.get_content_durations(
+            db,
+            {event.generated_content_id for event in events}
+            | {session.generated_content_id for session in sessions.values()},
+        )
+        for key, session_events in grouped.items():
+            session = sessions.get(key)
+            if session is None:
+                first = session_events[0]
+                session = PlaybackSession(
+                    user_id=first.user_id,
+                    session_key=first.session_key,
+                    generated_content_id=first.generated_content_id,
+                    started_at=_as_utc(first.received_at),
+                    last_received_at=_as_utc(first.received_at),
+                    listened_seconds=0.0,
+                    pause_count=0,
+                    rewind_count=0,
+                    seek_count=0,
+                    is_playing=False,
+                )
+                db.add(session)
+            fold_events(session, session_events, content_seconds=durations.get(session.generated_content_id))
+
+        # 세션 상태와 watermark를 같은 트랜잭션으로 반영
+        state.last_event_id = events[-1].id
+        db.commit()
+        processed += len(events)
+        if len(events) < batch_size:
+            return processed
+
+
+def finalize_idle_sessions(db: Session, *, now: datetime, idle_seconds: int) -> int:
+    """Record listening minutes of idle sessions into study_sessions; returns the session count."""
+    finalized = 0
+    for session in crud.list_idle_sessions(
+        db, idle_before=now - timedelta(seconds=idle_seconds), limit=FINALIZE_BATCH_SIZE
+    ):
+        total_minutes = math.ceil((session.listened_seconds or 0.0) / 60)
+        new_minutes = total_minutes - (session.study_minutes or 0)
+        session.finalized_at = now
+        session.study_minutes = max(total_minutes, session.study_minutes or 0)
+        session.is_playing = False
+        if new_minutes > 0:
+            # insert_study_session이 세션 종료 표시까지 한 트랜잭션으로 commit
+            stats_crud.insert_study_session(
+                db,
+                user_id=session.user_id,
+                duration_minutes=new_minutes,
+                activity_type="listening",
+                started_at=_as_utc(session.started_at),
+            )
+        else:
+            db.commit()
+        finalized += 1
+    return finalized
+
+
+class PlaybackPipeline:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_buffered_events: Optional[int] = None,
+    ):
+        self._session_factory = session_factory
+        self._max_buffered = max_buffered_events or settings.playback_buffer_max_events
+        self._buffer: Deque[Dict[str, object]] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop: Optional[asyncio.Event] = None
+        self._counts = {
+            "accepted": 0,
+            "rejected": 0,
+            "flushed": 0,
+            "flush_failures": 0,
+            "aggregated": 0,
+            "finalized_sessions": 0,
+        }
+
+    # ------------------------------------------------------------------ ingest
+    def enqueue(
+        self,
+        user_id: int,
+        events: Sequence[schemas.PlaybackEventIn],
+        *,
+        now: Optional[datetime] = None,
+    ) -> int:
+        received_at = now or datetime.now(timezone.utc)
+        rows = [
+            {
+                "user_id": user_id,
+                "session_key": event.session_id,
+                "generated_content_id": event.generated_content_id,
+                "event_type": event.type,
+                "position_seconds": event.position,
+                "from_position_seconds": event.from_position,
+                "client_ts": _as_utc(event.client_ts),
+                "received_at": received_at,
+            }
+            for event in events
+        ]
+        with self._lock:
+            if len(self._buffer) + len(rows) > self._max_buffered:
+                self._counts["rejected"] += len(rows)
+                raise PlaybackBufferFullException()
+            self._buffer.extend(rows)
+            self._counts["accepted"] += len(rows)
+        return len(rows)
+
+    def flush(self) -> int:
+        """Write everything buffered with one bulk INSERT; on failure the rows are re-queued."""
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._buffer)
+                self._buffer.clear()
+            if not rows:
+                return 0
+
+            db = self._session_factory()
+            try:
+                crud.bulk_insert_events(db, rows)
+                db.commit()
+            except Exception as e:  # noqa: BLE001
+                db.rollback()
+                with self._lock:
+                    self._buffer.extendleft(reversed(rows))
+                    self._counts["flush_failures"] += 1
+                logger.warning(f"[playback] flush of {len(rows)} events failed, re-queued: {e}")
+                return 0
+            finally:
+                db.close()
+
+            with self._lock:
+                self._counts["flushed"] += len(rows)
+            return len(rows)
+
+    # ------------------------------------------------------------------ aggregation
+    def aggregate(self, *, now: Optional[datetime] = None) -> Dict[str, int]:
+        db = self._session_factory()
+        try:
+            events = aggregate_pending(db)
+            sessions = finalize_idle_sessions(
+                db,
+                now=now or datetime.now(timezone.utc),
+                idle_seconds=settings.playback_session_idle_seconds,
+            )
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        with self._lock:
+            self._counts["aggregated"] += events
+            self._counts["finalized_sessions"] += sessions
+        return {"events": events, "finalized_sessions": sessions}
+
+    # ------------------------------------------------------------------ background loop
+    async def run(self) -> None:
+        stop = self._stop
+        last_aggregate = time.monotonic()
+        while stop is not None and not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.playback_flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await asyncio.to_thread(self.flush)
+                if stop.is_set() or time.monotonic() - last_aggregate >= settings.playback_aggregate_interval_seconds:
+                    last_aggregate = time.monotonic()
+                    await asyncio.to_thread(self.aggregate)
+            except Exception as e:  # noqa: BLE001
+                # 집계 실패는 다음 주기에 watermark부터 다시 시도
+                logger.error(f"[playback] pipeline iteration failed: {e}", exc_info=True)
+
+    def start(self) -> bool:
+        self._stop = asyncio.Event()
+        # 앱 수명 동안 도는 루프이므로 supervisor의 기본 timeout을 적용하지 않는다
+        return task_supervisor.submit("playback_pipeline", self.run, timeout=NO_TIMEOUT, retries=0)
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {**self._counts, "buffered": len(self._buffer)}
+
+
+pipeline = PlaybackPipeline()
+
+
+def ingest_events(user_id: int, payload: schemas.PlaybackEventBatchRequest) -> schemas.PlaybackEventBatchResponse:
+    if not settings.playback_ingest_enabled:
+        raise PlaybackIngestDisabledException()
+    return schemas.PlaybackEventBatchResponse(accepted=pipeline.enqueue(user_id, payload.events))
+
+
+def start_pipeline() -> None:
+    """Lifespan hook (no-op unless ``playback_ingest_enabled``)."""
+    if settings.playback_ingest_enabled:
+        pipeline.start()
+
+
+def stop_pipeline() -> None:
+    """Lifespan hook: the loop does a final flush + aggregation, awaited by ``task_supervisor.drain``."""
+    pipeline.stop()
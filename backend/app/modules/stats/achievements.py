@@ -0,0 +1,92 @@
+"""Achievement definitions and unlock thresholds.
+
+Pure data and rules (no DB access), shared by ``crud.insert_study_session``,
+which unlocks achievements as sessions are written, and by the stats service,
+which only reads them.
+"""
+from typing import Dict, Iterable, Set, Tuple
+
+DEFAULT_ACHIEVEMENTS: tuple[Dict[str, str], ...] = (
+    {
+        "code": "FIRST_SESSION",
+        "name": "첫 학습 달성",
+        "description": "첫 학습 세션을 완료했습니다.",
+        "category": "milestone",
+    },
+    {
+        "code": "STREAK_3",
+        "name": "3일 연속 학습",
+        "description": "3일 연속으로 학습했습니다.",
+        "category": "streak",
+    },
+    {
+        "code": "STREAK_7",
+        "name": "7일 연속 학습",
+        "description": "일주일 동안 하루도 빠지지 않고 학습했습니다.",
+        "category": "streak",
+    },
+    {
+        "code": "STREAK_30",
+        "name": "30일 연속 학습",
+        "description": "한 달 내내 학습 루틴을 유지했습니다.",
+        "category": "streak",
+    },
+    {
+        "code": "TOTAL_60",
+        "name": "누적 1시간 학습",
+        "description": "누적 60분 이상 학습했습니다.",
+        "category": "time",
+    },
+    {
+        "code": "TOTAL_300",
+        "name": "누적 5시간 학습",
+        "description": "누적 300분 이상 학습했습니다.",
+        "category": "time",
+    },
+    {
+        "code": "TOTAL_600",
+        "name": "누적 10시간 학습",
+        "description": "누적 600분 이상 학습했습니다.",
+        "category": "time",
+    },
+    {
+        "code": "TOTAL_1200",
+        "name": "누적 20시간 학습",
+        "description": "누적 1,200분 이상 학습했습니다.",
+        "category": "time",
+    },
+    {
+        "code": "TOTAL_3000",
+        "name": "누적 50시간 학습",
+        "description": "누적 3,000분 이상 학습했습니다.",
+        "category": "time",
+    },
+)
+
+# (code, user_study_totals 필드, 임계값): 값이 임계값 이상이면 해금
+ACHIEVEMENT_THRESHOLDS: Tuple[Tuple[str, str, int], ...] = (
+    ("FIRST_SESSION", "total_minutes", 1),
+    ("STREAK_3", "current_streak", 3),
+    ("STREAK_7", "current_streak", 7),
+    ("STREAK_30", "current_streak", 30),
+    ("TOTAL_60", "total_minutes", 60),
+    ("TOTAL_300", "total_minutes", 300),
+    ("TOTAL_600", "total_minutes", 600),
+    ("TOTAL_1200", "total_minutes", 1_200),
+    ("TOTAL_3000", "total_minutes", 3_000),
+)
+
+
+def achieved_codes(totals: object) -> Set[str]:
+    """Codes whose threshold is met by a ``UserStudyTotals``-like object."""
+    return {
+        code
+        for code, field, threshold in ACHIEVEMENT_THRESHOLDS
+        if int(getattr(totals, field, 0) or 0) >= threshold
+    }
+
+
+def order_definitions(definitions: Iterable[object]) -> list:
+    """Keep only known definitions, in ``DEFAULT_ACHIEVEMENTS`` order."""
+    by_code = {definition.code: definition for definition in definitions}
+    return [by_code[item["code"]] for item in DEFAULT_ACHIEVEMENTS if item["code"] in by_code]
@@ -0,0 +1,69 @@
+"""Year activity bitmaps for the study heatmap.
+
+One ``user_activity_years`` row per (user, year):
+
+- ``days_bitmap``: 366 bits, bit ``d`` set when day-of-year ``d`` (0-based) has
+  study minutes (LSB first, see ``core.bitset``)
+- ``minute_buckets``: 366 nibbles, ``min(15, ceil(minutes / 10))`` per day
+
+Rows are updated by ``crud.insert_study_session`` (under the per-user totals
+lock) and rebuilt by the rollup backfill. Day counts, streaks and the heatmap
+itself come from bit operations on these 229 bytes.
+"""
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+from typing import Optional
+
+from ...core import bitset
+
+DAYS_PER_YEAR = 366
+DAYS_BITMAP_BYTES = (DAYS_PER_YEAR + 7) // 8
+MINUTE_BUCKET_BYTES = (DAYS_PER_YEAR + 1) // 2
+BUCKET_MINUTES = 10
+MAX_BUCKET = 15
+
+
+def day_index(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def days_in_year(year: int) -> int:
+    return (date(year + 1, 1, 1) - date(year, 1, 1)).days
+
+
+def minutes_bucket(minutes: int) -> int:
+    if minutes <= 0:
+        return 0
+    return min(MAX_BUCKET, math.ceil(minutes / BUCKET_MINUTES))
+
+
+def empty_year() -> tuple[bytearray, bytearray]:
+    return bytearray(DAYS_BITMAP_BYTES), bytearray(MINUTE_BUCKET_BYTES)
+
+
+def record_day(row: object, day: date, minutes: int) -> None:
+    """Set ``day`` on a ``UserActivityYear`` row given that day's total minutes."""
+    days_bitmap = bytearray(row.days_bitmap or bytes(DAYS_BITMAP_BYTES))
+    buckets = bytearray(row.minute_buckets or bytes(MINUTE_BUCKET_BYTES))
+    index = day_index(day)
+    if minutes > 0:
+        bitset.set_bit(days_bitmap, index)
+    bitset.set_nibble(buckets, index, minutes_bucket(minutes))
+    # bytes로 다시 할당해야 SQLAlchemy가 변경을 감지함
+    row.days_bitmap = bytes(days_bitmap)
+    row.minute_buckets = bytes(buckets)
+
+
+def active_days(days_bitmap: Optional[bytes]) -> int:
+    return bitset.popcount(days_bitmap) if days_bitmap else 0
+
+
+def longest_streak_in_year(days_bitmap: Optional[bytes]) -> int:
+    return bitset.longest_run(days_bitmap) if days_bitmap else 0
+
+
+def last_active_day(year: int, days_bitmap: Optional[bytes]) -> Optional[date]:
+    index = bitset.highest_set_bit(days_bitmap) if days_bitmap else -1
+    return date(year, 1, 1) + timedelta(days=index) if index >= 0 else None
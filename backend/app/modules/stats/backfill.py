@@ -0,0 +1,137 @@
+"""Rebuild the study rollups (user_daily_study, user_study_totals, user_activity_years,
+user_leaderboard_scores) from study_sessions.
+
+Achievements reached by the rebuilt totals are unlocked too (INSERT IGNORE), for
+users whose sessions predate unlock-on-insert.
+
+Usage (from backend/):
+    python -m app.modules.stats.backfill
+    python -m app.modules.stats.backfill --user-id 12 --user-id 34
+
+Idempotent: each user's rollup rows are recomputed from scratch. Every user is
+handled in its own transaction while holding the user_study_totals row lock
+that ``crud.insert_study_session`` also takes, so it is safe to run while
+sessions keep coming in. The API's in-memory leaderboards pick up the rebuilt
+scores on its next restart.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import crud
+from .achievements import achieved_codes
+from .leaderboard import (
+    BOARD_STREAK,
+    BOARD_WEEKLY_MINUTES,
+    STREAK_PERIOD,
+    LeaderboardScore,
+    streak_expires_on,
+    week_key,
+)
+
+
+def compute_rollup(sessions: Iterable[Tuple[object, int]]) -> Tuple[Dict[date, Tuple[int, int]], Dict[str, object]]:
+    """(started_at, minutes) pairs -> ({date: (minutes, session_count)}, totals fields)."""
+    days: Dict[date, List[int]] = {}
+    for started_at, minutes in sessions:
+        entry = days.setdefault(started_at.date(), [0, 0])
+        entry[0] += minutes
+        entry[1] += 1
+
+    # insert_study_session과 같이 학습 시간이 있는 날만 학습일로 센다
+    active_days = [day for day, (minutes, _) in days.items() if minutes > 0]
+    current_streak, longest_streak = crud.compute_streaks(active_days)
+    totals = {
+        "total_minutes": sum(minutes for minutes, _ in days.values()),
+        "total_days": len(active_days),
+        "current_streak": current_streak,
+        "longest_streak": longest_streak,
+        "last_active_date": max(active_days) if active_days else None,
+    }
+    return {day: (minutes, count) for day, (minutes, count) in days.items()}, totals
+
+
+def compute_leaderboard_scores(
+    user_id: int,
+    days: Dict[date, Tuple[int, int]],
+    totals: Dict[str, object],
+) -> List[LeaderboardScore]:
+    """Weekly-minutes rows for every week with study time, plus the streak row."""
+    weeks: Dict[str, int] = {}
+    for study_date, (minutes, _) in days.items():
+        weeks[week_key(study_date)] = weeks.get(week_key(study_date), 0) + minutes
+    scores = [
+        LeaderboardScore(board=BOARD_WEEKLY_MINUTES, period=period, user_id=user_id, score=minutes)
+        for period, minutes in sorted(weeks.items())
+        if minutes > 0
+    ]
+    last_active = totals["last_active_date"]
+    if last_active is not None:
+        scores.append(
+            LeaderboardScore(
+                board=BOARD_STREAK,
+                period=STREAK_PERIOD,
+                user_id=user_id,
+                score=int(totals["current_streak"]),
+                expires_on=streak_expires_on(last_active),
+            )
+        )
+    return scores
+
+
+def backfill_user(db: Session, *, user_id: int) -> int:
+    """Recompute one user's rollups and commit; returns the number of day rows written."""
+    try:
+        totals = crud.lock_study_totals(db, user_id=user_id)
+        days, values = compute_rollup(crud.list_study_session_durations(db, user_id=user_id))
+        crud.replace_daily_study_rollup(db, user_id=user_id, days=days)
+        crud.replace_activity_years(db, user_id=user_id, days=days)
+        crud.replace_leaderboard_scores(
+            db, user_id=user_id, scores=compute_leaderboard_scores(user_id, days, values)
+        )
+        for field, value in values.items():
+            setattr(totals, field, value)
+        crud.grant_user_achievements(db, user_id=user_id, codes=achieved_codes(totals))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(days)
+
+
+def run_backfill(db: Session, *, user_ids: Optional[Iterable[int]] = None) -> Dict[str, object]:
+    started = time.perf_counter()
+    targets = list(user_ids) if user_ids else crud.list_study_session_user_ids(db)
+    day_rows = 0
+    for user_id in targets:
+        day_rows += backfill_user(db, user_id=user_id)
+    return {
+        "users": len(targets),
+        "day_rows": day_rows,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, action="append", dest="user_ids", help="limit to these users")
+    args = parser.parse_args(argv)
+
+    from ...core.config import SessionLocal
+
+    db = SessionLocal()
+    try:
+        report = run_backfill(db, user_ids=args.user_ids)
+    finally:
+        db.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
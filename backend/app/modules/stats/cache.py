@@ -0,0 +1,114 @@
+"""Per-user cache of the serialized ``UserStatsResponse``.
+
+Entries are dropped by the events that change the payload:
+
+- ``crud.insert_study_session`` (minutes, streak and achievement unlocks)
+- level updates in level_system and level_management
+
+Each entry also carries the UTC date it was built on, so the 7-day window
+rolls over at midnight without an explicit invalidation. ``invalidate`` bumps
+a per-user generation; a response computed from data read before that bump is
+not stored (``put`` with a stale generation is a no-op). Invalidate *after*
+the commit that changes the data.
+
+The cache is in-process (the API runs as a single uvicorn worker); the TTL
+bounds staleness from writes made by other processes (the rollup backfill,
+level_system.replay --apply).
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Optional
+
+from ...core.cache import LRUCache
+from ...core.config import settings
+
+
+@dataclass(frozen=True)
+class CachedStats:
+    day: date
+    etag: str
+    body: bytes
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 7232 weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class StatsResponseCache:
+    def __init__(self, *, maxsize: int = 10_000, ttl_seconds: Optional[int] = None):
+        ttl = settings.stats_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._ttl = ttl
+        self._entries: LRUCache = LRUCache(maxsize=maxsize, ttl_seconds=ttl or None)
+        self._lock = threading.Lock()
+        self._generations: Dict[int, int] = {}
+        self._counts = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def generation(self, user_id: int) -> int:
+        """Read before loading the data the response is built from; pass to ``put``."""
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def get(self, user_id: int, *, day: date) -> Optional[CachedStats]:
+        entry = self._entries.get(user_id) if self.enabled else None
+        # 날짜가 바뀌면 7일 구간이 달라지므로 miss
+        if entry is not None and entry.day != day:
+            entry = None
+        with self._lock:
+            self._counts["hits" if entry is not None else "misses"] += 1
+        return entry
+
+    def put(self, user_id: int, *, day: date, generation: int, body: bytes) -> CachedStats:
+        entry = CachedStats(day=day, etag=make_etag(body), body=body)
+        if not self.enabled:
+            return entry
+        with self._lock:
+            current = self._generations.get(user_id, 0) == generation
+        if current:
+            self._entries.put(user_id, entry)
+        return entry
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            self._counts["invalidations"] += 1
+        self._entries.discard(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generations.clear()
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["hits"] + counts["misses"]
+        return {
+            **counts,
+            "hit_ratio": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+
+stats_cache = StatsResponseCache()
+
+
+def invalidate_user_stats(user_id: int) -> None:
+    stats_cache.invalidate(user_id)
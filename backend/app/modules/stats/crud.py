@@ -1,11 +1,33 @@
-from datetime import date, datetime
-from typing import Iterable, Mapping, Sequence
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import and_, func, or_
 from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from .models import Achievement, StudySession, UserAchievement
+from ..users.models import User
+from . import activity
+from .achievements import achieved_codes
+from .cache import invalidate_user_stats
+from .leaderboard import (
+    BOARD_STREAK,
+    BOARD_WEEKLY_MINUTES,
+    STREAK_PERIOD,
+    LeaderboardScore,
+    leaderboards,
+    streak_expires_on,
+    week_key,
+)
+from .models import (
+    Achievement,
+    StudySession,
+    UserAchievement,
+    UserActivityYear,
+    UserDailyStudy,
+    UserLeaderboardScore,
+    UserStudyTotals,
+)
 
 
 def get_daily_study_minutes(
@@ -110,31 +132,221 @@ def list_user_achievements(db: Session, *, user_id: int) -> Sequence[UserAchieve
     )
 
 
-def ensure_user_achievement(
+def grant_user_achievements(db: Session, *, user_id: int, codes: Iterable[str]) -> int:
+    """Bulk INSERT IGNORE of unlocks (no commit); already unlocked codes are skipped."""
+    rows = [{"user_id": user_id, "achievement_code": code} for code in sorted(set(codes))]
+    if not rows:
+        return 0
+    stmt = (
+        UserAchievement.__table__.insert()
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
+    )
+    result = db.execute(stmt, rows)
+    return max(0, result.rowcount or 0)
+
+
+def get_study_totals(db: Session, *, user_id: int) -> Optional[UserStudyTotals]:
+    return db.get(UserStudyTotals, user_id)
+
+
+def get_daily_study_rollup(
     db: Session,
     *,
     user_id: int,
-    achievement_code: str,
-) -> UserAchievement:
-    record = (
-        db.query(UserAchievement)
+    start_date: date,
+    end_date: date,
+) -> Mapping[date, int]:
+    """Minutes per day from ``user_daily_study`` for start_date..end_date (inclusive)."""
+    rows = (
+        db.query(UserDailyStudy.study_date, UserDailyStudy.minutes)
         .filter(
-            UserAchievement.user_id == user_id,
-            UserAchievement.achievement_code == achievement_code,
+            UserDailyStudy.user_id == user_id,
+            UserDailyStudy.study_date >= start_date,
+            UserDailyStudy.study_date <= end_date,
         )
-        .first()
+        .all()
     )
-    if record is not None:
-        return record
+    return {row.study_date: int(row.minutes) for row in rows}
 
-    record = UserAchievement(
-        user_id=user_id,
-        achievement_code=achievement_code,
+
+def get_activity_year(db: Session, *, user_id: int, year: int) -> Optional[UserActivityYear]:
+    return db.get(UserActivityYear, (user_id, year))
+
+
+def list_daily_study_dates(db: Session, *, user_id: int) -> Sequence[date]:
+    """Dates with study minutes (the days that count toward total_days and streaks)."""
+    rows = (
+        db.query(UserDailyStudy.study_date)
+        .filter(UserDailyStudy.user_id == user_id, UserDailyStudy.minutes > 0)
+        .all()
     )
-    db.add(record)
-    db.commit()
-    db.refresh(record)
-    return record
+    return [row.study_date for row in rows]
+
+
+def compute_streaks(dates: Iterable[date]) -> Tuple[int, int]:
+    """(current, longest) run of consecutive dates; current is the run ending at the latest date."""
+    current = longest = 0
+    previous: Optional[date] = None
+    for day in sorted(set(dates)):
+        current = current + 1 if previous is not None and day == previous + timedelta(days=1) else 1
+        longest = max(longest, current)
+        previous = day
+    return current, longest
+
+
+def lock_study_totals(db: Session, *, user_id: int) -> UserStudyTotals:
+    """Return the user's totals row, creating it if needed, locked FOR UPDATE.
+
+    The row lock serializes rollup updates per user (concurrent sessions and the
+    backfill job), so read-modify-write on the counters is safe.
+    """
+    if db.get(UserStudyTotals, user_id) is None:
+        try:
+            with db.begin_nested():
+                db.add(
+                    UserStudyTotals(
+                        user_id=user_id, total_minutes=0, total_days=0, current_streak=0, longest_streak=0
+                    )
+                )
+        except IntegrityError:
+            # 다른 트랜잭션이 먼저 생성함
+            pass
+    return (
+        db.query(UserStudyTotals)
+        .filter(UserStudyTotals.user_id == user_id)
+        .with_for_update()
+        .populate_existing()
+        .one()
+    )
+
+
+def _apply_study_rollup(
+    db: Session,
+    *,
+    user_id: int,
+    study_date: date,
+    duration_minutes: int,
+) -> UserStudyTotals:
+    totals = lock_study_totals(db, user_id=user_id)
+    previously_achieved = achieved_codes(totals)
+
+    day = db.get(UserDailyStudy, (user_id, study_date))
+    previous_minutes = day.minutes if day is not None else 0
+    new_day = day is None
+    if new_day:
+        day = UserDailyStudy(user_id=user_id, study_date=study_date, minutes=0, session_count=0)
+        db.add(day)
+    day.minutes = previous_minutes + duration_minutes
+    day.session_count = (day.session_count or 0) + 1
+
+    year_row = db.get(UserActivityYear, (user_id, study_date.year))
+    if year_row is None:
+        days_bitmap, minute_buckets = activity.empty_year()
+        year_row = UserActivityYear(
+            user_id=user_id, year=study_date.year, days_bitmap=bytes(days_bitmap), minute_buckets=bytes(minute_buckets)
+        )
+        db.add(year_row)
+    activity.record_day(year_row, study_date, day.minutes)
+
+    totals.total_minutes = (totals.total_minutes or 0) + duration_minutes
+    # 학습일(total_days, 연속 학습일, 활동 비트맵)은 모두 학습 시간이 있는 날(minutes > 0)만 센다
+    if previous_minutes <= 0 < day.minutes:
+        totals.total_days = (totals.total_days or 0) + 1
+        last_active = totals.last_active_date
+        if last_active is None or study_date > last_active + timedelta(days=1):
+            totals.current_streak = 1
+            totals.last_active_date = study_date
+        elif study_date == last_active + timedelta(days=1):
+            totals.current_streak = (totals.current_streak or 0) + 1
+            totals.last_active_date = study_date
+        else:
+            # 마지막 활동일 이전의 날짜(드묾): 섬이 합쳐질 수 있으므로 일별 롤업에서 다시 계산
+            dates = list_daily_study_dates(db, user_id=user_id)
+            totals.current_streak, totals.longest_streak = compute_streaks([*dates, study_date])
+    # 그 외(이미 학습한 날, 0분 세션)는 streak 변화 없음
+    totals.longest_streak = max(totals.longest_streak or 0, totals.current_streak or 0)
+
+    # 이번 세션으로 새로 넘은 임계값만 해금 (같은 트랜잭션)
+    newly_achieved = achieved_codes(totals) - previously_achieved
+    if newly_achieved:
+        grant_user_achievements(db, user_id=user_id, codes=newly_achieved)
+    return totals
+
+
+def _upsert_leaderboard_score(db: Session, *, board: str, period: str, user_id: int) -> UserLeaderboardScore:
+    row = db.get(UserLeaderboardScore, (board, period, user_id))
+    if row is None:
+        row = UserLeaderboardScore(board=board, period=period, user_id=user_id, score=0)
+        db.add(row)
+    return row
+
+
+def _apply_leaderboard_scores(
+    db: Session,
+    *,
+    user_id: int,
+    study_date: date,
+    duration_minutes: int,
+    totals: UserStudyTotals,
+) -> List[LeaderboardScore]:
+    """Update the user's leaderboard rows (caller holds the totals lock); returns the new scores."""
+    weekly = _upsert_leaderboard_score(
+        db, board=BOARD_WEEKLY_MINUTES, period=week_key(study_date), user_id=user_id
+    )
+    weekly.score = (weekly.score or 0) + duration_minutes
+
+    streak = _upsert_leaderboard_score(db, board=BOARD_STREAK, period=STREAK_PERIOD, user_id=user_id)
+    streak.score = int(totals.current_streak or 0)
+    streak.expires_on = streak_expires_on(totals.last_active_date) if totals.last_active_date else None
+    return [
+        LeaderboardScore(board=row.board, period=row.period, user_id=user_id, score=row.score, expires_on=row.expires_on)
+        for row in (weekly, streak)
+    ]
+
+
+def list_leaderboard_scores(db: Session, *, periods: Sequence[Tuple[str, str]]) -> List[LeaderboardScore]:
+    if not periods:
+        return []
+    rows = (
+        db.query(UserLeaderboardScore)
+        .filter(
+            or_(
+                *(
+                    and_(UserLeaderboardScore.board == board, UserLeaderboardScore.period == period)
+                    for board, period in periods
+                )
+            )
+        )
+        .filter(UserLeaderboardScore.score > 0)
+        .all()
+    )
+    return [
+        LeaderboardScore(
+            board=row.board, period=row.period, user_id=row.user_id, score=row.score, expires_on=row.expires_on
+        )
+        for row in rows
+    ]
+
+
+def replace_leaderboard_scores(db: Session, *, user_id: int, scores: Iterable[LeaderboardScore]) -> None:
+    """Overwrite all of the user's ``user_leaderboard_scores`` rows."""
+    db.query(UserLeaderboardScore).filter(UserLeaderboardScore.user_id == user_id).delete(
+        synchronize_session=False
+    )
+    db.add_all(
+        UserLeaderboardScore(
+            board=row.board, period=row.period, user_id=user_id, score=row.score, expires_on=row.expires_on
+        )
+        for row in scores
+    )
+
+
+def get_user_nicknames(db: Session, *, user_ids: Sequence[int]) -> Dict[int, str]:
+    if not user_ids:
+        return {}
+    rows = db.query(User.id, User.nickname).filter(User.id.in_(list(user_ids))).all()
+    return {row.id: row.nickname for row in rows}
 
 
 def insert_study_session(
@@ -143,14 +355,99 @@ def insert_study_session(
     user_id: int,
     duration_minutes: int,
     activity_type: str | None = None,
+    started_at: datetime | None = None,
 ) -> StudySession:
-    """Insert a StudySession record and return it."""
+    """Insert a StudySession record and return it.
+
+    ``started_at`` defaults to the DB's now(); the playback aggregator passes
+    the time listening actually started.
+
+    ``user_daily_study``, ``user_study_totals`` and ``user_leaderboard_scores``
+    are updated, and newly reached achievements unlocked, in the same
+    transaction, so the rollups never disagree with study_sessions.
+    """
     record = StudySession(
         user_id=user_id,
         duration_minutes=duration_minutes,
         activity_type=activity_type,
     )
+    if started_at is not None:
+        record.started_at = started_at
     db.add(record)
-    db.commit()
+    try:
+        db.flush()
+        # started_at은 DB 기본값(now())이므로 읽어와서 집계 날짜로 사용 (func.date(started_at)과 동일 기준)
+        db.refresh(record, ["started_at"])
+        study_date = record.started_at.date()
+        totals = _apply_study_rollup(
+            db,
+            user_id=user_id,
+            study_date=study_date,
+            duration_minutes=duration_minutes,
+        )
+        scores = _apply_leaderboard_scores(
+            db,
+            user_id=user_id,
+            study_date=study_date,
+            duration_minutes=duration_minutes,
+            totals=totals,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    invalidate_user_stats(user_id)
+    leaderboards.record(scores, today=datetime.now(timezone.utc).date())
     db.refresh(record)
     return record
+
+
+def list_study_session_user_ids(db: Session) -> Sequence[int]:
+    rows = db.query(StudySession.user_id).distinct().order_by(StudySession.user_id).all()
+    return [row.user_id for row in rows]
+
+
+def list_study_session_durations(db: Session, *, user_id: int) -> Sequence[Tuple[datetime, int]]:
+    rows = (
+        db.query(StudySession.started_at, StudySession.duration_minutes)
+        .filter(StudySession.user_id == user_id)
+        .all()
+    )
+    return [(row.started_at, int(row.duration_minutes or 0)) for row in rows]
+
+
+def replace_daily_study_rollup(
+    db: Session,
+    *,
+    user_id: int,
+    days: Mapping[date, Tuple[int, int]],
+) -> None:
+    """Overwrite the user's ``user_daily_study`` rows with ``{date: (minutes, session_count)}``."""
+    db.query(UserDailyStudy).filter(UserDailyStudy.user_id == user_id).delete(synchronize_session=False)
+    db.add_all(
+        UserDailyStudy(user_id=user_id, study_date=study_date, minutes=minutes, session_count=count)
+        for study_date, (minutes, count) in days.items()
+    )
+
+
+def replace_activity_years(
+    db: Session,
+    *,
+    user_id: int,
+    days: Mapping[date, Tuple[int, int]],
+) -> None:
+    """Rebuild the user's ``user_activity_years`` rows from ``{date: (minutes, session_count)}``."""
+    db.query(UserActivityYear).filter(UserActivityYear.user_id == user_id).delete(synchronize_session=False)
+    rows: dict[int, UserActivityYear] = {}
+    for study_date, (minutes, _) in sorted(days.items()):
+        row = rows.get(study_date.year)
+        if row is None:
+            days_bitmap, minute_buckets = activity.empty_year()
+            row = rows[study_date.year] = UserActivityYear(
+                user_id=user_id,
+                year=study_date.year,
+                days_bitmap=bytes(days_bitmap),
+                minute_buckets=bytes(minute_buckets),
+            )
+        activity.record_day(row, study_date, minutes)
+    db.add_all(rows.values())
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, Header
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Path, Query, Response
 from sqlalchemy.orm import Session
 
 from ...core.auth import TokenType, verify_token
@@ -13,6 +15,7 @@ from ...core.exceptions import (
 )
 from ..users import crud as user_crud
 from . import schemas
+from .cache import etag_matches
 from .service import StatsService
 
 router = APIRouter(prefix="/stats", tags=["stats"])
@@ -36,6 +39,36 @@ def get_current_user(authorization: str = Header(...), db: Session = Depends(get
 @router.get(
     "",
     response_model=schemas.UserStatsResponse,
+    responses={
+        304: {"description": "If-None-Match와 ETag가 같아 본문 없이 응답"},
+        **AppException.to_openapi_examples(
+            [
+                InvalidAuthHeaderException,
+                UserNotFoundException,
+                AuthTokenExpiredException,
+                InvalidTokenException,
+                InvalidTokenTypeException,
+            ]
+        ),
+    },
+)
+def get_stats(
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+):
+    cached = service.get_cached_user_stats(db=db, user=current_user)
+    # no-cache: 클라이언트는 저장하되 매번 ETag로 재검증
+    headers = {"ETag": cached.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+
+@router.get(
+    "/activity/{year}",
+    response_model=schemas.ActivityYearResponse,
     responses=AppException.to_openapi_examples(
         [
             InvalidAuthHeaderException,
@@ -46,8 +79,33 @@ def get_current_user(authorization: str = Header(...), db: Session = Depends(get
         ]
     ),
 )
-def get_stats(
+def get_activity_year(
+    year: int = Path(..., ge=2000, le=2100),
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """연도별 학습 히트맵 (비트맵 + 4비트 학습 시간 구간, base64)"""
+    return service.get_activity_year(db=db, user=current_user, year=year)
+
+
+@router.get(
+    "/leaderboards/{board}",
+    response_model=schemas.LeaderboardResponse,
+    responses=AppException.to_openapi_examples(
+        [
+            InvalidAuthHeaderException,
+            UserNotFoundException,
+            AuthTokenExpiredException,
+            InvalidTokenException,
+            InvalidTokenTypeException,
+        ]
+    ),
+)
+def get_leaderboard(
+    board: schemas.LeaderboardBoard,
+    limit: int = Query(10, ge=1, le=100),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    return service.get_user_stats(db=db, user=current_user)
+    """이번 주 학습 시간 / 현재 연속 학습일 순위 (상위 limit명 + 내 순위)"""
+    return service.get_leaderboard(db=db, user=current_user, board=board, limit=limit)
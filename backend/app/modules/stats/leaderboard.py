@@ -0,0 +1,185 @@
+"""In-process leaderboards over ``user_leaderboard_scores``.
+
+Two boards:
+
+- ``weekly_minutes``: study minutes per ISO week (period ``"2024-W19"``)
+- ``streak``: current consecutive study days (period ``"current"``); a streak
+  counts until ``expires_on`` (two days after the last active date, i.e. it
+  survives a day with no study yet)
+
+``user_leaderboard_scores`` is the source of truth and is written by
+``crud.insert_study_session`` in the session's transaction. This module keeps
+one ``RankIndex`` per live (board, period) -- the current and previous week,
+and the streak board -- rebuilt from the table at startup and then updated
+with the absolute scores ``insert_study_session`` wrote, after its commit.
+Updates arriving before the first load are dropped (the load reads them from
+the DB). Like the stats cache this assumes a single API worker; other
+processes (the rollup backfill) are picked up on the next rebuild.
+"""
+from __future__ import annotations
+
+import heapq
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ...core.ranking import RankIndex
+
+BOARD_WEEKLY_MINUTES = "weekly_minutes"
+BOARD_STREAK = "streak"
+BOARDS = (BOARD_WEEKLY_MINUTES, BOARD_STREAK)
+STREAK_PERIOD = "current"
+
+
+def week_key(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def streak_expires_on(last_active_date: date) -> date:
+    # 마지막 학습일 다음 날까지는 연속 기록 유지
+    return last_active_date + timedelta(days=2)
+
+
+def live_streak(streak: int, last_active_date: Optional[date], today: date) -> int:
+    """``streak`` while it has not expired on ``today`` (same rule as the streak board), else 0."""
+    if last_active_date is None or streak_expires_on(last_active_date) <= today:
+        return 0
+    return streak
+
+
+def live_periods(today: date) -> List[Tuple[str, str]]:
+    """(board, period) pairs kept in memory on ``today``."""
+    return [
+        (BOARD_WEEKLY_MINUTES, week_key(today)),
+        (BOARD_WEEKLY_MINUTES, week_key(today - timedelta(days=7))),
+        (BOARD_STREAK, STREAK_PERIOD),
+    ]
+
+
+def current_period(board: str, today: date) -> str:
+    return week_key(today) if board == BOARD_WEEKLY_MINUTES else STREAK_PERIOD
+
+
+@dataclass(frozen=True)
+class LeaderboardScore:
+    board: str
+    period: str
+    user_id: int
+    score: int
+    expires_on: Optional[date] = None
+
+
+@dataclass(frozen=True)
+class Standings:
+    board: str
+    period: str
+    total_users: int
+    # (rank, user_id, score)
+    top: List[Tuple[int, int, int]]
+    my_rank: Optional[int]
+    my_score: int
+
+
+class Leaderboards:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._indexes: Dict[Tuple[str, str], RankIndex] = {}
+        # streak 만료: (expires_on, user_id) 힙 + 사용자별 최신 만료일
+        self._expiry_heap: List[Tuple[date, int]] = []
+        self._streak_expires: Dict[int, date] = {}
+        self._live: Tuple[Tuple[str, str], ...] = ()
+        self._today: Optional[date] = None
+        self.loaded = False
+
+    def rebuild(self, load: Callable[[List[Tuple[str, str]]], Iterable[LeaderboardScore]], *, today: date) -> int:
+        """Replace every index with ``load(live_periods(today))``; returns the row count.
+
+        ``load`` runs under the lock, so an update committed after its read
+        waits and is applied to the new indexes.
+        """
+        with self._lock:
+            self._indexes = {}
+            self._expiry_heap = []
+            self._streak_expires = {}
+            self._roll(today)
+            count = 0
+            for row in load(list(self._live)):
+                self._apply(row)
+                count += 1
+            self.loaded = True
+            return count
+
+    def record(self, scores: Iterable[LeaderboardScore], *, today: date) -> None:
+        with self._lock:
+            if not self.loaded:
+                return
+            self._roll(today)
+            for row in scores:
+                self._apply(row)
+
+    def standings(self, board: str, *, period: str, user_id: int, limit: int, today: date) -> Standings:
+        with self._lock:
+            self._roll(today)
+            index = self._indexes.get((board, period)) or RankIndex(capacity=1)
+            top = [(index.count_above(score) + 1, member, score) for member, score in index.top(limit)]
+            return Standings(
+                board=board,
+                period=period,
+                total_users=len(index),
+                top=top,
+                my_rank=index.rank(user_id),
+                my_score=index.score(user_id) or 0,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._indexes = {}
+            self._expiry_heap = []
+            self._streak_expires = {}
+            self._live = ()
+            self._today = None
+            self.loaded = False
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "boards": {f"{board}:{period}": len(index) for (board, period), index in self._indexes.items()},
+            }
+
+    # ------------------------------------------------------------------ internals (lock held)
+    def _roll(self, today: date) -> None:
+        if self._today != today:
+            self._today = today
+            self._live = tuple(live_periods(today))
+            # 지난 주차 인덱스는 버린다 (DB에는 남음)
+            self._indexes = {key: index for key, index in self._indexes.items() if key in self._live}
+        while self._expiry_heap and self._expiry_heap[0][0] <= today:
+            expires_on, user_id = heapq.heappop(self._expiry_heap)
+            if self._streak_expires.get(user_id) == expires_on:
+                del self._streak_expires[user_id]
+                self._index(BOARD_STREAK, STREAK_PERIOD).remove(user_id)
+
+    def _index(self, board: str, period: str) -> RankIndex:
+        index = self._indexes.get((board, period))
+        if index is None:
+            index = self._indexes[(board, period)] = RankIndex()
+        return index
+
+    def _apply(self, row: LeaderboardScore) -> None:
+        if (row.board, row.period) not in self._live:
+            return
+        score = row.score
+        if row.board == BOARD_STREAK:
+            if row.expires_on is None or row.expires_on <= self._today:
+                score = 0
+                self._streak_expires.pop(row.user_id, None)
+            else:
+                self._streak_expires[row.user_id] = row.expires_on
+                heapq.heappush(self._expiry_heap, (row.expires_on, row.user_id))
+        self._index(row.board, row.period).update(row.user_id, score)
+
+
+leaderboards = Leaderboards()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import VARBINARY, Column, Date, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.sql import func
 
 from ...core.config import Base
@@ -6,6 +6,7 @@ from ...core.config import Base
 
 class StudySession(Base):
     __tablename__ = "study_sessions"
+    __table_args__ = (Index("ix_study_sessions_user_started", "user_id", "started_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -33,6 +34,8 @@ class Achievement(Base):
 
 class UserAchievement(Base):
     __tablename__ = "user_achievements"
+    # 해금 기록을 INSERT IGNORE로 멱등하게 추가하기 위한 유니크 키
+    __table_args__ = (UniqueConstraint("user_id", "achievement_code", name="uq_user_achievements_user_code"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -43,3 +46,68 @@ class UserAchievement(Base):
         index=True,
     )
     achieved_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class UserDailyStudy(Base):
+    """Per-user, per-day rollup of study_sessions (maintained by ``crud.insert_study_session``)."""
+
+    __tablename__ = "user_daily_study"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    study_date = Column(Date, primary_key=True)
+    minutes = Column(Integer, nullable=False, default=0)
+    session_count = Column(Integer, nullable=False, default=0)
+
+
+class UserStudyTotals(Base):
+    """One counter row per user so the stats page needs no aggregation."""
+
+    __tablename__ = "user_study_totals"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_minutes = Column(Integer, nullable=False, default=0)
+    # 학습 시간이 0보다 큰 날짜 수
+    total_days = Column(Integer, nullable=False, default=0)
+    # last_active_date에서 끝나는 연속 학습 일수 (상한 없음)
+    current_streak = Column(Integer, nullable=False, default=0)
+    longest_streak = Column(Integer, nullable=False, default=0)
+    last_active_date = Column(Date, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class UserActivityYear(Base):
+    """Per-user, per-year activity bitmap for the heatmap (encoding in ``stats.activity``)."""
+
+    __tablename__ = "user_activity_years"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    # 366비트: 해당 연도의 n번째 날(0부터)에 학습 시간이 있으면 1
+    days_bitmap = Column(VARBINARY(46), nullable=False)
+    # 하루 4비트씩 366일: 학습 시간 구간(10분 단위, 15에서 포화)
+    minute_buckets = Column(VARBINARY(183), nullable=False)
+
+
+class UserLeaderboardScore(Base):
+    """Source of truth for the leaderboards (in-memory indexes in ``stats.leaderboard``)."""
+
+    __tablename__ = "user_leaderboard_scores"
+
+    # board: weekly_minutes | streak, period: ISO 주차("2024-W19") 또는 "current"
+    board = Column(String(32), primary_key=True)
+    period = Column(String(16), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    score = Column(Integer, nullable=False, default=0)
+    # streak 보드만: 이 날짜부터 연속 기록이 끊긴 것으로 본다
+    expires_on = Column(Date, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
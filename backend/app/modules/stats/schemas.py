@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
@@ -13,6 +14,8 @@ class DailyStudyMinutes(BaseModel):
 
 class StudyStreakSummary(BaseModel):
     consecutive_days: int = Field(ge=0)
+    longest_streak_days: int = Field(default=0, ge=0)
+    last_active_date: Optional[date] = None
     weekly_total_minutes: int = Field(ge=0)
     daily_minutes: List[DailyStudyMinutes]
 
@@ -45,3 +48,41 @@ class UserStatsResponse(BaseModel):
     total_time_spent_minutes: int = Field(ge=0)
     total_days: int = Field(ge=0)
     achievements: List[AchievementStatus]
+
+
+class ActivityYearResponse(BaseModel):
+    year: int
+    days_in_year: int
+    active_days: int = Field(ge=0)
+    longest_streak_days: int = Field(ge=0)
+    # 올해를 조회할 때만: 오늘(오늘 기록이 없으면 어제)에서 끝나는 연속 학습일
+    current_streak_days: Optional[int] = None
+    # base64; bit d (LSB first) = 1월 1일부터 d번째 날에 학습함
+    days_bitmap: str
+    # base64; 하루 4비트(짝수 날은 하위 니블), 값 = min(15, ceil(분 / bucket_minutes))
+    minute_buckets: str
+    bucket_minutes: int
+
+
+class LeaderboardBoard(str, Enum):
+    weekly_minutes = "weekly_minutes"
+    streak = "streak"
+
+
+class LeaderboardEntry(BaseModel):
+    # 동점은 같은 순위 (1, 2, 2, 4)
+    rank: int = Field(ge=1)
+    nickname: str
+    score: int = Field(ge=0)
+    is_me: bool = False
+
+
+class LeaderboardResponse(BaseModel):
+    board: LeaderboardBoard
+    # weekly_minutes: ISO 주차("2024-W19"), streak: "current"
+    period: str
+    total_users: int = Field(ge=0)
+    entries: List[LeaderboardEntry]
+    # 점수가 없으면 None
+    my_rank: Optional[int] = None
+    my_score: int = Field(default=0, ge=0)
@@ -1,70 +1,22 @@
-from datetime import date, datetime, time, timedelta, timezone
+import base64
+import threading
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Sequence, Set
+from typing import Dict, List, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
+from ...core.config import SessionLocal
+from ...core.logger import logger
 from ..level_management.models import CEFRLevel
 from ..level_system.utils import MAX_SCORE, MIN_SCORE, get_cefr_level_from_score, get_average_score_and_level
 from ..users.models import User
-from . import crud, schemas
-
-_DEFAULT_ACHIEVEMENTS: tuple[Dict[str, str], ...] = (
-    {
-        "code": "FIRST_SESSION",
-        "name": "첫 학습 달성",
-        "description": "첫 학습 세션을 완료했습니다.",
-        "category": "milestone",
-    },
-    {
-        "code": "STREAK_3",
-        "name": "3일 연속 학습",
-        "description": "3일 연속으로 학습했습니다.",
-        "category": "streak",
-    },
-    {
-        "code": "STREAK_7",
-        "name": "7일 연속 학습",
-        "description": "일주일 동안 하루도 빠지지 않고 학습했습니다.",
-        "category": "streak",
-    },
-    {
-        "code": "STREAK_30",
-        "name": "30일 연속 학습",
-        "description": "한 달 내내 학습 루틴을 유지했습니다.",
-        "category": "streak",
-    },
-    {
-        "code": "TOTAL_60",
-        "name": "누적 1시간 학습",
-        "description": "누적 60분 이상 학습했습니다.",
-        "category": "time",
-    },
-    {
-        "code": "TOTAL_300",
-        "name": "누적 5시간 학습",
-        "description": "누적 300분 이상 학습했습니다.",
-        "category": "time",
-    },
-    {
-        "code": "TOTAL_600",
-        "name": "누적 10시간 학습",
-        "description": "누적 600분 이상 학습했습니다.",
-        "category": "time",
-    },
-    {
-        "code": "TOTAL_1200",
-        "name": "누적 20시간 학습",
-        "description": "누적 1,200분 이상 학습했습니다.",
-        "category": "time",
-    },
-    {
-        "code": "TOTAL_3000",
-        "name": "누적 50시간 학습",
-        "description": "누적 3,000분 이상 학습했습니다.",
-        "category": "time",
-    },
-)
+from . import activity, crud, schemas
+from .achievements import DEFAULT_ACHIEVEMENTS, order_definitions
+from .cache import CachedStats, stats_cache
+from .leaderboard import current_period, leaderboards, live_streak
+
+_DEFAULT_ACHIEVEMENTS = DEFAULT_ACHIEVEMENTS
 
 _DEFAULT_ACHIEVEMENT_LOOKUP = {
     item["code"]: item for item in _DEFAULT_ACHIEVEMENTS
@@ -77,7 +29,80 @@ _ADVANCED_CEFR_LEVELS = {
 }
 
 
+# 시작 시 한 번 시드한 업적 정의 (조회 경로에서는 쓰기 없음)
+_achievement_definitions: Optional[tuple] = None
+_definitions_lock = threading.Lock()
+
+
+def seed_achievement_definitions(db: Session) -> Sequence:
+    """Upsert ``DEFAULT_ACHIEVEMENTS`` and cache the resulting definitions."""
+    global _achievement_definitions
+    with _definitions_lock:
+        crud.ensure_achievements(db, definitions=DEFAULT_ACHIEVEMENTS)
+        _achievement_definitions = tuple(order_definitions(crud.list_achievements(db)))
+        return _achievement_definitions
+
+
+def load_achievement_definitions_at_startup() -> None:
+    """Lifespan hook: on failure the definitions are read from the DB per request instead."""
+    db = SessionLocal()
+    try:
+        definitions = seed_achievement_definitions(db)
+        logger.info(f"[stats] seeded {len(definitions)} achievement definitions")
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"[stats] achievement seeding failed: {e}")
+    finally:
+        db.close()
+
+
+def reset_achievement_definitions() -> None:
+    global _achievement_definitions
+    with _definitions_lock:
+        _achievement_definitions = None
+
+
+def load_leaderboards(db: Session) -> int:
+    """Rebuild the in-memory leaderboards from ``user_leaderboard_scores``."""
+    return leaderboards.rebuild(
+        lambda periods: crud.list_leaderboard_scores(db, periods=periods),
+        today=datetime.now(timezone.utc).date(),
+    )
+
+
+def load_leaderboards_at_startup() -> None:
+    """Lifespan hook: on failure the first leaderboard request loads them instead."""
+    db = SessionLocal()
+    try:
+        count = load_leaderboards(db)
+        logger.info(f"[stats] loaded {count} leaderboard scores")
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"[stats] leaderboard load failed: {e}")
+    finally:
+        db.close()
+
+
 class StatsService:
+    def get_cached_user_stats(
+        self,
+        *,
+        db: Session,
+        user: User,
+    ) -> CachedStats:
+        """Serialized stats with their ETag, served from the per-user cache when still valid."""
+        today = datetime.now(timezone.utc).date()
+        cached = stats_cache.get(user.id, day=today)
+        if cached is not None:
+            return cached
+
+        generation = stats_cache.generation(user.id)
+        payload = self.get_user_stats(db=db, user=user)
+        return stats_cache.put(
+            user.id,
+            day=payload.streak.daily_minutes[-1].date,
+            generation=generation,
+            body=payload.model_dump_json().encode("utf-8"),
+        )
+
     def get_user_stats(
         self,
         *,
@@ -87,17 +112,16 @@ class StatsService:
         now = datetime.now(timezone.utc)
         today = now.date()
         week_start_date = today - timedelta(days=6)
-        week_start = self._start_of_day(week_start_date)
-        week_end = self._start_of_day(today + timedelta(days=1))
 
         achievement_defs = self._load_achievement_definitions(db)
-        definition_codes = {definition.code for definition in achievement_defs}
 
-        daily_minutes_map = crud.get_daily_study_minutes(
+        # 집계 쿼리 대신 롤업 테이블의 PK 조회만 사용 (insert_study_session에서 갱신)
+        totals = crud.get_study_totals(db, user_id=user.id)
+        daily_minutes_map = crud.get_daily_study_rollup(
             db,
             user_id=user.id,
-            start_at=week_start,
-            end_at=week_end,
+            start_date=week_start_date,
+            end_date=today,
         )
         daily_minutes = []
         cursor = week_start_date
@@ -113,15 +137,12 @@ class StatsService:
 
         weekly_total_minutes = sum(item.minutes for item in daily_minutes)
 
-        activity_dates = crud.get_study_dates_descending(
-            db,
-            user_id=user.id,
-            limit=60,
-        )
-        consecutive_days = self._calculate_streak(activity_dates)
-
-        total_time_spent = crud.get_total_study_minutes(db, user_id=user.id)
-        total_days = crud.get_total_study_days(db, user_id=user.id)
+        # 연속 학습일은 롤업에 상한 없이 유지됨 (O(1) 조회)
+        consecutive_days = self._current_streak(totals, today)
+        longest_streak = int(getattr(totals, "longest_streak", 0) or 0) if totals is not None else 0
+        longest_streak = max(longest_streak, consecutive_days)
+        total_time_spent = int(totals.total_minutes or 0) if totals is not None else 0
+        total_days = int(totals.total_days or 0) if totals is not None else 0
 
         skill_levels = self._build_skill_levels(user)
         
@@ -136,34 +157,7 @@ class StatsService:
             score=overall_result["average_score"]
         )
 
-        unlock_candidates: Set[str] = set()
-        if total_time_spent > 0:
-            unlock_candidates.add("FIRST_SESSION")
-        if consecutive_days >= 3:
-            unlock_candidates.add("STREAK_3")
-        if consecutive_days >= 7:
-            unlock_candidates.add("STREAK_7")
-        if consecutive_days >= 30:
-            unlock_candidates.add("STREAK_30")
-        if total_time_spent >= 60:
-            unlock_candidates.add("TOTAL_60")
-        if total_time_spent >= 300:
-            unlock_candidates.add("TOTAL_300")
-        if total_time_spent >= 600:
-            unlock_candidates.add("TOTAL_600")
-        if total_time_spent >= 1_200:
-            unlock_candidates.add("TOTAL_1200")
-        if total_time_spent >= 3_000:
-            unlock_candidates.add("TOTAL_3000")
-
-        for code in unlock_candidates:
-            if code in definition_codes:
-                crud.ensure_user_achievement(
-                    db,
-                    user_id=user.id,
-                    achievement_code=code,
-                )
-
+        # 업적 해금은 insert_study_session에서 처리되므로 여기서는 읽기만 한다
         user_achievements = crud.list_user_achievements(db, user_id=user.id)
         user_lookup = {
             record.achievement_code: record for record in user_achievements
@@ -202,6 +196,8 @@ class StatsService:
 
         streak_summary = schemas.StudyStreakSummary(
             consecutive_days=consecutive_days,
+            longest_streak_days=longest_streak,
+            last_active_date=getattr(totals, "last_active_date", None),
             weekly_total_minutes=weekly_total_minutes,
             daily_minutes=daily_minutes,
         )
@@ -214,31 +210,88 @@ class StatsService:
             achievements=achievement_statuses,
         )
 
+    def get_activity_year(
+        self,
+        *,
+        db: Session,
+        user: User,
+        year: int,
+    ) -> schemas.ActivityYearResponse:
+        row = crud.get_activity_year(db, user_id=user.id, year=year)
+        days_bitmap = row.days_bitmap if row is not None else None
+        minute_buckets = row.minute_buckets if row is not None else None
+
+        current_streak: Optional[int] = None
+        today = datetime.now(timezone.utc).date()
+        if year == today.year:
+            # /stats와 같은 값 (롤업의 연속 학습일)
+            current_streak = self._current_streak(crud.get_study_totals(db, user_id=user.id), today)
+
+        empty_bitmap, empty_buckets = activity.empty_year()
+        return schemas.ActivityYearResponse(
+            year=year,
+            days_in_year=activity.days_in_year(year),
+            active_days=activity.active_days(days_bitmap),
+            longest_streak_days=activity.longest_streak_in_year(days_bitmap),
+            current_streak_days=current_streak,
+            days_bitmap=base64.b64encode(days_bitmap or bytes(empty_bitmap)).decode("ascii"),
+            minute_buckets=base64.b64encode(minute_buckets or bytes(empty_buckets)).decode("ascii"),
+            bucket_minutes=activity.BUCKET_MINUTES,
+        )
+
+    def get_leaderboard(
+        self,
+        *,
+        db: Session,
+        user: User,
+        board: schemas.LeaderboardBoard,
+        limit: int,
+    ) -> schemas.LeaderboardResponse:
+        if not leaderboards.loaded:
+            load_leaderboards(db)
+        today = datetime.now(timezone.utc).date()
+        standings = leaderboards.standings(
+            board.value,
+            period=current_period(board.value, today),
+            user_id=user.id,
+            limit=limit,
+            today=today,
+        )
+        # 상위 K명의 닉네임만 조회 (PK IN)
+        nicknames = crud.get_user_nicknames(db, user_ids=[user_id for _, user_id, _ in standings.top])
+        return schemas.LeaderboardResponse(
+            board=board,
+            period=standings.period,
+            total_users=standings.total_users,
+            entries=[
+                schemas.LeaderboardEntry(
+                    rank=rank,
+                    nickname=nicknames.get(user_id, ""),
+                    score=score,
+                    is_me=user_id == user.id,
+                )
+                for rank, user_id, score in standings.top
+            ],
+            my_rank=standings.my_rank,
+            my_score=standings.my_score,
+        )
+
     def _load_achievement_definitions(self, db: Session) -> Sequence:
-        if _DEFAULT_ACHIEVEMENTS:
-            crud.ensure_achievements(db, definitions=_DEFAULT_ACHIEVEMENTS)
-        # Return achievements in the order defined in _DEFAULT_ACHIEVEMENTS
-        all_achievements = {a.code: a for a in crud.list_achievements(db)}
-        return [all_achievements[item["code"]] for item in _DEFAULT_ACHIEVEMENTS if item["code"] in all_achievements]
+        if _achievement_definitions is not None:
+            return _achievement_definitions
+        # 시작 시 시드 실패: 쓰기 없이 DB에서 읽기만
+        return order_definitions(crud.list_achievements(db))
 
     @staticmethod
-    def _start_of_day(target: date) -> datetime:
-        return datetime.combine(target, time.min, tzinfo=timezone.utc)
+    def _current_streak(totals: Optional[object], today: date) -> int:
+        """Current streak from the rollup; like the streak board, it lapses once a day is missed."""
+        if totals is None:
+            return 0
+        return live_streak(int(totals.current_streak or 0), totals.last_active_date, today)
 
     @staticmethod
     def _calculate_streak(activity_dates: Sequence[date]) -> int:
-        if not activity_dates:
-            return 0
-
-        activity_set = set(activity_dates)
-        most_recent = max(activity_set)
-        streak = 0
-
-        current = most_recent
-        while current in activity_set:
-            streak += 1
-            current = current - timedelta(days=1)
-        return streak
+        return crud.compute_streaks(activity_dates)[0]
 
     def _build_skill_levels(self, user: User) -> Dict[str, schemas.SkillLevel]:
         return {
@@ -1,5 +1,6 @@
 from typing import Sequence
 
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from ...core.exceptions import UserNotFoundException
@@ -57,6 +58,56 @@ def update_user_level(
     return user
 
 
+LEVEL_MIN = 0.0
+LEVEL_MAX = 300.0
+
+
+def _clamped_level(db: Session, column, delta: float):
+    """SQL expression for ``clamp(column + delta, LEVEL_MIN, LEVEL_MAX)``."""
+    value = column + delta
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite는 LEAST/GREATEST 대신 다중 인자 MIN/MAX 스칼라 함수를 쓴다
+        return func.min(LEVEL_MAX, func.max(LEVEL_MIN, value))
+    return func.least(LEVEL_MAX, func.greatest(LEVEL_MIN, value))
+
+
+def apply_level_deltas(
+    db: Session,
+    *,
+    user_id: int,
+    lexical_delta: float,
+    syntactic_delta: float,
+    speed_delta: float,
+    commit: bool = True,
+) -> tuple[float, float, float]:
+    """Add the deltas to the user's three levels in one atomic, clamped UPDATE.
+
+    The arithmetic happens in the database, so concurrent feedback submissions
+    cannot overwrite each other. Returns the new (lexical, syntactic, speed).
+    """
+    result = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(
+            lexical_level=_clamped_level(db, User.lexical_level, lexical_delta),
+            syntactic_level=_clamped_level(db, User.syntactic_level, syntactic_delta),
+            speed_level=_clamped_level(db, User.speed_level, speed_delta),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        raise UserNotFoundException()
+
+    # 같은 트랜잭션에서 읽으므로 방금 쓴 값이 보인다 (row lock은 commit까지 유지)
+    row = db.execute(
+        select(User.lexical_level, User.syntactic_level, User.speed_level).where(User.id == user_id)
+    ).one()
+    if commit:
+        db.commit()
+    return float(row[0]), float(row[1]), float(row[2])
+
+
 def update_user_password(db: Session, user: User, hashed_password: str) -> User:
     """
     Persist a password change for the given user.
@@ -1,6 +1,139 @@
+import unicodedata
+from datetime import datetime
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
-from .model import VocabEntry
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from .model import ContextualVocabSentence, ContextualVocabWord, VocabEntry, compute_sentence_hash
+
+# (collation key of the word, sentence hash)
+VocabKey = Tuple[str, str]
+
+
+def normalize_word(word: str) -> str:
+    # normalize word to lowercase for consistent storage and matching
+    return word.strip().lower() if isinstance(word, str) else word
+
+
+def collation_key(word: str) -> str:
+    """The form MySQL's case/accent-insensitive collation compares words by.
+
+    Two words with the same key collide on the unique indexes (vocab_entries word,
+    contextual_vocab_words word_key), so in-request dedupe has to use it too.
+    """
+    decomposed = unicodedata.normalize("NFKD", normalize_word(word))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def vocab_key(word: str, example_sentence: str | None) -> VocabKey:
+    return collation_key(word), compute_sentence_hash(example_sentence)
+
+
+def find_vocab_entries(
+    db: Session,
+    *,
+    user_id: int,
+    keys: Iterable[VocabKey],
+    words: Iterable[str] = (),
+) -> Dict[VocabKey, VocabEntry]:
+    """Existing entries for the given (word, sentence hash) keys, via the unique index.
+
+    The word lookup goes through the column collation, so on MySQL an entry saved
+    as "café" is found for the key "cafe", the same rule the unique index applies.
+    ``words`` adds the spellings being saved to the lookup for databases that
+    compare words byte by byte.
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+    candidates = {word for word, _ in keys} | {normalize_word(word) for word in words}
+    rows = (
+        db.query(VocabEntry)
+        .filter(
+            VocabEntry.user_id == user_id,
+            VocabEntry.word.in_(candidates),
+            VocabEntry.sentence_hash.in_({digest for _, digest in keys}),
+        )
+        .all()
+    )
+    found = {}
+    for row in rows:
+        key = (collation_key(row.word), row.sentence_hash)
+        if key in keys:
+            found.setdefault(key, row)
+    return found
+
+
+def insert_vocab_entries(
+    db: Session,
+    *,
+    user_id: int,
+    rows: Sequence[Dict[str, Any]],
+    refresh: bool = True,
+) -> List[VocabEntry]:
+    """Insert several entries in a single transaction.
+
+    Raises IntegrityError (after rolling back) if a concurrent save already
+    inserted one of the keys. Pass ``refresh=False`` when the caller does not
+    read the inserted rows back (bulk import).
+    """
+    entries = [
+        VocabEntry(
+            user_id=user_id,
+            word=normalize_word(row["word"]),
+            example_sentence=row.get("example_sentence"),
+            sentence_hash=compute_sentence_hash(row.get("example_sentence")),
+            pos=row.get("pos"),
+            meaning=row.get("meaning"),
+            example_sentence_url=row.get("example_sentence_url"),
+        )
+        for row in rows
+    ]
+    if not entries:
+        return []
+    db.add_all(entries)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+    if refresh:
+        for entry in entries:
+            db.refresh(entry)
+    return entries
+
+
+def insert_missing_vocab_entries(
+    db: Session,
+    *,
+    user_id: int,
+    rows: Dict[VocabKey, Dict[str, Any]],
+    existing: Dict[VocabKey, VocabEntry],
+    refresh: bool = True,
+) -> Dict[VocabKey, VocabEntry]:
+    """Insert the rows whose key is not in ``existing``; returns the inserted entries by key.
+
+    If a concurrent save wins one of the keys, the insert fails on the unique
+    index; the winners are re-read into ``existing`` and only the rest is
+    inserted once more. A second conflict re-reads again instead of inserting a
+    third time, and raises the IntegrityError if some key is still missing.
+    """
+    words = [row["word"] for row in rows.values()]
+    missing = {key: row for key, row in rows.items() if key not in existing}
+    error: Optional[IntegrityError] = None
+    for _ in range(2):
+        if not missing:
+            return {}
+        try:
+            inserted = insert_vocab_entries(db, user_id=user_id, rows=list(missing.values()), refresh=refresh)
+            return dict(zip(missing.keys(), inserted))
+        except IntegrityError as exc:
+            error = exc
+            existing.update(find_vocab_entries(db, user_id=user_id, keys=missing.keys(), words=words))
+            missing = {key: row for key, row in missing.items() if key not in existing}
+    if missing:
+        raise error
+    return {}
 
 
 def add_vocab_entry(
@@ -13,13 +146,11 @@ def add_vocab_entry(
     meaning: str | None = None,
     example_sentence_url: str | None = None,
 ) -> VocabEntry:
-    # normalize word to lowercase for consistent storage and matching
-    normalized_word = word.strip().lower() if isinstance(word, str) else word
-
     entry = VocabEntry(
         user_id=user_id,
-        word=normalized_word,
+        word=normalize_word(word),
         example_sentence=example_sentence,
+        sentence_hash=compute_sentence_hash(example_sentence),
         pos=pos,
         meaning=meaning,
         example_sentence_url=example_sentence_url,
@@ -39,6 +170,67 @@ def get_vocab_for_user(db: Session, user_id: int) -> List[VocabEntry]:
     )
 
 
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def list_vocab_for_user(
+    db: Session,
+    user_id: int,
+    *,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    word_prefix: Optional[str] = None,
+    word_contains: Optional[str] = None,
+    pos: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+) -> List[VocabEntry]:
+    """One keyset page of a user's vocab, newest first.
+
+    ``after`` is the (created_at, id) of the last row of the previous page. The
+    query walks ix_vocab_entries_user_created (or ix_vocab_entries_user_word for
+    prefix search) and stops after ``limit`` rows, so its cost does not grow with
+    the size of the library.
+    """
+    query = db.query(VocabEntry).filter(VocabEntry.user_id == user_id)
+
+    if after is not None:
+        after_created_at, after_id = after
+        query = query.filter(
+            or_(
+                VocabEntry.created_at < after_created_at,
+                and_(VocabEntry.created_at == after_created_at, VocabEntry.id < after_id),
+            )
+        )
+    if word_prefix:
+        query = query.filter(VocabEntry.word.like(f"{_escape_like(word_prefix.strip().lower())}%", escape="\\"))
+    if word_contains:
+        query = query.filter(VocabEntry.word.like(f"%{_escape_like(word_contains.strip().lower())}%", escape="\\"))
+    if pos:
+        query = query.filter(VocabEntry.pos == pos)
+    if created_from is not None:
+        query = query.filter(VocabEntry.created_at >= created_from)
+    if created_to is not None:
+        query = query.filter(VocabEntry.created_at < created_to)
+
+    return (
+        query.order_by(VocabEntry.created_at.desc(), VocabEntry.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def iter_vocab_for_user(db: Session, user_id: int, *, batch_size: int = 500) -> Iterator[VocabEntry]:
+    """Stream a user's vocab oldest-first through a server-side cursor."""
+    return (
+        db.query(VocabEntry)
+        .filter(VocabEntry.user_id == user_id)
+        .order_by(VocabEntry.created_at.asc(), VocabEntry.id.asc())
+        .yield_per(batch_size)
+    )
+
+
 def delete_vocab_entry(db: Session, *, entry_id: int, user_id: int) -> bool:
     """Delete a vocab entry if it belongs to the specified user.
 
@@ -52,3 +244,104 @@ def delete_vocab_entry(db: Session, *, entry_id: int, user_id: int) -> bool:
     )
     db.commit()
     return result > 0
+
+
+def replace_contextual_vocab(
+    db: Session,
+    *,
+    content_id: int,
+    sentences: Sequence[Dict[str, Any]],
+) -> int:
+    """Rewrite the normalized contextual vocab rows of a content from script_vocabs sentences.
+
+    Returns the number of word rows written. Words are keyed by lower(word); if the
+    LLM repeats a word inside one sentence (compared like the primary key's
+    case/accent-insensitive collation), the first occurrence wins.
+    """
+    db.query(ContextualVocabWord).filter(
+        ContextualVocabWord.generated_content_id == content_id
+    ).delete(synchronize_session=False)
+    db.query(ContextualVocabSentence).filter(
+        ContextualVocabSentence.generated_content_id == content_id
+    ).delete(synchronize_session=False)
+
+    sentence_rows = []
+    word_rows = []
+    for sentence in sentences:
+        index = sentence.get("index")
+        if not isinstance(index, int):
+            continue
+        sentence_rows.append(
+            {
+                "generated_content_id": content_id,
+                "sentence_index": index,
+                "text": sentence.get("text") or "",
+            }
+        )
+        seen = set()
+        for position, word in enumerate(sentence.get("words") or []):
+            surface = word.get("word") if isinstance(word, dict) else None
+            if not isinstance(surface, str) or not surface.strip():
+                continue
+            key = surface.strip().lower()[:255]
+            folded = collation_key(key)
+            if folded in seen:
+                continue
+            seen.add(folded)
+            word_rows.append(
+                {
+                    "generated_content_id": content_id,
+                    "sentence_index": index,
+                    "word_key": key,
+                    "position": position,
+                    "word": surface[:255],
+                    "pos": word.get("pos"),
+                    "meaning": word.get("meaning"),
+                }
+            )
+
+    if sentence_rows:
+        db.bulk_insert_mappings(ContextualVocabSentence, sentence_rows)
+    if word_rows:
+        db.bulk_insert_mappings(ContextualVocabWord, word_rows)
+    db.commit()
+    return len(word_rows)
+
+
+def has_contextual_vocab(db: Session, *, content_id: int) -> bool:
+    return (
+        db.query(ContextualVocabSentence.sentence_index)
+        .filter(ContextualVocabSentence.generated_content_id == content_id)
+        .first()
+        is not None
+    )
+
+
+def get_contextual_sentence(
+    db: Session,
+    *,
+    content_id: int,
+    sentence_index: int,
+) -> Optional[Dict[str, Any]]:
+    """Load one sentence and its words with primary-key reads; None if not normalized yet."""
+    sentence = db.get(ContextualVocabSentence, (content_id, sentence_index))
+    if sentence is None:
+        return None
+
+    words = (
+        db.query(ContextualVocabWord)
+        .filter(
+            ContextualVocabWord.generated_content_id == content_id,
+            ContextualVocabWord.sentence_index == sentence_index,
+        )
+        .order_by(ContextualVocabWord.position)
+        .all()
+    )
+    return {
+        "index": sentence_index,
+        "text": sentence.text,
+        "words": [
+            {"word": row.word, "pos": row.pos, "meaning": row.meaning}
+            for row in words
+        ],
+    }
@@ -1,10 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, Header, Response
+import codecs
+import csv
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, File, HTTPException, Header, Query, Response, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from ...core.config import get_db
+from ...core.config import get_db, SessionLocal
 from ..audio.model import GeneratedContent
 from . import crud as vocab_crud
 from . import schemas as vocab_schemas
+from . import transfer as vocab_transfer
+from .service import VocabService
 from ...core.auth import verify_token, TokenType
+from ...core.logger import logger
 from ..users.crud import get_user_by_username
 from ...core.exceptions import (
     InvalidAuthHeaderException,
@@ -13,11 +22,13 @@ from ...core.exceptions import (
 )
 import time
 from ...modules.audio.utils import get_elevenlabs_client
-from ...core.s3setting import generate_example_audio_key, upload_audio_to_s3
+from ...core.s3setting import delete_audio_from_s3, generate_example_audio_key, upload_audio_to_s3
 
 
 router = APIRouter(prefix="/vocabs", tags=["vocab"])
 
+DEFAULT_VOCAB_PAGE_SIZE = 100
+
 
 def get_current_user(authorization: str = Header(), db: Session = Depends(get_db)):
     if not authorization.startswith("Bearer "):
@@ -36,13 +47,79 @@ def get_current_user(authorization: str = Header(), db: Session = Depends(get_db
 
 @router.get("/me", response_model=list[vocab_schemas.VocabEntryResponse])
 def get_my_vocab(
+    response: Response,
+    limit: int = Query(DEFAULT_VOCAB_PAGE_SIZE, ge=1, le=500),
+    cursor: str | None = Query(None, description="X-Next-Cursor value from the previous page"),
+    q: str | None = Query(None, max_length=255, description="word search term"),
+    match: Literal["prefix", "contains"] = "prefix",
+    pos: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    entries = vocab_crud.get_vocab_for_user(db, current_user.id)
+    """Newest-first page of the user's vocab.
+
+    The response body stays a plain list; when more rows exist the cursor for the
+    next page is returned in the ``X-Next-Cursor`` header. There is no unpaged
+    form; clients follow the cursor to read the whole library.
+    """
+    entries, next_cursor = VocabService.get_vocab_page(
+        db,
+        current_user.id,
+        limit=limit,
+        cursor=cursor,
+        word_prefix=q if match == "prefix" else None,
+        word_contains=q if match == "contains" else None,
+        pos=pos,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return entries
 
 
+@router.get("/me/export")
+def export_my_vocab(
+    format: Literal["csv", "ndjson", "anki"] = "csv",
+    current_user = Depends(get_current_user),
+):
+    """Stream the user's whole vocab as CSV, NDJSON or an Anki plain-text TSV."""
+    user_id = current_user.id
+    export_format = vocab_transfer.EXPORT_FORMATS[format]
+
+    def stream():
+        # 응답 스트리밍이 끝날 때까지 쓰는 전용 세션 (요청 세션과 수명이 다름)
+        db = SessionLocal()
+        try:
+            for chunk in vocab_transfer.iter_export(db, user_id, format):
+                yield chunk.encode("utf-8")
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type=export_format["media_type"],
+        headers={"Content-Disposition": f'attachment; filename="vocab.{export_format["extension"]}"'},
+    )
+
+
+@router.post("/me/import", response_model=vocab_schemas.VocabImportResponse)
+def import_my_vocab(
+    file: UploadFile = File(...),
+    format: Literal["csv", "ndjson"] = "csv",
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Import vocab from a CSV (export columns) or NDJSON upload, batch by batch."""
+    reader = codecs.getreader("utf-8-sig")(file.file, errors="replace")
+    try:
+        return vocab_transfer.import_vocab(db, current_user.id, reader, format)
+    except csv.Error as e:
+        raise HTTPException(status_code=400, detail=f"invalid {format} file: {e}")
+
+
 @router.get("/{content_id}/sentences/{index}")
 def get_contextual_word(content_id: int, index: int, word: str | None = None, db: Session = Depends(get_db)):
     """Return contextual JSON for a single word inside a sentence.
@@ -50,104 +127,24 @@ def get_contextual_word(content_id: int, index: int, word: str | None = None, db
     Optional query param `word` can be provided: /.../sentences/{index}?word=enjoy
     If `word` is provided, return only that word's contextual JSON; otherwise return the whole sentence object.
     """
-    content = (
-        db.query(GeneratedContent)
-        .filter(GeneratedContent.generated_content_id == content_id)
-        .first()
-    )
-
-    if not content:
-        raise HTTPException(status_code=404, detail="generated content not found")
-
-    script_vocabs = content.script_vocabs
-    if not script_vocabs:
-        raise ScriptVocabsNotFoundException()
-
-    sentences = script_vocabs.get("sentences") if isinstance(script_vocabs, dict) else None
-    if not sentences or not isinstance(sentences, list):
-        raise HTTPException(status_code=404, detail="no sentences found in script_vocabs")
-
-    # find sentence by its 'index' field
-    target_sentence = None
-    for sent in sentences:
-        # each sentence is expected to have an 'index' field
-        if sent.get("index") == index:
-            target_sentence = sent
-            break
-
-    if not target_sentence:
-        raise HTTPException(status_code=404, detail="sentence index not found")
+    sentence = VocabService.get_contextual_sentence(db, content_id, index)
 
     # If no specific word requested, return full sentence (backwards-compatible)
     if not word:
-        return target_sentence
+        return sentence.to_dict()
 
-    requested_word = word
-    words = target_sentence.get("words") or []
     # case-insensitive match to the 'word' field
-    for w in words:
-        if isinstance(w.get("word"), str) and w.get("word").lower() == requested_word.lower():
-            return w
-
-    # not found
-    raise HTTPException(status_code=404, detail="word not found in sentence")
-
-
-
-@router.post("/{content_id}/sentences/{index}", status_code=201, responses={404: {"description": "not found"}})
-def add_word_to_vocab(
-    content_id: int,
-    index: int,
-    request: vocab_schemas.AddVocabRequest,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user),
-):
-    """Add a word to the current user's personal vocab,
-    and generate TTS for the example sentence using ElevenLabs (generator-safe).
-    """
-
-    # --- find target sentence ---
-    content = db.query(GeneratedContent).filter(
-        GeneratedContent.generated_content_id == content_id
-    ).first()
-    if not content:
-        raise HTTPException(status_code=404, detail="generated content not found")
-
-    script_vocabs = content.script_vocabs
-    if not script_vocabs or not isinstance(script_vocabs, dict):
-        raise ScriptVocabsNotFoundException()
-
-    sentences = script_vocabs.get("sentences")
-    if not sentences or not isinstance(sentences, list):
-        raise HTTPException(status_code=404, detail="no sentences found in script_vocabs")
-
-    target_sentence = next((s for s in sentences if s.get("index") == index), None)
-    if not target_sentence:
-        raise HTTPException(status_code=404, detail="sentence index not found")
-
-    # --- find target word ---
-    requested_word = request.word
-    word_obj = next(
-        (
-            {k: v for k, v in w.items() if k in ("word", "pos", "meaning")}
-            for w in target_sentence.get("words", [])
-            if isinstance(w.get("word"), str)
-            and w.get("word").lower() == requested_word.lower()
-        ),
-        None,
-    )
-    if not word_obj:
+    word_obj = sentence.find(word)
+    if word_obj is None:
         raise HTTPException(status_code=404, detail="word not found in sentence")
+    return dict(word_obj)
 
-    # --- senetence audio generation ---
-    # TODO: 비동기로 전환
-    text = target_sentence.get("text", "")
-    if not text:
-        raise HTTPException(status_code=400, detail="sentence text is empty")
 
+
+def _generate_example_audio(text: str) -> str:
+    """Generate TTS for an example sentence using ElevenLabs and upload it to S3."""
     print(f"[DEBUG] Generating example TTS for: '{text}'")
     start_time = time.time()
-    audio_url = None
 
     try:
         eleven_client = get_elevenlabs_client()
@@ -167,24 +164,76 @@ def add_word_to_vocab(
         key = generate_example_audio_key("mp3")
         audio_url = upload_audio_to_s3(audio_bytes, key)
         print(f"[DEBUG] Uploaded to S3: {audio_url}")
+        return audio_url
 
     except Exception as e:
         print(f"[ERROR] ElevenLabs TTS failed: {e}")
         raise HTTPException(status_code=500, detail=f"TTS generation failed: {e}")
 
-    # --- save vocab entries to DB ---
-    vocab_crud.add_vocab_entry(
+
+def _discard_example_audio(urls: list[str]) -> None:
+    """Delete example audio that was uploaded but not stored on any entry (best effort)."""
+    try:
+        delete_audio_from_s3(urls)
+    except Exception as e:
+        logger.warning(f"Failed to delete unused example audio {urls}: {e}")
+
+
+@router.post(
+    "/{content_id}/sentences/{index}",
+    status_code=201,
+    response_model=vocab_schemas.VocabEntryResponse,
+    responses={200: {"description": "already saved"}, 404: {"description": "not found"}},
+)
+def add_word_to_vocab(
+    content_id: int,
+    index: int,
+    request: vocab_schemas.AddVocabRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Add a word to the current user's personal vocab,
+    and generate TTS for the example sentence using ElevenLabs (generator-safe).
+
+    Saving a word that is already in the vocab with the same example sentence
+    returns the existing entry (200) without generating TTS again.
+    """
+    [(entry, created)] = VocabService.save_words(
         db,
-        user_id=current_user.id,
-        word=request.word,
-        example_sentence=text,
-        pos=word_obj.get("pos"),
-        meaning=word_obj.get("meaning"),
-        example_sentence_url=audio_url,
+        current_user.id,
+        [(content_id, index, request.word)],
+        synthesize=_generate_example_audio,
+        discard=_discard_example_audio,
     )
+    if not created:
+        response.status_code = 200
+    logger.debug(f"{'Inserted' if created else 'Reused'} vocab entry for '{request.word}'")
+    return entry
+
 
-    print(f"[DEBUG] Inserted vocab entry for '{requested_word}' with TTS URL.")
-    return Response(status_code=201)
+@router.post("/me/bulk", response_model=vocab_schemas.BulkAddVocabResponse)
+def add_words_to_vocab_bulk(
+    request: vocab_schemas.BulkAddVocabRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Save many (content, sentence, word) items in one transaction.
+
+    Already-saved words are returned unchanged; TTS runs once per new sentence.
+    """
+    results = VocabService.save_words(
+        db,
+        current_user.id,
+        [(item.content_id, item.index, item.word) for item in request.items],
+        synthesize=_generate_example_audio,
+        discard=_discard_example_audio,
+    )
+    return {
+        "created": sum(1 for _, created in results if created),
+        "existing": sum(1 for _, created in results if not created),
+        "entries": [entry for entry, _ in results],
+    }
 
 
 @router.delete("/me/{entry_id}", status_code=204)
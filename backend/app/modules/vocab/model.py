@@ -1,15 +1,35 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text
+import hashlib
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, JSON, Text, UniqueConstraint
 from sqlalchemy.sql import func
 from ...core.config import Base
 
 
+def compute_sentence_hash(sentence: str | None) -> str:
+    """sha256 hex of the example sentence ('' when missing); same as MySQL SHA2(x, 256)."""
+    return hashlib.sha256((sentence or "").encode("utf-8")).hexdigest()
+
+
+def _default_sentence_hash(context) -> str:
+    return compute_sentence_hash(context.get_current_parameters().get("example_sentence"))
+
+
 class VocabEntry(Base):
     __tablename__ = "vocab_entries"
+    __table_args__ = (
+        # keyset pagination: WHERE user_id = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+        Index("ix_vocab_entries_user_created", "user_id", "created_at", "id"),
+        # word prefix search within a user's library (words are stored lower-cased)
+        Index("ix_vocab_entries_user_word", "user_id", "word"),
+        # one entry per (user, word, example sentence); saving again is an upsert
+        UniqueConstraint("user_id", "word", "sentence_hash", name="uq_vocab_entries_user_word_sentence"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     word = Column(String(255), nullable=False, index=True)
     example_sentence = Column(Text, nullable=True)
+    sentence_hash = Column(String(64), nullable=False, default=_default_sentence_hash)
     example_sentence_url = Column(String(512), nullable=True)
     pos = Column(String(64), nullable=True)
     meaning = Column(Text, nullable=True)
@@ -20,3 +40,40 @@ class VocabEntry(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+
+class ContextualVocabSentence(Base):
+    """One sentence of a generated script, addressed by (content, sentence index)."""
+
+    __tablename__ = "contextual_vocab_sentences"
+
+    generated_content_id = Column(
+        Integer,
+        ForeignKey("generated_contents.generated_content_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    sentence_index = Column(Integer, primary_key=True)
+    text = Column(Text, nullable=False)
+
+
+class ContextualVocabWord(Base):
+    """Contextual meaning of a word inside one sentence.
+
+    The composite primary key (generated_content_id, sentence_index, word_key) is
+    the clustered index, so a word tap is a single point read and loading a whole
+    sentence is one range scan on the key prefix.
+    """
+
+    __tablename__ = "contextual_vocab_words"
+
+    generated_content_id = Column(
+        Integer,
+        ForeignKey("generated_contents.generated_content_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    sentence_index = Column(Integer, primary_key=True)
+    word_key = Column(String(255), primary_key=True)  # lower(word)
+    position = Column(Integer, nullable=False)
+    word = Column(String(255), nullable=False)
+    pos = Column(String(64), nullable=True)
+    meaning = Column(Text, nullable=True)
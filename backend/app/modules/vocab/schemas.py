@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Any, Optional
+from pydantic import BaseModel, Field
+from typing import Any, List, Optional
 
 
 class AddVocabRequest(BaseModel):
@@ -16,3 +16,25 @@ class VocabEntryResponse(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class BulkVocabItem(BaseModel):
+    content_id: int
+    index: int
+    word: str
+
+
+class BulkAddVocabRequest(BaseModel):
+    items: List[BulkVocabItem] = Field(..., min_length=1, max_length=100)
+
+
+class BulkAddVocabResponse(BaseModel):
+    created: int
+    existing: int
+    entries: List[VocabEntryResponse]
+
+
+class VocabImportResponse(BaseModel):
+    imported: int
+    skipped: int
+    invalid: int
@@ -1,14 +1,27 @@
 # app/modules/vocab/service.py
 import asyncio
+import base64
+import binascii
 import json
 import time
 import os
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from fastapi import HTTPException
 from openai import AsyncOpenAI
 from dotenv import load_dotenv
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ...core.cache import LRUCache
 from ...core.config import settings, SessionLocal
+from ...core.exceptions import ScriptVocabsNotFoundException, VocabSaveConflictException
 from ..audio import crud
+from . import crud as vocab_crud
+from .model import VocabEntry
 from ...core.logger import logger
+from ...core.tasks import task_supervisor
 
 
 load_dotenv()
@@ -19,10 +32,41 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "contextual_vocab")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
+@dataclass(frozen=True)
+class ContextualSentence:
+    """A sentence of contextual vocab with a lower(word) -> entry hash map."""
+
+    index: int
+    text: str
+    words: tuple
+    lookup: Dict[str, Dict[str, Any]] = field(repr=False)
+
+    @classmethod
+    def from_dict(cls, sentence: Dict[str, Any]) -> "ContextualSentence":
+        words = tuple(
+            {k: v for k, v in w.items() if k in ("word", "pos", "meaning")}
+            for w in sentence.get("words") or []
+            if isinstance(w, dict)
+        )
+        lookup: Dict[str, Dict[str, Any]] = {}
+        for w in words:
+            if isinstance(w.get("word"), str):
+                lookup.setdefault(w["word"].lower(), w)
+        return cls(index=sentence["index"], text=sentence.get("text") or "", words=words, lookup=lookup)
+
+    def find(self, word: str) -> Optional[Dict[str, Any]]:
+        return self.lookup.get(word.lower())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"index": self.index, "text": self.text, "words": [dict(w) for w in self.words]}
+
+
+# (generated_content_id, sentence_index) -> ContextualSentence
+_SENTENCE_CACHE: LRUCache = LRUCache(maxsize=4096)
+
+
 class VocabService:
-    _running_tasks = {}
 
-    
     @staticmethod
     async def process_sentence_async(index: int, sentence: str):
         prompt = f"""
@@ -84,16 +128,224 @@ class VocabService:
                 "words": []
             }
 
+    @staticmethod
+    def get_contextual_sentence(db: Session, content_id: int, index: int) -> ContextualSentence:
+        """Resolve one sentence of contextual vocab, memory first, then the normalized table.
+
+        Content generated before the normalized table existed only has the
+        script_vocabs JSON; it is normalized on first access.
+        """
+        cache_key = (content_id, index)
+        cached = _SENTENCE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        sentence = vocab_crud.get_contextual_sentence(db, content_id=content_id, sentence_index=index)
+        if sentence is None:
+            sentence = VocabService._load_sentence_from_script_vocabs(db, content_id, index)
+
+        resolved = ContextualSentence.from_dict(sentence)
+        _SENTENCE_CACHE.put(cache_key, resolved)
+        return resolved
+
+    @staticmethod
+    def _load_sentence_from_script_vocabs(db: Session, content_id: int, index: int) -> Dict[str, Any]:
+        content = crud.get_generated_content_by_id(db, content_id=content_id)
+        if not content:
+            raise HTTPException(status_code=404, detail="generated content not found")
+
+        script_vocabs = content.script_vocabs
+        if not script_vocabs or not isinstance(script_vocabs, dict):
+            raise ScriptVocabsNotFoundException()
+
+        sentences = script_vocabs.get("sentences")
+        if not sentences or not isinstance(sentences, list):
+            raise HTTPException(status_code=404, detail="no sentences found in script_vocabs")
+
+        if not vocab_crud.has_contextual_vocab(db, content_id=content_id):
+            try:
+                vocab_crud.replace_contextual_vocab(db, content_id=content_id, sentences=sentences)
+                logger.info(f"Normalized legacy script_vocabs for content_id={content_id}")
+            except IntegrityError:
+                # 다른 요청이 먼저 정규화한 경우: 다시 쓰지 않고 그쪽이 쓴 행을 읽는다
+                db.rollback()
+                stored = vocab_crud.get_contextual_sentence(db, content_id=content_id, sentence_index=index)
+                if stored is not None:
+                    return stored
+                logger.warning(f"Legacy script_vocabs normalization conflicted for content_id={content_id}; serving JSON")
+
+        target = next((s for s in sentences if isinstance(s, dict) and s.get("index") == index), None)
+        if not target:
+            raise HTTPException(status_code=404, detail="sentence index not found")
+        return target
+
+    @staticmethod
+    def invalidate_contextual_cache(content_id: int) -> None:
+        _SENTENCE_CACHE.discard_where(lambda key: key[0] == content_id)
+
+    @staticmethod
+    def encode_vocab_cursor(entry: VocabEntry) -> str:
+        raw = f"{entry.created_at.isoformat()}|{entry.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_vocab_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            created_at, entry_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+            return datetime.fromisoformat(created_at), int(entry_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise HTTPException(status_code=400, detail="invalid cursor")
+
+    @staticmethod
+    def get_vocab_page(
+        db: Session,
+        user_id: int,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> Tuple[List[VocabEntry], Optional[str]]:
+        """Return one page of the user's vocab and the cursor of the next page (None at the end)."""
+        after = VocabService.decode_vocab_cursor(cursor) if cursor else None
+        rows = vocab_crud.list_vocab_for_user(db, user_id, limit=limit + 1, after=after, **filters)
+        if len(rows) <= limit:
+            return rows, None
+        page = rows[:limit]
+        return page, VocabService.encode_vocab_cursor(page[-1])
+
+    @staticmethod
+    def save_words(
+        db: Session,
+        user_id: int,
+        items: Sequence[Tuple[int, int, str]],
+        synthesize: Callable[[str], Optional[str]],
+        discard: Optional[Callable[[List[str]], None]] = None,
+    ) -> List[Tuple[VocabEntry, bool]]:
+        """Save (content_id, sentence index, word) items to the user's vocab as an upsert.
+
+        Words already saved with the same example sentence are returned as-is
+        (with their existing example_sentence_url), so no TTS/S3 work is done
+        for them. New entries get one ``synthesize(text)`` call per distinct
+        sentence (run concurrently, see ``_synthesize_sentences``) and are
+        committed together in one transaction. Audio that ends up unused, because
+        the save failed or a concurrent save won every word of that sentence, is
+        passed to ``discard``. Returns ``(entry, created)`` in the order of
+        ``items``; an item repeated within ``items`` is ``created`` only at its
+        first occurrence.
+        """
+        discard = discard or (lambda urls: None)
+        resolved: List[Tuple[vocab_crud.VocabKey, Dict[str, Any]]] = []
+        for content_id, index, word in items:
+            sentence = VocabService.get_contextual_sentence(db, content_id, index)
+            word_obj = sentence.find(word)
+            if not word_obj:
+                raise HTTPException(status_code=404, detail="word not found in sentence")
+            if not sentence.text:
+                raise HTTPException(status_code=400, detail="sentence text is empty")
+            row = {
+                "word": word,
+                "example_sentence": sentence.text,
+                "pos": word_obj.get("pos"),
+                "meaning": word_obj.get("meaning"),
+            }
+            resolved.append((vocab_crud.vocab_key(word, sentence.text), row))
+
+        keys = [key for key, _ in resolved]
+        existing = vocab_crud.find_vocab_entries(
+            db, user_id=user_id, keys=keys, words=[row["word"] for _, row in resolved]
+        )
+
+        # "Café"와 "cafe"처럼 unique 인덱스에서 같은 키는 첫 항목만 저장
+        pending: Dict[vocab_crud.VocabKey, Dict[str, Any]] = {}
+        for key, row in resolved:
+            if key not in existing:
+                pending.setdefault(key, row)
+
+        created: Dict[vocab_crud.VocabKey, VocabEntry] = {}
+        if pending:
+            audio_urls = VocabService._synthesize_sentences(
+                [row["example_sentence"] for row in pending.values()], synthesize, discard
+            )
+            for row in pending.values():
+                row["example_sentence_url"] = audio_urls[row["example_sentence"]]
+
+            try:
+                created = vocab_crud.insert_missing_vocab_entries(
+                    db, user_id=user_id, rows=pending, existing=existing
+                )
+            except IntegrityError:
+                discard([url for url in audio_urls.values() if url])
+                raise VocabSaveConflictException()
+            except Exception:
+                discard([url for url in audio_urls.values() if url])
+                raise
+            used = {entry.example_sentence_url for entry in created.values()}
+            unused = [url for url in audio_urls.values() if url and url not in used]
+            if unused:
+                discard(unused)
+
+        # 같은 요청 안에서 반복된 키는 첫 항목만 created로 표시
+        results: List[Tuple[VocabEntry, bool]] = []
+        for key, _ in resolved:
+            if key in created:
+                results.append((created.pop(key), True))
+                existing[key] = results[-1][0]
+            else:
+                results.append((existing[key], False))
+        return results
+
+    @staticmethod
+    def _synthesize_sentences(
+        texts: Sequence[str],
+        synthesize: Callable[[str], Optional[str]],
+        discard: Callable[[List[str]], None],
+    ) -> Dict[str, Optional[str]]:
+        """Run ``synthesize`` once per distinct sentence, at most settings.vocab_tts_max_concurrency at a time.
+
+        On the first failure the calls not started yet are cancelled, the audio
+        already uploaded for the other sentences is discarded and the error is raised.
+        """
+        texts = list(dict.fromkeys(texts))
+        if len(texts) == 1:
+            return {texts[0]: synthesize(texts[0])}
+
+        workers = max(1, min(settings.vocab_tts_max_concurrency, len(texts)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vocab-tts") as pool:
+            futures = {pool.submit(synthesize, text): text for text in texts}
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+        # with 블록을 나오면 이미 실행 중이던 호출까지 끝나 있음
+
+        audio_urls: Dict[str, Optional[str]] = {}
+        error: Optional[BaseException] = None
+        for future, text in futures.items():
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            audio_urls[text] = future.result()
+        if error is not None:
+            discard([url for url in audio_urls.values() if url])
+            raise error
+        return audio_urls
+
+    @staticmethod
+    def schedule_contextual_vocab(sentences: list[str], generated_content_id: int) -> bool:
+        """Run build_contextual_vocab in the background task supervisor.
+
+        De-duplicated per generated_content_id; returns False if a build for the
+        same content is already queued or running.
+        """
+        return task_supervisor.submit(
+            f"contextual_vocab:{generated_content_id}",
+            lambda: VocabService.build_contextual_vocab(sentences, generated_content_id),
+            retries=1,
+        )
+
     @staticmethod
     async def build_contextual_vocab(sentences: list[str], generated_content_id: int):
-        
-        # preventing multiple execution
-        if generated_content_id in VocabService._running_tasks:
-            task = VocabService._running_tasks[generated_content_id]
-            if not task.done():
-                logger.warning(f"Skipping duplicate vocab build for content_id={generated_content_id}")
-                return
-        
         logger.info(f"✅ Starting async processing for {len(sentences)} sentences (content_id={generated_content_id})...")
         start_total = time.time()  
         tasks = [asyncio.create_task(VocabService.process_sentence_async(i, s)) for i, s in enumerate(sentences)]
@@ -103,10 +355,13 @@ class VocabService:
 
         merged_words_result = {"sentences": results_sorted}
 
+        # 모든 문장이 실패하면 빈 결과를 저장하지 않고 예외로 올려 supervisor가 재시도하게 한다
+        if results_sorted and all("error" in result for result in results_sorted):
+            raise RuntimeError(f"contextual vocab failed for every sentence (content_id={generated_content_id})")
 
-        # db update
+        # db update (실패도 예외로 올려 재시도)
+        db = SessionLocal()
         try:
-            db = SessionLocal()
             updated = crud.update_generated_content_vocabs(
                 db,
                 content_id=generated_content_id,
@@ -114,10 +369,17 @@ class VocabService:
             )
             if updated:
                 logger.info(f"DB Updated script_vocabs for content_id={generated_content_id}")
+                vocab_crud.replace_contextual_vocab(
+                    db,
+                    content_id=generated_content_id,
+                    sentences=results_sorted,
+                )
+                VocabService.invalidate_contextual_cache(generated_content_id)
             else:
                 logger.warning(f"No matching content_id={generated_content_id} found in DB")
         except Exception as e:
             logger.warning(f"Failed to update script_vocabs in DB: {e}")
+            raise
         finally:
             db.close()
 
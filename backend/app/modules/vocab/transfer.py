@@ -0,0 +1,205 @@
+# app/modules/vocab/transfer.py
+"""Streaming export / batched import of a user's personal vocab.
+
+Export reads vocab_entries through a server-side cursor (``yield_per``) and
+yields one encoded chunk per batch, so memory use does not depend on the size
+of the library. Import parses the upload line by line and upserts in batches,
+one transaction per batch.
+"""
+import csv
+import io
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ...core.exceptions import VocabSaveConflictException
+from ...core.s3setting import s3_url_prefix
+from . import crud as vocab_crud
+from .model import VocabEntry
+
+EXPORT_BATCH_SIZE = 500
+IMPORT_BATCH_SIZE = 500
+
+# 컬럼 길이를 넘는 행은 DataError(500) 대신 invalid로 센다
+_MAX_LENGTHS = {
+    name: VocabEntry.__table__.c[name].type.length for name in ("word", "pos", "example_sentence_url")
+}
+_TEXT_MAX_BYTES = 65535  # MySQL TEXT (meaning, example_sentence)
+
+CSV_FIELDS = ["word", "pos", "meaning", "example_sentence", "example_sentence_url", "created_at"]
+
+EXPORT_FORMATS: Dict[str, Dict[str, str]] = {
+    "csv": {"media_type": "text/csv; charset=utf-8", "extension": "csv"},
+    "ndjson": {"media_type": "application/x-ndjson", "extension": "ndjson"},
+    # Anki "Notes in Plain Text" import: Front / Back / Sentence
+    "anki": {"media_type": "text/tab-separated-values; charset=utf-8", "extension": "txt"},
+}
+
+
+def _entry_row(entry: VocabEntry) -> Dict[str, Any]:
+    return {
+        "word": entry.word,
+        "pos": entry.pos,
+        "meaning": entry.meaning,
+        "example_sentence": entry.example_sentence,
+        "example_sentence_url": entry.example_sentence_url,
+        "created_at": entry.created_at.isoformat() if entry.created_at else None,
+    }
+
+
+def _anki_field(value: Optional[str]) -> str:
+    # Anki plain-text import: tabs separate fields, newlines separate notes
+    return " ".join((value or "").split())
+
+
+def _encode_csv(rows: List[Dict[str, Any]], header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _encode_ndjson(rows: List[Dict[str, Any]], header: bool) -> str:
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+def _encode_anki(rows: List[Dict[str, Any]], header: bool) -> str:
+    lines = ["#separator:tab\n#html:false\n#columns:Front\tBack\tSentence\n"] if header else []
+    for row in rows:
+        back = f"({row['pos']}) {row['meaning'] or ''}" if row["pos"] else (row["meaning"] or "")
+        lines.append(
+            "\t".join(_anki_field(value) for value in (row["word"], back, row["example_sentence"])) + "\n"
+        )
+    return "".join(lines)
+
+
+_ENCODERS: Dict[str, Callable[[List[Dict[str, Any]], bool], str]] = {
+    "csv": _encode_csv,
+    "ndjson": _encode_ndjson,
+    "anki": _encode_anki,
+}
+
+
+def iter_export(db: Session, user_id: int, fmt: str, *, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """Yield the user's vocab encoded as ``fmt``, one chunk per fetched batch."""
+    encode = _ENCODERS[fmt]
+    header = True
+    batch: List[Dict[str, Any]] = []
+    for entry in vocab_crud.iter_vocab_for_user(db, user_id, batch_size=batch_size):
+        batch.append(_entry_row(entry))
+        if len(batch) >= batch_size:
+            yield encode(batch, header)
+            header = False
+            # identity map은 weak reference이므로 dict로 바꾼 ORM 객체는 배치마다 해제된다
+            batch = []
+    if batch or header:
+        yield encode(batch, header)
+
+
+def _parse_csv(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    yield from csv.DictReader(stream)
+
+
+def _parse_ndjson(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            yield {}
+            continue
+        yield row if isinstance(row, dict) else {}
+
+
+_PARSERS: Dict[str, Callable[[TextIO], Iterable[Dict[str, Any]]]] = {
+    "csv": _parse_csv,
+    "ndjson": _parse_ndjson,
+}
+
+
+def _clean_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    word = row.get("word")
+    if not isinstance(word, str) or not word.strip():
+        return None
+    cleaned = {"word": word}
+    for field_name in ("pos", "meaning", "example_sentence", "example_sentence_url"):
+        value = row.get(field_name)
+        cleaned[field_name] = value if isinstance(value, str) and value != "" else None
+
+    if len(vocab_crud.normalize_word(word)) > _MAX_LENGTHS["word"]:
+        return None
+    if cleaned["pos"] is not None and len(cleaned["pos"]) > _MAX_LENGTHS["pos"]:
+        return None
+    for field_name in ("meaning", "example_sentence"):
+        if cleaned[field_name] is not None and len(cleaned[field_name].encode("utf-8")) > _TEXT_MAX_BYTES:
+            return None
+    # 우리 버킷의 오디오만 유지: 외부 URL은 앱에서 그대로 재생되므로 버린다
+    url = cleaned["example_sentence_url"]
+    if url is not None and (len(url) > _MAX_LENGTHS["example_sentence_url"] or not url.startswith(s3_url_prefix())):
+        cleaned["example_sentence_url"] = None
+    return cleaned
+
+
+def _flush(db: Session, user_id: int, pending: Dict[vocab_crud.VocabKey, Dict[str, Any]]) -> int:
+    existing = vocab_crud.find_vocab_entries(
+        db, user_id=user_id, keys=pending.keys(), words=[row["word"] for row in pending.values()]
+    )
+    try:
+        # 동시에 저장/import된 키는 skipped로 세고 나머지만 다시 저장 (두 번째 충돌은 다시 읽기만 함)
+        inserted = vocab_crud.insert_missing_vocab_entries(
+            db, user_id=user_id, rows=pending, existing=existing, refresh=False
+        )
+    except IntegrityError:
+        raise VocabSaveConflictException()
+    # 배치가 끝난 ORM 객체는 세션에서 떼어내 메모리가 누적되지 않게 한다
+    for entry in [*existing.values(), *inserted.values()]:
+        db.expunge(entry)
+    return len(inserted)
+
+
+def import_vocab(
+    db: Session,
+    user_id: int,
+    stream: TextIO,
+    fmt: str,
+    *,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """Upsert vocab rows parsed from ``stream``; entries already saved are skipped.
+
+    No TTS is generated for imported rows; ``example_sentence_url`` is kept only
+    when it points into our S3 bucket. Rows whose values do not fit the columns
+    are counted as invalid. Batches already written stay imported if a later one
+    hits an unresolved concurrent-save conflict (409); importing again skips them.
+    """
+    imported = skipped = invalid = 0
+    pending: Dict[vocab_crud.VocabKey, Dict[str, Any]] = {}
+
+    for raw in _PARSERS[fmt](stream):
+        row = _clean_row(raw)
+        if row is None:
+            invalid += 1
+            continue
+        key = vocab_crud.vocab_key(row["word"], row["example_sentence"])
+        if key in pending:
+            skipped += 1
+            continue
+        pending[key] = row
+        if len(pending) >= batch_size:
+            written = _flush(db, user_id, pending)
+            imported += written
+            skipped += len(pending) - written
+            pending = {}
+
+    if pending:
+        written = _flush(db, user_id, pending)
+        imported += written
+        skipped += len(pending) - written
+
+    return {"imported": imported, "skipped": skipped, "invalid": invalid}
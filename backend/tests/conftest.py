@@ -53,6 +53,9 @@ def sqlite_session() -> Iterator[Session]:
     # Import models so metadata is populated without touching level-management router.
     import_module("app.modules.audio.model")
     import_module("app.modules.stats.models")
+    import_module("app.modules.playback.models")
+    import_module("app.modules.level_system.models")
+    import_module("app.core.level.models")
     import_module("app.modules.users.crud")
     Base.metadata.create_all(engine)
     TestingSessionLocal = sessionmaker(bind=engine)
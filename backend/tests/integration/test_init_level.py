@@ -27,6 +27,14 @@ def patch_prompt_store(monkeypatch):
     monkeypatch.setattr(service_module._PROMPT_STORE, "load", lambda _: FakePrompt)
 
 
+@pytest.fixture(autouse=True)
+def disable_evaluation_cache(monkeypatch):
+    # 테스트마다 LLM 호출 경로를 검증하므로 결과 캐시를 끈다
+    from backend.app.modules.level_management import service as service_module
+    from backend.app.modules.level_management.evaluation_cache import EvaluationCache
+    monkeypatch.setattr(service_module, "_EVALUATION_CACHE", EvaluationCache(ttl_seconds=0))
+
+
 class FakeLLMClient:
     def __init__(self, *, response: str | None = None, error: Exception | None = None):
         self._response = response
@@ -310,7 +318,7 @@ def test_evaluate_session_feedback_updates_user_and_history(monkeypatch):
     assert len(db.refreshed) == 2
     assert response.level == CEFRLevel.B2
     assert response.scores.level_score == 70
-    assert '"context": "session_feedback"' in llm.calls[0]["user_prompt"]
+    assert '"context":"session_feedback"' in llm.calls[0]["user_prompt"]
 
 
 def test_evaluate_session_feedback_llm_failure_preserves_user_level(monkeypatch):
@@ -456,7 +464,7 @@ def test_evaluate_initial_level_updates_user_and_history(monkeypatch):
     assert len(db.refreshed) == 2
     assert response.level == CEFRLevel.B1
     assert response.scores.level_score == 50
-    assert '"context": "initial_level_assessment"' in llm.calls[0]["user_prompt"]
+    assert '"context":"initial_level_assessment"' in llm.calls[0]["user_prompt"]
 
 
 def test_evaluate_initial_level_llm_failure_preserves_user_level(monkeypatch):
@@ -14,4 +14,25 @@ def test_read_root():
 def test_read_users():
     response = client.get("/api/v1/user/")
     assert response.status_code == 200
-    assert response.json() == []
\ No newline at end of file
+    assert response.json() == []
+
+
+def _admin_only(monkeypatch, path):
+    from backend.app.core.config import settings
+
+    monkeypatch.setattr(settings, "admin_api_key", "secret")
+    assert client.get(path).status_code == 403
+    assert client.get(path, headers={"X-Admin-Key": "wrong"}).status_code == 403
+    assert client.get(path, headers={"X-Admin-Key": "secret"}).status_code == 200
+
+
+def test_llm_health_requires_admin_key(monkeypatch):
+    _admin_only(monkeypatch, "/health/llm")
+
+
+def test_task_health_requires_admin_key(monkeypatch):
+    _admin_only(monkeypatch, "/health/tasks")
+
+
+def test_playback_health_requires_admin_key(monkeypatch):
+    _admin_only(monkeypatch, "/health/playback")
@@ -44,44 +44,31 @@ def test_get_user_stats_aggregates_data(monkeypatch):
         real_datetime(2024, 5, 7, tzinfo=timezone.utc).date(): 60,
     }
 
-    def fake_get_daily_study_minutes(
+    def fake_get_daily_study_rollup(
         db_arg,
         *,
         user_id,
-        start_at,
-        end_at,
+        start_date,
+        end_date,
     ):
         assert db_arg is db
         assert user_id == user.id
-        assert start_at.tzinfo is timezone.utc
-        assert end_at.tzinfo is timezone.utc
+        assert start_date == real_datetime(2024, 5, 1).date()
+        assert end_date == real_datetime(2024, 5, 7).date()
         return daily_minutes
 
-    def fake_get_study_dates_descending(db_arg, *, user_id, limit):
+    def fake_get_study_totals(db_arg, *, user_id):
         assert db_arg is db
         assert user_id == user.id
-        assert limit == 60
-        return [
-            real_datetime(2024, 5, 7).date(),
-            real_datetime(2024, 5, 6).date(),
-            real_datetime(2024, 5, 5).date(),
-        ]
-
-    def fake_get_total_study_minutes(db_arg, *, user_id):
-        assert db_arg is db
-        assert user_id == user.id
-        return 600
-
-    def fake_get_total_study_days(db_arg, *, user_id):
-        assert db_arg is db
-        assert user_id == user.id
-        return 42
-
-    ensured = []
+        return SimpleNamespace(
+            total_minutes=600,
+            total_days=42,
+            current_streak=3,
+            last_active_date=real_datetime(2024, 5, 7).date(),
+        )
 
     def fake_ensure_achievements(db_arg, *, definitions):
-        assert db_arg is db
-        ensured.append(tuple(defn["code"] for defn in definitions))
+        raise AssertionError("stats read path must not write")
 
     achievements = [
         SimpleNamespace(
@@ -97,19 +84,15 @@ def test_get_user_stats_aggregates_data(monkeypatch):
         assert db_arg is db
         return achievements
 
+    # insert_study_session 시점에 해금된 업적 (조회는 읽기만 함)
     awarded = {
         "FIRST_SESSION": real_datetime(2024, 5, 1, tzinfo=timezone.utc),
+        "STREAK_3": real_datetime(2024, 5, 7, tzinfo=timezone.utc),
+        "TOTAL_60": real_datetime(2024, 5, 5, tzinfo=timezone.utc),
+        "TOTAL_300": real_datetime(2024, 5, 6, tzinfo=timezone.utc),
+        "TOTAL_600": real_datetime(2024, 5, 7, tzinfo=timezone.utc),
     }
 
-    def fake_ensure_user_achievement(db_arg, *, user_id, achievement_code):
-        assert db_arg is db
-        assert user_id == user.id
-        awarded.setdefault(achievement_code, real_datetime(2024, 5, 7, tzinfo=timezone.utc))
-        return SimpleNamespace(
-            achievement_code=achievement_code,
-            achieved_at=awarded[achievement_code],
-        )
-
     def fake_list_user_achievements(db_arg, *, user_id):
         assert db_arg is db
         assert user_id == user.id
@@ -130,27 +113,15 @@ def test_get_user_stats_aggregates_data(monkeypatch):
         pass
 
     for module in {id(mod): mod for mod in crud_modules}.values():
-        monkeypatch.setattr(module, "get_daily_study_minutes", fake_get_daily_study_minutes)
-        monkeypatch.setattr(module, "get_study_dates_descending", fake_get_study_dates_descending)
-        monkeypatch.setattr(module, "get_total_study_minutes", fake_get_total_study_minutes)
-        monkeypatch.setattr(module, "get_total_study_days", fake_get_total_study_days)
+        monkeypatch.setattr(module, "get_daily_study_rollup", fake_get_daily_study_rollup)
+        monkeypatch.setattr(module, "get_study_totals", fake_get_study_totals)
         monkeypatch.setattr(module, "ensure_achievements", fake_ensure_achievements)
         monkeypatch.setattr(module, "list_achievements", fake_list_achievements)
-        monkeypatch.setattr(module, "ensure_user_achievement", fake_ensure_user_achievement)
         monkeypatch.setattr(module, "list_user_achievements", fake_list_user_achievements)
 
     service = StatsService()
     stats = service.get_user_stats(db=db, user=user)
 
-    if _DEFAULT_ACHIEVEMENTS:
-        assert ensured
-    assert set(awarded.keys()) == {
-        "FIRST_SESSION",
-        "STREAK_3",
-        "TOTAL_60",
-        "TOTAL_300",
-        "TOTAL_600",
-    }
     assert stats.total_time_spent_minutes == 600
     assert stats.current_level.lexical.cefr_level == CEFRLevel.B1
     assert stats.current_level.lexical.score == 80
@@ -190,14 +161,8 @@ def test_get_user_stats_handles_no_activity(monkeypatch):
     monkeypatch.setattr(crud, "list_achievements", lambda *args, **kwargs: [
         SimpleNamespace(code="FIRST_SESSION", name="첫 학습 달성", description=None, category="milestone")
     ])
-    monkeypatch.setattr(crud, "get_daily_study_minutes", lambda *args, **kwargs: {})
-    monkeypatch.setattr(crud, "get_study_dates_descending", lambda *args, **kwargs: [])
-    monkeypatch.setattr(crud, "get_total_study_minutes", lambda *args, **kwargs: 0)
-    monkeypatch.setattr(crud, "get_total_study_days", lambda *args, **kwargs: 0)
-    monkeypatch.setattr(crud, "ensure_user_achievement", lambda *args, **kwargs: SimpleNamespace(
-        achievement_code="FIRST_SESSION",
-        achieved_at=None,
-    ))
+    monkeypatch.setattr(crud, "get_daily_study_rollup", lambda *args, **kwargs: {})
+    monkeypatch.setattr(crud, "get_study_totals", lambda *args, **kwargs: None)
     monkeypatch.setattr(crud, "list_user_achievements", lambda *args, **kwargs: [])
 
     service = StatsService()
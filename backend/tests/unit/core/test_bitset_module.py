@@ -0,0 +1,38 @@
+from app.core import bitset
+
+
+def test_bits_and_popcount():
+    buf = bytearray(46)
+    for index in (0, 7, 8, 365):
+        bitset.set_bit(buf, index)
+    assert bitset.test_bit(buf, 7) and bitset.test_bit(buf, 365)
+    assert not bitset.test_bit(buf, 1)
+    assert bitset.popcount(buf) == 4
+    assert bitset.highest_set_bit(buf) == 365
+    assert bitset.highest_set_bit(bytearray(4)) == -1
+
+
+def test_runs():
+    buf = bytearray(46)
+    for index in list(range(0, 3)) + list(range(10, 17)) + [20]:
+        bitset.set_bit(buf, index)
+    assert bitset.run_ending_at(buf, 2) == 3
+    assert bitset.run_ending_at(buf, 16) == 7
+    assert bitset.run_ending_at(buf, 13) == 4
+    assert bitset.run_ending_at(buf, 18) == 0
+    assert bitset.longest_run(buf) == 7
+    assert bitset.longest_run(bytearray(46)) == 0
+
+    full = bytearray(b"\xff" * 46)
+    assert bitset.run_ending_at(full, 365) == 366
+    assert bitset.longest_run(full) == 368
+
+
+def test_nibbles():
+    buf = bytearray(183)
+    bitset.set_nibble(buf, 0, 3)
+    bitset.set_nibble(buf, 1, 15)
+    bitset.set_nibble(buf, 365, 9)
+    bitset.set_nibble(buf, 0, 5)
+    assert [bitset.get_nibble(buf, i) for i in (0, 1, 2, 365)] == [5, 15, 0, 9]
+    assert buf[0] == 0xF5
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a becomes most recent
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_lru_cache_discard_where_and_clear():
+    cache = LRUCache(maxsize=10)
+    for idx in range(4):
+        cache.put((idx % 2, idx), idx)
+
+    assert cache.discard_where(lambda key: key[0] == 0) == 2
+    assert len(cache) == 2
+    cache.discard((1, 1))
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_lru_cache_expires_entries_after_ttl(monkeypatch):
+    from app.core import cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(maxsize=10, ttl_seconds=60)
+    cache.put("a", 1)
+
+    now[0] += 59
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.misses == 1
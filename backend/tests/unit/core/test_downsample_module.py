@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from app.core.downsample import lttb_indices
+
+
+def test_short_series_is_returned_unchanged():
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 10).tolist() == [0, 1, 2]
+
+
+def test_keeps_endpoints_and_requested_count():
+    x = np.arange(1000)
+    y = np.sin(x / 50)
+
+    idx = lttb_indices(x, y, 100)
+
+    assert idx.shape == (100,)
+    assert idx[0] == 0 and idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_preserves_spikes():
+    x = np.arange(500)
+    y = np.zeros(500)
+    y[137] = 50.0
+    y[388] = -40.0
+
+    idx = lttb_indices(x, y, 20)
+
+    assert 137 in idx
+    assert 388 in idx
+
+
+def test_rejects_too_small_threshold():
+    with pytest.raises(ValueError):
+        lttb_indices(np.arange(10), np.arange(10), 2)
@@ -0,0 +1,235 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.config import Base
+from app.core.level import shadow as shadow_module
+from app.core.level.context import LevelContext
+from app.core.level.models import LevelShadowComparison
+from app.core.level.shadow import ShadowEvaluator, rollback_only_session, snapshot_levels
+from app.core.level.strategy import LevelServiceStrategy
+from app.modules.users import crud as user_crud
+from app.modules.users.models import User
+
+
+@pytest.fixture
+def engine(tmp_path):
+    import app.modules.level_system.models  # noqa: F401  (metadata)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'shadow.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def user_id(engine):
+    with Session(bind=engine) as session:
+        user = user_crud.create_user(session, username="shadow_user", hashed_password="pw")
+        user.lexical_level = 100
+        session.commit()
+        return user.id
+
+
+class WritingStrategy(LevelServiceStrategy):
+    """레벨을 덮어쓰고 commit까지 하는 전략 (shadow에서는 반영되면 안 됨)"""
+
+    def evaluate_level_test(self, db, user, payload):
+        return self.evaluate_session_feedback(db, user, payload)
+
+    def evaluate_session_feedback(self, db, user, payload):
+        user.lexical_level = 250
+        db.commit()
+        return {"lexical_level": 250.0, "payload": payload}
+
+    def set_manual_level(self, db, user, payload):
+        raise AssertionError("not shadowed")
+
+
+class FailingStrategy(WritingStrategy):
+    def evaluate_session_feedback(self, db, user, payload):
+        raise RuntimeError("llm down")
+
+
+def _lexical_level(engine, user_id):
+    with Session(bind=engine) as session:
+        return float(session.get(User, user_id).lexical_level)
+
+
+class TestShadowRun:
+    def test_rollback_only_session_discards_commits(self, engine, user_id):
+        with rollback_only_session(engine) as session:
+            session.get(User, user_id).lexical_level = 5
+            session.commit()
+            assert float(session.get(User, user_id).lexical_level) == 5
+
+        assert _lexical_level(engine, user_id) == 100
+
+    def test_shadow_never_writes_levels_and_records_comparison(self, engine, user_id):
+        evaluator = ShadowEvaluator(WritingStrategy(), sample_rate=1.0, bind=engine)
+
+        row_id = evaluator.run(
+            "evaluate_session_feedback",
+            user_id=user_id,
+            payload="p",
+            primary_strategy="Heuristic",
+            primary_result={"lexical_level": 101.0},
+            primary_latency_ms=3.2,
+            levels_before={"lexical_level": 100.0},
+        )
+
+        assert _lexical_level(engine, user_id) == 100
+        with Session(bind=engine) as session:
+            row = session.get(LevelShadowComparison, row_id)
+            assert row.shadow_strategy == "WritingStrategy"
+            assert row.primary_result == {"lexical_level": 101.0}
+            assert row.shadow_result == {"lexical_level": 250.0, "payload": "p"}
+            assert row.shadow_error is None
+            assert row.primary_latency_ms == 3.2
+            assert row.shadow_latency_ms >= 0
+
+    def test_shadow_failure_is_recorded(self, engine, user_id):
+        evaluator = ShadowEvaluator(FailingStrategy(), sample_rate=1.0, bind=engine)
+
+        row_id = evaluator.run(
+            "evaluate_session_feedback",
+            user_id=user_id,
+            payload=None,
+            primary_strategy="Heuristic",
+            primary_result={},
+            primary_latency_ms=1.0,
+        )
+
+        with Session(bind=engine) as session:
+            row = session.get(LevelShadowComparison, row_id)
+            assert row.shadow_result is None
+            assert "llm down" in row.shadow_error
+
+
+class TestShadowSubmit:
+    def test_adapter_can_skip_request(self, monkeypatch):
+        submitted = []
+        monkeypatch.setattr(shadow_module.task_supervisor, "submit", lambda *a, **k: submitted.append(a) or True)
+        evaluator = ShadowEvaluator(
+            WritingStrategy(), sample_rate=1.0, adapters={"evaluate_session_feedback": lambda payload: None}
+        )
+
+        assert evaluator.submit(
+            "evaluate_session_feedback",
+            user_id=1,
+            payload="p",
+            primary_strategy="H",
+            primary_result={},
+            primary_latency_ms=1.0,
+        ) is False
+        assert submitted == []
+
+    def test_submit_schedules_background_task(self, monkeypatch):
+        submitted = []
+        monkeypatch.setattr(
+            shadow_module.task_supervisor, "submit", lambda key, factory, **kwargs: submitted.append((key, kwargs)) or True
+        )
+        evaluator = ShadowEvaluator(WritingStrategy(), sample_rate=1.0)
+
+        assert evaluator.submit(
+            "evaluate_level_test",
+            user_id=9,
+            payload="p",
+            primary_strategy="H",
+            primary_result={"a": 1},
+            primary_latency_ms=1.0,
+        )
+        key, kwargs = submitted[0]
+        assert key.startswith("level_shadow:evaluate_level_test:9:")
+        assert kwargs["retries"] == 0
+
+    def test_only_evaluation_methods_are_sampled(self):
+        evaluator = ShadowEvaluator(WritingStrategy(), sample_rate=1.0)
+
+        assert evaluator.should_sample("evaluate_session_feedback")
+        assert not evaluator.should_sample("set_manual_level")
+        assert not ShadowEvaluator(WritingStrategy(), sample_rate=0.0).should_sample("evaluate_session_feedback")
+
+
+class RecordingShadow:
+    name = "Recording"
+    sample_rate = 1.0
+
+    def __init__(self, sample):
+        self.sample = sample
+        self.calls = []
+
+    def should_sample(self, method):
+        return self.sample
+
+    def submit(self, method, **kwargs):
+        self.calls.append((method, kwargs))
+        return True
+
+
+class PrimaryStrategy(WritingStrategy):
+    def evaluate_session_feedback(self, db, user, payload):
+        return {"lexical_level": 101.0}
+
+
+class TestLevelContextShadow:
+    def test_primary_result_is_returned_and_shadow_submitted(self):
+        shadow = RecordingShadow(sample=True)
+        context = LevelContext(PrimaryStrategy(), shadow=shadow)
+        user = SimpleNamespace(id=3, lexical_level=100, syntactic_level=90, speed_level=80)
+        payload = SimpleNamespace(generated_content_id=1)
+
+        result = context.evaluate_session_feedback(None, user, payload)
+
+        assert result == {"lexical_level": 101.0}
+        method, kwargs = shadow.calls[0]
+        assert method == "evaluate_session_feedback"
+        assert kwargs["primary_strategy"] == "PrimaryStrategy"
+        assert kwargs["primary_result"] == result
+        assert kwargs["levels_before"] == {"lexical_level": 100.0, "syntactic_level": 90.0, "speed_level": 80.0}
+
+    def test_unsampled_requests_skip_shadow(self):
+        shadow = RecordingShadow(sample=False)
+        context = LevelContext(PrimaryStrategy(), shadow=shadow)
+
+        context.evaluate_session_feedback(None, SimpleNamespace(id=3), SimpleNamespace(generated_content_id=1))
+
+        assert shadow.calls == []
+
+    def test_snapshot_levels_skips_non_level_values(self):
+        user = SimpleNamespace(lexical_level=None, level="B1", level_score=object())
+
+        assert snapshot_levels(user) == {"level": "B1"}
+
+
+def test_default_batch_aggregates_into_the_batch_response():
+    from app.modules.level_system.schemas import SessionFeedbackBatchResponse
+
+    class SteppingStrategy(WritingStrategy):
+        def evaluate_session_feedback(self, db, user, payload):
+            user.lexical_level += payload
+            return {
+                "lexical_level": float(user.lexical_level),
+                "syntactic_level": 90.0,
+                "speed_level": 80.0,
+                "lexical_level_delta": float(payload),
+                "syntactic_level_delta": 0.0,
+                "speed_level_delta": -0.5,
+            }
+
+    user = SimpleNamespace(lexical_level=100)
+
+    result = SteppingStrategy().evaluate_session_feedback_batch(None, user, [1.5, 2.0])
+
+    # 피드백을 순서대로 반영하고, 레벨은 마지막 결과 / delta는 합산
+    assert SessionFeedbackBatchResponse(**result).model_dump() == {
+        "applied_count": 2,
+        "lexical_level": 103.5,
+        "syntactic_level": 90.0,
+        "speed_level": 80.0,
+        "lexical_level_delta": 3.5,
+        "syntactic_level_delta": 0.0,
+        "speed_level_delta": -1.0,
+    }
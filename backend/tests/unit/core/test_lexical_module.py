@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from app.core import lexical
+
+
+def test_lookup_level_handles_inflections():
+    wordlist = {"play": "A1", "judge": "A1", "story": "A2"}
+    assert lexical.lookup_level("play", wordlist) == "A1"
+    assert lexical.lookup_level("played", wordlist) == "A1"
+    assert lexical.lookup_level("playing", wordlist) == "A1"
+    assert lexical.lookup_level("judged", wordlist) == "A1"
+    assert lexical.lookup_level("stories", wordlist) == "A2"
+    assert lexical.lookup_level("unlisted", wordlist) is None
+
+
+def test_cefr_distribution_skips_function_words():
+    counts = lexical.cefr_distribution(lexical.tokenize("I don't play in the snow with the pizza."))
+    assert counts["A1"] == 3
+    assert sum(counts.values()) == 3
+
+
+def test_wordlist_file_overrides_seed(tmp_path, monkeypatch):
+    path = tmp_path / "words.tsv"
+    path.write_text("Serendipity\tc2\nbroken line\n", encoding="utf-8")
+    monkeypatch.setattr(lexical.settings, "cefr_wordlist_path", str(path))
+    lexical.get_wordlist.cache_clear()
+    try:
+        assert lexical.get_wordlist() == {"serendipity": "C2"}
+    finally:
+        monkeypatch.setattr(lexical.settings, "cefr_wordlist_path", None)
+        lexical.get_wordlist.cache_clear()
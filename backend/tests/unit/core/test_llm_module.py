@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -66,3 +67,137 @@ def test_llm_client_requires_api_key(monkeypatch):
     monkeypatch.setattr(llm, "settings", type("Settings", (), {"openai_api_key": None, "openai_base_url": None})())
     with pytest.raises(llm.LLMServiceError):
         llm.OpenAILLMClient(api_key=None)
+
+
+class _FakeAsyncCompletions:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else self.outcomes_default
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome == "hang":
+            await asyncio.sleep(10)
+        message = type("Msg", (), {"content": outcome})()
+        return type("Completion", (), {"choices": [type("Choice", (), {"message": message})()]})()
+
+
+def _async_client(monkeypatch, outcomes, **kwargs):
+    completions = _FakeAsyncCompletions(outcomes)
+    completions.outcomes_default = RuntimeError("exhausted")
+
+    class FakeAsyncOpenAI:
+        def __init__(self, **client_kwargs):
+            assert client_kwargs["max_retries"] == 0
+            self.chat = type("Chat", (), {"completions": completions})()
+
+    monkeypatch.setattr(llm, "AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(llm, "settings", type("Settings", (), {"openai_api_key": "token", "openai_base_url": None})())
+    kwargs.setdefault("backoff_base_seconds", 0.001)
+    return llm.AsyncOpenAILLMClient(**kwargs), completions
+
+
+def _generate(client, **kwargs):
+    return asyncio.run(client.generate_json(model="gpt", system_prompt="s", user_prompt="u", **kwargs))
+
+
+def test_async_client_retries_transient_errors(monkeypatch):
+    client, completions = _async_client(monkeypatch, [asyncio.TimeoutError(), '{"ok": true}'])
+
+    assert _generate(client) == '{"ok": true}'
+    assert completions.calls == 2
+    stats = client.stats()
+    assert stats["retries"] == 1 and stats["successes"] == 1
+    assert stats["circuit"]["state"] == llm.CircuitBreaker.CLOSED
+
+
+def test_async_client_does_not_retry_programming_errors(monkeypatch):
+    client, completions = _async_client(monkeypatch, [ValueError("bad request")])
+
+    with pytest.raises(llm.LLMServiceError):
+        _generate(client)
+    assert completions.calls == 1
+
+
+def test_async_client_enforces_deadline(monkeypatch):
+    client, completions = _async_client(monkeypatch, ["hang"])
+
+    with pytest.raises(llm.LLMDeadlineExceededError):
+        _generate(client, deadline_seconds=0.05)
+    assert client.stats()["deadline_exceeded"] == 1
+
+
+def test_backoff_uses_full_jitter(monkeypatch):
+    client, _ = _async_client(monkeypatch, [], backoff_base_seconds=1.0, backoff_max_seconds=3.0)
+    delays = [client._backoff_delay(attempt) for attempt in (1, 2, 3, 4) for _ in range(50)]
+
+    assert all(0 <= delay <= 3.0 for delay in delays)
+    assert max(client._backoff_delay(1) for _ in range(50)) <= 1.0
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(llm.time, "monotonic", lambda: now[0])
+    breaker = llm.CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == llm.CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    now[0] += 31
+    assert breaker.state == llm.CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # trial call 하나만 허용
+    breaker.record_success()
+    assert breaker.state == llm.CircuitBreaker.CLOSED
+
+
+def test_async_client_short_circuits_while_open(monkeypatch):
+    breaker = llm.CircuitBreaker(failure_threshold=1, reset_timeout_seconds=60)
+    client, completions = _async_client(monkeypatch, [asyncio.TimeoutError()], breaker=breaker)
+
+    with pytest.raises(llm.LLMServiceError):
+        _generate(client, max_retries=1)
+    with pytest.raises(llm.LLMCircuitOpenError):
+        _generate(client)
+    assert completions.calls == 1
+    assert client.stats()["short_circuited"] == 1
+
+
+def test_non_retryable_errors_do_not_open_the_circuit(monkeypatch):
+    breaker = llm.CircuitBreaker(failure_threshold=1, reset_timeout_seconds=60)
+    client, completions = _async_client(monkeypatch, [ValueError("bad request"), '{"ok": true}'], breaker=breaker)
+
+    with pytest.raises(llm.LLMServiceError):
+        _generate(client)
+    assert breaker.state == llm.CircuitBreaker.CLOSED
+    assert _generate(client) == '{"ok": true}'
+
+
+def test_cancelled_half_open_trial_is_released(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(llm.time, "monotonic", lambda: now[0])
+    breaker = llm.CircuitBreaker(failure_threshold=1, reset_timeout_seconds=30)
+    breaker.record_failure()
+    now[0] += 31
+    client, completions = _async_client(monkeypatch, ["hang", '{"ok": true}'], breaker=breaker)
+
+    async def cancel_trial():
+        task = asyncio.create_task(client.generate_json(model="gpt", system_prompt="s", user_prompt="u"))
+        while completions.calls == 0:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_trial())
+
+    # 취소된 trial이 반납되어 다음 요청이 trial로 실행되고 circuit을 닫는다
+    assert breaker.state == llm.CircuitBreaker.HALF_OPEN
+    assert _generate(client) == '{"ok": true}'
+    assert breaker.state == llm.CircuitBreaker.CLOSED
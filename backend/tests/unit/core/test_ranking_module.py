@@ -0,0 +1,49 @@
+import random
+
+from app.core.ranking import RankIndex
+
+
+def test_rank_and_top_with_ties():
+    index = RankIndex(capacity=8)
+    for member, score in {1: 30, 2: 50, 3: 30, 4: 10, 5: 0}.items():
+        index.update(member, score)
+
+    assert len(index) == 4 and 5 not in index
+    assert index.top(10) == [(2, 50), (1, 30), (3, 30), (4, 10)]
+    assert index.top(2) == [(2, 50), (1, 30)]
+    assert [index.rank(m) for m in (2, 1, 3, 4)] == [1, 2, 2, 4]
+    assert index.rank(5) is None
+
+
+def test_update_and_remove_move_members():
+    index = RankIndex(capacity=4)
+    index.update(1, 3)
+    index.update(2, 2)
+    index.update(2, 9)  # 용량 초과 -> 트리 확장
+    assert index.top(2) == [(2, 9), (1, 3)]
+    assert index.count_above(3) == 1
+
+    index.update(2, 0)
+    assert 2 not in index and index.rank(1) == 1
+    assert index.remove(1) is True
+    assert index.remove(1) is False
+    assert index.top(5) == []
+
+
+def test_matches_sorting():
+    rng = random.Random(7)
+    index = RankIndex(capacity=16)
+    scores = {}
+    for _ in range(2000):
+        member = rng.randrange(200)
+        score = rng.randrange(0, 3000)
+        index.update(member, score)
+        if score > 0:
+            scores[member] = score
+        else:
+            scores.pop(member, None)
+
+    expected = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    assert index.top(25) == expected[:25]
+    for member, score in scores.items():
+        assert index.rank(member) == 1 + sum(1 for other in scores.values() if other > score)
@@ -29,3 +29,22 @@ def test_upload_audio_to_s3(monkeypatch):
     url = s3setting.upload_audio_to_s3(b"audio-bytes", "audio/demo.mp3")
     assert "test-bucket" in url
     assert calls["key"] == "audio/demo.mp3"
+
+
+def test_delete_audio_from_s3_only_touches_our_bucket(monkeypatch):
+    calls = []
+
+    class DummyClient:
+        def delete_objects(self, Bucket, Delete):
+            calls.append((Bucket, [obj["Key"] for obj in Delete["Objects"]]))
+
+    monkeypatch.setattr(s3setting, "s3_client", DummyClient())
+    monkeypatch.setattr(s3setting, "AWS_S3_BUCKET", "test-bucket")
+    monkeypatch.setattr(s3setting, "AWS_REGION", "local")
+
+    s3setting.delete_audio_from_s3(
+        ["https://test-bucket.s3.local.amazonaws.com/audio/examples/a.mp3", "https://evil.example/a.mp3", None]
+    )
+    s3setting.delete_audio_from_s3(["https://evil.example/b.mp3"])
+
+    assert calls == [("test-bucket", ["audio/examples/a.mp3"])]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.tasks import NO_TIMEOUT, TaskSupervisor
+
+
+@pytest.mark.asyncio
+async def test_supervisor_runs_and_records_durations():
+    supervisor = TaskSupervisor()
+    done = []
+
+    async def job():
+        done.append(True)
+
+    assert supervisor.submit("vocab:1", job) is True
+    await supervisor.drain()
+
+    stats = supervisor.stats()
+    assert done == [True]
+    assert stats["counters"]["succeeded"] == 1
+    assert stats["durations"]["vocab"]["count"] == 1
+    assert stats["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_supervisor_deduplicates_by_key_until_finished():
+    supervisor = TaskSupervisor()
+    release = asyncio.Event()
+
+    async def job():
+        await release.wait()
+
+    assert supervisor.submit("vocab:7", job) is True
+    assert supervisor.submit("vocab:7", job) is False
+    assert supervisor.is_active("vocab:7")
+
+    release.set()
+    await supervisor.drain()
+    assert not supervisor.is_active("vocab:7")
+
+    supervisor.start()
+    assert supervisor.submit("vocab:7", job) is True
+    await supervisor.drain()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_retries_with_backoff_and_times_out():
+    supervisor = TaskSupervisor(backoff_base_seconds=0.001)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("boom")
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    supervisor.submit("flaky:1", flaky, retries=2)
+    supervisor.submit("slow:1", slow, timeout=0.01)
+    await supervisor.drain()
+
+    counters = supervisor.stats()["counters"]
+    assert len(attempts) == 3
+    assert counters["retried"] == 2
+    assert counters["succeeded"] == 1
+    assert counters["timed_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_supervisor_no_timeout_outlives_default_timeout():
+    supervisor = TaskSupervisor(default_timeout=0.01)
+
+    async def loop():
+        await asyncio.sleep(0.1)
+
+    supervisor.submit("default:1", loop)
+    supervisor.submit("loop:1", loop, timeout=NO_TIMEOUT)
+    await supervisor.drain()
+
+    counters = supervisor.stats()["counters"]
+    assert counters["timed_out"] == 1
+    assert counters["succeeded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_supervisor_limits_concurrency():
+    supervisor = TaskSupervisor(max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def job():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for idx in range(6):
+        supervisor.submit(f"job:{idx}", job)
+    await supervisor.drain()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_supervisor_accepts_submissions_from_threads_and_rejects_after_drain():
+    supervisor = TaskSupervisor()
+    supervisor.start()
+    finished = asyncio.Event()
+
+    async def job():
+        finished.set()
+
+    accepted = []
+    worker = threading.Thread(target=lambda: accepted.append(supervisor.submit("thread:1", job)))
+    worker.start()
+    worker.join()
+
+    await asyncio.wait_for(finished.wait(), timeout=1)
+    await supervisor.drain()
+
+    assert accepted == [True]
+    assert supervisor.submit("late:1", job) is False
+    assert supervisor.stats()["counters"]["rejected"] == 1
+
+
+def test_supervisor_rejects_without_event_loop():
+    supervisor = TaskSupervisor()
+
+    async def job():
+        return None
+
+    assert supervisor.submit("orphan:1", job) is False
+    assert not supervisor.is_active("orphan:1")
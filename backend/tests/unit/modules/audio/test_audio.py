@@ -4,6 +4,7 @@ from types import SimpleNamespace
 import pytest
 
 from backend.app.modules.audio import utils as audio_utils
+from backend.app.modules.audio.analysis import analyze_content, compute_alignment_duration_seconds
 from backend.app.modules.audio.service import AudioService
 from backend.app.modules.audio.utils import parse_tts_by_newlines
 
@@ -190,3 +191,31 @@ def test_insert_study_session_handles_exceptions(monkeypatch):
 
     monkeypatch.setattr(audio_utils.stats_crud, "insert_study_session", fake_insert)
     audio_utils.insert_study_session_from_sentences(user_id=1, sentences=[{"end": 120}])
+
+
+def test_alignment_duration_uses_last_character_end():
+    assert compute_alignment_duration_seconds(FAKE_TTS_RESPONSE["alignment"]) == 2.32
+    assert compute_alignment_duration_seconds(None) is None
+
+
+def test_analyze_content_counts_and_distribution():
+    script = "The happy reporter rides a bicycle.\nIt was a tremendous experience!\n\n"
+    analysis = analyze_content(script, duration_seconds=6.0)
+
+    assert analysis["word_count"] == 11
+    assert analysis["sentence_count"] == 2
+    assert analysis["avg_sentence_length"] == 5.5
+    assert analysis["words_per_minute"] == 110.0
+    distribution = analysis["cefr_distribution"]
+    # function words (the, a, it, was) are excluded
+    assert analysis["content_word_count"] == 6
+    assert distribution["A1"] == 3  # happy, reporter, bicycle
+    assert distribution["B1"] == 2  # tremendous, experience
+    assert distribution["unknown"] == 1  # rides (not in the seed list)
+
+
+def test_analyze_content_without_duration():
+    analysis = analyze_content("", None)
+    assert analysis["sentence_count"] == 0
+    assert analysis["avg_sentence_length"] == 0.0
+    assert analysis["words_per_minute"] is None
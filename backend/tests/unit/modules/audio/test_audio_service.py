@@ -278,12 +278,11 @@ def test_generate_full_audio_handles_background_failures(monkeypatch, sqlite_ses
     def fail_insert(*args, **kwargs):
         raise RuntimeError("db down")
 
-    def fail_task(coro):
-        coro.close()
+    def fail_schedule(sentences, content_id):
         raise RuntimeError("vocab fail")
 
     monkeypatch.setattr(audio_service_module.crud, "insert_generated_content", fail_insert)
-    monkeypatch.setattr(audio_service_module.asyncio, "create_task", fail_task)
+    monkeypatch.setattr(audio_service_module.VocabService, "schedule_contextual_vocab", staticmethod(fail_schedule))
     monkeypatch.setattr(audio_service_module, "insert_study_session_from_sentences", lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("stats fail")))
 
     updated = {}
@@ -346,11 +345,10 @@ def test_generate_full_audio_streaming_handles_soft_failures(monkeypatch, sqlite
     request = AudioGenerateRequest(style="steady", theme="mountain")
     ws = DummyWebSocket()
 
-    def fail_task(coro):
-        coro.close()
+    def fail_schedule(sentences, content_id):
         raise RuntimeError("vocab fail")
 
-    monkeypatch.setattr(audio_service_module.asyncio, "create_task", fail_task)
+    monkeypatch.setattr(audio_service_module.VocabService, "schedule_contextual_vocab", staticmethod(fail_schedule))
     monkeypatch.setattr(audio_service_module, "insert_study_session_from_sentences", lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("stats fail")))
 
     def fail_update(*args, **kwargs):
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app.core.llm import LLMCircuitOpenError
+from app.modules.level_management import schemas
+from app.modules.level_management.evaluation_cache import EvaluationCache
+from app.modules.level_management.service import LevelManagementService
+from app.modules.level_management.models import CEFRLevel
+
+
+class FakeAsyncLLMClient:
+    def __init__(self, *, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = 0
+
+    async def generate_json(self, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def _summarize(service):
+    tests = [schemas.LevelTestItem(script_id="s1", understanding=80)]
+    scripts = {"s1": SimpleNamespace(transcript="Hello there.", target_level=CEFRLevel.B1, title="t")}
+    return asyncio.run(service._summarize_level_test_async(tests=tests, scripts=scripts))
+
+
+def test_async_summary_parses_llm_payload():
+    client = FakeAsyncLLMClient(
+        response=json.dumps({"level": "B2", "level_score": 70, "llm_confidence": 65, "rationale": "good"})
+    )
+    result = _summarize(LevelManagementService(async_llm_client=client, evaluation_cache=EvaluationCache()))
+
+    assert result.llm_success
+    assert result.level == CEFRLevel.B2
+    assert result.level_score == 70
+    assert client.calls == 1
+
+
+def test_async_summary_falls_back_when_circuit_is_open():
+    client = FakeAsyncLLMClient(error=LLMCircuitOpenError("open"))
+    result = _summarize(LevelManagementService(async_llm_client=client, evaluation_cache=EvaluationCache()))
+
+    assert not result.llm_success
+    assert result.average_understanding == 80
+    assert result.sample_count == 1
+
+
+class FakeLLMClient:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def generate_json(self, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+def _summarize_sync(service, db=None, *, understanding=80, profile=None):
+    tests = [schemas.LevelTestItem(script_id="s1", understanding=understanding)]
+    scripts = {"s1": SimpleNamespace(transcript="Hello there.", target_level=CEFRLevel.B1, title="t")}
+    return service._summarize_level_test(db=db, tests=tests, scripts=scripts, current_profile=profile)
+
+
+_LLM_RESPONSE = json.dumps({"level": "B1", "level_score": 50, "llm_confidence": 60, "rationale": "ok"})
+
+
+def test_identical_prompts_hit_the_memory_cache():
+    client = FakeLLMClient(_LLM_RESPONSE)
+    cache = EvaluationCache()
+    service = LevelManagementService(llm_client=client, evaluation_cache=cache)
+
+    first = _summarize_sync(service, profile={"context": "initial_level_assessment", "level_updated_at": "t1"})
+    second = _summarize_sync(service, profile={"context": "initial_level_assessment", "level_updated_at": "t2"})
+    _summarize_sync(service, understanding=20)
+
+    assert client.calls == 2  # 시각 필드는 키에서 제외, 이해도가 다르면 miss
+    assert first == second
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_db_tier_is_shared_between_processes(sqlite_session):
+    client = FakeLLMClient(_LLM_RESPONSE)
+    writer = LevelManagementService(llm_client=client, evaluation_cache=EvaluationCache())
+    _summarize_sync(writer, sqlite_session)
+    sqlite_session.commit()
+
+    reader_cache = EvaluationCache()  # 다른 워커: 메모리 tier는 비어 있음
+    reader = LevelManagementService(llm_client=client, evaluation_cache=reader_cache)
+    result = _summarize_sync(reader, sqlite_session)
+
+    assert result.llm_success
+    assert client.calls == 1
+    assert reader_cache.stats()["db_hits"] == 1
+
+
+def test_cache_version_change_invalidates_entries(sqlite_session, monkeypatch):
+    from app.modules.level_management import evaluation_cache
+
+    client = FakeLLMClient(_LLM_RESPONSE)
+    _summarize_sync(LevelManagementService(llm_client=client, evaluation_cache=EvaluationCache()), sqlite_session)
+    sqlite_session.commit()
+
+    monkeypatch.setattr(evaluation_cache.settings, "level_eval_cache_version", "2")
+    _summarize_sync(LevelManagementService(llm_client=client, evaluation_cache=EvaluationCache()), sqlite_session)
+    sqlite_session.commit()
+    assert client.calls == 2
+
+    from datetime import datetime
+    from app.modules.level_management import crud
+
+    assert crud.delete_stale_evaluations(sqlite_session, version_prefix="2:", now=datetime.utcnow()) == 1
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from app.modules.level_management import prompt_compaction, schemas
+from app.modules.level_management.evaluation_cache import EvaluationCache
+from app.modules.level_management.models import CEFRLevel
+from app.modules.level_management.service import LevelManagementService
+
+_LONG_SCRIPT = "\n".join(
+    f"In chapter {i}, the committee examined how sustainable infrastructure investment affects regional economies."
+    for i in range(120)
+)
+
+
+class RecordingLLMClient:
+    def __init__(self):
+        self.calls = []
+
+    def generate_json(self, **kwargs):
+        self.calls.append(kwargs)
+        return json.dumps({"level": "B2", "level_score": 65, "llm_confidence": 60, "rationale": "ok"})
+
+
+def test_estimate_tokens_counts_words_and_symbols():
+    assert prompt_compaction.estimate_tokens("Hello, world!") == 4
+    assert prompt_compaction.estimate_tokens("internationalization") > 1
+
+
+def test_excerpt_truncates_to_word_limit():
+    assert prompt_compaction.excerpt("a b c d", 2) == "a b …"
+    assert prompt_compaction.excerpt("a b", 5) == "a b"
+    assert prompt_compaction.excerpt("a b", 0) == ""
+
+
+def test_features_prefer_stored_content_analysis():
+    analysis = SimpleNamespace(
+        word_count=300,
+        sentence_count=20,
+        avg_sentence_length=15.0,
+        content_word_count=150,
+        cefr_distribution={"A1": 100, "B2": 50, "C2": 0},
+        words_per_minute=142.0,
+    )
+    features = prompt_compaction.script_features(SimpleNamespace(analysis=analysis), "ignored")
+
+    assert features["words_per_minute"] == 142.0
+    assert features["cefr_distribution"] == {"A1": 100, "B2": 50}
+
+
+def test_fit_to_budget_shortens_excerpts():
+    entries = [{"id": i} for i in range(3)]
+    transcripts = [_LONG_SCRIPT] * 3
+    render = lambda items: prompt_compaction.compact_json(items)
+
+    generous, _ = prompt_compaction.fit_to_budget([dict(e) for e in entries], transcripts, render, budget=10_000)
+    tight, tokens = prompt_compaction.fit_to_budget([dict(e) for e in entries], transcripts, render, budget=120)
+
+    assert "excerpt" in json.loads(generous)[0]
+    assert len(tight) < len(generous)
+    assert tokens <= 120
+
+
+def test_session_feedback_prompt_omits_full_transcript():
+    client = RecordingLLMClient()
+    service = LevelManagementService(llm_client=client, evaluation_cache=EvaluationCache(ttl_seconds=0))
+    scripts = {
+        str(i): SimpleNamespace(transcript=_LONG_SCRIPT, target_level=CEFRLevel.B1, title="Economy")
+        for i in range(1, 6)
+    }
+    tests = [schemas.LevelTestItem(generated_content_id=i, understanding=70) for i in range(1, 6)]
+
+    service._summarize_level_test(tests=tests, scripts=scripts, default_target_level=CEFRLevel.B1)
+    prompt = client.calls[0]["user_prompt"]
+
+    # 전체 transcript 5개를 그대로 넣던 이전 방식보다 수 배 작아야 한다
+    assert prompt_compaction.estimate_tokens(prompt) * 4 < prompt_compaction.estimate_tokens(_LONG_SCRIPT) * 5
+    assert _LONG_SCRIPT not in prompt
+    assert '"avg_sentence_length"' in prompt
+    assert '"title":"Economy"' in prompt
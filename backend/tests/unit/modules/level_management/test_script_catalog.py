@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core import auth
+from app.core.exceptions import InvalidAdminKeyException
+from app.modules.level_management import crud, schemas, script_catalog
+from app.modules.level_management.models import CEFRLevel, LevelTestScript
+from app.modules.level_management.service import LevelManagementService
+
+
+@pytest.fixture(autouse=True)
+def empty_catalog():
+    script_catalog.reset_catalog()
+    yield
+    script_catalog.reset_catalog()
+
+
+def _seed(db, *rows):
+    for script_id, level, transcript in rows:
+        db.add(LevelTestScript(id=script_id, target_level=level, transcript=transcript))
+    db.commit()
+
+
+def test_compute_features_counts_sentences_and_words():
+    features = script_catalog.compute_features("I like the cat. It is big!\nWe walk home.")
+
+    assert features.sentence_count == 3
+    assert features.word_count == 10
+    assert features.avg_sentence_length == round(10 / 3, 2)
+    assert sum(dict(features.cefr_distribution).values()) == features.content_word_count
+
+
+def test_level_test_reads_scripts_from_the_catalog(sqlite_session, monkeypatch):
+    _seed(sqlite_session, ("a1", CEFRLevel.A1, "Hello there."), ("b2", CEFRLevel.B2, "Markets fluctuate."))
+    catalog, changed = script_catalog.load_catalog(sqlite_session)
+    assert changed and len(catalog) == 2
+
+    def fail_db_read(*args, **kwargs):
+        raise AssertionError("catalog hit must not query the DB")
+
+    monkeypatch.setattr(crud, "get_scripts_by_ids", fail_db_read)
+    payload = schemas.LevelTestRequest(tests=[schemas.LevelTestItem(script_id="b2", understanding=50)])
+    scripts = LevelManagementService()._load_level_test_scripts(sqlite_session, payload)
+
+    assert scripts["b2"].target_level == CEFRLevel.B2
+    assert scripts["b2"].features.word_count == 2
+
+
+def test_scripts_added_after_load_fall_back_to_the_db(sqlite_session):
+    _seed(sqlite_session, ("a1", CEFRLevel.A1, "Hello there."))
+    script_catalog.load_catalog(sqlite_session)
+    _seed(sqlite_session, ("c1", CEFRLevel.C1, "Nuanced argument."))
+
+    payload = schemas.LevelTestRequest(
+        tests=[
+            schemas.LevelTestItem(script_id="a1", understanding=90),
+            schemas.LevelTestItem(script_id="c1", understanding=30),
+        ]
+    )
+    scripts = LevelManagementService()._load_level_test_scripts(sqlite_session, payload)
+    assert set(scripts) == {"a1", "c1"}
+
+
+def test_reload_swaps_only_when_content_changes(sqlite_session):
+    _seed(sqlite_session, ("a1", CEFRLevel.A1, "Hello there."))
+    first, _ = script_catalog.load_catalog(sqlite_session)
+
+    same, changed = script_catalog.load_catalog(sqlite_session)
+    assert not changed and same is first
+
+    sqlite_session.get(LevelTestScript, "a1").transcript = "Hello again."
+    sqlite_session.commit()
+    updated, changed = script_catalog.load_catalog(sqlite_session)
+    assert changed and updated.version != first.version
+    assert script_catalog.get_catalog() is updated
+
+
+def test_admin_key_is_required(monkeypatch):
+    monkeypatch.setattr(auth.settings, "admin_api_key", None)
+    with pytest.raises(InvalidAdminKeyException):
+        auth.verify_admin_key("anything")
+
+    monkeypatch.setattr(auth.settings, "admin_api_key", "secret")
+    with pytest.raises(InvalidAdminKeyException):
+        auth.verify_admin_key("wrong")
+    auth.verify_admin_key("secret")
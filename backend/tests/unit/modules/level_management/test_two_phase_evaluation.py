@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.llm import LLMServiceError
+from app.modules.level_management import schemas
+from app.modules.level_management import service as service_module
+from app.modules.level_management.evaluation_cache import EvaluationCache
+from app.modules.level_management.models import CEFRLevel, LevelTestScript, UserLevelHistory
+from app.modules.level_management.service import LevelEvaluationNotFoundException, LevelManagementService
+
+
+class FakeAsyncLLMClient:
+    def __init__(self, *, response=None, error=None):
+        self.response = response
+        self.error = error
+
+    async def generate_json(self, **kwargs):
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+@pytest.fixture
+def user(sqlite_session):
+    from app.modules.users import crud as user_crud
+
+    sqlite_session.add(LevelTestScript(id="s1", transcript="The weather is nice today.", target_level=CEFRLevel.B1))
+    sqlite_session.commit()
+    return user_crud.create_user(sqlite_session, username="two_phase_user", hashed_password="pw")
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    # in-memory SQLite는 스레드마다 다른 DB이므로 threadpool 대신 바로 실행
+    async def inline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    jobs = []
+    monkeypatch.setattr(service_module, "run_in_threadpool", inline)
+    monkeypatch.setattr(service_module.task_supervisor, "submit", lambda key, factory, **kw: jobs.append(factory) or True)
+    return jobs
+
+
+def _service(sqlite_session, client):
+    # 백그라운드 작업용 세션: 같은 in-memory DB 연결을 공유하는 별도 Session
+    return LevelManagementService(
+        async_llm_client=client,
+        evaluation_cache=EvaluationCache(ttl_seconds=0),
+        session_factory=lambda: Session(bind=sqlite_session.connection()),
+    )
+
+
+def _start(service, db, user):
+    payload = schemas.LevelTestRequest(tests=[schemas.LevelTestItem(script_id="s1", understanding=90)])
+    return asyncio.run(service.evaluate_initial_level_two_phase(db=db, user=user, payload=payload))
+
+
+_B2 = json.dumps({"level": "B2", "level_score": 70, "llm_confidence": 80, "rationale": "refined"})
+
+
+def test_provisional_answer_then_background_refinement(sqlite_session, user, submitted):
+    service = _service(sqlite_session, FakeAsyncLLMClient(response=_B2))
+
+    response = _start(service, sqlite_session, user)
+    assert response.provisional and response.evaluation_id is not None
+    assert len(submitted) == 1
+
+    pending = service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id)
+    assert pending.status == "pending" and pending.result is None
+
+    asyncio.run(submitted[0]())
+    done = service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id)
+    assert done.status == "refined"
+    assert done.result.level == CEFRLevel.B2
+    sqlite_session.refresh(user)
+    assert user.level.value == "B2"
+    assert sqlite_session.query(UserLevelHistory).filter_by(user_id=user.id).count() == 2
+
+
+def test_refinement_does_not_override_a_newer_level(sqlite_session, user, submitted):
+    service = _service(sqlite_session, FakeAsyncLLMClient(response=_B2))
+    response = _start(service, sqlite_session, user)
+
+    service.set_manual_level(db=sqlite_session, user=user, payload=schemas.ManualLevelUpdateRequest(level=CEFRLevel.A2))
+    asyncio.run(submitted[0]())
+
+    status = service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id)
+    assert status.status == "superseded"
+    sqlite_session.refresh(user)
+    assert user.level.value == "A2"
+
+
+def test_llm_failure_keeps_the_provisional_level(sqlite_session, user, submitted):
+    service = _service(sqlite_session, FakeAsyncLLMClient(error=LLMServiceError("down")))
+    response = _start(service, sqlite_session, user)
+    asyncio.run(submitted[0]())
+
+    status = service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id)
+    assert status.status == "failed"
+    sqlite_session.refresh(user)
+    assert user.level.value == response.level.value
+
+
+def test_other_users_cannot_poll_an_evaluation(sqlite_session, user, submitted):
+    from types import SimpleNamespace
+
+    service = _service(sqlite_session, FakeAsyncLLMClient(response=_B2))
+    response = _start(service, sqlite_session, user)
+
+    with pytest.raises(LevelEvaluationNotFoundException):
+        service.get_evaluation_status(db=sqlite_session, user=SimpleNamespace(id=user.id + 1), evaluation_id=response.evaluation_id)
+
+
+def test_unscheduled_refinement_is_marked_failed(monkeypatch, sqlite_session, user, submitted):
+    # supervisor가 종료 중이면 submit이 False를 돌려준다
+    monkeypatch.setattr(service_module.task_supervisor, "submit", lambda *args, **kwargs: False)
+    service = _service(sqlite_session, FakeAsyncLLMClient(response=_B2))
+    response = _start(service, sqlite_session, user)
+
+    status = service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id)
+    assert status.status == "failed"
+    sqlite_session.refresh(user)
+    assert user.level.value == response.level.value
+
+
+class HangingAsyncLLMClient:
+    async def generate_json(self, **kwargs):
+        await asyncio.Event().wait()
+
+
+def test_cancelled_refinement_is_marked_failed(sqlite_session, user, submitted):
+    service = _service(sqlite_session, HangingAsyncLLMClient())
+    response = _start(service, sqlite_session, user)
+
+    async def run_with_timeout():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(submitted[0](), 0.05)
+
+    asyncio.run(run_with_timeout())
+    status = service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id)
+    assert status.status == "failed"
+
+
+def test_startup_fails_stale_pending_jobs(monkeypatch, sqlite_session, user, submitted):
+    service = _service(sqlite_session, FakeAsyncLLMClient(response=_B2))
+    response = _start(service, sqlite_session, user)
+
+    monkeypatch.setattr(service_module, "SessionLocal", lambda: Session(bind=sqlite_session.connection()))
+    service_module.fail_stale_evaluation_jobs_at_startup()
+
+    status = service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id)
+    assert status.status == "failed"
+    # 재시작 전의 작업이 뒤늦게 실행돼도 결과를 덮어쓰지 않는다
+    asyncio.run(submitted[0]())
+    assert service.get_evaluation_status(db=sqlite_session, user=user, evaluation_id=response.evaluation_id).status == "failed"
@@ -0,0 +1,251 @@
+import json
+
+import numpy as np
+import pytest
+
+from backend.app.modules.level_system import crud as level_crud
+from backend.app.modules.level_system import schemas
+from backend.app.modules.level_system.engine import (
+    EventArrays,
+    LevelParameters,
+    compute_deltas,
+    replay,
+)
+from backend.app.modules.level_system.models import (
+    EVENT_BASELINE,
+    EVENT_FEEDBACK,
+    EVENT_REPLAY,
+    LevelFeedbackEvent,
+)
+from backend.app.modules.level_system import replay as replay_module
+from backend.app.modules.level_system.replay import current_parameters, run_replay, same_update_rule
+from backend.app.modules.level_system.service import (
+    DEFAULT_CLIP_RANGES,
+    DEFAULT_WEIGHT_MATRIX,
+    LevelSystemService,
+)
+from backend.app.modules.level_system.utils import _compute_levels_delta_from_weights
+
+
+def _sequential_replay(events, params_values):
+    """참조 구현: 이벤트를 하나씩 순서대로 적용"""
+    W, clip = params_values
+    levels = {}
+    for user_id, reset, vector, reset_levels in events:
+        if reset:
+            levels[user_id] = list(reset_levels)
+            continue
+        deltas = _compute_levels_delta_from_weights(vector, W, clip)
+        current = levels.get(user_id, [0.0, 0.0, 0.0])
+        levels[user_id] = [round(min(300.0, max(0.0, c + d)), 1) for c, d in zip(current, deltas)]
+    return levels
+
+
+class TestLevelEngine:
+    def test_compute_deltas_matches_scalar_rule(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.uniform(-1, 1, size=(50, 6))
+        params = LevelParameters.from_values(DEFAULT_WEIGHT_MATRIX, DEFAULT_CLIP_RANGES)
+
+        deltas = compute_deltas(vectors, params)
+
+        for vector, row in zip(vectors, deltas):
+            expected = _compute_levels_delta_from_weights(list(vector), DEFAULT_WEIGHT_MATRIX, DEFAULT_CLIP_RANGES)
+            assert row == pytest.approx(expected)
+
+    def test_replay_matches_sequential_application(self):
+        rng = np.random.default_rng(1)
+        events = []
+        for user_id in range(20):
+            events.append((user_id, True, [0.0] * 6, [float(rng.integers(0, 300))] * 3))
+            for _ in range(int(rng.integers(0, 30))):
+                if rng.random() < 0.05:
+                    events.append((user_id, True, [0.0] * 6, [295.0, 5.0, 150.0]))
+                else:
+                    events.append((user_id, False, list(rng.uniform(-1, 1, 6)), [0.0] * 3))
+
+        params = LevelParameters.from_values(DEFAULT_WEIGHT_MATRIX, DEFAULT_CLIP_RANGES)
+        final, trajectory = replay(
+            np.array([e[0] for e in events]),
+            np.array([e[1] for e in events]),
+            np.array([e[2] for e in events]),
+            np.array([e[3] for e in events]),
+            params,
+            n_users=20,
+        )
+
+        expected = _sequential_replay(events, (DEFAULT_WEIGHT_MATRIX, DEFAULT_CLIP_RANGES))
+        for user_id, levels in expected.items():
+            assert final[user_id] == pytest.approx(levels)
+        assert trajectory.shape == (len(events), 3)
+        assert np.all((final >= 0) & (final <= 300))
+
+    def test_replay_rejects_unsorted_events(self):
+        params = LevelParameters.from_values(DEFAULT_WEIGHT_MATRIX)
+        with pytest.raises(ValueError):
+            replay(np.array([1, 0]), np.zeros(2, bool), np.zeros((2, 6)), np.zeros((2, 3)), params, n_users=2)
+
+    def test_event_arrays_from_rows(self):
+        rows = [
+            (1, 7, EVENT_BASELINE, None, 10, 20, 30),
+            (4, 7, EVENT_FEEDBACK, [0.1] * 6, 11, 20, 30),
+            (2, 9, EVENT_BASELINE, None, 50, 50, 50),
+        ]
+        arrays = EventArrays.from_rows(rows)
+
+        assert arrays.user_ids.tolist() == [7, 9]
+        assert arrays.user_index.tolist() == [0, 0, 1]
+        assert arrays.is_reset.tolist() == [True, False, True]
+        assert arrays.vectors[0].tolist() == [0.0] * 6
+
+    def test_parameters_from_json_file(self, tmp_path):
+        path = tmp_path / "weights.json"
+        path.write_text(json.dumps({"weight_matrix": DEFAULT_WEIGHT_MATRIX, "clip_ranges": {"lexical": [-1, 1]}}))
+
+        params = LevelParameters.from_json_file(str(path))
+
+        assert params.weight_matrix.shape == (6, 3)
+        lower, upper = params.clip_bounds()
+        assert lower[0] == -1 and upper[0] == 1 and np.isinf(upper[1])
+
+    def test_parameters_reject_bad_shape(self):
+        with pytest.raises(ValueError):
+            LevelParameters.from_values([[1, 2, 3]])
+
+
+class TestLevelEventLogReplay:
+    @staticmethod
+    def _seed(session, username="replay_user", levels=(100.0, 100.0, 100.0)):
+        from backend.app.modules.audio.model import ContentAnalysis, GeneratedContent
+        from backend.app.modules.users import crud as user_crud
+
+        user = user_crud.create_user(session, username=username, hashed_password="pw")
+        user.lexical_level, user.syntactic_level, user.speed_level = levels
+        content = GeneratedContent(user_id=user.id, title="t", script_data="word " * 100)
+        session.add(content)
+        session.flush()
+        session.add(
+            ContentAnalysis(
+                generated_content_id=content.generated_content_id,
+                word_count=100,
+                sentence_count=10,
+                avg_sentence_length=10.0,
+                content_word_count=50,
+                cefr_distribution={},
+            )
+        )
+        session.commit()
+        return user, content.generated_content_id
+
+    @staticmethod
+    def _feedback(content_id, understanding=3):
+        return schemas.SessionFeedbackRequest(
+            generated_content_id=content_id,
+            pause_cnt=1,
+            rewind_cnt=0,
+            vocab_lookup_cnt=2,
+            vocab_save_cnt=1,
+            understanding_difficulty=understanding,
+            speed_difficulty=3,
+        )
+
+    def test_feedback_writes_baseline_and_events(self, sqlite_session):
+        user, content_id = self._seed(sqlite_session)
+        service = LevelSystemService()
+
+        service.evaluate_session_feedback(sqlite_session, user, self._feedback(content_id))
+        result = service.evaluate_session_feedback(sqlite_session, user, self._feedback(content_id, 4))
+
+        events = sqlite_session.query(LevelFeedbackEvent).order_by(LevelFeedbackEvent.id).all()
+        assert [e.event_type for e in events] == [EVENT_BASELINE, EVENT_FEEDBACK, EVENT_FEEDBACK]
+        assert float(events[0].lexical_level) == 100.0
+        assert len(events[1].vector) == 6
+        assert float(events[-1].lexical_level) == pytest.approx(result["lexical_level"])
+
+    def test_baseline_is_written_once_under_the_row_lock(self, sqlite_session):
+        from sqlalchemy import event
+
+        user, _ = self._seed(sqlite_session)
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(context.compiled.statement if context.compiled is not None else None)
+
+        engine = sqlite_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            assert level_crud.ensure_baseline_event(sqlite_session, user_id=user.id) == (100.0, 100.0, 100.0)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        # 사용자 행을 잠그고 읽는다 (SQLite는 FOR UPDATE를 생략하지만 구문에는 남는다)
+        locked = [s for s in statements if getattr(s, "_for_update_arg", None) is not None]
+        assert len(locked) == 1
+        level_crud.ensure_baseline_event(sqlite_session, user_id=user.id)
+        sqlite_session.commit()
+
+        events = sqlite_session.query(LevelFeedbackEvent).filter_by(user_id=user.id).all()
+        assert [e.event_type for e in events] == [EVENT_BASELINE]
+        assert level_crud.ensure_baseline_event(sqlite_session, user_id=user.id + 999) is None
+
+    def test_replay_with_current_parameters_reproduces_levels(self, sqlite_session):
+        user, content_id = self._seed(sqlite_session)
+        service = LevelSystemService()
+        for understanding in (1, 2, 3, 4, 4):
+            service.evaluate_session_feedback(sqlite_session, user, self._feedback(content_id, understanding))
+
+        report = run_replay(sqlite_session, current_parameters())
+
+        assert report.users == 1
+        assert report.events == 6
+        assert report.changed_users == 0
+        assert report.applied is False
+
+    def test_replay_apply_rewrites_levels(self, sqlite_session):
+        user, content_id = self._seed(sqlite_session)
+        service = LevelSystemService()
+        for _ in range(3):
+            service.evaluate_session_feedback(sqlite_session, user, self._feedback(content_id, 4))
+        before = level_crud.get_user_levels(sqlite_session, user_ids=[user.id])[user.id]
+
+        def snapshot():
+            rows = sqlite_session.query(LevelFeedbackEvent).order_by(LevelFeedbackEvent.id).all()
+            return [(e.id, e.event_type, float(e.lexical_level), float(e.speed_level)) for e in rows]
+
+        logged = snapshot()
+        doubled = current_parameters()
+        params = type(doubled).from_values(doubled.weight_matrix * 2, DEFAULT_CLIP_RANGES)
+        dry_run = run_replay(sqlite_session, params)
+        assert level_crud.get_user_levels(sqlite_session, user_ids=[user.id])[user.id] == before
+
+        report = run_replay(sqlite_session, params, apply=True)
+
+        after = level_crud.get_user_levels(sqlite_session, user_ids=[user.id])[user.id]
+        assert report.applied is True
+        assert report.changed_users == dry_run.changed_users == 1
+        assert after != before
+        # 기존 이벤트는 그대로 두고 replay 이벤트만 덧붙인다
+        sqlite_session.expire_all()
+        appended = snapshot()
+        assert appended[: len(logged)] == logged
+        assert [row[1] for row in appended[len(logged):]] == [EVENT_REPLAY]
+        assert appended[-1][2] == pytest.approx(after[0])
+        # 적용 후 다시 돌리면 변화 없음
+        assert run_replay(sqlite_session, params).changed_users == 0
+
+    def test_apply_refuses_weights_the_service_does_not_load(self, tmp_path, monkeypatch):
+        from backend.app.modules.level_system import service as level_service
+
+        monkeypatch.setattr(level_service.settings, "level_weights_path", None)
+        active = current_parameters()
+        doubled = type(active).from_values(active.weight_matrix * 2, DEFAULT_CLIP_RANGES, "v2")
+        assert same_update_rule(active, type(active).from_values(active.weight_matrix, DEFAULT_CLIP_RANGES, "copy"))
+        assert not same_update_rule(active, doubled)
+        # clip 범위가 빠진 설정도 서비스(기본 clip 적용)와 다르게 움직인다
+        assert not same_update_rule(active, type(active).from_values(active.weight_matrix, None))
+
+        path = tmp_path / "v2.json"
+        path.write_text(json.dumps({"weight_matrix": doubled.weight_matrix.tolist(), "version": "v2"}))
+        monkeypatch.setattr("backend.app.core.config.SessionLocal", lambda: pytest.fail("must not touch the DB"))
+        with pytest.raises(SystemExit) as exc:
+            replay_module.main(["--weights", str(path), "--apply"])
+        assert exc.value.code == 2
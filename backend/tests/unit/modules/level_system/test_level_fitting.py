@@ -0,0 +1,170 @@
+import json
+
+import numpy as np
+import pytest
+
+from backend.app.modules.level_system import service as level_service
+from backend.app.modules.level_system.engine import LevelParameters
+from backend.app.modules.level_system.fitting import (
+    FEATURES,
+    RidgeAccumulator,
+    accumulate_samples,
+    fit_from_accumulator,
+    fit_weights,
+    iter_training_samples,
+    write_weight_config,
+)
+from backend.app.modules.level_system.models import EVENT_BASELINE, EVENT_FEEDBACK, EVENT_LEVEL_TEST, EVENT_RESET
+from backend.app.modules.level_system.service import DEFAULT_CLIP_RANGES, DEFAULT_WEIGHT_MATRIX
+
+
+@pytest.fixture
+def restore_weights():
+    saved = dict(level_service._active_weights)
+    yield
+    level_service._active_weights.clear()
+    level_service._active_weights.update(saved)
+
+
+def _prior():
+    return LevelParameters.from_values(DEFAULT_WEIGHT_MATRIX, DEFAULT_CLIP_RANGES)
+
+
+def _synthetic_samples(W_true, n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-3, 3, size=(n, 6))
+    Y = X @ W_true
+    return [(X[i], Y[i], 3) for i in range(n)]
+
+
+class TestTrainingSamples:
+    def test_intervals_end_at_level_tests(self):
+        rows = [
+            (1, 1, EVENT_BASELINE, None, 100, 100, 100),
+            (2, 1, EVENT_FEEDBACK, [1, 0, 0, 0, 0, 0], 0, 0, 0),
+            (3, 1, EVENT_FEEDBACK, [1, 0, 0, 0, 1, 0], 0, 0, 0),
+            (4, 1, EVENT_LEVEL_TEST, None, 110, 105, 100),
+            (5, 1, EVENT_RESET, None, 50, 50, 50),  # 수동 설정: 정답 아님, 새 anchor
+            (6, 1, EVENT_FEEDBACK, [0, 1, 0, 0, 0, 0], 0, 0, 0),
+            (7, 1, EVENT_LEVEL_TEST, None, 48, 49, 50),
+            (8, 2, EVENT_FEEDBACK, [0, 0, 1, 0, 0, 0], 0, 0, 0),  # anchor 없음
+            (9, 2, EVENT_LEVEL_TEST, None, 10, 10, 10),
+            (10, 2, EVENT_LEVEL_TEST, None, 20, 20, 20),  # 사이에 피드백 없음
+        ]
+
+        samples = list(iter_training_samples(rows))
+
+        assert len(samples) == 2
+        x, y, n = samples[0]
+        assert x.tolist() == [2, 0, 0, 0, 1, 0]
+        assert y.tolist() == [10, 5, 0]
+        assert n == 2
+        assert samples[1][1].tolist() == [-2, -1, 0]
+
+
+class TestRidgeFit:
+    def test_recovers_true_weights(self):
+        W_true = np.array(DEFAULT_WEIGHT_MATRIX) * 1.5
+        acc = accumulate_samples(_synthetic_samples(W_true), chunk_size=64)
+
+        result = fit_from_accumulator(acc, _prior(), alpha=1e-6)
+
+        assert result.n_samples == 500
+        assert result.n_feedback == 1500
+        np.testing.assert_allclose(result.weight_matrix, W_true, atol=1e-3)
+        assert all(v == pytest.approx(0, abs=1e-3) for v in result.rmse.values())
+        assert result.r2["lexical"] == pytest.approx(1.0)
+        assert result.baseline_rmse["lexical"] > 0
+
+    def test_statistics_match_direct_computation(self):
+        rng = np.random.default_rng(3)
+        X = rng.normal(size=(100, 6))
+        Y = rng.normal(size=(100, 3))
+        acc = RidgeAccumulator()
+        acc.add(X[:40], Y[:40])
+        acc.add(X[40:], Y[40:])
+        W = rng.normal(size=(6, 3))
+
+        np.testing.assert_allclose(acc.sse(W), ((X @ W - Y) ** 2).sum(axis=0))
+
+    def test_strong_regularization_keeps_prior(self):
+        acc = accumulate_samples(_synthetic_samples(np.zeros((6, 3))))
+
+        result = fit_from_accumulator(acc, _prior(), alpha=1e9)
+
+        np.testing.assert_allclose(result.weight_matrix, DEFAULT_WEIGHT_MATRIX, atol=1e-3)
+
+    def test_sensitivity_reports_every_feature(self):
+        W_true = np.array(DEFAULT_WEIGHT_MATRIX)
+        acc = accumulate_samples(_synthetic_samples(W_true))
+
+        result = fit_from_accumulator(acc, _prior(), alpha=1e-6)
+
+        assert set(result.sensitivity) == set(FEATURES)
+        # understanding은 세 차원 모두에 영향, vocab_save는 lexical에만 영향
+        assert result.sensitivity["understanding"]["syntactic"] > 0
+        assert result.sensitivity["vocab_save"]["speed"] == pytest.approx(0, abs=1e-6)
+
+    def test_no_samples_returns_prior(self):
+        result = fit_from_accumulator(RidgeAccumulator(), _prior(), alpha=1.0)
+
+        np.testing.assert_allclose(result.weight_matrix, DEFAULT_WEIGHT_MATRIX)
+        assert result.n_samples == 0
+
+
+class TestWeightConfig:
+    def test_written_config_is_loaded_by_service(self, tmp_path, restore_weights):
+        W_true = np.array(DEFAULT_WEIGHT_MATRIX) * 2
+        result = fit_from_accumulator(accumulate_samples(_synthetic_samples(W_true)), _prior(), alpha=1e-6)
+
+        path = write_weight_config(str(tmp_path), result, _prior(), version="v2")
+
+        data = json.loads(open(path).read())
+        assert data["version"] == "v2"
+        assert data["previous_version"] == "default"
+        assert data["fit"]["n_samples"] == 500
+
+        assert level_service.load_weight_config(path) == "v2"
+        weight_matrix, clip_ranges, version = level_service.get_active_weights()
+        assert version == "v2"
+        np.testing.assert_allclose(weight_matrix, W_true, atol=1e-3)
+        assert clip_ranges["lexical"] == (-8.0, 8.0)
+
+        with pytest.raises(FileExistsError):
+            write_weight_config(str(tmp_path), result, _prior(), version="v2")
+
+    def test_invalid_config_keeps_current_weights(self, tmp_path, restore_weights):
+        path = tmp_path / "bad.json"
+        path.write_text(json.dumps({"weight_matrix": [[1, 2]]}))
+
+        assert level_service.load_weight_config(str(path)) == "default"
+        assert level_service.get_active_weights()[0] == DEFAULT_WEIGHT_MATRIX
+
+    def test_fit_weights_streams_event_log(self, sqlite_session):
+        from backend.app.modules.level_system import crud as level_crud
+        from backend.app.modules.users import crud as user_crud
+
+        W_true = np.array(DEFAULT_WEIGHT_MATRIX) * 0.5
+        rng = np.random.default_rng(7)
+        for u in range(5):
+            user = user_crud.create_user(sqlite_session, username=f"fit_{u}", hashed_password="pw")
+            levels = np.array([100.0, 100.0, 100.0])
+            level_crud.add_reset_event(sqlite_session, user_id=user.id, levels=tuple(levels), event_type=EVENT_LEVEL_TEST)
+            for _ in range(4):
+                vectors = rng.uniform(-1, 1, size=(3, 6))
+                for vector in vectors:
+                    level_crud.add_feedback_event(
+                        sqlite_session, user_id=user.id, generated_content_id=None, vector=vector.tolist(), levels=(0, 0, 0)
+                    )
+                levels = levels + vectors.sum(axis=0) @ W_true
+                level_crud.add_reset_event(
+                    sqlite_session, user_id=user.id, levels=tuple(np.round(levels, 1)), event_type=EVENT_LEVEL_TEST
+                )
+        sqlite_session.commit()
+
+        result = fit_weights(sqlite_session, _prior(), alpha=1e-3, chunk_size=3)
+
+        assert result.n_samples == 20
+        assert result.n_feedback == 60
+        assert max(result.rmse.values()) < 0.2
+        assert max(result.rmse.values()) < min(result.baseline_rmse.values())
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.app.modules.level_system import crud as level_crud
+from backend.app.modules.level_system.models import LevelFeedbackEvent
+from backend.app.modules.level_system.service import LevelSystemService
+
+
+@pytest.fixture
+def user(sqlite_session):
+    from backend.app.modules.users import crud as user_crud
+
+    return user_crud.create_user(sqlite_session, username="history_user", hashed_password="pw")
+
+
+def _add_daily_events(session, user_id, days, start=datetime(2025, 1, 1)):
+    for day in range(days):
+        level = 50 + (day % 30)
+        session.add(
+            LevelFeedbackEvent(
+                user_id=user_id,
+                event_type="feedback",
+                vector=[0.0] * 6,
+                lexical_level=level,
+                syntactic_level=level + 1,
+                speed_level=level + 2,
+                created_at=start + timedelta(days=day),
+            )
+        )
+    session.commit()
+
+
+class TestLevelHistory:
+    def test_feedback_is_recorded_in_history(self, sqlite_session, user):
+        level_crud.add_reset_event(sqlite_session, user_id=user.id, levels=(80.0, 90.0, 100.0))
+        sqlite_session.commit()
+
+        result = LevelSystemService().get_level_history(sqlite_session, user)
+
+        assert result["total_points"] == 1
+        assert result["downsampled"] is False
+        point = result["points"][0]
+        assert (point["lexical_level"], point["syntactic_level"], point["speed_level"]) == (80.0, 90.0, 100.0)
+        assert point["overall_level"] == 90.0
+
+    def test_year_of_daily_updates_is_downsampled(self, sqlite_session, user):
+        _add_daily_events(sqlite_session, user.id, 365)
+
+        result = LevelSystemService().get_level_history(sqlite_session, user, points=100)
+
+        assert result["total_points"] == 365
+        assert result["downsampled"] is True
+        assert len(result["points"]) == 100
+        timestamps = [p["timestamp"] for p in result["points"]]
+        assert timestamps == sorted(timestamps)
+        assert timestamps[0] == datetime(2025, 1, 1)
+        assert timestamps[-1] == datetime(2025, 1, 1) + timedelta(days=364)
+
+    def test_range_filter(self, sqlite_session, user):
+        _add_daily_events(sqlite_session, user.id, 60)
+
+        result = LevelSystemService().get_level_history(
+            sqlite_session,
+            user,
+            start=datetime(2025, 1, 11),
+            end=datetime(2025, 1, 20),
+        )
+
+        assert result["total_points"] == 10
+        assert result["points"][0]["timestamp"] == datetime(2025, 1, 11)
+
+    def test_other_users_are_excluded(self, sqlite_session, user):
+        from backend.app.modules.users import crud as user_crud
+
+        other = user_crud.create_user(sqlite_session, username="other_user", hashed_password="pw")
+        _add_daily_events(sqlite_session, other.id, 5)
+
+        assert LevelSystemService().get_level_history(sqlite_session, user)["points"] == []
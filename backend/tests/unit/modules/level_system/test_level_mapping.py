@@ -0,0 +1,70 @@
+import numpy as np
+
+from backend.app.modules.level_system import utils
+from backend.app.modules.level_system.level_mapping import (
+    CEFRLevel,
+    average_scores_and_levels,
+    cefr_indices_from_scores,
+    cefr_levels_from_scores,
+    get_average_score_and_level,
+    get_cefr_level_from_score,
+    get_speed_from_level_score,
+    speeds_from_level_scores,
+)
+from backend.app.modules.level_system.mapping_benchmark import (
+    _previous_cefr_level,
+    _previous_speed,
+    run_benchmark,
+)
+
+GRID = [round(float(x), 2) for x in np.arange(-10, 310, 0.05)]
+# DECIMAL(4,1)로 저장되는 레벨 값 그대로
+DECIMAL_LEVELS = [float(f"{tenths / 10:.1f}") for tenths in range(0, 3001)]
+
+
+class TestLevelMapping:
+    def test_utils_reexports_mapping(self):
+        assert utils.get_cefr_level_from_score is get_cefr_level_from_score
+        assert utils.CEFRLevel is CEFRLevel
+
+    def test_cefr_matches_previous_implementation(self):
+        assert [get_cefr_level_from_score(s) for s in GRID] == [_previous_cefr_level(s) for s in GRID]
+
+    def test_speed_matches_previous_implementation(self):
+        assert [get_speed_from_level_score(s) for s in GRID] == [_previous_speed(s) for s in GRID]
+
+    def test_cefr_batch_matches_scalar(self):
+        levels = cefr_levels_from_scores(GRID)
+
+        assert levels.tolist() == [get_cefr_level_from_score(s) for s in GRID]
+        assert cefr_indices_from_scores([0, 24.9, 25, 300, 999]).tolist() == [0, 0, 1, 5, 5]
+
+    def test_speed_batch_matches_scalar(self):
+        for scores in (GRID, DECIMAL_LEVELS):
+            assert speeds_from_level_scores(scores).tolist() == [get_speed_from_level_score(s) for s in scores]
+        assert speeds_from_level_scores([195.0, 97.5, 62.5]).tolist() == [1.15, 0.99, 0.93]
+
+    def test_average_batch_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        lexical, syntactic, speed = rng.uniform(0, 300, size=(3, 1000))
+
+        batch = average_scores_and_levels(lexical, syntactic, speed)
+
+        for i in range(1000):
+            scalar = get_average_score_and_level(lexical[i], syntactic[i], speed[i])
+            assert batch["average_score"][i] == scalar["average_score"]
+            assert batch["average_level"][i] == scalar["average_level"]
+
+        # DECIMAL(4,1) 레벨 조합 (x.x5 경계가 자주 나옴)
+        levels = np.array(DECIMAL_LEVELS)
+        lexical, syntactic, speed = levels, levels[::-1], np.roll(levels, 7)
+        batch = average_scores_and_levels(lexical, syntactic, speed)
+        expected = [get_average_score_and_level(*triple) for triple in zip(lexical.tolist(), syntactic.tolist(), speed.tolist())]
+        assert batch["average_score"].tolist() == [item["average_score"] for item in expected]
+        assert batch["average_level"].tolist() == [item["average_level"] for item in expected]
+
+    def test_benchmark_reports_each_implementation(self):
+        results = run_benchmark(2000, repeat=1)
+
+        assert set(results) == {"cefr", "speed"}
+        assert set(results["cefr"]) == {"previous_s", "bisect_s", "numpy_batch_s", "bisect_speedup", "batch_speedup"}
@@ -0,0 +1,31 @@
+from backend.app.modules.level_system import schemas
+from backend.app.modules.level_system.shadow import (
+    level_test_to_llm_request,
+    session_feedback_to_llm_request,
+)
+
+
+class TestLlmShadowAdapters:
+    def test_session_feedback_maps_understanding(self):
+        request = session_feedback_to_llm_request(
+            schemas.SessionFeedbackRequest(generated_content_id=5, understanding_difficulty=3)
+        )
+
+        assert request.tests[0].generated_content_id == 5
+        assert request.tests[0].understanding == 75
+        assert session_feedback_to_llm_request(schemas.SessionFeedbackRequest(understanding_difficulty=3)) is None
+
+    def test_level_test_uses_script_ids_only(self):
+        payload = schemas.LevelTestRequest(
+            level="B1",
+            tests=[{"script_id": f"s{i}", "generated_content_id": i, "understanding": 80} for i in range(1, 3)],
+        )
+
+        request = level_test_to_llm_request(payload)
+
+        assert [t.script_id for t in request.tests] == ["s1", "s2"]
+        assert all(t.generated_content_id is None for t in request.tests)
+        too_many = schemas.LevelTestRequest(
+            level="B1", tests=[{"script_id": "s", "generated_content_id": 1, "understanding": 1}] * 6
+        )
+        assert level_test_to_llm_request(too_many) is None
@@ -0,0 +1,123 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from backend.app.modules.level_system import service as level_service
+from backend.app.modules.level_system.engine import LevelParameters
+from backend.app.modules.level_system.service import DEFAULT_CLIP_RANGES, DEFAULT_WEIGHT_MATRIX
+from backend.app.modules.level_system.simulation import (
+    NoiseModel,
+    PopulationConfig,
+    _vocab_scores,
+    generate_feedback,
+    main,
+    simulate,
+)
+from backend.app.modules.level_system.utils import (
+    LOOKUP_HIGH_THRESHOLD_RATIO,
+    LOOKUP_THRESHOLD_RATIO,
+    SAVE_HIGH_THRESHOLD_RATIO,
+    SAVE_THRESHOLD_RATIO,
+    normalize_vocab_factor,
+)
+
+
+def _params(scale=1.0):
+    return LevelParameters.from_values(np.array(DEFAULT_WEIGHT_MATRIX) * scale, DEFAULT_CLIP_RANGES)
+
+
+class TestFeedbackGeneration:
+    def test_vocab_scores_match_normalize_vocab_factor(self):
+        counts = np.arange(0, 40)
+        lookup = _vocab_scores(counts, 150, LOOKUP_THRESHOLD_RATIO, LOOKUP_HIGH_THRESHOLD_RATIO)
+        save = _vocab_scores(counts, 150, SAVE_THRESHOLD_RATIO, SAVE_HIGH_THRESHOLD_RATIO)
+
+        with patch(
+            "backend.app.modules.level_system.utils.audio_crud.get_or_create_content_analysis",
+            return_value=SimpleNamespace(word_count=150),
+        ):
+            for i, count in enumerate(counts):
+                expected = normalize_vocab_factor(None, 1, int(count), int(count))
+                assert (lookup[i], save[i]) == expected
+
+    def test_easy_content_gives_positive_feedback(self):
+        rng = np.random.default_rng(0)
+        n = 2000
+        true_levels = np.full((n, 3), 200.0)
+
+        too_easy = generate_feedback(true_levels, np.full((n, 3), 100.0), NoiseModel(), rng)
+        too_hard = generate_feedback(true_levels, np.full((n, 3), 290.0), NoiseModel(), rng)
+
+        assert too_easy.shape == (n, 6)
+        assert too_easy[:, 4].mean() > 0 > too_hard[:, 4].mean()  # understanding
+        assert too_easy[:, 2].mean() > too_hard[:, 2].mean()  # vocab lookup
+        assert too_easy[:, 0].mean() < too_hard[:, 0].mean()  # pause
+
+
+class TestSimulate:
+    def test_estimates_converge_toward_true_levels(self):
+        report = simulate(
+            _params(),
+            sessions=80,
+            population=PopulationConfig(n_learners=2000, initial_level=100.0),
+            noise=NoiseModel(ease_noise_sd=0.2),
+            tolerance=25.0,
+            seed=1,
+        )
+
+        assert report.learners == 2000
+        assert report.mean_abs_error_curve[-1] < report.mean_abs_error_curve[0]
+        assert report.converged_ratio > 0.5
+        assert report.convergence_sessions["p50"] >= 1
+        assert set(report.final_abs_error) == {"lexical", "syntactic", "speed"}
+
+    def test_zero_weights_never_move(self):
+        report = simulate(
+            _params(0.0),
+            sessions=5,
+            population=PopulationConfig(n_learners=100, initial_error_sd=0.0),
+            tolerance=1.0,
+        )
+
+        assert report.converged_ratio == 1.0
+        assert report.final_abs_error["lexical"]["p99"] < 0.1
+        assert report.mean_sign_flips["speed"] == 0
+
+    def test_same_seed_is_deterministic(self):
+        kwargs = dict(sessions=20, population=PopulationConfig(n_learners=500), seed=7)
+
+        first = simulate(_params(), **kwargs).as_dict()
+        second = simulate(_params(), **kwargs).as_dict()
+
+        first.pop("elapsed_seconds")
+        second.pop("elapsed_seconds")
+        assert first == second
+
+    def test_larger_steps_oscillate_more(self):
+        kwargs = dict(sessions=60, population=PopulationConfig(n_learners=1000), seed=3)
+
+        small = simulate(_params(0.25), **kwargs)
+        large = simulate(_params(2.0), **kwargs)
+
+        assert large.final_abs_error["lexical"]["mean"] > small.final_abs_error["lexical"]["mean"]
+
+
+class TestMain:
+    @pytest.fixture
+    def restore_weights(self):
+        saved = dict(level_service._active_weights)
+        yield
+        level_service._active_weights.clear()
+        level_service._active_weights.update(saved)
+
+    def test_defaults_to_the_service_weight_config(self, tmp_path, monkeypatch, capsys, restore_weights):
+        path = tmp_path / "level_weights_v3.json"
+        path.write_text(json.dumps({"weight_matrix": (np.array(DEFAULT_WEIGHT_MATRIX) * 0.5).tolist(), "version": "v3"}))
+        monkeypatch.setattr(level_service.settings, "level_weights_path", str(path))
+
+        main(["--learners", "50", "--sessions", "5"])
+
+        assert json.loads(capsys.readouterr().out)["weights_version"] == "v3"
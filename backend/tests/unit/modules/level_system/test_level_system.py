@@ -13,7 +13,7 @@ from backend.app.modules.level_system.utils import (
     _compute_levels_delta_from_weights,
     CEFRLevel,
 )
-from backend.app.modules.level_system.service import LevelSystemService
+from backend.app.modules.level_system.service import LevelSystemService, _deltas_from_vector
 from backend.app.modules.level_system import schemas
 from backend.app.modules.level_system.builders.director import Director
 from backend.app.modules.level_system.builders.normalized_builder import NormalizedInputVectorBuilder
@@ -191,11 +191,9 @@ class TestNormalizationFunctions:
 
     def test_normalize_vocab_factor(self):
         """단어 조회/저장 정규화 테스트"""
-        # Mock DB와 GeneratedContent 생성
+        # Mock DB와 미리 계산된 content_analysis
         mock_db = MagicMock()
-        mock_content = MagicMock()
-        mock_content.script_data = "word " * 100  # 100 단어
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_content
+        mock_db.get.return_value = SimpleNamespace(word_count=100)  # 100 단어
         
         # 단어 조회가 없는 경우
         lookup, save = normalize_vocab_factor(mock_db, 1, 0, 0)
@@ -210,6 +208,24 @@ class TestNormalizationFunctions:
         lookup, save = normalize_vocab_factor(mock_db, 1, 20, 0)
         assert lookup == -1.0
 
+    def test_normalize_vocab_factor_backfills_legacy_content(self, sqlite_session):
+        """분석이 없는 과거 콘텐츠는 script_data로 한 번 계산해 저장"""
+        from backend.app.modules.audio.model import ContentAnalysis, GeneratedContent
+        from backend.app.modules.users import crud as user_crud
+
+        user = user_crud.create_user(sqlite_session, username="legacy", hashed_password="pw")
+        content = GeneratedContent(user_id=user.id, title="t", script_data="word " * 100)
+        sqlite_session.add(content)
+        sqlite_session.commit()
+
+        lookup, _ = normalize_vocab_factor(sqlite_session, content.generated_content_id, 5, 0)
+        assert lookup == 0.5
+        stored = sqlite_session.get(ContentAnalysis, content.generated_content_id)
+        assert stored.word_count == 100
+
+        with pytest.raises(ValueError):
+            normalize_vocab_factor(sqlite_session, 9999, 0, 0)
+
 
 class TestComputeLevelsDelta:
     """레벨 변화량 계산 함수 테스트"""
@@ -282,9 +298,8 @@ class TestDirectorAndBuilder:
         """NormalizedInputVectorBuilder가 올바른 벡터를 생성하는지 테스트"""
         # Mock DB와 피드백 생성
         mock_db = MagicMock()
-        mock_content = MagicMock()
-        mock_content.script_data = "word " * 100
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_content
+        mock_db.get.return_value = SimpleNamespace(word_count=100)
+        mock_db.query.side_effect = AssertionError("feedback must not load the script")
         
         feedback = schemas.SessionFeedbackRequest(
             generated_content_id=1,
@@ -472,10 +487,8 @@ class TestLevelSystemService:
 
     def test_evaluate_session_feedback(self, service, mock_db, mock_user):
         """세션 피드백으로 레벨 업데이트 테스트"""
-        # Mock GeneratedContent
-        mock_content = MagicMock()
-        mock_content.script_data = "word " * 100
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_content
+        # Mock content_analysis
+        mock_db.get.return_value = SimpleNamespace(word_count=100)
         
         feedback = schemas.SessionFeedbackRequest(
             generated_content_id=1,
@@ -496,19 +509,36 @@ class TestLevelSystemService:
         assert "syntactic_level_delta" in result
         assert "speed_level_delta" in result
 
-    def test_evaluate_session_feedback_level_boundaries(self, service, mock_db, mock_user):
-        """레벨 업데이트 시 경계값 테스트 (0~300 범위)"""
-        mock_user.lexical_level = Decimal("299.0")
-        mock_user.syntactic_level = Decimal("1.0")
-        mock_user.speed_level = Decimal("150.0")
-        
-        mock_content = MagicMock()
-        mock_content.script_data = "word " * 100
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_content
-        
+    @staticmethod
+    def _seed_user_and_content(session, levels=(100.0, 100.0, 100.0)):
+        from backend.app.modules.audio.model import ContentAnalysis, GeneratedContent
+        from backend.app.modules.users import crud as user_crud
+
+        user = user_crud.create_user(session, username="feedback_user", hashed_password="pw")
+        user.lexical_level, user.syntactic_level, user.speed_level = levels
+        content = GeneratedContent(user_id=user.id, title="t", script_data="word " * 100)
+        session.add(content)
+        session.flush()
+        session.add(
+            ContentAnalysis(
+                generated_content_id=content.generated_content_id,
+                word_count=100,
+                sentence_count=10,
+                avg_sentence_length=10.0,
+                content_word_count=50,
+                cefr_distribution={},
+            )
+        )
+        session.commit()
+        return user, content.generated_content_id
+
+    def test_evaluate_session_feedback_level_boundaries(self, service, sqlite_session):
+        """레벨 업데이트 시 경계값 테스트 (0~300 범위, SQL에서 클램프)"""
+        user, content_id = self._seed_user_and_content(sqlite_session, levels=(299.0, 1.0, 150.0))
+
         # 매우 긍정적인 피드백
         feedback = schemas.SessionFeedbackRequest(
-            generated_content_id=1,
+            generated_content_id=content_id,
             pause_cnt=0,
             rewind_cnt=0,
             vocab_lookup_cnt=0,
@@ -516,10 +546,53 @@ class TestLevelSystemService:
             understanding_difficulty=4,
             speed_difficulty=4,
         )
-        
-        result = service.evaluate_session_feedback(mock_db, mock_user, feedback)
-        
+
+        result = service.evaluate_session_feedback(sqlite_session, user, feedback)
+
         # 레벨은 0~300 범위 내에 있어야 함
-        assert 0 <= result["lexical_level"] <= 300
-        assert 0 <= result["syntactic_level"] <= 300
+        assert result["lexical_level"] == 300.0
+        assert result["syntactic_level"] == pytest.approx(1.0 + result["syntactic_level_delta"], abs=0.05)
         assert 0 <= result["speed_level"] <= 300
+        sqlite_session.refresh(user)
+        assert float(user.lexical_level) == 300.0
+
+    def test_evaluate_session_feedback_batch_steps_each_feedback(self, service, sqlite_session):
+        """배치 피드백은 피드백마다 순서대로 clamp/0.1 단위 저장 (단건 경로·replay와 같은 규칙)"""
+        import numpy as np
+
+        from backend.app.modules.level_system.engine import step_levels
+        from backend.app.modules.level_system.models import LevelFeedbackEvent
+
+        user, content_id = self._seed_user_and_content(sqlite_session)
+        feedback = schemas.SessionFeedbackRequest(
+            generated_content_id=content_id,
+            pause_cnt=2,
+            rewind_cnt=2,
+            vocab_lookup_cnt=5,
+            vocab_save_cnt=0,
+            understanding_difficulty=3,
+            speed_difficulty=2,
+        )
+        single = _deltas_from_vector(service._build_feedback_vector(sqlite_session, feedback))
+        expected, levels = [], np.array([100.0, 100.0, 100.0])
+        for _ in range(3):
+            levels = step_levels(levels, np.array(single))
+            expected.append(tuple(float(v) for v in levels))
+
+        result = service.evaluate_session_feedback_batch(sqlite_session, user, [feedback] * 3)
+
+        assert result["applied_count"] == 3
+        assert result["lexical_level_delta"] == pytest.approx(single[0] * 3)
+        assert (result["lexical_level"], result["syntactic_level"], result["speed_level"]) == pytest.approx(
+            expected[-1]
+        )
+        events = (
+            sqlite_session.query(LevelFeedbackEvent)
+            .filter_by(user_id=user.id, event_type="feedback")
+            .order_by(LevelFeedbackEvent.id)
+            .all()
+        )
+        # 피드백마다 그 직후의 레벨을 기록
+        assert [
+            (float(e.lexical_level), float(e.syntactic_level), float(e.speed_level)) for e in events
+        ] == pytest.approx(expected)
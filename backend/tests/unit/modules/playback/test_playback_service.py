@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.tasks import TaskSupervisor
+from app.core.exceptions import PlaybackBufferFullException, PlaybackIngestDisabledException
+from app.modules.audio.model import GeneratedContent
+from app.modules.level_system import service as level_system_service
+from app.modules.level_system.schemas import SessionFeedbackRequest
+from app.modules.playback import crud, service
+from app.modules.playback.models import PlaybackEvent, PlaybackSession
+from app.modules.playback.schemas import PlaybackEventBatchRequest, PlaybackEventIn
+from app.modules.stats import crud as stats_crud
+from app.modules.users.models import User, CEFRLevel as UserCEFR
+
+T0 = datetime(2024, 5, 7, 9, 0, tzinfo=timezone.utc)
+
+
+def _event(kind: str, offset: float, *, session_id: str = "s1", position: float = 0.0) -> PlaybackEventIn:
+    return PlaybackEventIn(
+        session_id=session_id,
+        generated_content_id=11,
+        type=kind,
+        position=position,
+        client_ts=T0 + timedelta(seconds=offset),
+    )
+
+
+def _add_user(session, username: str = "listener", content_id: int = 11) -> int:
+    user = User(username=username, hashed_password="x", nickname="l", level=UserCEFR.A2)
+    session.add(user)
+    session.flush()
+    session.add(GeneratedContent(generated_content_id=content_id, user_id=user.id, title="t"))
+    session.commit()
+    # pipeline이 세션을 close하므로 id만 넘긴다
+    return user.id
+
+
+def _send_live(pipeline, user_id, events):
+    # 실제 클라이언트처럼 이벤트마다 그 시각에 전송
+    for event in events:
+        pipeline.enqueue(user_id, [event], now=event.client_ts)
+
+
+@pytest.fixture()
+def pipeline(sqlite_session):
+    return service.PlaybackPipeline(session_factory=lambda: sqlite_session, max_buffered_events=10)
+
+
+def test_enqueue_buffers_and_flush_bulk_inserts(sqlite_session, pipeline):
+    user_id = _add_user(sqlite_session)
+    assert pipeline.enqueue(user_id, [_event("play", 0), _event("heartbeat", 30)]) == 2
+    assert sqlite_session.query(PlaybackEvent).count() == 0  # write-behind
+
+    assert pipeline.flush() == 2
+    assert sqlite_session.query(PlaybackEvent).count() == 2
+    assert pipeline.stats()["buffered"] == 0
+
+    with pytest.raises(PlaybackBufferFullException):
+        pipeline.enqueue(user_id, [_event("heartbeat", i) for i in range(11)])
+    assert pipeline.stats()["rejected"] == 11
+
+
+def test_failed_flush_requeues(monkeypatch, sqlite_session, pipeline):
+    pipeline.enqueue(1, [_event("play", 0)])
+
+    def boom(*_, **__):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(service.crud, "bulk_insert_events", boom)
+    assert pipeline.flush() == 0
+    assert pipeline.stats()["buffered"] == 1
+    assert pipeline.stats()["flush_failures"] == 1
+
+
+def test_aggregate_derives_listening_time_and_counts(sqlite_session, pipeline):
+    user_id = _add_user(sqlite_session)
+    _send_live(
+        pipeline,
+        user_id,
+        [
+            _event("play", 0),
+            _event("heartbeat", 30),
+            _event("pause", 50),  # 50초 청취
+            _event("play", 120),  # 정지 구간은 제외
+            _event("rewind", 130),  # +10
+            _event("heartbeat", 300),  # 간격 170초 -> 60초로 제한
+        ],
+    )
+    pipeline.flush()
+
+    assert pipeline.aggregate(now=datetime.now(timezone.utc))["events"] == 6
+    session = sqlite_session.query(PlaybackSession).one()
+    assert session.listened_seconds == pytest.approx(120.0)
+    assert (session.pause_count, session.rewind_count, session.seek_count) == (1, 1, 0)
+    assert crud.get_watermark(sqlite_session).last_event_id == 6
+    assert crud.get_interaction_counts(sqlite_session, user_id=user_id, generated_content_id=11) == (1, 1)
+    assert crud.get_interaction_counts(sqlite_session, user_id=user_id + 1, generated_content_id=11) is None
+
+    # watermark 이후 새 이벤트가 없으면 아무것도 하지 않음
+    assert pipeline.aggregate(now=datetime.now(timezone.utc))["events"] == 0
+
+
+def test_events_for_other_users_content_are_dropped(sqlite_session, pipeline):
+    owner_id = _add_user(sqlite_session)
+    other_id = _add_user(sqlite_session, username="other", content_id=12)
+    # other가 owner의 콘텐츠(11)에 이벤트를 보냄
+    pipeline.enqueue(other_id, [_event("play", 0), _event("pause", 30), _event("rewind", 31)])
+    pipeline.flush()
+
+    assert pipeline.aggregate(now=datetime.now(timezone.utc))["events"] == 3
+    assert sqlite_session.query(PlaybackSession).count() == 0
+    assert crud.get_watermark(sqlite_session).last_event_id == 3
+    assert crud.get_interaction_counts(sqlite_session, user_id=owner_id, generated_content_id=11) is None
+
+
+def test_fabricated_client_timestamps_are_bounded_by_server_time(sqlite_session, monkeypatch):
+    monkeypatch.setattr(service.settings, "playback_flush_interval_seconds", 2.0)
+    pipeline = service.PlaybackPipeline(session_factory=lambda: sqlite_session, max_buffered_events=1000)
+    user_id = _add_user(sqlite_session)
+    # 한 요청에 60초 간격 heartbeat 500개 (client_ts로는 499분)
+    pipeline.enqueue(user_id, [_event("play", 0)] + [_event("heartbeat", 60 * i) for i in range(1, 500)], now=T0)
+    pipeline.flush()
+
+    pipeline.aggregate(now=T0 + timedelta(hours=2))
+
+    session = sqlite_session.query(PlaybackSession).one()
+    assert session.listened_seconds == pytest.approx(2.0)  # 수신 시각 범위 0초 + flush 주기
+    assert stats_crud.get_total_study_minutes(sqlite_session, user_id=user_id) == 1
+
+
+def test_listening_time_is_capped_by_content_duration(sqlite_session, pipeline):
+    from app.modules.audio.model import ContentAnalysis
+
+    user_id = _add_user(sqlite_session)
+    sqlite_session.add(
+        ContentAnalysis(
+            generated_content_id=11,
+            word_count=100,
+            sentence_count=10,
+            avg_sentence_length=10.0,
+            content_word_count=50,
+            cefr_distribution={},
+            duration_seconds=75.0,
+        )
+    )
+    sqlite_session.commit()
+    _send_live(pipeline, user_id, [_event("play", 0), _event("heartbeat", 60), _event("heartbeat", 120), _event("pause", 150)])
+    pipeline.flush()
+
+    pipeline.aggregate(now=T0)
+
+    assert sqlite_session.query(PlaybackSession).one().listened_seconds == pytest.approx(75.0)
+
+
+def test_idle_sessions_become_study_sessions(sqlite_session, pipeline):
+    user_id = _add_user(sqlite_session)
+    _send_live(pipeline, user_id, [_event("play", 0), _event("heartbeat", 60), _event("pause", 90)])
+    pipeline.flush()
+    later = datetime.now(timezone.utc) + timedelta(hours=2)
+
+    assert pipeline.aggregate(now=later)["finalized_sessions"] == 1
+    assert stats_crud.get_total_study_minutes(sqlite_session, user_id=user_id) == 2
+    assert stats_crud.get_study_totals(sqlite_session, user_id=user_id).total_minutes == 2
+
+    # 같은 세션을 이어서 재생하면 다시 열리고 추가된 분만 기록
+    _send_live(pipeline, user_id, [_event("play", 200), _event("heartbeat", 260), _event("pause", 300)])
+    pipeline.flush()
+    pipeline.aggregate(now=later + timedelta(hours=2))
+    assert stats_crud.get_total_study_minutes(sqlite_session, user_id=user_id) == 4
+    assert sqlite_session.query(PlaybackSession).one().study_minutes == 4
+
+
+class _NullSession:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_started_loop_outlives_supervisor_default_timeout(monkeypatch):
+    supervisor = TaskSupervisor(default_timeout=0.05)
+    supervisor.start()
+    flushed = []
+    monkeypatch.setattr(service, "task_supervisor", supervisor)
+    monkeypatch.setattr(service.settings, "playback_flush_interval_seconds", 0.01)
+    monkeypatch.setattr(service.settings, "playback_aggregate_interval_seconds", 0.01)
+    monkeypatch.setattr(service.crud, "bulk_insert_events", lambda db, rows: flushed.extend(rows))
+    monkeypatch.setattr(service, "aggregate_pending", lambda db: 0)
+    monkeypatch.setattr(service, "finalize_idle_sessions", lambda db, **_: 0)
+
+    loop_pipeline = service.PlaybackPipeline(session_factory=_NullSession)
+    assert loop_pipeline.start() is True
+    await asyncio.sleep(0.2)  # supervisor 기본 timeout(0.05초)을 넘김
+    assert supervisor.is_active("playback_pipeline")
+
+    loop_pipeline.enqueue(1, [_event("play", 0)])
+    for _ in range(50):
+        if flushed:
+            break
+        await asyncio.sleep(0.01)
+    assert len(flushed) == 1
+
+    loop_pipeline.stop()
+    await supervisor.drain(timeout=1.0)
+    counters = supervisor.stats()["counters"]
+    assert counters["succeeded"] == 1
+    assert "timed_out" not in counters
+
+
+def test_ingest_requires_setting(monkeypatch):
+    payload = PlaybackEventBatchRequest(events=[_event("play", 0)])
+    monkeypatch.setattr(service.settings, "playback_ingest_enabled", False)
+    with pytest.raises(PlaybackIngestDisabledException):
+        service.ingest_events(1, payload)
+
+    monkeypatch.setattr(service.settings, "playback_ingest_enabled", True)
+    monkeypatch.setattr(service, "pipeline", service.PlaybackPipeline(session_factory=lambda: None))
+    assert service.ingest_events(1, payload).accepted == 1
+
+
+def test_feedback_uses_server_counts(monkeypatch):
+    captured = {}
+
+    class FakeBuilder:
+        def __init__(self, db, feedback):
+            captured["feedback"] = feedback
+
+    class FakeDirector:
+        def __init__(self, builder):
+            pass
+
+        def buildInputVector(self):
+            return [0.0] * 6
+
+    monkeypatch.setattr(level_system_service, "NormalizedInputVectorBuilder", FakeBuilder)
+    monkeypatch.setattr(level_system_service, "Director", FakeDirector)
+    monkeypatch.setattr(level_system_service.settings, "playback_ingest_enabled", True)
+    lookups = []
+
+    def fake_counts(db, *, user_id, generated_content_id):
+        lookups.append((user_id, generated_content_id))
+        return (4, 2)
+
+    monkeypatch.setattr(level_system_service.playback_crud, "get_interaction_counts", fake_counts)
+
+    feedback = SessionFeedbackRequest(generated_content_id=11, rewind_cnt=7)
+    level_system_service.LevelSystemService._build_feedback_vector("session", feedback, user_id=3)
+    assert (captured["feedback"].pause_cnt, captured["feedback"].rewind_cnt) == (4, 7)
+    assert lookups == [(3, 11)]
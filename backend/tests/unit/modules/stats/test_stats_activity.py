@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import base64
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.core import bitset
+from app.modules.stats import activity, crud
+from app.modules.stats import service as stats_service
+from app.modules.users.models import User, CEFRLevel as UserCEFR
+
+
+def _year_row(year, days):
+    days_bitmap, buckets = activity.empty_year()
+    row = SimpleNamespace(year=year, days_bitmap=bytes(days_bitmap), minute_buckets=bytes(buckets))
+    for day, minutes in days.items():
+        activity.record_day(row, day, minutes)
+    return row
+
+
+def test_record_day_sets_bit_and_bucket():
+    row = _year_row(2024, {date(2024, 1, 1): 5, date(2024, 12, 31): 500, date(2024, 3, 1): 0})
+
+    assert len(row.days_bitmap) == activity.DAYS_BITMAP_BYTES
+    assert len(row.minute_buckets) == activity.MINUTE_BUCKET_BYTES
+    assert bitset.test_bit(row.days_bitmap, 0)
+    assert bitset.test_bit(row.days_bitmap, 365)  # 윤년 12/31
+    assert not bitset.test_bit(row.days_bitmap, activity.day_index(date(2024, 3, 1)))
+    assert bitset.get_nibble(row.minute_buckets, 0) == 1
+    assert bitset.get_nibble(row.minute_buckets, 365) == activity.MAX_BUCKET
+    assert activity.active_days(row.days_bitmap) == 2
+    assert activity.last_active_day(2024, row.days_bitmap) == date(2024, 12, 31)
+
+
+def test_longest_streak_in_year():
+    current = _year_row(2024, {date(2024, 1, 1) + timedelta(days=offset): 10 for offset in range(40)})
+    activity.record_day(current, date(2024, 3, 1), 10)
+
+    assert activity.longest_streak_in_year(current.days_bitmap) == 40
+
+
+def test_insert_study_session_updates_year_bitmap(sqlite_session):
+    user = User(username="heatmap", hashed_password="x", nickname="h", level=UserCEFR.A2)
+    sqlite_session.add(user)
+    sqlite_session.commit()
+
+    record = crud.insert_study_session(sqlite_session, user_id=user.id, duration_minutes=25)
+    study_date = record.started_at.date()
+
+    row = crud.get_activity_year(sqlite_session, user_id=user.id, year=study_date.year)
+    index = activity.day_index(study_date)
+    assert bitset.test_bit(row.days_bitmap, index)
+    assert bitset.get_nibble(row.minute_buckets, index) == 3
+
+    crud.insert_study_session(sqlite_session, user_id=user.id, duration_minutes=20)
+    sqlite_session.refresh(row)
+    assert bitset.get_nibble(row.minute_buckets, index) == 5
+    assert activity.active_days(row.days_bitmap) == 1
+
+
+def test_service_encodes_year(monkeypatch):
+    today = datetime.now(timezone.utc).date()
+    yesterday = today - timedelta(days=1)
+    rows = {
+        yesterday.year: _year_row(yesterday.year, {yesterday: 30}),
+    }
+    if today.year not in rows:
+        rows[today.year] = _year_row(today.year, {})
+    monkeypatch.setattr(
+        stats_service.crud, "get_activity_year", lambda db, *, user_id, year: rows.get(year)
+    )
+    totals = SimpleNamespace(current_streak=4, longest_streak=4, last_active_date=yesterday)
+    monkeypatch.setattr(stats_service.crud, "get_study_totals", lambda db, *, user_id: totals)
+
+    response = stats_service.StatsService().get_activity_year(db="session", user=SimpleNamespace(id=1), year=today.year)
+
+    # 오늘 기록이 없으면 어제까지의 streak (/stats와 같은 롤업 값)
+    assert response.current_streak_days == 4
+    assert response.bucket_minutes == activity.BUCKET_MINUTES
+    decoded = base64.b64decode(response.days_bitmap)
+    assert len(decoded) == activity.DAYS_BITMAP_BYTES
+    assert len(base64.b64decode(response.minute_buckets)) == activity.MINUTE_BUCKET_BYTES
+
+    totals.last_active_date = today - timedelta(days=2)
+    expired = stats_service.StatsService().get_activity_year(db="session", user=SimpleNamespace(id=1), year=today.year)
+    assert expired.current_streak_days == 0
+
+    past = stats_service.StatsService().get_activity_year(db="session", user=SimpleNamespace(id=1), year=2001)
+    assert past.active_days == 0
+    assert past.current_streak_days is None
+    assert past.days_in_year == 365
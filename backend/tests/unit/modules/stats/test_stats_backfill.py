@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from app.modules.stats import activity, backfill, crud
+from app.modules.stats.models import StudySession, UserDailyStudy
+from app.modules.users.models import User, CEFRLevel as UserCEFR
+
+
+def _add_user(session, username: str) -> User:
+    user = User(username=username, hashed_password="secret", nickname=username, level=UserCEFR.A2)
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+def test_compute_rollup():
+    days, totals = backfill.compute_rollup(
+        [
+            (datetime(2024, 5, 5, 9), 30),
+            (datetime(2024, 5, 5, 21), 15),
+            (datetime(2024, 5, 6, 8), 0),
+            (datetime(2024, 5, 7, 8), 10),
+            (datetime(2024, 5, 1, 8), 5),
+        ]
+    )
+
+    assert days[date(2024, 5, 5)] == (45, 2)
+    assert days[date(2024, 5, 6)] == (0, 1)
+    assert totals == {
+        "total_minutes": 60,
+        "total_days": 3,
+        # 0분인 5/6은 학습일이 아니므로 streak가 끊김
+        "current_streak": 1,
+        "longest_streak": 1,
+        "last_active_date": date(2024, 5, 7),
+    }
+
+    assert backfill.compute_rollup([]) == ({}, {
+        "total_minutes": 0,
+        "total_days": 0,
+        "current_streak": 0,
+        "longest_streak": 0,
+        "last_active_date": None,
+    })
+
+
+def test_run_backfill_rebuilds_rollups(sqlite_session):
+    user = _add_user(sqlite_session, "legacy")
+    sqlite_session.add_all(
+        [
+            StudySession(user_id=user.id, started_at=datetime(2024, 5, 5, 10), duration_minutes=30),
+            StudySession(user_id=user.id, started_at=datetime(2024, 5, 6, 9), duration_minutes=45),
+        ]
+    )
+    # 잘못된 기존 롤업 행은 덮어써져야 함
+    sqlite_session.add(UserDailyStudy(user_id=user.id, study_date=date(2024, 4, 1), minutes=999, session_count=9))
+    sqlite_session.commit()
+
+    report = backfill.run_backfill(sqlite_session)
+    assert report["users"] == 1
+    assert report["day_rows"] == 2
+
+    totals = crud.get_study_totals(sqlite_session, user_id=user.id)
+    assert (totals.total_minutes, totals.total_days, totals.current_streak) == (75, 2, 2)
+    assert totals.last_active_date == date(2024, 5, 6)
+    assert crud.get_daily_study_rollup(
+        sqlite_session, user_id=user.id, start_date=date(2024, 4, 1), end_date=date(2024, 5, 31)
+    ) == {date(2024, 5, 5): 30, date(2024, 5, 6): 45}
+
+    year_row = crud.get_activity_year(sqlite_session, user_id=user.id, year=2024)
+    assert activity.active_days(year_row.days_bitmap) == 2
+    assert activity.last_active_day(2024, year_row.days_bitmap) == date(2024, 5, 6)
+
+    codes = {record.achievement_code for record in crud.list_user_achievements(sqlite_session, user_id=user.id)}
+    assert codes == {"FIRST_SESSION", "TOTAL_60"}
+
+    # 재실행해도 결과가 같음
+    backfill.run_backfill(sqlite_session, user_ids=[user.id])
+    assert crud.get_study_totals(sqlite_session, user_id=user.id).total_minutes == 75
+    assert len(crud.list_user_achievements(sqlite_session, user_id=user.id)) == 2
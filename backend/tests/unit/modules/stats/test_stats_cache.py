@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.stats import cache as stats_cache_module
+from app.modules.stats import service as stats_service
+from app.modules.stats.cache import StatsResponseCache, etag_matches, make_etag
+
+
+def test_cache_hit_and_date_rollover():
+    cache = StatsResponseCache(ttl_seconds=60)
+    today = date(2024, 5, 7)
+
+    entry = cache.put(1, day=today, generation=cache.generation(1), body=b"{}")
+    assert cache.get(1, day=today) == entry
+    assert entry.etag == make_etag(b"{}")
+    # 다음 날에는 7일 구간이 바뀌므로 miss
+    assert cache.get(1, day=today + timedelta(days=1)) is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_invalidate_discards_and_blocks_stale_puts():
+    cache = StatsResponseCache(ttl_seconds=60)
+    today = date(2024, 5, 7)
+    cache.put(1, day=today, generation=cache.generation(1), body=b"old")
+
+    stale_generation = cache.generation(1)
+    cache.invalidate(1)
+    assert cache.get(1, day=today) is None
+
+    # 무효화 이전에 읽은 데이터로 만든 응답은 저장하지 않음
+    cache.put(1, day=today, generation=stale_generation, body=b"stale")
+    assert cache.get(1, day=today) is None
+
+    cache.put(1, day=today, generation=cache.generation(1), body=b"fresh")
+    assert cache.get(1, day=today).body == b"fresh"
+
+
+def test_disabled_cache_never_stores():
+    cache = StatsResponseCache(ttl_seconds=0)
+    entry = cache.put(1, day=date(2024, 5, 7), generation=0, body=b"{}")
+    assert entry.etag
+    assert cache.get(1, day=date(2024, 5, 7)) is None
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_service_serves_cached_payload_until_invalidated(monkeypatch):
+    cache = StatsResponseCache(ttl_seconds=60)
+    monkeypatch.setattr(stats_service, "stats_cache", cache)
+    monkeypatch.setattr(stats_cache_module, "stats_cache", cache)
+    svc = stats_service.StatsService()
+    calls = []
+    real_get_user_stats = svc.get_user_stats
+
+    def counting_get_user_stats(**kwargs):
+        calls.append(1)
+        return real_get_user_stats(**kwargs)
+
+    monkeypatch.setattr(svc, "get_user_stats", counting_get_user_stats)
+    monkeypatch.setattr(stats_service.crud, "list_achievements", lambda *_: [])
+    monkeypatch.setattr(stats_service.crud, "list_user_achievements", lambda *_, **__: [])
+    monkeypatch.setattr(stats_service.crud, "get_daily_study_rollup", lambda *_, **__: {})
+    totals = SimpleNamespace(total_minutes=10, total_days=1, current_streak=1, last_active_date=None)
+    monkeypatch.setattr(stats_service.crud, "get_study_totals", lambda *_, **__: totals)
+    user = SimpleNamespace(id=5, lexical_level=50, syntactic_level=50, speed_level=50, level_updated_at=None)
+
+    first = svc.get_cached_user_stats(db="session", user=user)
+    second = svc.get_cached_user_stats(db="session", user=user)
+    assert second is first
+    assert len(calls) == 1
+
+    totals.total_minutes = 40
+    stats_cache_module.invalidate_user_stats(user.id)
+    third = svc.get_cached_user_stats(db="session", user=user)
+    assert len(calls) == 2
+    assert third.etag != first.etag
+    assert b'"total_time_spent_minutes":40' in third.body
@@ -51,3 +51,113 @@ def test_stats_crud_flow(sqlite_session):
     # user_achievements 조회 테스트는 빈 리스트 확인만
     user_achievements = crud.list_user_achievements(sqlite_session, user_id=user.id)
     assert isinstance(user_achievements, list)  # 빈 리스트라도 OK
+
+
+def test_insert_study_session_updates_rollups(sqlite_session):
+    user = _add_user(sqlite_session, username="rollup")
+
+    first = crud.insert_study_session(sqlite_session, user_id=user.id, duration_minutes=20)
+    crud.insert_study_session(sqlite_session, user_id=user.id, duration_minutes=0)
+    study_date = first.started_at.date()
+
+    totals = crud.get_study_totals(sqlite_session, user_id=user.id)
+    assert totals.total_minutes == 20
+    assert totals.total_days == 1
+    assert totals.current_streak == 1
+    assert totals.last_active_date == study_date
+
+    daily = crud.get_daily_study_rollup(
+        sqlite_session, user_id=user.id, start_date=study_date, end_date=study_date
+    )
+    assert daily == {study_date: 20}
+
+    # 롤업이 원본 집계와 일치
+    assert totals.total_minutes == crud.get_total_study_minutes(sqlite_session, user_id=user.id)
+    assert totals.total_days == crud.get_total_study_days(sqlite_session, user_id=user.id)
+
+
+def test_rollup_streak_follows_consecutive_days(sqlite_session):
+    user = _add_user(sqlite_session, username="streaker")
+    day = datetime(2024, 5, 5).date()
+
+    for offset in (0, 1, 2):
+        crud._apply_study_rollup(
+            sqlite_session, user_id=user.id, study_date=day + timedelta(days=offset), duration_minutes=10
+        )
+    # 같은 날 두 번째 세션은 streak를 바꾸지 않음
+    crud._apply_study_rollup(sqlite_session, user_id=user.id, study_date=day + timedelta(days=2), duration_minutes=5)
+    sqlite_session.commit()
+
+    totals = crud.get_study_totals(sqlite_session, user_id=user.id)
+    assert (totals.current_streak, totals.total_days, totals.total_minutes) == (3, 3, 35)
+
+    # 하루를 건너뛰면 새 streak 시작
+    crud._apply_study_rollup(sqlite_session, user_id=user.id, study_date=day + timedelta(days=4), duration_minutes=10)
+    sqlite_session.commit()
+    totals = crud.get_study_totals(sqlite_session, user_id=user.id)
+    assert totals.current_streak == 1
+    assert totals.last_active_date == day + timedelta(days=4)
+
+    # 0분 세션만 있는 날은 학습일이 아니다 (total_days, 활동 비트맵과 같은 기준)
+    crud._apply_study_rollup(sqlite_session, user_id=user.id, study_date=day + timedelta(days=5), duration_minutes=0)
+    sqlite_session.commit()
+    totals = crud.get_study_totals(sqlite_session, user_id=user.id)
+    assert (totals.current_streak, totals.total_days) == (1, 4)
+    assert totals.last_active_date == day + timedelta(days=4)
+
+    # 같은 날 학습 시간이 생기면 그때 이어진다
+    crud._apply_study_rollup(sqlite_session, user_id=user.id, study_date=day + timedelta(days=5), duration_minutes=10)
+    sqlite_session.commit()
+    totals = crud.get_study_totals(sqlite_session, user_id=user.id)
+    assert (totals.current_streak, totals.total_days) == (2, 5)
+
+
+def test_insert_study_session_unlocks_crossed_thresholds(sqlite_session):
+    user = _add_user(sqlite_session, username="achiever")
+
+    crud.insert_study_session(sqlite_session, user_id=user.id, duration_minutes=30)
+    codes = [record.achievement_code for record in crud.list_user_achievements(sqlite_session, user_id=user.id)]
+    assert codes == ["FIRST_SESSION"]
+
+    crud.insert_study_session(sqlite_session, user_id=user.id, duration_minutes=40)
+    crud.insert_study_session(sqlite_session, user_id=user.id, duration_minutes=5)
+    codes = sorted(record.achievement_code for record in crud.list_user_achievements(sqlite_session, user_id=user.id))
+    assert codes == ["FIRST_SESSION", "TOTAL_60"]
+
+    # 이미 해금된 업적은 INSERT IGNORE로 건너뜀
+    assert crud.grant_user_achievements(sqlite_session, user_id=user.id, codes=["TOTAL_60", "FIRST_SESSION"]) == 0
+    sqlite_session.commit()
+    assert len(crud.list_user_achievements(sqlite_session, user_id=user.id)) == 2
+
+
+def test_compute_streaks_is_unbounded():
+    start = datetime(2022, 1, 1).date()
+    multi_year = [start + timedelta(days=offset) for offset in range(800)]
+    assert crud.compute_streaks(multi_year) == (800, 800)
+
+    # 긴 streak 이후 끊기면 current는 새로 시작, longest는 유지
+    later = [multi_year[-1] + timedelta(days=10), multi_year[-1] + timedelta(days=11)]
+    assert crud.compute_streaks(later + multi_year) == (2, 800)
+    assert crud.compute_streaks([]) == (0, 0)
+
+
+def test_rollup_tracks_longest_and_backdated_days(sqlite_session):
+    user = _add_user(sqlite_session, username="marathon")
+    day = datetime(2024, 1, 1).date()
+
+    def add(offset):
+        crud._apply_study_rollup(
+            sqlite_session, user_id=user.id, study_date=day + timedelta(days=offset), duration_minutes=10
+        )
+        sqlite_session.commit()
+        return crud.get_study_totals(sqlite_session, user_id=user.id)
+
+    for offset in range(4):
+        add(offset)
+    totals = add(6)
+    assert (totals.current_streak, totals.longest_streak) == (1, 4)
+
+    add(4)  # 과거 날짜: 0..4 섬이 길어짐
+    totals = add(5)  # 0..6 섬으로 합쳐짐
+    assert (totals.current_streak, totals.longest_streak) == (7, 7)
+    assert totals.last_active_date == day + timedelta(days=6)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 from types import SimpleNamespace
 
 import pytest
 
 from app.modules.stats import endpoints
+from app.modules.stats.cache import make_etag
 from app.core.exceptions import InvalidAuthHeaderException, UserNotFoundException
 
 
@@ -41,14 +43,23 @@ def test_get_current_user_missing_user(monkeypatch):
 
 def test_get_stats_delegates_to_service(monkeypatch):
     called = {}
+    body = b'{"total_time_spent_minutes":42}'
 
-    def fake_get_user_stats(db, user):
+    def fake_get_cached_user_stats(db, user):
         called["db"] = db
         called["user"] = user
-        return {"total_time_spent_minutes": 42}
+        return SimpleNamespace(etag=make_etag(body), body=body)
 
-    monkeypatch.setattr(endpoints.service, "get_user_stats", fake_get_user_stats)
+    monkeypatch.setattr(endpoints.service, "get_cached_user_stats", fake_get_cached_user_stats)
     user = SimpleNamespace(id=1)
-    response = endpoints.get_stats(current_user=user, db="session")
-    assert response["total_time_spent_minutes"] == 42
+    response = endpoints.get_stats(current_user=user, db="session", if_none_match=None)
+    assert response.status_code == 200
+    assert json.loads(response.body)["total_time_spent_minutes"] == 42
+    assert response.headers["etag"] == make_etag(body)
     assert called["db"] == "session"
+
+    # 같은 ETag로 재검증하면 본문 없이 304
+    not_modified = endpoints.get_stats(current_user=user, db="session", if_none_match=f"W/{make_etag(body)}")
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["etag"] == make_etag(body)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.stats import backfill, crud, endpoints
+from app.modules.stats.leaderboard import (
+    BOARD_STREAK,
+    BOARD_WEEKLY_MINUTES,
+    STREAK_PERIOD,
+    LeaderboardScore,
+    Leaderboards,
+    leaderboards,
+    week_key,
+)
+from app.modules.stats.schemas import LeaderboardBoard
+from app.modules.stats.service import StatsService
+from app.modules.users.models import User, CEFRLevel as UserCEFR
+
+TODAY = date(2024, 5, 8)  # 수요일, 2024-W19
+
+
+@pytest.fixture(autouse=True)
+def _reset_leaderboards():
+    leaderboards.reset()
+    yield
+    leaderboards.reset()
+
+
+def _weekly(user_id: int, score: int, day: date = TODAY) -> LeaderboardScore:
+    return LeaderboardScore(board=BOARD_WEEKLY_MINUTES, period=week_key(day), user_id=user_id, score=score)
+
+
+def _streak(user_id: int, score: int, last_active: date) -> LeaderboardScore:
+    return LeaderboardScore(
+        board=BOARD_STREAK,
+        period=STREAK_PERIOD,
+        user_id=user_id,
+        score=score,
+        expires_on=last_active + timedelta(days=2),
+    )
+
+
+def test_rebuild_loads_live_periods_and_ranks():
+    boards = Leaderboards()
+    rows = [
+        _weekly(1, 40),
+        _weekly(2, 90),
+        _weekly(3, 40),
+        _weekly(4, 500, TODAY - timedelta(days=14)),  # 2주 전: 메모리에 올리지 않음
+        _streak(1, 3, TODAY),
+    ]
+    requested = {}
+
+    def load(periods):
+        requested["periods"] = periods
+        return rows
+
+    assert boards.rebuild(load, today=TODAY) == 5
+    assert (BOARD_WEEKLY_MINUTES, "2024-W19") in requested["periods"]
+    assert (BOARD_WEEKLY_MINUTES, "2024-W18") in requested["periods"]
+
+    standings = boards.standings(BOARD_WEEKLY_MINUTES, period="2024-W19", user_id=3, limit=10, today=TODAY)
+    assert standings.top == [(1, 2, 90), (2, 1, 40), (2, 3, 40)]
+    assert (standings.total_users, standings.my_rank, standings.my_score) == (3, 2, 40)
+    assert boards.standings(BOARD_WEEKLY_MINUTES, period="2024-W17", user_id=4, limit=10, today=TODAY).total_users == 0
+
+
+def test_record_is_ignored_until_loaded_then_applied():
+    boards = Leaderboards()
+    boards.record([_weekly(1, 10)], today=TODAY)
+    boards.rebuild(lambda periods: [], today=TODAY)
+    assert boards.standings(BOARD_WEEKLY_MINUTES, period="2024-W19", user_id=1, limit=5, today=TODAY).my_rank is None
+
+    boards.record([_weekly(1, 10), _weekly(2, 5)], today=TODAY)
+    boards.record([_weekly(2, 25)], today=TODAY)  # 절대 점수로 갱신
+    standings = boards.standings(BOARD_WEEKLY_MINUTES, period="2024-W19", user_id=1, limit=5, today=TODAY)
+    assert standings.top == [(1, 2, 25), (2, 1, 10)]
+
+
+def test_streaks_expire_after_a_missed_day():
+    boards = Leaderboards()
+    boards.rebuild(lambda periods: [_streak(1, 5, TODAY), _streak(2, 9, TODAY - timedelta(days=1))], today=TODAY)
+    assert boards.standings(BOARD_STREAK, period=STREAK_PERIOD, user_id=1, limit=5, today=TODAY).top == [
+        (1, 2, 9),
+        (2, 1, 5),
+    ]
+
+    tomorrow = TODAY + timedelta(days=1)
+    standings = boards.standings(BOARD_STREAK, period=STREAK_PERIOD, user_id=2, limit=5, today=tomorrow)
+    assert standings.top == [(1, 1, 5)]
+    assert standings.my_rank is None
+
+    # 주차가 바뀌면 지난주 인덱스는 이전 주차로만 남는다
+    boards.record([_weekly(1, 30)], today=TODAY)
+    next_week = TODAY + timedelta(days=7)
+    assert boards.standings(BOARD_WEEKLY_MINUTES, period=week_key(TODAY), user_id=1, limit=5, today=next_week).my_score == 30
+    boards.standings(BOARD_STREAK, period=STREAK_PERIOD, user_id=1, limit=5, today=TODAY + timedelta(days=14))
+    assert f"{BOARD_WEEKLY_MINUTES}:{week_key(TODAY)}" not in boards.stats()["boards"]
+
+
+def _add_user(session, username: str, nickname: str) -> User:
+    user = User(username=username, hashed_password="x", nickname=nickname, level=UserCEFR.A2)
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+def test_insert_study_session_maintains_scores(sqlite_session):
+    alice = _add_user(sqlite_session, "alice", "Alice")
+    bob = _add_user(sqlite_session, "bob", "Bob")
+    service = StatsService()
+
+    crud.insert_study_session(sqlite_session, user_id=alice.id, duration_minutes=20)
+    # 첫 조회 시 DB에서 적재
+    response = service.get_leaderboard(db=sqlite_session, user=bob, board=LeaderboardBoard.weekly_minutes, limit=10)
+    assert [(e.rank, e.nickname, e.score) for e in response.entries] == [(1, "Alice", 20)]
+    assert response.my_rank is None and response.my_score == 0
+
+    # 적재 이후에는 커밋 후 증분 반영
+    crud.insert_study_session(sqlite_session, user_id=bob.id, duration_minutes=15)
+    crud.insert_study_session(sqlite_session, user_id=bob.id, duration_minutes=10)
+    response = service.get_leaderboard(db=sqlite_session, user=bob, board=LeaderboardBoard.weekly_minutes, limit=10)
+    assert [(e.rank, e.nickname, e.score, e.is_me) for e in response.entries] == [
+        (1, "Bob", 25, True),
+        (2, "Alice", 20, False),
+    ]
+    assert response.period == week_key(datetime.now(timezone.utc).date())
+
+    streak = service.get_leaderboard(db=sqlite_session, user=alice, board=LeaderboardBoard.streak, limit=1)
+    assert streak.total_users == 2 and len(streak.entries) == 1
+    assert (streak.my_rank, streak.my_score) == (1, 1)
+
+    # DB(원본)에서 다시 적재해도 같은 순위
+    leaderboards.reset()
+    rebuilt = service.get_leaderboard(db=sqlite_session, user=bob, board=LeaderboardBoard.weekly_minutes, limit=10)
+    assert rebuilt.entries == response.entries
+
+
+def test_backfill_writes_leaderboard_scores():
+    days = {TODAY: (30, 1), TODAY - timedelta(days=1): (15, 2), TODAY - timedelta(days=7): (0, 1)}
+    _, totals = backfill.compute_rollup([])
+    totals.update(current_streak=2, last_active_date=TODAY)
+
+    scores = backfill.compute_leaderboard_scores(7, days, totals)
+    assert scores == [
+        LeaderboardScore(board=BOARD_WEEKLY_MINUTES, period="2024-W19", user_id=7, score=45),
+        _streak(7, 2, TODAY),
+    ]
+
+
+def test_get_leaderboard_endpoint_delegates(monkeypatch):
+    called = {}
+
+    def fake_get_leaderboard(db, user, board, limit):
+        called.update(db=db, board=board, limit=limit)
+        return "payload"
+
+    monkeypatch.setattr(endpoints.service, "get_leaderboard", fake_get_leaderboard)
+    result = endpoints.get_leaderboard(
+        board=LeaderboardBoard.streak, limit=5, current_user=SimpleNamespace(id=1), db="session"
+    )
+    assert result == "payload"
+    assert called == {"db": "session", "board": LeaderboardBoard.streak, "limit": 5}
@@ -4,6 +4,8 @@ from datetime import date, timedelta
 from decimal import Decimal
 from types import SimpleNamespace
 
+import pytest
+
 from app.modules.stats import service as stats_service
 
 try:
@@ -18,6 +20,17 @@ def _patch_crud(monkeypatch, attr: str, value):
         monkeypatch.setattr(backend_stats_service.crud, attr, value)
 
 
+def _fail_on_write(*_, **__):
+    raise AssertionError("stats read path must not write")
+
+
+@pytest.fixture(autouse=True)
+def reset_definitions():
+    stats_service.reset_achievement_definitions()
+    yield
+    stats_service.reset_achievement_definitions()
+
+
 def _make_user(
     level: float = 90.0,
     *,
@@ -41,9 +54,9 @@ def test_stats_service_builds_full_payload(monkeypatch):
     user = _make_user()
 
     today = date.today()
-    activity_dates = [today - timedelta(days=offset) for offset in range(5)]
 
-    _patch_crud(monkeypatch, "ensure_achievements", lambda *_, **__: None)
+    _patch_crud(monkeypatch, "ensure_achievements", _fail_on_write)
+    _patch_crud(monkeypatch, "grant_user_achievements", _fail_on_write)
     _patch_crud(
         monkeypatch,
         "list_achievements",
@@ -54,24 +67,17 @@ def test_stats_service_builds_full_payload(monkeypatch):
     )
     _patch_crud(
         monkeypatch,
-        "get_daily_study_minutes",
+        "get_daily_study_rollup",
         lambda *_, **__: {today - timedelta(days=1): 60, today: 45},
     )
     _patch_crud(
         monkeypatch,
-        "get_study_dates_descending",
-        lambda *_, **__: activity_dates,
+        "get_study_totals",
+        lambda *_, **__: SimpleNamespace(
+            total_minutes=3_600, total_days=42, current_streak=5, longest_streak=120, last_active_date=today
+        ),
     )
-    _patch_crud(monkeypatch, "get_total_study_minutes", lambda *_, **__: 3_600)
-    _patch_crud(monkeypatch, "get_total_study_days", lambda *_, **__: 42)
-
-    recorded_unlocks = []
-
-    def fake_ensure_user_achievement(db, user_id, achievement_code):
-        recorded_unlocks.append((user_id, achievement_code))
-        return SimpleNamespace(achievement_code=achievement_code, achieved_at=today)
 
-    _patch_crud(monkeypatch, "ensure_user_achievement", fake_ensure_user_achievement)
     _patch_crud(
         monkeypatch,
         "list_user_achievements",
@@ -90,21 +96,22 @@ def test_stats_service_builds_full_payload(monkeypatch):
         == stats_service.get_cefr_level_from_score(90.0).value
     )
     assert payload.streak.consecutive_days == 5
-    assert recorded_unlocks  # achievements recorded
-    assert any(a.code == "FIRST_SESSION" for a in payload.achievements)
+    assert payload.streak.longest_streak_days == 120
+    assert payload.streak.last_active_date == today
+    assert payload.streak.weekly_total_minutes == 105
+    achieved = {a.code: a.achieved for a in payload.achievements}
+    # 조회는 저장된 해금만 보여준다 (TOTAL_3000은 세션 저장 시 해금됨)
+    assert achieved == {"FIRST_SESSION": True, "TOTAL_3000": False}
 
 
 def test_stats_service_calculates_overall_cefr_level(monkeypatch):
     svc = stats_service.StatsService()
     user = _make_user(level=200.0, syntactic_level=150.0, auditory_level=100.0)
 
-    _patch_crud(monkeypatch, "ensure_achievements", lambda *_, **__: None)
+    _patch_crud(monkeypatch, "ensure_achievements", _fail_on_write)
     _patch_crud(monkeypatch, "list_achievements", lambda *_, **__: [])
-    _patch_crud(monkeypatch, "get_daily_study_minutes", lambda *_, **__: {})
-    _patch_crud(monkeypatch, "get_study_dates_descending", lambda *_, **__: [])
-    _patch_crud(monkeypatch, "get_total_study_minutes", lambda *_, **__: 0)
-    _patch_crud(monkeypatch, "get_total_study_days", lambda *_, **__: 0)
-    _patch_crud(monkeypatch, "ensure_user_achievement", lambda *_, **__: None)
+    _patch_crud(monkeypatch, "get_daily_study_rollup", lambda *_, **__: {})
+    _patch_crud(monkeypatch, "get_study_totals", lambda *_, **__: None)
     _patch_crud(monkeypatch, "list_user_achievements", lambda *_, **__: [])
 
     payload = svc.get_user_stats(db="session", user=user)
@@ -116,12 +123,43 @@ def test_stats_service_calculates_overall_cefr_level(monkeypatch):
     assert overall_level.cefr_level.value == stats_service.CEFRLevel.C1.value
 
 
+def test_seeded_definitions_are_cached(monkeypatch):
+    seeded = []
+    definitions = [
+        SimpleNamespace(code=item["code"], name=item["name"], description=None, category=item["category"])
+        for item in reversed(stats_service.DEFAULT_ACHIEVEMENTS)
+    ]
+    _patch_crud(monkeypatch, "ensure_achievements", lambda db, definitions: seeded.append(len(definitions)))
+    _patch_crud(monkeypatch, "list_achievements", lambda *_: definitions + [SimpleNamespace(code="LEGACY")])
+
+    cached = stats_service.seed_achievement_definitions("session")
+    assert seeded == [len(stats_service.DEFAULT_ACHIEVEMENTS)]
+    assert [d.code for d in cached] == [item["code"] for item in stats_service.DEFAULT_ACHIEVEMENTS]
+
+    _patch_crud(monkeypatch, "ensure_achievements", _fail_on_write)
+    _patch_crud(monkeypatch, "list_achievements", _fail_on_write)
+    _patch_crud(monkeypatch, "get_daily_study_rollup", lambda *_, **__: {})
+    _patch_crud(monkeypatch, "get_study_totals", lambda *_, **__: None)
+    _patch_crud(monkeypatch, "list_user_achievements", lambda *_, **__: [])
+
+    payload = stats_service.StatsService().get_user_stats(db="session", user=_make_user())
+    assert len(payload.achievements) == len(stats_service.DEFAULT_ACHIEVEMENTS)
+    assert not any(a.achieved for a in payload.achievements)
+
+
 def test_stats_service_helpers():
     svc = stats_service.StatsService()
     today = date.today()
     assert svc._calculate_streak([today, today - timedelta(days=1), today - timedelta(days=3)]) == 2
     assert svc._calculate_streak([]) == 0
 
+    # 리더보드 streak와 같이 하루를 건너뛰면 만료
+    totals = SimpleNamespace(current_streak=6, last_active_date=today - timedelta(days=1))
+    assert svc._current_streak(totals, today) == 6
+    totals.last_active_date = today - timedelta(days=2)
+    assert svc._current_streak(totals, today) == 0
+    assert svc._current_streak(None, today) == 0
+
     level = svc._build_skill_level(Decimal("15.5"))
     assert level.cefr_level.value in {"A1", "A2", "B1", "B2", "C1", "C2"}
 
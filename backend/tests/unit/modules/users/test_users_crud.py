@@ -95,3 +95,48 @@ def test_set_user_interests_flow(sqlite_session):
 def test_set_user_interests_missing_user(sqlite_session):
     with pytest.raises(UserNotFoundException):
         crud.set_user_interests(sqlite_session, user_id=999, interest_keys=[InterestKey.MUSIC])
+
+
+def test_apply_level_deltas_clamps_in_sql(sqlite_session):
+    user = crud.create_user(sqlite_session, username="deltas", hashed_password="pw")
+    user.lexical_level, user.syntactic_level, user.speed_level = 299.0, 1.0, 150.0
+    sqlite_session.commit()
+
+    levels = crud.apply_level_deltas(
+        sqlite_session, user_id=user.id, lexical_delta=5.0, syntactic_delta=-3.0, speed_delta=2.5
+    )
+    assert levels == (300.0, 0.0, 152.5)
+
+    sqlite_session.refresh(user)
+    assert (float(user.lexical_level), float(user.syntactic_level), float(user.speed_level)) == levels
+
+
+def test_apply_level_deltas_is_relative_to_stored_value(sqlite_session):
+    user = crud.create_user(sqlite_session, username="concurrent", hashed_password="pw")
+    user.lexical_level = 100.0
+    sqlite_session.commit()
+
+    # 다른 요청이 먼저 반영한 값 위에 더해진다 (메모리의 stale 값과 무관)
+    crud.apply_level_deltas(sqlite_session, user_id=user.id, lexical_delta=4.0, syntactic_delta=0, speed_delta=0)
+    levels = crud.apply_level_deltas(
+        sqlite_session, user_id=user.id, lexical_delta=4.0, syntactic_delta=0, speed_delta=0
+    )
+    assert levels[0] == 108.0
+
+
+def test_apply_level_deltas_missing_user(sqlite_session):
+    with pytest.raises(UserNotFoundException):
+        crud.apply_level_deltas(sqlite_session, user_id=999, lexical_delta=1, syntactic_delta=1, speed_delta=1)
+
+
+def test_clamped_level_uses_least_greatest_on_mysql():
+    from unittest.mock import MagicMock
+
+    from sqlalchemy.dialects import mysql
+
+    from app.modules.users.models import User
+
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "mysql"
+    sql = str(crud._clamped_level(db, User.lexical_level, 1.5).compile(dialect=mysql.dialect()))
+    assert sql.startswith("least(") and "greatest(" in sql
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from app.modules.users import crud as user_crud
 from app.modules.vocab import crud as vocab_crud
+from app.modules.vocab import service as vocab_service
+from app.modules.vocab import transfer as vocab_transfer
 from app.modules.vocab.service import VocabService
+from app.modules.audio.model import GeneratedContent
 
 
 def _create_user(session, username: str = "demo"):
@@ -68,6 +73,529 @@ class TestVocabCRUD:
         assert entry3.id in entry_ids
 
 
+class TestVocabPagination:
+    """/vocabs/me keyset 페이지네이션 + 검색 테스트"""
+
+    def _seed(self, session, user_id):
+        from datetime import datetime, timedelta
+
+        base = datetime(2025, 1, 1, 12, 0, 0)
+        words = [("apple", "명사"), ("apply", "동사"), ("banana", "명사"), ("grape", "명사"), ("happy", "형용사")]
+        for offset, (word, pos) in enumerate(words):
+            entry = vocab_crud.add_vocab_entry(session, user_id=user_id, word=word, pos=pos)
+            # 두 개씩 같은 created_at을 공유해 id tie-break를 검증
+            entry.created_at = base + timedelta(minutes=offset // 2)
+        session.commit()
+
+    def test_cursor_walks_all_pages_without_gaps(self, sqlite_session):
+        user = _create_user(sqlite_session, username="pager")
+        self._seed(sqlite_session, user.id)
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = VocabService.get_vocab_page(sqlite_session, user.id, limit=2, cursor=cursor)
+            seen.extend(entry.word for entry in page)
+            assert len(page) <= 2
+            if cursor is None:
+                break
+
+        assert seen == ["happy", "grape", "banana", "apply", "apple"]
+
+    def test_endpoint_always_pages(self, sqlite_session):
+        import inspect
+
+        from fastapi import Response
+
+        from app.modules.vocab import endpoints as vocab_endpoints
+
+        user = _create_user(sqlite_session, username="legacy")
+        self._seed(sqlite_session, user.id)
+
+        def call(limit, cursor=None):
+            response = Response()
+            entries = vocab_endpoints.get_my_vocab(
+                response,
+                limit=limit,
+                cursor=cursor,
+                q=None,
+                match="prefix",
+                pos=None,
+                created_from=None,
+                created_to=None,
+                db=sqlite_session,
+                current_user=user,
+            )
+            return [entry.word for entry in entries], response.headers.get("X-Next-Cursor")
+
+        # limit 없이 호출해도 기본 페이지 크기로 자른다 (전체 목록 경로 없음)
+        default_limit = inspect.signature(vocab_endpoints.get_my_vocab).parameters["limit"].default
+        assert default_limit.default == vocab_endpoints.DEFAULT_VOCAB_PAGE_SIZE
+
+        first, next_cursor = call(2)
+        assert first == ["happy", "grape"] and next_cursor
+        rest, last_cursor = call(2, cursor=next_cursor)
+        assert rest == ["banana", "apply"] and last_cursor
+        assert call(2, cursor=last_cursor) == (["apple"], None)
+
+    def test_search_and_filters(self, sqlite_session):
+        from datetime import datetime
+
+        user = _create_user(sqlite_session, username="searcher")
+        self._seed(sqlite_session, user.id)
+
+        def words(**filters):
+            page, _ = VocabService.get_vocab_page(sqlite_session, user.id, limit=10, **filters)
+            return [entry.word for entry in page]
+
+        assert words(word_prefix="APP") == ["apply", "apple"]
+        assert words(word_contains="pp") == ["happy", "apply", "apple"]
+        assert words(word_prefix="a%") == []
+        assert words(pos="명사") == ["grape", "banana", "apple"]
+        assert words(created_from=datetime(2025, 1, 1, 12, 1), created_to=datetime(2025, 1, 1, 12, 2)) == [
+            "grape",
+            "banana",
+        ]
+
+    def test_invalid_cursor_is_rejected(self, sqlite_session):
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc:
+            VocabService.get_vocab_page(sqlite_session, 1, limit=10, cursor="not-a-cursor")
+        assert exc.value.status_code == 400
+
+
+class TestVocabUpsert:
+    """(user, word, sentence) 기준 upsert 저장 테스트"""
+
+    SCRIPT_VOCABS = {
+        "sentences": [
+            {
+                "index": 0,
+                "text": "Hello world",
+                "words": [
+                    {"word": "Hello", "pos": "감탄사", "meaning": "안녕"},
+                    {"word": "world", "pos": "명사", "meaning": "세계"},
+                ],
+            },
+            {"index": 1, "text": "Hello again", "words": [{"word": "Hello", "pos": "감탄사", "meaning": "안녕"}]},
+        ]
+    }
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        vocab_service._SENTENCE_CACHE.clear()
+        yield
+        vocab_service._SENTENCE_CACHE.clear()
+
+    def _setup(self, session):
+        user = _create_user(session, username="saver")
+        content = GeneratedContent(user_id=user.id, title="t", script_vocabs=self.SCRIPT_VOCABS)
+        session.add(content)
+        session.commit()
+        return user.id, content.generated_content_id
+
+    def test_second_save_reuses_entry_without_tts(self, sqlite_session):
+        user_id, content_id = self._setup(sqlite_session)
+        synthesize = MagicMock(return_value="https://s3/a.mp3")
+
+        [(first, created)] = VocabService.save_words(sqlite_session, user_id, [(content_id, 0, "HELLO")], synthesize)
+        assert created is True
+        assert first.example_sentence_url == "https://s3/a.mp3"
+
+        [(again, created_again)] = VocabService.save_words(sqlite_session, user_id, [(content_id, 0, "hello")], synthesize)
+        assert created_again is False
+        assert again.id == first.id
+        assert synthesize.call_count == 1
+
+    def test_bulk_save_one_tts_per_sentence(self, sqlite_session):
+        user_id, content_id = self._setup(sqlite_session)
+        synthesize = MagicMock(side_effect=lambda text: f"https://s3/{text}.mp3")
+
+        results = VocabService.save_words(
+            sqlite_session,
+            user_id,
+            [(content_id, 0, "Hello"), (content_id, 0, "world"), (content_id, 1, "Hello"), (content_id, 0, "hello")],
+            synthesize,
+        )
+
+        assert [created for _, created in results] == [True, True, True, False]
+        assert results[0][0].id == results[3][0].id
+        assert results[0][0].id != results[2][0].id  # 다른 문장이면 별도 항목
+        assert synthesize.call_count == 2
+        assert len(vocab_crud.get_vocab_for_user(sqlite_session, user_id)) == 3
+
+    def test_unknown_word_saves_nothing(self, sqlite_session):
+        from fastapi import HTTPException
+
+        user_id, content_id = self._setup(sqlite_session)
+        synthesize = MagicMock()
+        with pytest.raises(HTTPException):
+            VocabService.save_words(sqlite_session, user_id, [(content_id, 0, "Hello"), (content_id, 0, "nope")], synthesize)
+        synthesize.assert_not_called()
+        assert vocab_crud.get_vocab_for_user(sqlite_session, user_id) == []
+
+    def test_concurrent_insert_falls_back_to_existing(self, sqlite_session):
+        user_id, content_id = self._setup(sqlite_session)
+        # 다른 요청이 먼저 저장한 상황
+        winner = vocab_crud.add_vocab_entry(
+            sqlite_session, user_id=user_id, word="hello", example_sentence="Hello world", example_sentence_url="u1"
+        )
+        real_find = vocab_crud.find_vocab_entries
+        calls = []
+
+        def stale_then_real(db, **kwargs):
+            calls.append(1)
+            return {} if len(calls) == 1 else real_find(db, **kwargs)
+
+        with patch.object(vocab_crud, "find_vocab_entries", side_effect=stale_then_real):
+            results = VocabService.save_words(
+                sqlite_session, user_id, [(content_id, 0, "Hello"), (content_id, 0, "world")], lambda text: "u2"
+            )
+
+        assert results[0] == (winner, False)
+        assert results[1][1] is True
+
+
+    def test_second_conflict_rereads_instead_of_inserting_again(self, sqlite_session):
+        from sqlalchemy.exc import IntegrityError
+
+        user_id, content_id = self._setup(sqlite_session)
+        winner = vocab_crud.add_vocab_entry(
+            sqlite_session, user_id=user_id, word="hello", example_sentence="Hello world", example_sentence_url="u1"
+        )
+        real_find = vocab_crud.find_vocab_entries
+        inserts = []
+
+        def stale_then_real(db, **kwargs):
+            # 처음 두 번의 조회는 다른 요청의 커밋을 보지 못한 상황
+            return {} if len(inserts) < 2 else real_find(db, **kwargs)
+
+        def conflict(db, **kwargs):
+            inserts.append(kwargs["rows"])
+            raise IntegrityError("INSERT", {}, Exception("duplicate key"))
+
+        discard = MagicMock()
+        with patch.object(vocab_crud, "find_vocab_entries", side_effect=stale_then_real), \
+             patch.object(vocab_crud, "insert_vocab_entries", side_effect=conflict):
+            [(entry, created)] = VocabService.save_words(
+                sqlite_session, user_id, [(content_id, 0, "Hello")], lambda text: "u2", discard
+            )
+
+        assert (entry, created) == (winner, False)
+        assert len(inserts) == 2  # 세 번째 insert는 하지 않음
+        discard.assert_called_once_with(["u2"])
+
+    def test_unresolved_conflict_is_409_and_discards_audio(self, sqlite_session):
+        from sqlalchemy.exc import IntegrityError
+        from app.core.exceptions import VocabSaveConflictException
+
+        user_id, content_id = self._setup(sqlite_session)
+        discard = MagicMock()
+        with patch.object(
+            vocab_crud, "insert_vocab_entries", side_effect=IntegrityError("INSERT", {}, Exception("duplicate key"))
+        ) as insert:
+            with pytest.raises(VocabSaveConflictException):
+                VocabService.save_words(sqlite_session, user_id, [(content_id, 0, "Hello")], lambda text: "u2", discard)
+
+        assert insert.call_count == 2
+        discard.assert_called_once_with(["u2"])
+
+    def test_accent_and_case_variants_share_one_entry(self, sqlite_session):
+        user = _create_user(sqlite_session, username="accent")
+        content = GeneratedContent(
+            user_id=user.id,
+            title="t",
+            script_vocabs={
+                "sentences": [
+                    {
+                        "index": 0,
+                        "text": "Café or cafe",
+                        "words": [
+                            {"word": "Café", "pos": "명사", "meaning": "카페"},
+                            {"word": "cafe", "pos": "명사", "meaning": "카페"},
+                        ],
+                    }
+                ]
+            },
+        )
+        sqlite_session.add(content)
+        sqlite_session.commit()
+
+        results = VocabService.save_words(
+            sqlite_session,
+            user.id,
+            [(content.generated_content_id, 0, "Café"), (content.generated_content_id, 0, "cafe")],
+            lambda text: "u",
+        )
+
+        # MySQL unique 인덱스(대소문자/악센트 무시)에서 같은 키이므로 한 항목만 저장
+        assert [created for _, created in results] == [True, False]
+        assert results[0][0].id == results[1][0].id
+        assert vocab_crud.collation_key("CAFÉ") == vocab_crud.collation_key("cafe") == "cafe"
+        assert len(vocab_crud.get_vocab_for_user(sqlite_session, user.id)) == 1
+
+    def test_tts_runs_concurrently_and_failure_discards_uploads(self, sqlite_session):
+        import threading
+
+        user_id, content_id = self._setup(sqlite_session)
+        both_started = threading.Barrier(2, timeout=5)
+
+        def synthesize(text):
+            both_started.wait()  # 두 문장의 TTS가 동시에 실행되어야 통과
+            if text == "Hello again":
+                raise RuntimeError("TTS down")
+            return f"https://s3/{text}.mp3"
+
+        discard = MagicMock()
+        with pytest.raises(RuntimeError, match="TTS down"):
+            VocabService.save_words(
+                sqlite_session, user_id, [(content_id, 0, "Hello"), (content_id, 1, "Hello")], synthesize, discard
+            )
+
+        discard.assert_called_once_with(["https://s3/Hello world.mp3"])
+        assert vocab_crud.get_vocab_for_user(sqlite_session, user_id) == []
+
+
+class TestVocabTransfer:
+    """단어장 스트리밍 export / 배치 import 테스트"""
+
+    def _seed(self, session, user_id, count=5):
+        for idx in range(count):
+            vocab_crud.add_vocab_entry(
+                session,
+                user_id=user_id,
+                word=f"word{idx}",
+                example_sentence=f"Sentence\twith tab {idx}",
+                pos="명사",
+                meaning=f"뜻 {idx}",
+            )
+
+    def test_export_streams_in_batches(self, sqlite_session):
+        import csv
+        import io
+        import json
+
+        user = _create_user(sqlite_session, username="exporter")
+        self._seed(sqlite_session, user.id)
+
+        csv_chunks = list(vocab_transfer.iter_export(sqlite_session, user.id, "csv", batch_size=2))
+        assert len(csv_chunks) == 3
+        rows = list(csv.DictReader(io.StringIO("".join(csv_chunks))))
+        assert [row["word"] for row in rows] == [f"word{idx}" for idx in range(5)]
+        assert rows[0]["meaning"] == "뜻 0"
+
+        ndjson = "".join(vocab_transfer.iter_export(sqlite_session, user.id, "ndjson", batch_size=2))
+        assert [json.loads(line)["word"] for line in ndjson.splitlines()] == [f"word{idx}" for idx in range(5)]
+
+        anki = "".join(vocab_transfer.iter_export(sqlite_session, user.id, "anki")).splitlines()
+        assert anki[0] == "#separator:tab"
+        assert anki[3].split("\t") == ["word0", "(명사) 뜻 0", "Sentence with tab 0"]
+
+    def test_export_of_empty_library_has_header_only(self, sqlite_session):
+        user = _create_user(sqlite_session, username="empty_exporter")
+        chunks = list(vocab_transfer.iter_export(sqlite_session, user.id, "csv"))
+        assert "".join(chunks).strip() == ",".join(vocab_transfer.CSV_FIELDS)
+
+    def test_import_round_trip_skips_existing_and_invalid(self, sqlite_session):
+        import io
+
+        source = _create_user(sqlite_session, username="source")
+        self._seed(sqlite_session, source.id, count=3)
+        exported = "".join(vocab_transfer.iter_export(sqlite_session, source.id, "csv"))
+
+        target = _create_user(sqlite_session, username="target")
+        vocab_crud.add_vocab_entry(
+            sqlite_session, user_id=target.id, word="word0", example_sentence="Sentence\twith tab 0"
+        )
+        exported += ",,,,,\n"  # word 없는 행
+
+        result = vocab_transfer.import_vocab(sqlite_session, target.id, io.StringIO(exported), "csv", batch_size=2)
+        assert result == {"imported": 2, "skipped": 1, "invalid": 1}
+        assert len(vocab_crud.get_vocab_for_user(sqlite_session, target.id)) == 3
+
+    def test_import_ndjson_dedupes_within_upload(self, sqlite_session):
+        import io
+
+        user = _create_user(sqlite_session, username="ndjson_importer")
+        upload = io.StringIO(
+            '{"word": "Apple", "meaning": "사과"}\n'
+            '\n'
+            '{"word": "apple"}\n'
+            'not json\n'
+            '{"word": "pear", "example_sentence": "A pear."}\n'
+        )
+        result = vocab_transfer.import_vocab(sqlite_session, user.id, upload, "ndjson")
+        assert result == {"imported": 2, "skipped": 1, "invalid": 1}
+
+    def test_import_counts_concurrently_saved_rows_as_skipped(self, sqlite_session):
+        import io
+
+        user = _create_user(sqlite_session, username="racing_importer")
+        # import 도중 다른 요청이 같은 단어를 먼저 저장한 상황
+        vocab_crud.add_vocab_entry(sqlite_session, user_id=user.id, word="apple")
+        real_find = vocab_crud.find_vocab_entries
+        calls = []
+
+        def stale_then_real(db, **kwargs):
+            calls.append(1)
+            return {} if len(calls) == 1 else real_find(db, **kwargs)
+
+        upload = io.StringIO('{"word": "apple"}\n{"word": "pear"}\n')
+        with patch.object(vocab_crud, "find_vocab_entries", side_effect=stale_then_real):
+            result = vocab_transfer.import_vocab(sqlite_session, user.id, upload, "ndjson")
+
+        assert len(calls) == 2  # 충돌 후 다시 읽음
+        assert result == {"imported": 1, "skipped": 1, "invalid": 0}
+        assert sorted(e.word for e in vocab_crud.get_vocab_for_user(sqlite_session, user.id)) == ["apple", "pear"]
+
+
+    def test_import_counts_oversized_rows_as_invalid(self, sqlite_session):
+        import io
+        import json
+
+        user = _create_user(sqlite_session, username="oversized_importer")
+        rows = [
+            {"word": "w" * 256},
+            {"word": "ok", "pos": "p" * 65},
+            {"word": "long", "meaning": "뜻" * 30000},
+            {"word": "fits", "pos": "명사"},
+        ]
+        upload = io.StringIO("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+
+        result = vocab_transfer.import_vocab(sqlite_session, user.id, upload, "ndjson")
+        assert result == {"imported": 1, "skipped": 0, "invalid": 3}
+
+    def test_import_keeps_only_our_bucket_urls(self, sqlite_session, monkeypatch):
+        import io
+        import json
+        from app.core import s3setting
+
+        user = _create_user(sqlite_session, username="url_importer")
+        monkeypatch.setattr(s3setting, "AWS_S3_BUCKET", "test-bucket")
+        monkeypatch.setattr(s3setting, "AWS_REGION", "local")
+        ours = "https://test-bucket.s3.local.amazonaws.com/audio/examples/a.mp3"
+        rows = [
+            {"word": "ours", "example_sentence_url": ours},
+            {"word": "foreign", "example_sentence_url": "https://evil.example/a.mp3"},
+            {"word": "too_long", "example_sentence_url": ours + "x" * 512},
+        ]
+        upload = io.StringIO("".join(json.dumps(row) + "\n" for row in rows))
+
+        result = vocab_transfer.import_vocab(sqlite_session, user.id, upload, "ndjson")
+        assert result == {"imported": 3, "skipped": 0, "invalid": 0}
+        urls = {e.word: e.example_sentence_url for e in vocab_crud.get_vocab_for_user(sqlite_session, user.id)}
+        assert urls == {"ours": ours, "foreign": None, "too_long": None}
+
+    def test_import_unresolved_conflict_is_409(self, sqlite_session):
+        import io
+        from sqlalchemy.exc import IntegrityError
+        from app.core.exceptions import VocabSaveConflictException
+
+        user = _create_user(sqlite_session, username="conflicted_importer")
+        with patch.object(
+            vocab_crud, "insert_vocab_entries", side_effect=IntegrityError("INSERT", {}, Exception("duplicate key"))
+        ) as insert:
+            with pytest.raises(VocabSaveConflictException):
+                vocab_transfer.import_vocab(sqlite_session, user.id, io.StringIO('{"word": "apple"}\n'), "ndjson")
+        assert insert.call_count == 2  # 두 번째 충돌 뒤에는 다시 insert하지 않음
+
+
+class TestContextualVocabStore:
+    """정규화된 contextual vocab 저장소 + LRU 테스트"""
+
+    SCRIPT_VOCABS = {
+        "sentences": [
+            {
+                "index": 0,
+                "text": "Hello world",
+                "words": [
+                    {"word": "Hello", "pos": "감탄사", "meaning": "안녕"},
+                    {"word": "world", "pos": "명사", "meaning": "세계"},
+                    {"word": "hello", "pos": "감탄사", "meaning": "중복"},
+                ],
+            },
+            {"index": 1, "text": "Good morning", "words": [{"word": "Good", "pos": "형용사", "meaning": "좋은"}]},
+        ]
+    }
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        vocab_service._SENTENCE_CACHE.clear()
+        yield
+        vocab_service._SENTENCE_CACHE.clear()
+
+    def _create_content(self, session, script_vocabs=None):
+        user = _create_user(session, username="ctx_user")
+        content = GeneratedContent(user_id=user.id, title="t", script_vocabs=script_vocabs)
+        session.add(content)
+        session.commit()
+        return content.generated_content_id
+
+    def test_replace_and_point_read(self, sqlite_session):
+        content_id = self._create_content(sqlite_session)
+        written = vocab_crud.replace_contextual_vocab(
+            sqlite_session, content_id=content_id, sentences=self.SCRIPT_VOCABS["sentences"]
+        )
+        assert written == 3  # duplicated "hello" is collapsed
+
+        sentence = vocab_crud.get_contextual_sentence(sqlite_session, content_id=content_id, sentence_index=0)
+        assert sentence["text"] == "Hello world"
+        assert [w["word"] for w in sentence["words"]] == ["Hello", "world"]
+        assert vocab_crud.get_contextual_sentence(sqlite_session, content_id=content_id, sentence_index=5) is None
+
+    def test_legacy_script_vocabs_are_normalized_and_cached(self, sqlite_session):
+        content_id = self._create_content(sqlite_session, script_vocabs=self.SCRIPT_VOCABS)
+        assert vocab_crud.has_contextual_vocab(sqlite_session, content_id=content_id) is False
+
+        sentence = VocabService.get_contextual_sentence(sqlite_session, content_id, 0)
+        assert sentence.find("HELLO")["meaning"] == "안녕"
+        assert vocab_crud.has_contextual_vocab(sqlite_session, content_id=content_id) is True
+
+        with patch.object(vocab_crud, "get_contextual_sentence", side_effect=AssertionError("cache miss")):
+            assert VocabService.get_contextual_sentence(sqlite_session, content_id, 0) is sentence
+
+        VocabService.invalidate_contextual_cache(content_id)
+        assert len(vocab_service._SENTENCE_CACHE) == 0
+
+    def test_concurrent_legacy_normalization_reads_the_winner(self, sqlite_session):
+        from sqlalchemy.exc import IntegrityError
+
+        content_id = self._create_content(sqlite_session, script_vocabs=self.SCRIPT_VOCABS)
+        real_replace = vocab_crud.replace_contextual_vocab
+
+        def lose_the_race(db, **kwargs):
+            # 다른 요청이 먼저 정규화를 마친 뒤 중복 키로 실패하는 상황
+            real_replace(db, **kwargs)
+            raise IntegrityError("INSERT", {}, Exception("duplicate key"))
+
+        with patch.object(vocab_crud, "replace_contextual_vocab", side_effect=lose_the_race):
+            sentence = VocabService.get_contextual_sentence(sqlite_session, content_id, 0)
+
+        assert sentence.text == "Hello world"
+        assert sentence.find("world")["meaning"] == "세계"
+        assert vocab_crud.has_contextual_vocab(sqlite_session, content_id=content_id) is True
+
+    def test_missing_content_and_sentence_errors(self, sqlite_session):
+        from fastapi import HTTPException
+        from app.core.exceptions import ScriptVocabsNotFoundException
+
+        with pytest.raises(HTTPException) as exc:
+            VocabService.get_contextual_sentence(sqlite_session, 12345, 0)
+        assert exc.value.status_code == 404
+
+        empty_id = self._create_content(sqlite_session)
+        with pytest.raises(ScriptVocabsNotFoundException):
+            VocabService.get_contextual_sentence(sqlite_session, empty_id, 0)
+
+    def test_missing_sentence_index(self, sqlite_session):
+        from fastapi import HTTPException
+
+        content_id = self._create_content(sqlite_session, script_vocabs=self.SCRIPT_VOCABS)
+        with pytest.raises(HTTPException) as exc:
+            VocabService.get_contextual_sentence(sqlite_session, content_id, 9)
+        assert exc.value.detail == "sentence index not found"
+
+
 class TestVocabService:
     """VocabService 클래스 테스트"""
 
@@ -165,25 +693,31 @@ class TestVocabService:
         assert call_args[1]["content_id"] == generated_content_id
 
     @pytest.mark.asyncio
-    async def test_build_contextual_vocab_duplicate_prevention(self):
-        """build_contextual_vocab가 중복 실행을 방지하는지 테스트"""
-        sentences = ["Test sentence"]
-        generated_content_id = 999
-        
-        # 실행 중인 태스크 시뮬레이션
-        mock_task = MagicMock()
-        mock_task.done = MagicMock(return_value=False)
-        VocabService._running_tasks[generated_content_id] = mock_task
-        
-        try:
-            result = await VocabService.build_contextual_vocab(sentences, generated_content_id)
-            
-            # 중복 실행 시 None 반환
-            assert result is None
-        finally:
-            # 테스트 후 cleanup
-            if generated_content_id in VocabService._running_tasks:
-                del VocabService._running_tasks[generated_content_id]
+    async def test_schedule_contextual_vocab_duplicate_prevention(self):
+        """같은 content_id의 vocab 빌드가 중복 스케줄되지 않는지 테스트"""
+        from app.core.tasks import TaskSupervisor
+
+        supervisor = TaskSupervisor()
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = []
+
+        async def fake_build(sentences, content_id):
+            calls.append(content_id)
+            started.set()
+            await release.wait()
+
+        with patch('app.modules.vocab.service.task_supervisor', supervisor), \
+             patch.object(VocabService, 'build_contextual_vocab', staticmethod(fake_build)):
+            assert VocabService.schedule_contextual_vocab(["Test sentence"], 999) is True
+            await started.wait()
+            # 실행 중인 태스크가 있으면 중복 스케줄은 거부됨
+            assert VocabService.schedule_contextual_vocab(["Test sentence"], 999) is False
+            release.set()
+            await supervisor.drain()
+
+        assert calls == [999]
+        assert supervisor.stats()["counters"]["deduplicated"] == 1
 
     @pytest.mark.asyncio
     async def test_build_contextual_vocab_db_update_failure(self):
@@ -209,9 +743,35 @@ class TestVocabService:
              patch('app.modules.vocab.service.crud', mock_crud), \
              patch('app.modules.vocab.service.SessionLocal', return_value=mock_db):
             
-            # DB 실패해도 결과는 반환되어야 함
-            result = await VocabService.build_contextual_vocab(sentences, generated_content_id)
-        
-        assert result is not None
-        assert "sentences" in result
-        assert len(result["sentences"]) == 1
+            # DB 실패는 supervisor가 재시도할 수 있도록 예외로 올라가야 함
+            with pytest.raises(Exception, match="DB Error"):
+                await VocabService.build_contextual_vocab(sentences, generated_content_id)
+
+        mock_db.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_build_contextual_vocab_retries_when_every_sentence_fails(self):
+        """모든 문장의 LLM 호출이 실패하면 저장하지 않고, supervisor 재시도로 다시 만든다"""
+        from app.core.tasks import TaskSupervisor
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = '{"entries": [{"word": "Test", "pos": "명사", "meaning": "테스트"}]}'
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=[Exception("LLM down"), mock_response])
+        mock_crud = MagicMock()
+        mock_crud.update_generated_content_vocabs = MagicMock(return_value=True)
+
+        supervisor = TaskSupervisor(backoff_base_seconds=0.0)
+        with patch('app.modules.vocab.service.client', mock_client), \
+             patch('app.modules.vocab.service.crud', mock_crud), \
+             patch('app.modules.vocab.service.vocab_crud'), \
+             patch('app.modules.vocab.service.SessionLocal', return_value=MagicMock()), \
+             patch('app.modules.vocab.service.task_supervisor', supervisor):
+            assert VocabService.schedule_contextual_vocab(["Test sentence"], 3) is True
+            await supervisor.drain()
+
+        # 첫 시도는 저장 없이 실패, 재시도에서 저장
+        mock_crud.update_generated_content_vocabs.assert_called_once()
+        saved = mock_crud.update_generated_content_vocabs.call_args[1]["script_vocabs"]
+        assert saved["sentences"][0]["words"][0]["word"] == "Test"
@@ -1,9 +1,17 @@
 import { getVocab, addVocab, getMyVocab, deleteMyVocab } from '../vocab';
-import { customFetch } from '../client';
+import { customFetch, customFetchWithHeaders } from '../client';
 
 jest.mock('../client');
 
 const mockCustomFetch = customFetch as jest.MockedFunction<typeof customFetch>;
+const mockCustomFetchWithHeaders = customFetchWithHeaders as jest.MockedFunction<
+  typeof customFetchWithHeaders
+>;
+
+const page = (data: unknown, nextCursor?: string) => ({
+  data,
+  headers: new Headers(nextCursor ? { 'X-Next-Cursor': nextCursor } : {}),
+});
 
 describe('vocab API', () => {
   beforeEach(() => {
@@ -122,19 +130,36 @@ describe('vocab API', () => {
         },
       ];
 
-      mockCustomFetch.mockResolvedValue(mockResponse);
+      mockCustomFetchWithHeaders.mockResolvedValue(page(mockResponse));
 
       const result = await getMyVocab();
 
-      expect(mockCustomFetch).toHaveBeenCalledWith('/vocabs/me', {
+      expect(mockCustomFetchWithHeaders).toHaveBeenCalledWith('/vocabs/me', {
         method: 'GET',
       });
       expect(result).toEqual(mockResponse);
       expect(result).toHaveLength(2);
     });
 
+    it('X-Next-Cursor를 따라 다음 페이지까지 조회', async () => {
+      const first = [{ id: 2, word: 'b' }];
+      const second = [{ id: 1, word: 'a' }];
+      mockCustomFetchWithHeaders
+        .mockResolvedValueOnce(page(first, 'abc=='))
+        .mockResolvedValueOnce(page(second));
+
+      const result = await getMyVocab();
+
+      expect(mockCustomFetchWithHeaders).toHaveBeenNthCalledWith(
+        2,
+        '/vocabs/me?cursor=abc%3D%3D',
+        { method: 'GET' },
+      );
+      expect(result).toEqual([...first, ...second]);
+    });
+
     it('빈 단어장', async () => {
-      mockCustomFetch.mockResolvedValue([]);
+      mockCustomFetchWithHeaders.mockResolvedValue(page([]));
 
       const result = await getMyVocab();
 
@@ -143,7 +168,7 @@ describe('vocab API', () => {
 
     it('단어장 조회 실패', async () => {
       const error = new Error('Failed to fetch my vocab');
-      mockCustomFetch.mockRejectedValue(error);
+      mockCustomFetchWithHeaders.mockRejectedValue(error);
 
       await expect(getMyVocab()).rejects.toThrow('Failed to fetch my vocab');
     });
@@ -238,10 +238,11 @@ const refreshAccessToken = async (): Promise<RefreshResponse> => {
 };
 // --------------------
 
-export const customFetch = async <T>(
+// 인증(401 시 토큰 갱신 후 재요청)과 에러 변환까지 처리한 응답을 돌려준다
+const fetchWithAuth = async (
   endpoint: string,
   options: RequestInit = {},
-): Promise<T> => {
+): Promise<Response> => {
   const baseUrl = getBaseUrl();
   const headers = new Headers(options.headers as HeadersInit);
   const hasJsonBody =
@@ -275,7 +276,7 @@ export const customFetch = async <T>(
     if (isRefreshing) {
       return new Promise((resolve, reject) => {
         failedQueue.push({
-          resolve: () => resolve(customFetch(endpoint, options)),
+          resolve: () => resolve(fetchWithAuth(endpoint, options)),
           reject,
         });
       });
@@ -326,5 +327,21 @@ export const customFetch = async <T>(
     throw await parseErrorResponse(response);
   }
 
-  return parseResponse<T>(response);
+  return response;
+};
+
+export const customFetch = async <T>(
+  endpoint: string,
+  options: RequestInit = {},
+): Promise<T> => {
+  return parseResponse<T>(await fetchWithAuth(endpoint, options));
+};
+
+/** 응답 헤더가 필요한 요청용 (예: 페이지네이션의 X-Next-Cursor) */
+export const customFetchWithHeaders = async <T>(
+  endpoint: string,
+  options: RequestInit = {},
+): Promise<{ data: T; headers: Headers }> => {
+  const response = await fetchWithAuth(endpoint, options);
+  return { data: await parseResponse<T>(response), headers: response.headers };
 };
@@ -1,4 +1,4 @@
-import { customFetch } from './client';
+import { customFetch, customFetchWithHeaders } from './client';
 
 /** ========= Types: 학습 오디오별 Vocab ========= */
 
@@ -59,10 +59,20 @@ export const addVocab = async (
 
 /** ========= API: 내 단어장(My Vocab) ========= */
 
+/** 서버는 페이지 단위로만 응답하므로 X-Next-Cursor를 따라 모든 페이지를 모은다 */
 export const getMyVocab = async (): Promise<MyVocab[]> => {
-  return customFetch<MyVocab[]>(`/vocabs/me`, {
-    method: 'GET',
-  });
+  const entries: MyVocab[] = [];
+  let cursor: string | null = null;
+  do {
+    const query: string = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    const { data, headers } = await customFetchWithHeaders<MyVocab[]>(
+      `/vocabs/me${query}`,
+      { method: 'GET' },
+    );
+    entries.push(...(data ?? []));
+    cursor = headers.get('X-Next-Cursor');
+  } while (cursor);
+  return entries;
 };
 
 export const deleteMyVocab = async (wordId: number): Promise<void> => {